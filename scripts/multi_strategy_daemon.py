@@ -22,21 +22,26 @@ Usage:
 
 import asyncio
 import json
-import httpx
 import logging
 import sys
 import os
 import signal
 import gc
-from datetime import datetime, timedelta
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, AsyncIterator
 from collections import deque
 import argparse
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.data import json_codec
+from src.data.http_client import HttpTransport, HostPolicy, get_transport, close_transport
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -64,6 +69,8 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 # CRITICAL: Import MarketData first (needed for type hints even if strategies fail)
 try:
     from src.trading.strategies.base_strategy import MarketData, TradeSignal, SignalType
+    from src.trading.strategies.market_universe import MarketUniverse, MarketRow
+    from src.trading.signal_journal import SignalJournal
     MARKET_DATA_AVAILABLE = True
 except Exception as e:
     MARKET_DATA_AVAILABLE = False
@@ -93,7 +100,7 @@ except Exception as e:
 try:
     from src.db.multi_strategy_models import (
         get_session, Trade, TradeStatus, Side, Outcome,
-        record_trade, get_strategy_stats, init_database
+        init_database, TradeWriter
     )
     DB_AVAILABLE = True
     logger.info("✅ Database available")
@@ -140,10 +147,15 @@ class Config:
     # API
     POLYMARKET_API = "https://clob.polymarket.com"
     GAMMA_API = "https://gamma-api.polymarket.com"
+    GAMMA_HOST = "gamma-api.polymarket.com"
     
     # Storage
     DATA_DIR = Path("data/multi_strategy")
-    SIGNALS_FILE = DATA_DIR / "signals.json"
+    SIGNALS_DIR = DATA_DIR / "signals"  # Daily JSONL journals
+    SIGNAL_FLUSH_SIZE = 50  # Buffered signals before a journal write
+    SIGNAL_FLUSH_INTERVAL = 5.0  # Max seconds a signal stays buffered
+    DB_BATCH_SIZE = 200  # Max trades per DB transaction
+    DB_BATCH_LINGER = 0.05  # Seconds the writer waits to fill a batch
     STATS_FILE = DATA_DIR / "stats.json"
     
     # Performance - Now with full pagination, we can scan more!
@@ -151,12 +163,68 @@ class Config:
     MAX_MARKETS_PER_CYCLE = 500  # Actionable markets after filtering
     REQUEST_DELAY = 0.1  # seconds between API calls (10 req/s)
     
+    # Concurrent pagination (Gamma allows 300 req / 10s)
+    FETCH_WINDOW = 8  # Pages in flight at once (1 = sequential)
+    GAMMA_RATE_LIMIT = 300  # Requests per GAMMA_RATE_PERIOD
+    GAMMA_RATE_PERIOD = 10.0  # seconds
+    
+    # Incremental sync: only re-parse/re-evaluate markets that changed
+    INCREMENTAL_SYNC = True
+    FULL_RESYNC_CYCLES = 30  # Re-emit the whole universe every N cycles
+    SYNC_EVICT_SWEEPS = 3  # Drop markets missing from N limited sweeps in a row
+    # Hours-to-expiry cut-offs strategies filter on (FlashSniper/Sniper 0.5h,
+    # Sniper 24h, Tail score bands 24h/168h/720h): unchanged markets that
+    # cross one are re-evaluated that cycle
+    EXPIRY_RECHECK_HOURS = (0.5, 24.0, 168.0, 720.0)
+    
+    # Pipelined cycle: fetch -> parse -> evaluate -> record (incremental sync only)
+    PIPELINE_ENABLED = True
+    PIPELINE_PAGE_QUEUE = 16  # Raw pages buffered between fetch and parse
+    PIPELINE_EVAL_QUEUE = 16  # Changed-row chunks buffered before evaluation
+    PIPELINE_SIGNAL_QUEUE = 256  # Signals buffered before recording
+    
+    # Per-strategy evaluation budget per cycle (None = evaluate every candidate)
+    STRATEGY_EVAL_BUDGET_MARKETS = None
+    STRATEGY_EVAL_BUDGET_CPU_MS = None
+    
     # Memory management
     GC_INTERVAL_CYCLES = 5  # Run GC every N cycles (more frequent now)
 
 # Ensure directories exist
 Config.DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# =============================================================================
+# MARKET DELTA
+# =============================================================================
+
+@dataclass
+class MarketDelta:
+    """
+    Result of an incremental universe sync.
+    
+    - changed: markets that are new, whose price/volume/liquidity/end date moved,
+      or whose hours_to_expiry crossed one of Config.EXPIRY_RECHECK_HOURS
+    - removed: condition IDs that left the universe (closed, filtered, delisted)
+    - universe: columnar view of every tracked market, keyed by condition ID
+    """
+    universe: "MarketUniverse"
+    changed: List["MarketRow"] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    complete: bool = True  # False if the sweep stopped early at `limit`
+    
+    # Sweep state (used while pages are being ingested)
+    limit: int = 0
+    full: bool = False
+    accepted: int = 0
+    seen_ids: set = field(default_factory=set)
+    started_at: float = 0.0
+    
+    @property
+    def truncated(self) -> bool:
+        """True once `limit` markets were accepted (stop fetching)."""
+        return not self.complete
+
 # =============================================================================
 # MARKET SCANNER (OPTIMIZED WITH FULL PAGINATION)
 # =============================================================================
@@ -169,6 +237,10 @@ class MarketScanner:
     - Paginates through ALL active markets (~4000+) using Gamma API
     - On-the-fly filtering to minimize RAM usage
     - Rate limiting (10 req/s safe for Gamma's 300 req/10s limit)
+    - Windowed mode: keeps `fetch_window` pages in flight under a token
+      bucket, still consuming pages strictly in offset order
+    - Incremental mode (sync_markets): persistent universe keyed by
+      conditionId, only changed markets are re-parsed and re-emitted
     - Memory efficient: processes and discards each batch immediately
     
     Target: Scan 100% of Polymarket with <50MB RAM overhead
@@ -183,26 +255,53 @@ class MarketScanner:
     # Pagination settings
     BATCH_SIZE = 100           # Markets per API call (Gamma max)
     REQUEST_DELAY = 0.1        # 100ms between requests (10 req/s)
-    MAX_RETRIES = 3            # Retries per failed request
     
-    def __init__(self):
-        self.client: Optional[httpx.AsyncClient] = None
+    def __init__(self, fetch_window: int = Config.FETCH_WINDOW,
+                 transport: Optional[HttpTransport] = None,
+                 evict_after: int = Config.SYNC_EVICT_SWEEPS):
+        # Shared pooled transport (Gamma budget, retries, keep-alive)
+        self.transport = transport
+        
+        # Concurrent pagination (1 = legacy sequential walk)
+        self.fetch_window = max(1, fetch_window)
         
         # Stats for logging
         self._total_scanned = 0
         self._total_filtered = 0
         self._total_accepted = 0
+        self._pages_fetched = 0
+        
+        # Persistent columnar universe for incremental sync
+        self._universe = MarketUniverse(capacity=Config.MAX_MARKETS_PER_CYCLE * 2)
+        self._fingerprints: Dict[str, tuple] = {}
+        
+        # Sweep number each market was last accepted in; a truncated sweep
+        # cannot prove a market is gone, so it must be missing from
+        # `evict_after` sweeps in a row
+        self.evict_after = max(1, evict_after)
+        self._sweep = 0
+        self._last_seen: Dict[str, int] = {}
+    
+    @property
+    def universe(self) -> MarketUniverse:
+        """Full view of all markets tracked by incremental sync."""
+        return self._universe
     
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(
-            timeout=30,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        )
+        if self.transport is None:
+            self.transport = get_transport()
+        self.transport.set_policy(Config.GAMMA_HOST, HostPolicy(
+            # Keep 20% headroom under Gamma's budget for retries
+            rate=int(Config.GAMMA_RATE_LIMIT * 0.8),
+            period=Config.GAMMA_RATE_PERIOD,
+            burst=self.fetch_window * 2,
+            max_connections=max(10, self.fetch_window),
+            max_keepalive=max(5, self.fetch_window),
+        ))
         return self
     
     async def __aexit__(self, *args):
-        if self.client:
-            await self.client.aclose()
+        pass  # The shared transport outlives the scanner
     
     async def get_active_markets(self, limit: int = 500) -> List[MarketData]:
         """
@@ -214,6 +313,9 @@ class MarketScanner:
         3. Parse only qualifying markets into MarketData
         4. Release memory after each batch
         
+        Pages are always consumed in offset order, so dedup, filtering and
+        the limit-based early stop behave identically in both fetch modes.
+        
         Args:
             limit: Maximum markets to return (default 500, 0 = unlimited)
         
@@ -222,98 +324,351 @@ class MarketScanner:
         """
         markets: List[MarketData] = []
         seen_ids: set = set()
-        offset = 0
         
         # Reset stats
         self._total_scanned = 0
         self._total_filtered = 0
         self._total_accepted = 0
+        self._pages_fetched = 0
+        scan_start = time.monotonic()
         
-        logger.info("🔍 Starting full market scan with pagination...")
+        logger.info(f"🔍 Starting full market scan (window={self.fetch_window})...")
+        pages = self._iter_pages()
         
-        while True:
-            # Fetch batch from Gamma API
-            batch = await self._fetch_batch(offset)
-            
-            # Stop if empty response (no more markets)
-            if not batch:
-                logger.debug(f"Empty batch at offset {offset}, stopping")
-                break
-            
-            batch_size = len(batch)
-            self._total_scanned += batch_size
-            
-            # Process batch on-the-fly
-            for raw_market in batch:
-                # Gamma uses conditionId, CLOB uses condition_id
-                cid = raw_market.get("conditionId") or raw_market.get("condition_id")
+        async with aclosing(pages):
+            async for batch in pages:
+                self._pages_fetched += 1
+                self._total_scanned += len(batch)
                 
-                # Skip if no condition ID
-                if not cid:
-                    self._total_filtered += 1
-                    continue
+                # Process batch on-the-fly
+                for raw_market in batch:
+                    # Gamma uses conditionId, CLOB uses condition_id
+                    cid = raw_market.get("conditionId") or raw_market.get("condition_id")
+                    
+                    # Skip if no condition ID
+                    if not cid:
+                        self._total_filtered += 1
+                        continue
+                    
+                    # Skip duplicates
+                    if cid in seen_ids:
+                        continue
+                    seen_ids.add(cid)
+                    
+                    # Quick filter (before expensive parsing)
+                    if not self._quick_filter(raw_market):
+                        self._total_filtered += 1
+                        continue
+                    
+                    # Parse to MarketData
+                    market_data = self._parse_market_sync(raw_market)
+                    if market_data:
+                        markets.append(market_data)
+                        self._total_accepted += 1
+                        
+                        # Check limit
+                        if limit > 0 and len(markets) >= limit:
+                            break
+                    else:
+                        # Failed parsing (e.g., invalid prices)
+                        self._total_filtered += 1
                 
-                # Skip duplicates
-                if cid in seen_ids:
-                    continue
-                seen_ids.add(cid)
+                # Log progress every 1000 markets
+                if self._total_scanned % 1000 == 0:
+                    logger.info(f"📊 Scanned {self._total_scanned} markets... "
+                               f"({self._total_accepted} accepted)")
                 
-                # Quick filter (before expensive parsing)
-                if not self._quick_filter(raw_market):
-                    self._total_filtered += 1
-                    continue
+                # Release batch memory
+                del batch
                 
-                # Parse to MarketData
-                market_data = self._parse_market_sync(raw_market)
-                if market_data:
-                    markets.append(market_data)
-                    self._total_accepted += 1
-                    
-                    # Check limit
-                    if limit > 0 and len(markets) >= limit:
-                        break
+                # Check if we hit limit (closing the iterator cancels in-flight pages)
+                if limit > 0 and len(markets) >= limit:
+                    break
+        
+        # Force garbage collection after full scan
+        gc.collect()
+        
+        # Final log
+        logger.info(f"✅ Scan complete: {self._total_accepted} actionable markets "
+                   f"out of {self._total_scanned} scanned "
+                   f"({self._total_filtered} filtered out, {self._pages_fetched} pages "
+                   f"in {time.monotonic() - scan_start:.1f}s)")
+        
+        return markets
+    
+    async def sync_markets(self, limit: int = 500, full: bool = False) -> MarketDelta:
+        """
+        Incrementally sync the persistent universe with Gamma.
+        
+        Pages are still fetched every cycle, but markets whose raw price,
+        volume, liquidity and end date are unchanged are not re-parsed.
+        Changed markets are written in place into the columnar universe,
+        so steady-state cycles allocate no MarketData objects at all;
+        hours_to_expiry is advanced for everyone in one vectorized pass.
+        
+        A Gamma server-side filter drops low-volume markets before they hit
+        the wire; when `limit` truncates the sweep, markets are ordered by
+        volume so the most liquid ones are kept. Markets past their end
+        date stay in while Gamma lists them as active (near-expiry markets
+        are what FlashSniper and Tail look for).
+        
+        Args:
+            limit: Maximum markets to track (0 = unlimited)
+            full: Emit every market as changed (periodic full resync)
+        
+        Returns:
+            MarketDelta with changed/removed markets and the full universe
+        """
+        delta = self.begin_sync(limit, full)
+        
+        pages = self._iter_pages(self.sync_params(limit))
+        async with aclosing(pages):
+            async for batch in pages:
+                self.ingest_page(batch, delta)
+                del batch
+                if delta.truncated:
+                    break
+        
+        self.finish_sync(delta)
+        return delta
+    
+    def sync_params(self, limit: int) -> Dict[str, Any]:
+        """Gamma server-side filters/ordering used by incremental sync."""
+        params: Dict[str, Any] = {"volume_num_min": self.MIN_VOLUME_24H}
+        if limit > 0:
+            params.update({"order": "volumeNum", "ascending": "false"})
+        return params
+    
+    def begin_sync(self, limit: int = 500, full: bool = False) -> MarketDelta:
+        """Start an incremental sync; feed pages with ingest_page()."""
+        self._total_scanned = 0
+        self._total_filtered = 0
+        self._total_accepted = 0
+        self._pages_fetched = 0
+        self._sweep += 1
+        
+        return MarketDelta(
+            universe=self._universe,
+            limit=limit,
+            full=full,
+            started_at=time.monotonic(),
+        )
+    
+    def ingest_page(self, batch: List[dict], delta: MarketDelta) -> List["MarketRow"]:
+        """
+        Merge one raw Gamma page into the universe.
+        
+        Args:
+            batch: Raw market dicts, in offset order
+            delta: Sync state from begin_sync()
+        
+        Returns:
+            Rows changed by this page (also appended to delta.changed)
+        """
+        changed: List[MarketRow] = []
+        self._pages_fetched += 1
+        self._total_scanned += len(batch)
+        
+        for raw_market in batch:
+            if delta.truncated:
+                break
+            
+            cid = raw_market.get("conditionId") or raw_market.get("condition_id")
+            if not cid:
+                self._total_filtered += 1
+                continue
+            
+            if cid in delta.seen_ids:
+                continue
+            delta.seen_ids.add(cid)
+            
+            if not self._quick_filter(raw_market):
+                self._total_filtered += 1
+                self._drop(cid, delta)
+                continue
+            
+            fingerprint = self._fingerprint(raw_market)
+            
+            if cid in self._universe and self._fingerprints.get(cid) == fingerprint:
+                # Unchanged: skip JSON decoding entirely
+                if delta.full:
+                    changed.append(self._universe[cid])
                 else:
-                    # Failed parsing (e.g., invalid prices)
+                    delta.unchanged += 1
+            else:
+                fields = self._parse_fields(raw_market)
+                if not fields:
                     self._total_filtered += 1
+                    self._drop(cid, delta)
+                    continue
+                del fields["condition_id"]
+                changed.append(self._universe.upsert(cid, **fields))
+                self._fingerprints[cid] = fingerprint
+            
+            self._last_seen[cid] = self._sweep
+            delta.accepted += 1
+            if delta.limit > 0 and delta.accepted >= delta.limit:
+                delta.complete = False
+        
+        delta.changed.extend(changed)
+        return changed
+    
+    def finish_sync(self, delta: MarketDelta) -> List["MarketRow"]:
+        """
+        Drop markets that left the universe and advance expiries.
+        
+        A complete sweep drops every market it did not see. A sweep cut
+        short at `limit` only drops markets not seen for `evict_after`
+        sweeps (closed, expired, or pushed out of the top `limit`).
+        
+        Markets whose raw data did not change but whose hours_to_expiry
+        just crossed one of Config.EXPIRY_RECHECK_HOURS are added to
+        delta.changed, so time-based strategy filters are re-checked
+        without waiting for a price move or a full resync.
+        
+        Returns:
+            Rows re-emitted for crossing an expiry threshold
+        """
+        stale_after = 1 if delta.complete else self.evict_after
+        for cid in [
+            c for c in self._universe
+            if self._sweep - self._last_seen.get(c, 0) >= stale_after
+        ]:
+            self._drop(cid, delta)
+        
+        # Advance the clock for unchanged markets (changed ones were just parsed)
+        crossed = self._universe.refresh_expiry(
+            datetime.now(timezone.utc), Config.EXPIRY_RECHECK_HOURS
+        )
+        emitted = {row.slot for row in delta.changed}
+        expiring = [row for row in self._universe.select(crossed) if row.slot not in emitted]
+        delta.changed.extend(expiring)
+        delta.unchanged -= sum(
+            self._last_seen.get(row.condition_id) == self._sweep for row in expiring
+        )
+        self._total_accepted = delta.accepted
+        delta.seen_ids = set()  # Release memory
+        
+        logger.info(f"✅ Sync complete: {len(delta.changed)} changed "
+                   f"({len(expiring)} near expiry), "
+                   f"{delta.unchanged} unchanged, {len(delta.removed)} removed "
+                   f"(universe {len(self._universe)}, {self._total_scanned} scanned "
+                   f"in {time.monotonic() - delta.started_at:.1f}s)")
+        return expiring
+    
+    def _drop(self, cid: str, delta: MarketDelta):
+        """Remove a market from the persistent universe."""
+        if self._universe.remove(cid):
+            self._fingerprints.pop(cid, None)
+            self._last_seen.pop(cid, None)
+            delta.removed.append(cid)
+    
+    @staticmethod
+    def _fingerprint(raw: dict) -> tuple:
+        """
+        Cheap change detector over the raw Gamma fields we derive data from.
+        
+        Uses the undecoded strings so unchanged markets never hit json.loads.
+        """
+        return (
+            raw.get("outcomePrices"),
+            raw.get("volume") or raw.get("volumeNum"),
+            raw.get("liquidity") or raw.get("liquidityNum"),
+            raw.get("endDate") or raw.get("end_date_iso") or raw.get("end_date"),
+        )
+    
+    def _iter_pages(self, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[List[dict]]:
+        """Pick the page iterator for the configured fetch mode."""
+        if self.fetch_window > 1:
+            return self._iter_pages_windowed(params)
+        return self._iter_pages_sequential(params)
+    
+    async def _iter_pages_sequential(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Walk Gamma pages one offset at a time (legacy mode).
+        
+        Yields:
+            Raw market batches in offset order
+        """
+        offset = 0
+        while True:
+            batch = await self._fetch_batch(offset, params)
             
-            # Log progress every 1000 markets
-            if self._total_scanned % 1000 == 0:
-                logger.info(f"📊 Scanned {self._total_scanned} markets... "
-                           f"({self._total_accepted} accepted)")
+            # Stop if empty response (no more markets)
+            if not batch:
+                logger.debug(f"Empty batch at offset {offset}, stopping")
+                return
             
-            # Release batch memory
-            del batch
+            yield batch
             
-            # Check if we hit limit
-            if limit > 0 and len(markets) >= limit:
-                break
+            # Safety check: if batch was smaller than BATCH_SIZE, we're at the end
+            if len(batch) < self.BATCH_SIZE:
+                return
             
             # Move to next page
             offset += self.BATCH_SIZE
             
             # Rate limiting - be nice to the API
             await asyncio.sleep(self.REQUEST_DELAY)
-            
-            # Safety check: if batch was smaller than BATCH_SIZE, we're at the end
-            if batch_size < self.BATCH_SIZE:
-                break
+    
+    async def _iter_pages_windowed(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Keep up to `fetch_window` page requests in flight and yield in order.
         
-        # Force garbage collection after full scan
-        gc.collect()
+        Requests are paced by the token bucket rather than a fixed sleep.
+        Once a short or empty page is seen, no further offsets are scheduled;
+        pages already in flight past the end are cancelled on exit.
         
-        # Final log
-        logger.info(f"✅ Scan complete: {self._total_accepted} actionable markets "
-                   f"out of {self._total_scanned} scanned "
-                   f"({self._total_filtered} filtered out)")
+        Yields:
+            Raw market batches in offset order
+        """
+        in_flight: Dict[int, asyncio.Task] = {}
+        next_offset = 0   # Next offset to schedule
+        yield_offset = 0  # Next offset the consumer expects
         
-        return markets
+        try:
+            while True:
+                # Top up the window
+                while len(in_flight) < self.fetch_window:
+                    in_flight[next_offset] = asyncio.create_task(
+                        self._fetch_batch(next_offset, params)
+                    )
+                    next_offset += self.BATCH_SIZE
+                
+                batch = await in_flight.pop(yield_offset)
+                
+                if not batch:
+                    logger.debug(f"Empty batch at offset {yield_offset}, stopping")
+                    return
+                
+                yield batch
+                
+                if len(batch) < self.BATCH_SIZE:
+                    return
+                
+                yield_offset += self.BATCH_SIZE
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight.values(), return_exceptions=True)
     
-    async def _fetch_batch(self, offset: int) -> List[dict]:
+    async def _fetch_batch(
+        self, offset: int, extra_params: Optional[Dict[str, Any]] = None
+    ) -> List[dict]:
         """
-        Fetch a single batch from Gamma API with retries.
+        Fetch a single batch from Gamma API.
+        
+        Rate budget, 429/5xx backoff and retries are handled by the
+        shared transport.
         
         Args:
             offset: Starting position for pagination
+            extra_params: Additional Gamma query filters/ordering
             
         Returns:
             List of raw market dicts, or empty list on failure
@@ -325,34 +680,28 @@ class MarketScanner:
             "active": "true",      # Only active markets
             "closed": "false",     # Not closed
         }
+        if extra_params:
+            params.update(extra_params)
         
-        for attempt in range(self.MAX_RETRIES):
+        try:
+            resp = await self.transport.get(url, params=params)
+        except Exception as e:
+            logger.debug(f"Error fetching batch at offset {offset}: {e}")
+            return []
+        
+        if resp.status_code == 200:
             try:
-                resp = await self.client.get(url, params=params)
-                
-                if resp.status_code == 200:
-                    data = resp.json()
-                    # Gamma returns list directly, not wrapped in "data"
-                    return data if isinstance(data, list) else data.get("data", [])
-                
-                elif resp.status_code == 429:
-                    # Rate limited - back off
-                    wait_time = 2 ** attempt
-                    logger.warning(f"⚠️ Rate limited at offset {offset}, "
-                                  f"waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    
-                else:
-                    logger.debug(f"API error {resp.status_code} at offset {offset}")
-                    
-            except httpx.TimeoutException:
-                logger.debug(f"Timeout at offset {offset}, retry {attempt + 1}")
-                await asyncio.sleep(1)
-                
+                data = json_codec.loads(resp.content)
+                # Gamma returns list directly, not wrapped in "data"
+                return data if isinstance(data, list) else data.get("data", [])
             except Exception as e:
-                logger.debug(f"Error fetching batch at offset {offset}: {e}")
-                await asyncio.sleep(0.5)
-        
+                logger.debug(f"Bad batch body at offset {offset}: {e}")
+                return []
+
+        if resp.status_code == 429:
+            logger.warning(f"⚠️ Rate limited at offset {offset} (retries exhausted)")
+        else:
+            logger.debug(f"API error {resp.status_code} at offset {offset}")
         return []
     
     def _quick_filter(self, raw: dict) -> bool:
@@ -420,6 +769,22 @@ class MarketScanner:
         Handles both Gamma API format (strings) and CLOB format (objects).
         Extracts only essential fields to minimize memory.
         """
+        fields = self._parse_fields(raw)
+        if not fields:
+            return None
+        
+        return MarketData(
+            **fields,
+            competitor_prices={},  # Fetched on-demand by ArbitrageStrategy
+            raw_data=None  # Don't store raw data - saves RAM!
+        )
+    
+    def _parse_fields(self, raw: dict) -> Optional[Dict[str, Any]]:
+        """
+        Extract MarketData fields from a raw market without building an object.
+        
+        Shared by the MarketData path and the columnar universe upsert.
+        """
         try:
             # Gamma uses conditionId, CLOB uses condition_id
             cid = raw.get("conditionId") or raw.get("condition_id")
@@ -439,14 +804,11 @@ class MarketScanner:
             
             if outcome_prices and outcomes:
                 try:
-                    # Parse JSON strings
-                    if isinstance(outcome_prices, str):
-                        prices_list = json.loads(outcome_prices)
-                    else:
-                        prices_list = outcome_prices
+                    # Parse JSON strings (outcomes repeat across markets: cached)
+                    prices_list = json_codec.decode_str_array(outcome_prices)
                     
                     if isinstance(outcomes, str):
-                        outcomes_list = json.loads(outcomes)
+                        outcomes_list = json_codec.cached_str_array(outcomes)
                     else:
                         outcomes_list = outcomes
                     
@@ -458,7 +820,7 @@ class MarketScanner:
                                 yes_price = price
                             elif outcome.upper() == "NO":
                                 no_price = price
-                except (json.JSONDecodeError, ValueError, IndexError):
+                except (json_codec.JSONDecodeError, ValueError, IndexError):
                     pass
             
             # Fallback to CLOB format (tokens array)
@@ -481,10 +843,7 @@ class MarketScanner:
                 clob_token_ids = raw.get("clobTokenIds")
                 if clob_token_ids:
                     try:
-                        if isinstance(clob_token_ids, str):
-                            token_ids = json.loads(clob_token_ids)
-                        else:
-                            token_ids = clob_token_ids
+                        token_ids = json_codec.decode_str_array(clob_token_ids)
                         if token_ids:
                             token_id = token_ids[0]  # First token is YES
                     except:
@@ -500,6 +859,7 @@ class MarketScanner:
             
             # Parse end date (Gamma uses endDate or endDateIso)
             hours_to_expiry = None
+            end_dt = None
             end_date = raw.get("endDate") or raw.get("end_date_iso") or raw.get("end_date")
             if end_date:
                 try:
@@ -511,7 +871,7 @@ class MarketScanner:
                             end_dt = datetime.fromisoformat(end_date + "T23:59:59+00:00")
                         hours_to_expiry = max(0, (end_dt - datetime.now(end_dt.tzinfo)).total_seconds() / 3600)
                 except:
-                    pass
+                    end_dt = None
             
             # Get volume (handle string format)
             volume = 0.0
@@ -521,7 +881,7 @@ class MarketScanner:
             except:
                 pass
             
-            return MarketData(
+            return dict(
                 condition_id=cid,
                 question=question,
                 token_id=token_id,
@@ -533,9 +893,8 @@ class MarketScanner:
                 mid_price=mid_price,
                 spread_bps=spread_bps,
                 volume_24h=volume,
+                end_date=end_dt,
                 hours_to_expiry=hours_to_expiry,
-                competitor_prices={},  # Fetched on-demand by ArbitrageStrategy
-                raw_data=None  # Don't store raw data - saves RAM!
             )
             
         except Exception as e:
@@ -553,57 +912,82 @@ class MarketScanner:
 
 class SignalRecorder:
     """
-    Records signals to database and JSON backup.
+    Records signals to database and an append-only JSONL journal.
     Thread-safe for async usage.
+    
+    Journal writes are buffered and flushed by size/age (see SignalJournal);
+    DB writes go through a TradeWriter, so signals recorded concurrently
+    share one bulk-insert transaction. Stats are kept incrementally for
+    the current UTC day.
     """
     
-    def __init__(self):
-        self._signals_today: List[dict] = []
+    def __init__(self, journal: Optional[SignalJournal] = None):
+        self.journal = journal or SignalJournal(
+            Config.SIGNALS_DIR,
+            flush_size=Config.SIGNAL_FLUSH_SIZE,
+            flush_interval=Config.SIGNAL_FLUSH_INTERVAL,
+        )
+        self.trade_writer = TradeWriter(
+            batch_size=Config.DB_BATCH_SIZE,
+            linger=Config.DB_BATCH_LINGER,
+        ) if DB_AVAILABLE else None
+        self._stats_day = None
+        self._reset_stats()
         self._load_existing()
     
+    def _reset_stats(self):
+        self._stats_day = datetime.now(timezone.utc).date()
+        self._total_signals = 0
+        self._total_stake = 0.0
+        self._by_strategy: Dict[str, Dict[str, float]] = {}
+    
     def _load_existing(self):
-        """Load existing signals from JSON."""
-        if Config.SIGNALS_FILE.exists():
-            try:
-                self._signals_today = json.loads(Config.SIGNALS_FILE.read_text())
-            except:
-                self._signals_today = []
+        """Seed today's stats from the journal (streamed, not kept in memory)."""
+        try:
+            for signal_dict in self.journal.read_day(self._stats_day):
+                self._count(signal_dict)
+        except Exception as e:
+            logger.error(f"Journal load error: {e}")
+    
+    def _count(self, signal_dict: dict):
+        sid = signal_dict.get("strategy_id", "unknown")
+        stake = signal_dict.get("stake", 0) or 0
+        
+        entry = self._by_strategy.get(sid)
+        if entry is None:
+            entry = self._by_strategy[sid] = {"count": 0, "stake": 0}
+        entry["count"] += 1
+        entry["stake"] += stake
+        self._total_signals += 1
+        self._total_stake += stake
     
     async def record(self, signal: TradeSignal) -> str:
         """
-        Record a signal to database and JSON (async-safe).
+        Record a signal to database and journal (async-safe).
         
-        Uses asyncio.to_thread() to run sync DB operations in a thread pool,
-        avoiding greenlet/async conflicts.
+        The DB inserts (the trade and a MarketSnapshot of its market) are
+        batched by the TradeWriter (sync SQLAlchemy runs in a worker
+        thread, avoiding greenlet/async conflicts). Awaiting record() for
+        several signals concurrently lets them share one transaction.
         
         Returns:
             Trade ID
         """
-        trade_id = f"{signal.strategy_id}-{int(datetime.utcnow().timestamp())}"
-        
-        # Save to database (run sync function in thread pool)
-        if DB_AVAILABLE:
-            try:
-                # Run sync record_trade in a thread to avoid greenlet issues
-                trade = await asyncio.to_thread(
-                    record_trade,
-                    strategy_id=signal.strategy_id,
-                    condition_id=signal.condition_id,
-                    outcome=signal.outcome,
-                    entry_price=signal.entry_price,
-                    stake=signal.stake,
-                    snapshot_data=signal.snapshot_data or {},
-                    signal_data=signal.signal_data or {},
-                    paper_mode=True,
-                    token_id=signal.token_id,
-                    question=signal.question
-                )
-                trade_id = trade.trade_id
-                logger.debug(f"Trade saved to DB: {trade_id}")
-            except Exception as e:
-                logger.error(f"DB record error: {e}")
-        
-        # Save to JSON backup (sync, but fast)
+        trade_id, _ = await asyncio.gather(self.record_db(
+            strategy_id=signal.strategy_id,
+            condition_id=signal.condition_id,
+            outcome=signal.outcome,
+            entry_price=signal.entry_price,
+            stake=signal.stake,
+            snapshot_data=signal.snapshot_data or {},
+            signal_data=signal.signal_data or {},
+            paper_mode=True,
+            token_id=signal.token_id,
+            question=signal.question
+        ), self.record_snapshot_db(signal.snapshot_data))
+        trade_id = trade_id or f"{signal.strategy_id}-{int(datetime.utcnow().timestamp())}"
+        
+        # Save to journal (buffered; written off the event loop)
         signal_dict = {
             "trade_id": trade_id,
             "strategy_id": signal.strategy_id,
@@ -620,38 +1004,223 @@ class SignalRecorder:
             "snapshot_data": signal.snapshot_data,
         }
         
-        self._signals_today.append(signal_dict)
-        self._save_json()
+        await self.append(signal_dict)
         
         return trade_id
     
-    def _save_json(self):
-        """Save signals to JSON file."""
+    async def record_db(self, **trade_fields) -> Optional[str]:
+        """Insert a trade through the batched writer; None if the DB is unavailable."""
+        if self.trade_writer is None:
+            return None
+        try:
+            trade_id = await self.trade_writer.record_trade(**trade_fields)
+            logger.debug(f"Trade saved to DB: {trade_id}")
+            return trade_id
+        except Exception as e:
+            logger.error(f"DB record error: {e}")
+            return None
+    
+    async def record_snapshot_db(self, snapshot: Optional[Dict[str, Any]]):
+        """Insert a MarketSnapshot through the batched writer (skipped without a market)."""
+        if self.trade_writer is None or not snapshot or not snapshot.get("condition_id"):
+            return
         try:
-            Config.SIGNALS_FILE.write_text(
-                json.dumps(self._signals_today, indent=2, default=str)
-            )
+            await self.trade_writer.record_snapshot(snapshot)
         except Exception as e:
-            logger.error(f"JSON save error: {e}")
+            logger.error(f"DB snapshot error: {e}")
+    
+    async def append(self, signal_dict: dict):
+        """Journal an already-built signal dict and update stats."""
+        if datetime.now(timezone.utc).date() != self._stats_day:
+            self._reset_stats()  # Daily rotation
+        
+        self.journal.append(signal_dict)
+        self._count(signal_dict)
+        await self.journal.maybe_flush()
+    
+    async def start(self):
+        if self.trade_writer:
+            await self.trade_writer.start()
+    
+    async def close(self):
+        """Commit queued trades and flush buffered signals."""
+        if self.trade_writer:
+            await self.trade_writer.close()
+        await self.journal.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get signal statistics for the current day."""
+        return {
+            "total_signals": self._total_signals,
+            "by_strategy": {sid: dict(s) for sid, s in self._by_strategy.items()},
+            "total_stake": self._total_stake,
+            "journal": self.journal.get_stats(),
+            "db_writer": self.trade_writer.get_stats() if self.trade_writer else None,
+        }
+
+# =============================================================================
+# CYCLE PIPELINE
+# =============================================================================
+
+_END_OF_STREAM = object()
+
+@dataclass
+class StageStats:
+    """Per-stage counters for one pipelined cycle."""
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0  # Depth of this stage's output queue
+    
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "busy_s": round(self.busy_seconds, 3),
+            "throughput_per_s": round(self.items / elapsed, 1) if elapsed > 0 else 0.0,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+class CyclePipeline:
+    """
+    Staged asyncio pipeline for one cycle:
+    
+        fetch (pages) -> parse (changed rows) -> evaluate (signals) -> record
+    
+    Stages are connected by bounded queues, so strategies see the first
+    page's changed markets while later pages are still in flight, and slow
+    DB writes back up the record queue instead of stalling evaluation.
+    Evaluation is chunked per page but shares one admission budget cycle.
+    """
+    
+    def __init__(self, scanner: MarketScanner, registry, record_signal):
+        self.scanner = scanner
+        self.registry = registry
+        self.record_signal = record_signal
+        
+        self.stages = {name: StageStats(name) for name in ("fetch", "parse", "evaluate", "record")}
+        self.first_signal_latency: Optional[float] = None
+        self._started_at = 0.0
+    
+    async def run(self, limit: int, full: bool = False) -> MarketDelta:
+        """Run all stages to completion and return the sync delta."""
+        self._started_at = time.monotonic()
+        
+        pages_q: asyncio.Queue = asyncio.Queue(maxsize=Config.PIPELINE_PAGE_QUEUE)
+        rows_q: asyncio.Queue = asyncio.Queue(maxsize=Config.PIPELINE_EVAL_QUEUE)
+        signals_q: asyncio.Queue = asyncio.Queue(maxsize=Config.PIPELINE_SIGNAL_QUEUE)
+        
+        delta = self.scanner.begin_sync(limit, full)
+        
+        async with asyncio.TaskGroup() as tg:
+            fetch_task = tg.create_task(self._fetch(pages_q, self.scanner.sync_params(limit)))
+            tg.create_task(self._parse(pages_q, rows_q, delta, fetch_task))
+            tg.create_task(self._evaluate(rows_q, signals_q, delta))
+            tg.create_task(self._record(signals_q))
+        
+        return delta
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get signal statistics."""
-        stats = {
-            "total_signals": len(self._signals_today),
-            "by_strategy": {},
-            "total_stake": 0,
+        elapsed = time.monotonic() - self._started_at
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "first_signal_latency_s": (
+                round(self.first_signal_latency, 3)
+                if self.first_signal_latency is not None else None
+            ),
+            "stages": {name: st.to_dict(elapsed) for name, st in self.stages.items()},
         }
+    
+    async def _put(self, queue: asyncio.Queue, item, stats: StageStats):
+        await queue.put(item)
+        stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize())
+    
+    async def _fetch(self, pages_q: asyncio.Queue, params: Dict[str, Any]):
+        stats = self.stages["fetch"]
+        pages = self.scanner._iter_pages(params)
+        async with aclosing(pages):
+            async for batch in pages:
+                stats.items += 1
+                await self._put(pages_q, batch, stats)
+        await pages_q.put(_END_OF_STREAM)
+    
+    async def _parse(self, pages_q: asyncio.Queue, rows_q: asyncio.Queue,
+                     delta: MarketDelta, fetch_task: asyncio.Task):
+        stats = self.stages["parse"]
+        while True:
+            batch = await pages_q.get()
+            if batch is _END_OF_STREAM:
+                break
+            
+            start = time.perf_counter()
+            rows = self.scanner.ingest_page(batch, delta)
+            stats.busy_seconds += time.perf_counter() - start
+            stats.items += len(rows)
+            del batch
+            
+            if rows:
+                await self._put(rows_q, rows, stats)
+            
+            if delta.truncated:
+                # Limit reached: cancelling fetch closes the page window
+                fetch_task.cancel()
+                break
+        
+        expiring = self.scanner.finish_sync(delta)
+        await self.registry.notify_universe(delta.universe, delta.removed)
+        if expiring:
+            await self._put(rows_q, expiring, stats)
+        await rows_q.put(_END_OF_STREAM)
+    
+    async def _evaluate(self, rows_q: asyncio.Queue, signals_q: asyncio.Queue,
+                        delta: MarketDelta):
+        stats = self.stages["evaluate"]
+        universe = delta.universe
+        new_cycle = True
         
-        for s in self._signals_today:
-            sid = s.get("strategy_id", "unknown")
-            if sid not in stats["by_strategy"]:
-                stats["by_strategy"][sid] = {"count": 0, "stake": 0}
+        while True:
+            rows = await rows_q.get()
+            if rows is _END_OF_STREAM:
+                break
+            
+            start = time.perf_counter()
+            # Filter just this chunk: batch masks are per-row, so scanning
+            # the whole universe per page would repeat the work N times
+            signals = await self.registry.process_batch(
+                universe.slice(rows), new_cycle=new_cycle
+            )
+            stats.busy_seconds += time.perf_counter() - start
+            stats.items += len(rows)
+            new_cycle = False
             
-            stats["by_strategy"][sid]["count"] += 1
-            stats["by_strategy"][sid]["stake"] += s.get("stake", 0)
-            stats["total_stake"] += s.get("stake", 0)
+            for sig in signals:
+                if self.first_signal_latency is None:
+                    self.first_signal_latency = time.monotonic() - self._started_at
+                await self._put(signals_q, sig, stats)
+        
+        if new_cycle:
+            # Nothing changed: still give deferred backlogs their budget
+            for sig in await self.registry.process_batch(universe.slice([])):
+                await self._put(signals_q, sig, stats)
         
-        return stats
+        await signals_q.put(_END_OF_STREAM)
+    
+    async def _record(self, signals_q: asyncio.Queue):
+        stats = self.stages["record"]
+        done = False
+        while not done:
+            # Record everything already queued together: concurrent
+            # records share one DB transaction in the TradeWriter
+            batch = [await signals_q.get()]
+            while not signals_q.empty():
+                batch.append(signals_q.get_nowait())
+            if batch[-1] is _END_OF_STREAM:
+                batch.pop()
+                done = True
+            
+            start = time.perf_counter()
+            await asyncio.gather(*(self.record_signal(signal) for signal in batch))
+            stats.busy_seconds += time.perf_counter() - start
+            stats.items += len(batch)
 
 # =============================================================================
 # ORCHESTRATOR
@@ -662,16 +1231,25 @@ class MultiStrategyOrchestrator:
     Main orchestrator that coordinates all components.
     
     Flow:
-    1. Scanner fetches market data
+    1. Scanner syncs market data (only changed markets are re-emitted)
     2. ARB batch scan runs first (efficient cross-exchange matching)
-    3. Other strategies process per-market
+    3. Strategies evaluate the cycle as one batch (vectorized pre-filters)
     4. Signals are recorded immediately
     5. Stats are updated
     6. ORACLE monitors esports independently
     """
     
-    def __init__(self, paper_mode: bool = True):
+    def __init__(
+        self,
+        paper_mode: bool = True,
+        fetch_window: int = Config.FETCH_WINDOW,
+        incremental: bool = Config.INCREMENTAL_SYNC,
+        pipelined: bool = Config.PIPELINE_ENABLED,
+    ):
         self.paper_mode = paper_mode
+        self.fetch_window = fetch_window
+        self.incremental = incremental
+        self.pipelined = pipelined and incremental
         self.scanner: Optional[MarketScanner] = None
         self.recorder = SignalRecorder()
         
@@ -691,6 +1269,7 @@ class MultiStrategyOrchestrator:
         self.stats = {
             "cycles": 0,
             "markets_scanned": 0,
+            "markets_changed": 0,
             "signals_generated": 0,
             "arb_signals": 0,
             "errors": 0,
@@ -698,9 +1277,12 @@ class MultiStrategyOrchestrator:
     
     async def __aenter__(self):
         # Initialize scanner (no PredictBase dependency)
-        self.scanner = MarketScanner()
+        self.scanner = MarketScanner(fetch_window=self.fetch_window)
         await self.scanner.__aenter__()
         
+        # Start the batched DB writer
+        await self.recorder.start()
+        
         # Register strategies
         self._register_strategies()
         
@@ -720,6 +1302,9 @@ class MultiStrategyOrchestrator:
         
         if self.scanner:
             await self.scanner.__aexit__(*args)
+        
+        await self.recorder.close()
+        await close_transport()
     
     async def _init_oracle(self):
         """
@@ -784,27 +1369,22 @@ class MultiStrategyOrchestrator:
                 "snapshot_data": {},
             }
             
-            # Save to JSON backup
-            self.recorder._signals_today.append(signal_dict)
-            self.recorder._save_json()
+            # Save to journal
+            await self.recorder.append(signal_dict)
             
-            # Save to database if available
-            if DB_AVAILABLE:
-                try:
-                    record_trade(
-                        strategy_id="ORACLE",
-                        condition_id=oracle_signal.market_condition_id,
-                        outcome=oracle_signal.recommended_side,
-                        entry_price=oracle_signal.current_price,
-                        stake=oracle_signal.stake_usdc,
-                        snapshot_data={},
-                        signal_data=signal_dict["signal_data"],
-                        paper_mode=self.paper_mode,
-                        token_id=oracle_signal.token_id,
-                        question=oracle_signal.market_question,
-                    )
-                except Exception as e:
-                    logger.error(f"DB error recording ORACLE signal: {e}")
+            # Save to database if available (batched writer)
+            await self.recorder.record_db(
+                strategy_id="ORACLE",
+                condition_id=oracle_signal.market_condition_id,
+                outcome=oracle_signal.recommended_side,
+                entry_price=oracle_signal.current_price,
+                stake=oracle_signal.stake_usdc,
+                snapshot_data={},
+                signal_data=signal_dict["signal_data"],
+                paper_mode=self.paper_mode,
+                token_id=oracle_signal.token_id,
+                question=oracle_signal.market_question,
+            )
             
             self.stats["signals_generated"] += 1
             
@@ -859,6 +1439,8 @@ class MultiStrategyOrchestrator:
         ]
         
         for s in strategies:
+            s._admission.max_markets = Config.STRATEGY_EVAL_BUDGET_MARKETS
+            s._admission.cpu_budget_ms = Config.STRATEGY_EVAL_BUDGET_CPU_MS
             strategy_registry.register(s)
             s._is_running = True
             logger.info(f"   📊 {s.strategy_id}: {s.get_config()}")
@@ -884,6 +1466,44 @@ class MultiStrategyOrchestrator:
             logger.debug(f"Internal ARB check error: {e}")
             return None
     
+    async def _record_signal(self, signal: TradeSignal, results: Dict[str, Any]):
+        """Record one BUY signal and append it to the cycle results."""
+        try:
+            if signal and signal.signal_type == SignalType.BUY:
+                # Record signal (async to avoid greenlet issues)
+                trade_id = await self.recorder.record(signal)
+                
+                results["signals"].append({
+                    "trade_id": trade_id,
+                    "strategy": signal.strategy_id,
+                    "question": signal.question[:50],
+                    "price": signal.entry_price,
+                    "stake": signal.stake,
+                })
+                
+                self.stats["signals_generated"] += 1
+                
+                # Special log for Internal ARB
+                if signal.strategy_id == "ARB_INTERNAL_V1":
+                    roi_pct = signal.signal_data.get("roi_pct", 0) if signal.signal_data else 0
+                    logger.info(
+                        f"🎯 INTERNAL ARB [{signal.strategy_id}] "
+                        f"Cost: ${signal.entry_price:.4f} | "
+                        f"ROI: {roi_pct:.2f}% | "
+                        f"{signal.question[:40]}..."
+                    )
+                else:
+                    logger.info(
+                        f"✅ SIGNAL [{signal.strategy_id}] "
+                        f"${signal.entry_price:.4f} | "
+                        f"EV: ${signal.expected_value:+.2f} | "
+                        f"{signal.question[:40]}..."
+                    )
+        
+        except Exception as e:
+            results["errors"].append(str(e))
+            logger.debug(f"Signal recording error: {e}")
+    
     async def run_cycle(self) -> Dict[str, Any]:
         """
         Run a single scanning and processing cycle.
@@ -901,70 +1521,87 @@ class MultiStrategyOrchestrator:
         results = {
             "cycle": self._cycle_count,
             "markets_scanned": 0,
+            "markets_changed": 0,
+            "universe_size": 0,
             "signals": [],
             "errors": [],
         }
         
         try:
             # 1. Fetch markets
-            markets = await self.scanner.get_active_markets(limit=Config.MAX_MARKETS_PER_CYCLE)
-            results["markets_scanned"] = len(markets)
-            self.stats["markets_scanned"] += len(markets)
+            if self.pipelined:
+                # Fetch, parse, evaluate and record overlap; signals are
+                # recorded as they are produced
+                pipeline = CyclePipeline(
+                    self.scanner,
+                    strategy_registry,
+                    lambda sig: self._record_signal(sig, results),
+                )
+                delta = await pipeline.run(
+                    limit=Config.MAX_MARKETS_PER_CYCLE,
+                    full=self._cycle_count % Config.FULL_RESYNC_CYCLES == 0,
+                )
+                universe = delta.universe
+                candidates = None
+                changed = len(delta.changed)
+                results["pipeline"] = pipeline.get_stats()
+            elif self.incremental:
+                # Only changed markets are evaluated; full universe goes to hooks
+                delta = await self.scanner.sync_markets(
+                    limit=Config.MAX_MARKETS_PER_CYCLE,
+                    full=self._cycle_count % Config.FULL_RESYNC_CYCLES == 0,
+                )
+                universe = delta.universe
+                candidates = universe.mask_for(delta.changed)
+                changed = len(delta.changed)
+                await strategy_registry.notify_universe(universe, delta.removed)
+            else:
+                markets = await self.scanner.get_active_markets(limit=Config.MAX_MARKETS_PER_CYCLE)
+                universe = MarketUniverse.from_markets(markets)
+                candidates = None
+                changed = len(markets)
             
-            # 2. Process each market through ALL strategies (including Internal ARB)
-            for market in markets:
-                try:
-                    # All strategies process via registry (Internal ARB included)
-                    signals = await strategy_registry.process_all(market)
-                    
-                    for signal in signals:
-                        if signal and signal.signal_type == SignalType.BUY:
-                            # Record signal (async to avoid greenlet issues)
-                            trade_id = await self.recorder.record(signal)
-                            
-                            results["signals"].append({
-                                "trade_id": trade_id,
-                                "strategy": signal.strategy_id,
-                                "question": signal.question[:50],
-                                "price": signal.entry_price,
-                                "stake": signal.stake,
-                            })
-                            
-                            self.stats["signals_generated"] += 1
-                            
-                            # Special log for Internal ARB
-                            if signal.strategy_id == "ARB_INTERNAL_V1":
-                                roi_pct = signal.signal_data.get("roi_pct", 0) if signal.signal_data else 0
-                                logger.info(
-                                    f"🎯 INTERNAL ARB [{signal.strategy_id}] "
-                                    f"Cost: ${signal.entry_price:.4f} | "
-                                    f"ROI: {roi_pct:.2f}% | "
-                                    f"{signal.question[:40]}..."
-                                )
-                            else:
-                                logger.info(
-                                    f"✅ SIGNAL [{signal.strategy_id}] "
-                                    f"${signal.entry_price:.4f} | "
-                                    f"EV: ${signal.expected_value:+.2f} | "
-                                    f"{signal.question[:40]}..."
-                                )
-                    
-                except Exception as e:
-                    results["errors"].append(str(e))
-                    logger.debug(f"Market processing error: {e}")
+            results["markets_scanned"] = len(universe)
+            results["universe_size"] = len(universe)
+            results["markets_changed"] = changed
+            self.stats["markets_scanned"] += len(universe)
+            self.stats["markets_changed"] += changed
+            
+            if not self.pipelined:
+                # 2. Evaluate the batch through ALL strategies (one call per strategy)
+                signals = await strategy_registry.process_batch(universe, candidates)
+                
+                # 3. Record signals (concurrently: one DB batch per cycle)
+                await asyncio.gather(*(self._record_signal(s, results) for s in signals))
             
             # 4. Log cycle summary
             duration = (datetime.utcnow() - cycle_start).total_seconds()
             
             logger.info("-" * 40)
             logger.info(f"📊 Cycle Summary:")
-            logger.info(f"   Markets: {results['markets_scanned']}")
+            logger.info(f"   Markets: {results['markets_scanned']} "
+                       f"({results['markets_changed']} changed)")
             logger.info(f"   Signals: {len(results['signals'])}")
             logger.info(f"   Duration: {duration:.1f}s")
             
+            if "pipeline" in results:
+                pipe = results["pipeline"]
+                first = pipe["first_signal_latency_s"]
+                logger.info(f"   Pipeline: first signal "
+                           f"{f'{first:.2f}s' if first is not None else 'n/a'}")
+                for name, st in pipe["stages"].items():
+                    logger.info(f"      {name}: {st['items']} items, "
+                               f"{st['throughput_per_s']}/s, busy {st['busy_s']}s, "
+                               f"max queue {st['max_queue_depth']}")
+            
             # Strategy stats
             for sid, stats in strategy_registry.get_all_stats().items():
-                logger.info(f"   {sid}: {stats['signals_generated']} signals, {stats['trades_today']} today")
+                admission = stats.get("admission", {})
+                logger.info(f"   {sid}: {stats['signals_generated']} signals, "
+                           f"{stats['trades_today']} today | "
+                           f"evaluated {admission.get('last_cycle_evaluated', 0)}, "
+                           f"backlog {admission.get('backlog', 0)}, "
+                           f"dropped {admission.get('dropped', 0)}")
             
         except Exception as e:
             self.stats["errors"] += 1
@@ -993,6 +1630,8 @@ class MultiStrategyOrchestrator:
         logger.info("=" * 60)
         logger.info(f"   Paper Mode: {self.paper_mode}")
         logger.info(f"   Interval: {interval_seconds}s")
+        logger.info(f"   Sync: {'incremental' if self.incremental else 'full rescan'}"
+                   f"{' (pipelined)' if self.pipelined else ''}")
         logger.info(f"   Strategies: {len(strategy_registry.get_all())}")
         logger.info(f"   Database: {'✅' if DB_AVAILABLE else '❌'}")
         logger.info(f"   Internal ARB: {'✅' if self._internal_arb_strategy else '❌'}")
@@ -1069,6 +1708,12 @@ async def main():
     parser.add_argument("--interval", "-i", type=int, default=60, help="Interval (seconds)")
     parser.add_argument("--live", action="store_true", help="Live mode (DANGEROUS)")
     parser.add_argument("--init-db", action="store_true", help="Initialize database")
+    parser.add_argument("--fetch-window", type=int, default=Config.FETCH_WINDOW,
+                        help="Gamma pages in flight per scan (1 = sequential)")
+    parser.add_argument("--full-rescan", action="store_true",
+                        help="Re-parse and re-evaluate every market each cycle")
+    parser.add_argument("--no-pipeline", action="store_true",
+                        help="Run fetch, evaluate and record one after another")
     
     args = parser.parse_args()
     
@@ -1084,7 +1729,12 @@ async def main():
     # Run orchestrator
     paper_mode = not args.live
     
-    async with MultiStrategyOrchestrator(paper_mode=paper_mode) as orchestrator:
+    async with MultiStrategyOrchestrator(
+        paper_mode=paper_mode,
+        fetch_window=args.fetch_window,
+        incremental=not args.full_rescan,
+        pipelined=not args.no_pipeline,
+    ) as orchestrator:
         if args.daemon:
             await orchestrator.run_daemon(interval_seconds=args.interval)
         else:
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+from src.data.keyword_matcher import get_keyword_matcher
+
 try:
     import xgboost as xgb
     XGBOOST_AVAILABLE = True
@@ -94,14 +96,11 @@ class TailFeatureEngineer:
     @staticmethod
     def detect_category(question: str) -> Dict[str, int]:
         """Detect market category from question"""
-        q = question.lower()
+        hits = get_keyword_matcher().scan(question)
         
         return {
-            "is_political": 1 if any(kw in q for kw in TailFeatureEngineer.POLITICAL_KEYWORDS) else 0,
-            "is_crypto": 1 if any(kw in q for kw in TailFeatureEngineer.CRYPTO_KEYWORDS) else 0,
-            "is_sports": 1 if any(kw in q for kw in TailFeatureEngineer.SPORTS_KEYWORDS) else 0,
-            "is_finance": 1 if any(kw in q for kw in TailFeatureEngineer.FINANCE_KEYWORDS) else 0,
-            "is_tech": 1 if any(kw in q for kw in TailFeatureEngineer.TECH_KEYWORDS) else 0,
+            feature: 1 if group in hits else 0
+            for feature, group in _CATEGORY_GROUPS.items()
         }
     
     @staticmethod
@@ -156,6 +155,19 @@ class TailFeatureEngineer:
         )
 
 
+# Feature name -> keyword matcher group (one scan answers all five)
+_CATEGORY_GROUPS = {
+    feature: get_keyword_matcher().add_group(f"tail_scorer.{feature}", keywords)
+    for feature, keywords in (
+        ("is_political", TailFeatureEngineer.POLITICAL_KEYWORDS),
+        ("is_crypto", TailFeatureEngineer.CRYPTO_KEYWORDS),
+        ("is_sports", TailFeatureEngineer.SPORTS_KEYWORDS),
+        ("is_finance", TailFeatureEngineer.FINANCE_KEYWORDS),
+        ("is_tech", TailFeatureEngineer.TECH_KEYWORDS),
+    )
+}
+
+
 @dataclass
 class TailScoreResult:
     """Result of tail scoring"""
@@ -100,9 +100,15 @@ RETRY_DELAY_SECONDS = 1.0
 RETRY_BACKOFF_MULTIPLIER = 2.0
 
 # WebSocket Configuration
-WS_RECONNECT_DELAY_SECONDS = 5.0
+WS_RECONNECT_DELAY_SECONDS = 1.0  # First reconnect backoff; doubles per failure
+WS_RECONNECT_MAX_DELAY_SECONDS = 60.0
 WS_PING_INTERVAL_SECONDS = 30.0
 WS_PING_TIMEOUT_SECONDS = 10.0
+WS_MAX_TOKENS_PER_CONNECTION = 500  # Tokens per socket before opening another
+WS_SUBSCRIBE_BATCH_SIZE = 100  # Tokens per subscribe/unsubscribe frame
+WS_RESYNC_CONCURRENCY = 8  # Parallel REST /book snapshot fetches
+WS_RESYNC_GRACE_SECONDS = 2.0  # Wait for socket snapshots before REST resync
+WS_CALLBACK_QUEUE_SIZE = 10000  # Coalesced book updates queued per callback
 
 # Logging
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
@@ -0,0 +1,216 @@
+"""
+Size- and TTL-bounded cache.
+
+Long-lived per-market structures (dedup sets, price buffers, cooldowns,
+negative lookups) used to be plain dicts and sets that only shrank when
+someone remembered to prune them. BoundedCache is a drop-in mapping with
+hard limits:
+
+    seen = BoundedCache(maxsize=50_000, ttl=86400)   # set-like
+    seen.add(condition_id)
+    condition_id in seen
+
+    buffers = BoundedCache(maxsize=20_000, ttl=86400, sliding=True)
+    buf = buffers.get_or_create(condition_id, PriceBuffer)
+
+- O(1) get/set/contains/delete (OrderedDict in LRU order)
+- maxsize: least recently used entries are evicted first
+- ttl: entries expire ttl seconds after they were set (sliding=True:
+  after they were last used); expired entries read as missing
+- Hit/miss/eviction/expiration counters and an approximate memory
+  footprint in get_stats()
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """
+    LRU mapping with an entry limit and optional per-entry TTL.
+
+    Parameters:
+        maxsize: Maximum number of entries (None = unbounded, TTL only)
+        ttl: Seconds an entry stays valid (None = no expiry)
+        sliding: Reset an entry's TTL whenever it is read
+        sizeof: Bytes of one value for get_stats() (default: sys.getsizeof)
+        clock: Monotonic time source (tests inject a fake clock)
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 10000,
+        ttl: Optional[float] = None,
+        sliding: bool = False,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sliding = sliding
+        self.sizeof = sizeof or sys.getsizeof
+        self.clock = clock
+
+        # key -> (value, expires)
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # -------------------------------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------------------------------
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+
+        value, expires = entry
+        if self.ttl is not None:
+            now = self.clock()
+            if expires <= now:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return _MISSING
+            if self.sliding:
+                self._data[key] = (value, now + self.ttl)
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Cached value for key, creating and storing factory() when missing."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = factory()
+            self[key] = value
+        return value
+
+    # -------------------------------------------------------------------------
+    # UPDATE
+    # -------------------------------------------------------------------------
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        now = self.clock() if self.ttl is not None else 0.0
+        expires = now + self.ttl if self.ttl is not None else float("inf")
+        self._data.pop(key, None)
+        self._data[key] = (value, expires)
+
+        data = self._data
+        if self.ttl is not None:
+            # Expired entries at the LRU end go first (amortized O(1))
+            while data:
+                _, (_, oldest_expires) = next(iter(data.items()))
+                if oldest_expires > now:
+                    break
+                data.popitem(last=False)
+                self.expirations += 1
+        if self.maxsize is not None:
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def add(self, key: Hashable) -> None:
+        """Set-style insert."""
+        self[key] = True
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def discard(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge(self) -> int:
+        """Drop every expired entry now (O(n)); returns how many."""
+        if self.ttl is None:
+            return 0
+        now = self.clock()
+        expired = [key for key, (_, expires) in self._data.items() if expires <= now]
+        for key in expired:
+            del self._data[key]
+        self.expirations += len(expired)
+        return len(expired)
+
+    # -------------------------------------------------------------------------
+    # ITERATION (live entries, least recently used first; no stats, no LRU touch)
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __bool__(self) -> bool:
+        return bool(self._data)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        now = self.clock() if self.ttl is not None else 0.0
+        return [
+            (key, value) for key, (value, expires) in self._data.items()
+            if self.ttl is None or expires > now
+        ]
+
+    def keys(self) -> List[Hashable]:
+        return [key for key, _ in self.items()]
+
+    def values(self) -> List[Any]:
+        return [value for _, value in self.items()]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        return f"BoundedCache(size={len(self._data)}, maxsize={self.maxsize}, ttl={self.ttl})"
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def memory_bytes(self) -> int:
+        """Approximate footprint: the table plus each key and value (O(n))."""
+        total = sys.getsizeof(self._data)
+        for key, (value, _) in self._data.items():
+            total += sys.getsizeof(key) + self.sizeof(value)
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "memory_bytes": self.memory_bytes(),
+        }
@@ -0,0 +1,271 @@
+"""
+Async fan-out bus with per-consumer backpressure.
+
+The publisher (e.g. the WebSocket receive loop) hands each update to the
+bus; every consumer reads from its own bounded queue at its own pace:
+
+    bus = FanoutBus()
+    latest = bus.subscribe("strategy", topics={"book"}, policy=OverflowPolicy.COALESCE)
+    recorder = bus.subscribe("recorder", topics={"raw"}, maxsize=50_000,
+                             policy=OverflowPolicy.BLOCK)
+
+    await bus.publish("book", token_id, orderbook)
+    async for topic, key, payload in latest:
+        ...
+
+Overflow policies when a consumer's queue is full:
+
+- DROP_OLDEST: discard the oldest queued update (counted in `dropped`)
+- COALESCE: one slot per (topic, key) - a newer update replaces the queued
+  one in place, so a consumer that only needs the latest state per token
+  never falls more than one update per token behind
+- BLOCK: publish() waits for room (lossless; the publisher slows to the
+  consumer once it is maxsize behind)
+
+A slow consumer only ever affects the publisher under BLOCK. Per-consumer
+lag (queued updates), drops, coalesced updates, publisher wait time and
+queue delay are reported by get_stats().
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+# (topic, key, payload, published_at)
+_Item = Tuple[str, Hashable, Any, float]
+
+
+class OverflowPolicy(str, Enum):
+    """What a full consumer queue does with a new update."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    BLOCK = "block"
+
+
+class BusSubscription:
+    """
+    One consumer's bounded queue.
+
+    Parameters:
+        name: Consumer name (stats key)
+        topics: Topics to receive (None = all)
+        keys: Keys to receive, e.g. token ids (None = all; the set may be
+              changed while subscribed)
+        maxsize: Queue bound (distinct (topic, key) slots under COALESCE)
+        policy: OverflowPolicy applied when the queue is full
+    """
+
+    def __init__(
+        self,
+        name: str,
+        topics: Optional[Iterable[str]] = None,
+        keys: Optional[Iterable[Hashable]] = None,
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        self.name = name
+        self.topics: Optional[Set[str]] = set(topics) if topics is not None else None
+        self.keys: Optional[Set[Hashable]] = set(keys) if keys is not None else None
+        self.maxsize = max(1, maxsize)
+        self.policy = OverflowPolicy(policy)
+        self.closed = False
+
+        self._queue: "deque[_Item]" = deque()
+        self._latest: "OrderedDict[Tuple[str, Hashable], _Item]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_lag = 0
+        self.blocked_s = 0.0
+        self._delay_s = 0.0
+
+    def wants(self, topic: str, key: Hashable) -> bool:
+        return (
+            not self.closed
+            and (self.topics is None or topic in self.topics)
+            and (self.keys is None or key in self.keys)
+        )
+
+    @property
+    def lag(self) -> int:
+        """Updates queued and not yet read."""
+        return len(self._latest) if self.policy is OverflowPolicy.COALESCE else len(self._queue)
+
+    # -------------------------------------------------------------------------
+    # PUBLISHER SIDE
+    # -------------------------------------------------------------------------
+
+    def offer(self, item: _Item) -> bool:
+        """Enqueue without waiting; False only when full under BLOCK."""
+        if self.closed:
+            return True
+
+        if self.policy is OverflowPolicy.COALESCE:
+            slot = (item[0], item[1])
+            if slot in self._latest:
+                self._latest[slot] = item  # Keeps its place in line
+                self.coalesced += 1
+                self.published += 1
+                return True
+            if len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)
+                self.dropped += 1
+            self._latest[slot] = item
+        else:
+            if len(self._queue) >= self.maxsize:
+                if self.policy is OverflowPolicy.BLOCK:
+                    return False
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(item)
+
+        self.published += 1
+        lag = self.lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        self._ready.set()
+        return True
+
+    async def put(self, item: _Item) -> None:
+        """Enqueue, waiting for room under BLOCK."""
+        if self.offer(item):
+            return
+        start = time.monotonic()
+        while not self.offer(item):
+            self._space.clear()
+            await self._space.wait()
+        self.blocked_s += time.monotonic() - start
+
+    # -------------------------------------------------------------------------
+    # CONSUMER SIDE
+    # -------------------------------------------------------------------------
+
+    def get_nowait(self) -> Optional[Tuple[str, Hashable, Any]]:
+        """Next update, or None if nothing is queued."""
+        if self.policy is OverflowPolicy.COALESCE:
+            if not self._latest:
+                return None
+            _, item = self._latest.popitem(last=False)
+        else:
+            if not self._queue:
+                return None
+            item = self._queue.popleft()
+
+        self.delivered += 1
+        self._delay_s += time.monotonic() - item[3]
+        self._space.set()
+        return item[0], item[1], item[2]
+
+    async def get(self) -> Optional[Tuple[str, Hashable, Any]]:
+        """Next (topic, key, payload); None once closed and drained."""
+        while True:
+            update = self.get_nowait()
+            if update is not None:
+                return update
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+    def __aiter__(self) -> AsyncIterator[Tuple[str, Hashable, Any]]:
+        return self
+
+    async def __anext__(self) -> Tuple[str, Hashable, Any]:
+        update = await self.get()
+        if update is None:
+            raise StopAsyncIteration
+        return update
+
+    def close(self) -> None:
+        """Stop receiving; readers drain what is queued, blocked publishers resume."""
+        self.closed = True
+        self._ready.set()
+        self._space.set()
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy.value,
+            "maxsize": self.maxsize,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "blocked_s": round(self.blocked_s, 3),
+            "avg_delay_ms": round(self._delay_s / max(1, self.delivered) * 1000, 3),
+        }
+
+    def __repr__(self) -> str:
+        return f"BusSubscription({self.name!r}, policy={self.policy.value}, lag={self.lag})"
+
+
+class FanoutBus:
+    """Topic/key pub-sub: every matching consumer gets each update in its own queue."""
+
+    def __init__(self) -> None:
+        self._subscriptions: Tuple[BusSubscription, ...] = ()
+
+    def subscribe(
+        self,
+        name: str,
+        topics: Optional[Iterable[str]] = None,
+        keys: Optional[Iterable[Hashable]] = None,
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> BusSubscription:
+        """Add a consumer (see BusSubscription for the parameters)."""
+        subscription = BusSubscription(name, topics, keys, maxsize, policy)
+        self._subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: BusSubscription) -> None:
+        """Remove and close a consumer."""
+        subscription.close()
+        self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+
+    def has_subscribers(self, topic: str) -> bool:
+        """True if any consumer takes `topic` (lets publishers skip building payloads)."""
+        return any(s.topics is None or topic in s.topics for s in self._subscriptions)
+
+    async def publish(self, topic: str, key: Hashable, payload: Any) -> int:
+        """
+        Hand an update to every matching consumer.
+
+        Only waits if a BLOCK consumer is full.
+
+        Returns:
+            Number of consumers the update went to.
+        """
+        item = (topic, key, payload, time.monotonic())
+        delivered = 0
+        for subscription in self._subscriptions:
+            if subscription.wants(topic, key):
+                if not subscription.offer(item):
+                    await subscription.put(item)
+                delivered += 1
+        return delivered
+
+    def close(self) -> None:
+        """Close every consumer."""
+        for subscription in self._subscriptions:
+            subscription.close()
+        self._subscriptions = ()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-consumer queue stats, by consumer name."""
+        return {s.name: s.get_stats() for s in self._subscriptions}
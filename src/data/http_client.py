@@ -0,0 +1,374 @@
+"""
+Shared HTTP transport.
+
+One process-wide transport for scanners, feeds and strategies instead of
+a client/session per caller:
+
+- Per-host connection pools (one httpx.AsyncClient per host), kept alive
+  between cycles, HTTP/2 when the ``h2`` package is installed
+- Per-host rate budgets (token buckets); hosts that share an upstream
+  limit (e.g. every ``*.api.riotgames.com`` region) share one budget
+- One retry/backoff policy: transport errors and retryable statuses are
+  retried with exponential backoff + jitter, honouring Retry-After
+
+Usage:
+    transport = get_transport()
+    resp = await transport.get(url, params=params)      # httpx.Response
+    data = await transport.get_json(url, params=params)  # decoded body or None
+
+Policies are looked up by host suffix, so ``"api.riotgames.com"`` covers
+``na1.api.riotgames.com`` and ``kr.api.riotgames.com``.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.data import json_codec
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# =============================================================================
+# RATE LIMITER
+# =============================================================================
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Tokens refill continuously at `rate / period` per second up to `capacity`.
+    Each request takes one token; callers wait when the bucket is empty.
+
+    Sized below the upstream budget so retries and other callers still fit.
+    """
+
+    def __init__(self, rate: float, period: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.period = period
+        self.capacity = capacity or rate
+        self._tokens = float(self.capacity)
+        self._fill_rate = rate / period  # tokens per second
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._fill_rate)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until `tokens` are available, then consume them; returns seconds waited."""
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self._fill_rate)
+                self._refill()
+            self._tokens -= tokens
+        return time.monotonic() - start
+
+    def drain(self) -> None:
+        """Empty the bucket (e.g. after a 429) so callers slow down together."""
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+
+
+# =============================================================================
+# POLICIES
+# =============================================================================
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Shared retry/backoff policy."""
+    max_retries: int = 3
+    backoff_base: float = 0.5  # seconds; doubles per attempt
+    max_backoff: float = 30.0
+    jitter: float = 0.25  # +/- fraction of the delay
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        delay = min(self.backoff_base * (2.0 ** attempt), self.max_backoff)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """
+    Connection pool, rate budget and retry settings for a host (suffix).
+
+    rate=None disables the budget for that host.
+    """
+    rate: Optional[float] = None  # requests per period
+    period: float = 1.0
+    burst: Optional[float] = None  # bucket capacity (default: rate)
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 60.0
+    timeout: float = 30.0
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+
+
+# Upstream budgets, with ~20% headroom for retries
+DEFAULT_POLICIES: Dict[str, HostPolicy] = {
+    # Gamma: 300 requests / 10s
+    "gamma-api.polymarket.com": HostPolicy(rate=240, period=10.0, burst=16),
+    # CLOB: 1500 requests / 10s on /book, far less elsewhere
+    "clob.polymarket.com": HostPolicy(rate=100, period=10.0, burst=10),
+    # Riot development keys: 20 requests / 1s, 100 / 2min; the esports
+    # client handles 429/503 itself (pauses the key), so only retry 5xx
+    "api.riotgames.com": HostPolicy(
+        rate=80, period=120.0, burst=15, timeout=10.0,
+        retry=RetryPolicy(max_retries=2, retry_statuses=frozenset({500, 502, 504})),
+    ),
+    "lolesports.com": HostPolicy(rate=10, period=1.0, timeout=10.0),
+}
+
+
+# =============================================================================
+# TRANSPORT
+# =============================================================================
+
+@dataclass
+class _HostStats:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    rate_wait_s: float = 0.0
+    latency_s: float = 0.0
+
+
+class HttpTransport:
+    """
+    Pooled HTTP transport with per-host budgets and shared retries.
+
+    Parameters:
+        policies: Host-suffix -> HostPolicy (merged over DEFAULT_POLICIES)
+        default_policy: Policy for hosts with no matching suffix
+        http2: Negotiate HTTP/2 (default: when ``h2`` is installed)
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        default_policy: Optional[HostPolicy] = None,
+        http2: Optional[bool] = None,
+    ):
+        self._policies: Dict[str, HostPolicy] = {**DEFAULT_POLICIES, **(policies or {})}
+        self._default_policy = default_policy or HostPolicy()
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}  # host -> pool
+        self._buckets: Dict[str, TokenBucket] = {}  # policy key -> budget
+        self._stats: Dict[str, _HostStats] = {}
+        self._closed = False
+
+    # -------------------------------------------------------------------------
+    # CONFIGURATION
+    # -------------------------------------------------------------------------
+
+    def set_policy(self, host: str, policy: HostPolicy) -> None:
+        """
+        Install a policy for a host suffix.
+
+        The budget is replaced immediately; pool limits apply to pools
+        opened afterwards.
+        """
+        self._policies[host] = policy
+        self._buckets.pop(host, None)
+
+    def policy_for(self, host: str) -> "tuple[str, HostPolicy]":
+        """(policy key, policy) for a host: longest matching suffix wins."""
+        best = None
+        for key in self._policies:
+            if host == key or host.endswith("." + key):
+                if best is None or len(key) > len(best):
+                    best = key
+        if best is None:
+            return host, self._default_policy
+        return best, self._policies[best]
+
+    # -------------------------------------------------------------------------
+    # POOLS
+    # -------------------------------------------------------------------------
+
+    def _client(self, host: str, policy: HostPolicy) -> httpx.AsyncClient:
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=policy.timeout,
+                limits=httpx.Limits(
+                    max_connections=policy.max_connections,
+                    max_keepalive_connections=policy.max_keepalive,
+                    keepalive_expiry=policy.keepalive_expiry,
+                ),
+            )
+            self._clients[host] = client
+        return client
+
+    def _bucket(self, key: str, policy: HostPolicy) -> Optional[TokenBucket]:
+        if policy.rate is None:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(policy.rate, policy.period, capacity=policy.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def aclose(self) -> None:
+        """Close every pool."""
+        self._closed = True
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> "HttpTransport":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    # -------------------------------------------------------------------------
+    # REQUESTS
+    # -------------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the host's pool and budget.
+
+        Retryable statuses are retried per the policy; the last response
+        is returned when retries run out (callers still check the status).
+        Transport errors are retried and re-raised after the last attempt.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            retry: Override the host's RetryPolicy
+            **kwargs: Passed to httpx (params, headers, json, timeout, ...)
+        """
+        host = urlsplit(url).hostname or ""
+        key, policy = self.policy_for(host)
+        retry = retry or policy.retry
+        client = self._client(host, policy)
+        bucket = self._bucket(key, policy)
+        stats = self._stats.setdefault(key, _HostStats())
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                stats.rate_wait_s += await bucket.acquire()
+
+            stats.requests += 1
+            start = time.perf_counter()
+            try:
+                resp = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                stats.errors += 1
+                if attempt >= retry.max_retries:
+                    raise
+                delay = retry.delay(attempt)
+                logger.debug(f"{method} {host} failed ({type(e).__name__}), retry in {delay:.1f}s")
+            else:
+                stats.latency_s += time.perf_counter() - start
+                if resp.status_code not in retry.retry_statuses or attempt >= retry.max_retries:
+                    return resp
+
+                if resp.status_code == 429 and bucket is not None:
+                    bucket.drain()  # Everyone sharing this budget backs off
+                delay = retry.delay(attempt, _retry_after(resp))
+                logger.debug(f"{method} {host} -> {resp.status_code}, retry in {delay:.1f}s")
+                await resp.aclose()
+
+            stats.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs: Any) -> Any:
+        """GET and decode the body; None on non-200 or transport failure."""
+        try:
+            resp = await self.get(url, **kwargs)
+        except httpx.HTTPError as e:
+            logger.debug(f"GET {url} failed: {e}")
+            return None
+        if resp.status_code != 200:
+            return None
+        return json_codec.loads(resp.content)
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "pools": len(self._clients),
+            "hosts": {
+                key: {
+                    "requests": s.requests,
+                    "retries": s.retries,
+                    "errors": s.errors,
+                    "rate_wait_s": round(s.rate_wait_s, 3),
+                    "avg_latency_ms": round(
+                        s.latency_s / max(1, s.requests - s.errors) * 1000, 1
+                    ),
+                }
+                for key, s in self._stats.items()
+            },
+        }
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    value = resp.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_transport: Optional[HttpTransport] = None
+
+
+def get_transport() -> HttpTransport:
+    """Get the shared transport (created on first use)."""
+    global _transport
+    if _transport is None or _transport._closed:
+        _transport = HttpTransport()
+    return _transport
+
+
+async def close_transport() -> None:
+    """Close the shared transport's pools (call once at shutdown)."""
+    global _transport
+    if _transport is not None:
+        await _transport.aclose()
+        _transport = None
@@ -0,0 +1,126 @@
+"""
+JSON codec with pluggable fast backends.
+
+Gamma and CLOB payloads are decoded with the fastest installed backend:
+msgspec, then orjson, then the stdlib ``json`` module. Callers keep a
+single API (``loads``/``dumps``) and a single error type
+(``JSONDecodeError``, the stdlib class) regardless of backend.
+
+Gamma also embeds JSON arrays as strings inside market objects
+(``outcomes``, ``outcomePrices``, ``clobTokenIds``); ``decode_str_array``
+decodes those, and ``cached_str_array`` memoizes the highly repetitive
+ones such as ``'["Yes", "No"]'``.
+
+Backend selection can be forced with POLYBOT_JSON_BACKEND=json|orjson|msgspec.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Tuple
+
+JSONDecodeError = json.JSONDecodeError
+
+_loads: Callable[[Any], Any] = json.loads
+_dumps: Callable[[Any], str] = json.dumps
+BACKEND = "json"
+
+
+def _use_json() -> None:
+    global _loads, _dumps, BACKEND
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+    _loads, _dumps, BACKEND = json.loads, _json_dumps, "json"
+
+
+def _use_orjson() -> None:
+    import orjson
+
+    global _loads, _dumps, BACKEND
+
+    def _orjson_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _loads, _dumps, BACKEND = orjson.loads, _orjson_dumps, "orjson"
+
+
+def _use_msgspec() -> None:
+    import msgspec
+
+    global _loads, _dumps, BACKEND
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(enc_hook=str)
+
+    def _msgspec_loads(data: Any) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from None
+
+    def _msgspec_dumps(obj: Any) -> str:
+        return encoder.encode(obj).decode()
+
+    _loads, _dumps, BACKEND = _msgspec_loads, _msgspec_dumps, "msgspec"
+
+
+_BACKENDS = {"json": _use_json, "orjson": _use_orjson, "msgspec": _use_msgspec}
+
+
+def set_backend(name: str) -> str:
+    """
+    Select a backend by name ("auto" picks the fastest installed one).
+
+    Returns:
+        Name of the backend in use.
+
+    Raises:
+        ValueError: Unknown backend name.
+        ImportError: Requested backend is not installed.
+    """
+    if name == "auto":
+        for candidate in ("msgspec", "orjson", "json"):
+            try:
+                _BACKENDS[candidate]()
+                break
+            except ImportError:
+                continue
+    elif name in _BACKENDS:
+        _BACKENDS[name]()
+    else:
+        raise ValueError(f"Unknown JSON backend: {name}")
+
+    cached_str_array.cache_clear()
+    return BACKEND
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from str, bytes or bytearray."""
+    return _loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode compact JSON (non-serializable values fall back to str())."""
+    return _dumps(obj)
+
+
+def decode_str_array(value: Any) -> Any:
+    """
+    Decode a Gamma field that may hold a JSON array encoded as a string.
+
+    Non-string values (already-decoded lists) are returned unchanged.
+    """
+    if isinstance(value, str):
+        return _loads(value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def cached_str_array(value: str) -> Tuple[Any, ...]:
+    """Memoized decode_str_array for low-cardinality fields (e.g. outcomes)."""
+    return tuple(_loads(value))
+
+
+set_backend(os.getenv("POLYBOT_JSON_BACKEND", "auto"))
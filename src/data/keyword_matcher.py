@@ -0,0 +1,301 @@
+"""
+Shared multi-pattern keyword matcher.
+
+Strategies and scorers used to scan each question once per keyword list
+(`any(kw in q for kw in ...)`, alternation regexes) - five or more scans
+per market per cycle, most of them over the same text. This module keeps
+every registered keyword list in one Aho-Corasick automaton, so a single
+pass over the lowercased question finds every hit of every list:
+
+    matcher = get_keyword_matcher()
+    matcher.add_group("flash_sniper.crypto", ["btc", "bitcoin", "eth"])
+    matcher.add_group("contrarian_no.sensational", ["war", "coup"], whole_words=True)
+
+    hits = matcher.scan(question)
+    "flash_sniper.crypto" in hits               # any keyword of the group
+    hits.keywords("contrarian_no.sensational")  # which ones
+    hits.first(("political", "crypto"))         # first listed group with a hit
+
+- Substring semantics by default (same as `kw in question.lower()`)
+- whole_words=True matches like `\\b(kw)\\b`
+- The automaton is rebuilt lazily after a group changes; registering the
+  same group again with the same keywords is free
+- Results are LRU-memoized per question text (the same markets every cycle)
+- Uses the pyahocorasick C extension when installed (extra `fast-match`),
+  else a pure-Python automaton with identical results
+
+Group names are namespaced by owner ("<module>.<list>") so different
+strategies can register overlapping keywords with different semantics.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+CACHE_SIZE = 32768
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+# group -> (keywords, whole_words)
+GroupSpecs = Dict[str, Tuple[FrozenSet[str], bool]]
+
+
+class KeywordHits:
+    """
+    Keywords found in one text (immutable, shared via the cache).
+
+    Group membership is resolved on demand with set intersections against
+    the group definitions the text was scanned with.
+    """
+
+    __slots__ = ("_substring", "_whole", "_groups")
+
+    def __init__(self, substring: FrozenSet[str], whole: FrozenSet[str], groups: GroupSpecs):
+        self._substring = substring  # every keyword occurring in the text
+        self._whole = whole          # ... of those, occurring as whole words
+        self._groups = groups
+
+    def _match(self, group: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """(group keywords, keywords found with the group's semantics)."""
+        keywords, whole_words = self._groups[group]
+        return keywords, self._whole if whole_words else self._substring
+
+    def __contains__(self, group: str) -> bool:
+        keywords, found = self._match(group)
+        return not keywords.isdisjoint(found)
+
+    def __bool__(self) -> bool:
+        return bool(self._substring)
+
+    def __repr__(self) -> str:
+        return f"KeywordHits({sorted(self._substring)!r})"
+
+    @property
+    def groups(self) -> FrozenSet[str]:
+        """Every registered group with a hit."""
+        return frozenset(group for group in self._groups if group in self)
+
+    def keywords(self, group: str) -> FrozenSet[str]:
+        """Keywords of `group` present in the text."""
+        keywords, found = self._match(group)
+        return keywords & found
+
+    def first(self, groups: Sequence[str]) -> Optional[str]:
+        """First of `groups` (in the given order) with a hit, else None."""
+        for group in groups:
+            if group in self:
+                return group
+        return None
+
+
+class _Automaton:
+    """Aho-Corasick goto/fail/output tables over lowercase keywords."""
+
+    __slots__ = ("goto", "fail", "out")
+
+    def __init__(self, keywords: Iterable[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        out: List[List[str]] = [[]]
+
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(keyword)
+
+        # Breadth-first failure links (depth-1 states fail to the root);
+        # outputs inherit their fail state's
+        self.fail = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                out[nxt].extend(out[self.fail[nxt]])
+        self.out: List[Tuple[str, ...]] = [tuple(o) for o in out]
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """(end index, keyword) for every occurrence, overlaps included."""
+        goto, fail, out = self.goto, self.fail, self.out
+        found = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for keyword in out[state]:
+                    found.append((i, keyword))
+        return found
+
+
+class _NativeAutomaton:
+    """Same interface backed by pyahocorasick."""
+
+    __slots__ = ("_automaton",)
+
+    def __init__(self, keywords: Iterable[str]):
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword, keyword)
+        if len(self._automaton):
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        if not len(self._automaton):
+            return []
+        return list(self._automaton.iter(text))
+
+
+class KeywordMatcher:
+    """
+    Registry of named keyword groups scanned with one automaton.
+
+    Parameters:
+        cache_size: Memoized scan results (per distinct text)
+        native: Use pyahocorasick if installed (None = when available)
+    """
+
+    def __init__(self, cache_size: int = CACHE_SIZE, native: Optional[bool] = None):
+        self.cache_size = cache_size
+        self.native = AHOCORASICK_AVAILABLE if native is None else native and AHOCORASICK_AVAILABLE
+
+        # Replaced (never mutated) on change, so cached hits keep their snapshot
+        self._groups: GroupSpecs = {}
+        self._whole_keywords: FrozenSet[str] = _EMPTY  # need a boundary check
+        self._keyword_count = 0
+        self._automaton: Optional[Union[_Automaton, _NativeAutomaton]] = None
+        self._scan = lru_cache(maxsize=cache_size)(self._scan_uncached)
+        self._builds = 0
+
+    # -------------------------------------------------------------------------
+    # REGISTRATION
+    # -------------------------------------------------------------------------
+
+    def add_group(self, name: str, keywords: Iterable[str], whole_words: bool = False) -> str:
+        """
+        Register (or replace) a keyword group; returns its name.
+
+        Keywords are matched case-insensitively. Re-registering identical
+        keywords is a no-op, so owners can register in __init__.
+        """
+        spec = (frozenset(kw.lower() for kw in keywords if kw), whole_words)
+        if self._groups.get(name) == spec:
+            return name
+        self._groups = {**self._groups, name: spec}
+        self._invalidate()
+        return name
+
+    def add_groups(self, groups: Dict[str, Iterable[str]], prefix: str = "",
+                   whole_words: bool = False) -> Tuple[str, ...]:
+        """Register several groups; returns their names in the given order."""
+        return tuple(
+            self.add_group(prefix + name, keywords, whole_words=whole_words)
+            for name, keywords in groups.items()
+        )
+
+    def _invalidate(self) -> None:
+        self._automaton = None
+        self._scan.cache_clear()
+
+    def _build(self) -> Union[_Automaton, _NativeAutomaton]:
+        keywords: Set[str] = set()
+        whole: Set[str] = set()
+        for group_keywords, whole_words in self._groups.values():
+            keywords |= group_keywords
+            if whole_words:
+                whole |= group_keywords
+
+        self._whole_keywords = frozenset(whole)
+        self._keyword_count = len(keywords)
+        automaton = (_NativeAutomaton if self.native else _Automaton)(sorted(keywords))
+        self._automaton = automaton
+        self._builds += 1
+        return automaton
+
+    # -------------------------------------------------------------------------
+    # SCANNING
+    # -------------------------------------------------------------------------
+
+    def scan(self, text: str) -> KeywordHits:
+        """Every registered group hit in `text` (one pass, memoized)."""
+        return self._scan(text or "")
+
+    def _scan_uncached(self, text: str) -> KeywordHits:
+        automaton = self._automaton or self._build()
+        groups = self._groups
+        lower = text.lower()
+
+        matches = automaton.find(lower)
+        if not matches:
+            return KeywordHits(_EMPTY, _EMPTY, groups)
+
+        substring = frozenset(keyword for _, keyword in matches)
+        whole = _EMPTY
+        if not self._whole_keywords.isdisjoint(substring):
+            whole = frozenset(
+                keyword for end, keyword in matches
+                if keyword in self._whole_keywords
+                and self._at_boundaries(lower, end - len(keyword) + 1, end, keyword)
+            )
+        return KeywordHits(substring, whole, groups)
+
+    @staticmethod
+    def _at_boundaries(text: str, start: int, end: int, keyword: str) -> bool:
+        """Regex `\\b` semantics on both ends of text[start:end + 1]."""
+        before = text[start - 1] if start > 0 else " "
+        after = text[end + 1] if end + 1 < len(text) else " "
+        return (
+            _is_word(keyword[0]) != _is_word(before)
+            and _is_word(keyword[-1]) != _is_word(after)
+        )
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        info = self._scan.cache_info()
+        return {
+            "groups": len(self._groups),
+            "keywords": self._keyword_count if self._automaton else None,
+            "native": self.native,
+            "builds": self._builds,
+            "cache_hits": info.hits,
+            "cache_misses": info.misses,
+            "cache_size": info.currsize,
+        }
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_matcher: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Get the shared keyword matcher (created on first use)."""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher()
+    return _matcher
@@ -3,13 +3,21 @@ Real-time Polymarket data feed for training and evaluation.
 NO TRADING - Read only for ML training.
 """
 import asyncio
-import aiohttp
 import time
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 import json
 
+from src.data import json_codec
+from src.data.http_client import HttpTransport, get_transport
+from src.data.keyword_matcher import get_keyword_matcher
+
+# Flash-like market filter for get_flash_markets()
+FLASH_GROUP = get_keyword_matcher().add_group(
+    "polymarket_feed.flash", ["minute", "1-min", "5-min", "flash", "btc", "eth", "sol", "price"]
+)
+
 
 @dataclass
 class MarketTick:
@@ -64,37 +72,33 @@ class PolymarketFeed:
     CLOB_BASE = "https://clob.polymarket.com"
     GAMMA_BASE = "https://gamma-api.polymarket.com"
     
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        # Shared pooled transport: per-host rate budget and retries
+        self.transport = transport
         self.price_history: Dict[str, List[Dict]] = {}  # token_id -> [{ts, price}]
         self.callbacks: List[Callable[[MarketTick], None]] = []
         self.running = False
-        self._rate_limit_delay = 0.5  # 500ms between requests
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.transport is None:
+            self.transport = get_transport()
         return self
         
     async def __aexit__(self, *args):
-        if self.session:
-            await self.session.close()
+        pass  # The shared transport outlives the feed
             
     async def _request(self, url: str, params: Dict = None) -> Optional[Dict]:
-        """Make rate-limited request"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Make rate-limited request (budget and 429 backoff live in the transport)"""
+        if self.transport is None:
+            self.transport = get_transport()
             
         try:
-            await asyncio.sleep(self._rate_limit_delay)
-            async with self.session.get(url, params=params, timeout=10) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                elif resp.status == 429:
-                    print(f"⚠️ Rate limited, waiting 5s...")
-                    await asyncio.sleep(5)
-                    return None
-                else:
-                    return None
+            resp = await self.transport.get(url, params=params, timeout=10)
+            if resp.status_code == 200:
+                return json_codec.loads(resp.content)
+            elif resp.status_code == 429:
+                print("⚠️ Rate limited (retries exhausted)")
+            return None
         except Exception as e:
             print(f"Request error: {e}")
             return None
@@ -154,11 +158,10 @@ class PolymarketFeed:
             
         # Filter for flash-like markets
         flash_markets = []
-        flash_keywords = ["minute", "1-min", "5-min", "flash", "btc", "eth", "sol", "price"]
+        keywords = get_keyword_matcher()
         
         for m in data:
-            question = m.get("question", "").lower()
-            if any(kw in question for kw in flash_keywords):
+            if FLASH_GROUP in keywords.scan(m.get("question", "")):
                 flash_markets.append({
                     "condition_id": m.get("conditionId", ""),
                     "question": m.get("question", ""),
@@ -0,0 +1,152 @@
+"""
+Shared question-text normalization.
+
+Market questions used to be lowercased, regex-cleaned and keyword-scanned
+separately by the ARB matcher, the universe mapper, the tail strategy's
+feature extractor and the resolution tracker - several passes per market
+per cycle, with the regexes recompiled inline. This module does it once:
+
+    norm = normalize(question)
+    norm.clean     # matching text: lowercase, dates and punctuation stripped
+    norm.tokens    # frozenset of words in `clean`
+    norm.category  # politics, crypto, sports, economics, tech, entertainment or other
+    norm.flags     # ML keyword flags (see FLAG_PATTERNS)
+
+Patterns are compiled at import and results are LRU-memoized per question
+text, so repeated questions (the same market every cycle) cost a dict hit.
+
+Flags keep the tail strategy's original substring semantics ("ai" also
+matches "said") so its features stay comparable with collected training
+data; categories match whole words.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, NamedTuple, Tuple
+
+CACHE_SIZE = 32768
+
+# -----------------------------------------------------------------------------
+# CLEANING
+# -----------------------------------------------------------------------------
+
+_NUMERIC_DATE = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')
+_MONTH_DATE = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d+\b')
+_NON_WORD = re.compile(r'[^\w\s]')
+_YEAR = re.compile(r'\b\d{4}\b')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_question(q: str) -> str:
+    """Lowercase, drop dates and punctuation, collapse whitespace."""
+    q = q.lower()
+
+    # Remove dates in various formats (keep the question semantic)
+    q = _NUMERIC_DATE.sub('', q)
+    q = _MONTH_DATE.sub('', q)
+
+    # Remove special chars but keep spaces
+    q = _NON_WORD.sub(' ', q)
+
+    return ' '.join(q.split())
+
+
+def strip_years(clean: str) -> str:
+    """Drop 4-digit years from cleaned text (universe mapper matching)."""
+    return ' '.join(_YEAR.sub('', clean).split())
+
+
+def is_year(token: str) -> bool:
+    return len(token) == 4 and token.isdigit()
+
+
+# -----------------------------------------------------------------------------
+# CATEGORIES
+# -----------------------------------------------------------------------------
+
+# First category with a matching word wins
+CATEGORY_KEYWORDS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("politics", frozenset({
+        "trump", "biden", "election", "president", "presidential", "congress",
+        "senate", "governor", "democrat", "democrats", "republican", "republicans",
+    })),
+    ("crypto", frozenset({
+        "crypto", "bitcoin", "ethereum", "btc", "eth", "solana", "sol", "defi",
+    })),
+    ("sports", frozenset({
+        "sports", "nfl", "nba", "mlb", "nhl", "ncaa", "soccer", "football",
+        "basketball", "baseball", "hockey", "tennis", "ufc", "game", "match",
+    })),
+    ("economics", frozenset({
+        "economics", "inflation", "gdp", "fed", "rate", "rates", "stock",
+        "stocks", "market", "recession",
+    })),
+    ("tech", frozenset({
+        "tech", "technology", "software", "ai", "google", "apple", "science", "space",
+    })),
+    ("entertainment", frozenset({
+        "entertainment", "movie", "movies", "tv", "oscars", "emmys", "grammys",
+    })),
+)
+
+CATEGORIES = tuple(name for name, _ in CATEGORY_KEYWORDS) + ("other",)
+
+
+def _category(tokens: FrozenSet[str]) -> str:
+    for name, keywords in CATEGORY_KEYWORDS:
+        if not tokens.isdisjoint(keywords):
+            return name
+    return "other"
+
+
+# -----------------------------------------------------------------------------
+# ML FLAGS
+# -----------------------------------------------------------------------------
+
+def _any_of(*keywords: str) -> "re.Pattern[str]":
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+# Searched in the lowercased raw question (substring semantics)
+FLAG_PATTERNS = {
+    "crypto": _any_of('crypto', 'bitcoin', 'ethereum', 'btc', 'eth'),
+    "stock": _any_of('nvidia', 'tesla', 'apple', 'stock', 'nvda', 'tsla'),
+    "ai": _any_of('ai', 'openai', 'gpt', 'artificial intelligence', 'chatgpt'),
+    "politics": _any_of('trump', 'biden', 'election', 'president', 'congress'),
+    "sports": _any_of('sports', 'nba', 'nfl', 'football', 'basketball', 'score'),
+    "number": re.compile(r'\d+'),
+    "date": re.compile(
+        r'(january|february|march|april|may|june|july|august|september'
+        r'|october|november|december|\d{4})'
+    ),
+    "comparison": _any_of('above', 'below', 'more than', 'less than', 'exceed'),
+}
+
+
+# -----------------------------------------------------------------------------
+# NORMALIZE
+# -----------------------------------------------------------------------------
+
+class NormalizedQuestion(NamedTuple):
+    clean: str
+    tokens: FrozenSet[str]
+    category: str
+    flags: FrozenSet[str]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize(question: str) -> NormalizedQuestion:
+    """Clean text, tokens, category and ML flags for a question (memoized)."""
+    clean = clean_question(question)
+    tokens = frozenset(clean.split())
+    lower = question.lower()
+    flags = frozenset(name for name, pattern in FLAG_PATTERNS.items() if pattern.search(lower))
+    return NormalizedQuestion(clean, tokens, _category(tokens), flags)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters of the memoized functions."""
+    return {
+        fn.__name__: fn.cache_info()._asdict()
+        for fn in (clean_question, normalize)
+    }
@@ -0,0 +1,242 @@
+"""
+Fixed-tick NumPy order book.
+
+One compact book layout for every producer - the WebSocket feed's
+incremental L2Book, the paper-trading SimulatedOrderbook and the REST
+polymarket_feed.OrderBookSnapshot:
+
+    book = TickBook.from_book(anything_with_bids_and_asks)
+    fill = book.walk("ask", size=250)          # market buy of 250 shares
+    fill = book.walk_notional("ask", 100.0)    # market buy of $100
+
+- Two float64 arrays of size per price tick (TICKS + 1 slots over 0..1,
+  0.001 grid), so a book is ~16KB whatever its depth
+- Non-empty levels and their cumulative size/notional are cached best
+  first, so a walk is one searchsorted instead of a Python loop
+- Readers get read-only views of the arrays (no copies)
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.scanner.order_book import ASK, BID, normalize_side, parse_level
+
+TICKS = 1000
+TICK_SIZE = 1.0 / TICKS
+
+# Price of every tick slot
+TICK_PRICES = np.arange(TICKS + 1, dtype=np.float64) / TICKS
+TICK_PRICES.flags.writeable = False
+
+# (prices, sizes, cum_size, cum_notional) of a side, best first
+_Levels = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _side(side: str) -> str:
+    normalized = normalize_side(side)
+    if normalized is None:
+        raise ValueError(f"Unknown book side: {side!r}")
+    return normalized
+
+
+class Fill(NamedTuple):
+    """Result of walking one side of the book."""
+    size: float          # Shares filled
+    cost: float          # Notional paid/received (sum of price * size)
+    avg_price: float     # cost / size (0 when nothing filled)
+    worst_price: float   # Price of the deepest level touched (0 when nothing filled)
+    levels: int          # Price levels touched
+    complete: bool       # False if the side ran out first
+
+
+class TickBook:
+    """
+    Order book as size-per-tick arrays.
+
+    Parameters:
+        token_id: Token identifier
+        bids, asks: Optional initial levels (tuples, dicts or level objects)
+    """
+
+    __slots__ = ("token_id", "_sizes", "_levels")
+
+    def __init__(
+        self,
+        token_id: str = "",
+        bids: Iterable[Any] = (),
+        asks: Iterable[Any] = (),
+    ):
+        self.token_id = token_id
+        self._sizes = {BID: np.zeros(TICKS + 1), ASK: np.zeros(TICKS + 1)}
+        # side -> cached _Levels
+        self._levels: Dict[str, _Levels] = {}
+        self.apply_snapshot(bids, asks)
+
+    # -------------------------------------------------------------------------
+    # ADAPTERS
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_book(cls, book: Any, token_id: Optional[str] = None) -> "TickBook":
+        """
+        Build from any producer's book (returned as-is if already a TickBook).
+
+        Accepts the WebSocket feed's L2Book (read level by level, no list
+        copies), SlippageSimulator's SimulatedOrderbook (OrderbookLevel
+        lists) and polymarket_feed.OrderBookSnapshot ({"price", "size"}
+        dicts), or anything else with bids/asks level lists.
+        """
+        if isinstance(book, cls):
+            return book
+        token_id = token_id if token_id is not None else getattr(book, "token_id", "")
+        bid_side = getattr(book, "bid_side", None)
+        if bid_side is not None and hasattr(bid_side, "levels"):  # L2Book
+            return cls(token_id, bid_side.levels(), book.ask_side.levels())
+        return cls(token_id, book.bids, book.asks)
+
+    # -------------------------------------------------------------------------
+    # UPDATES
+    # -------------------------------------------------------------------------
+
+    def apply_snapshot(self, bids: Iterable[Any], asks: Iterable[Any]) -> None:
+        """Replace both sides (levels on the same tick are summed)."""
+        for side, levels in ((BID, bids), (ASK, asks)):
+            sizes = self._sizes[side]
+            sizes[:] = 0.0
+            for level in levels:
+                parsed = parse_level(level)
+                if parsed is None:
+                    continue
+                price, size = parsed
+                tick = int(round(price * TICKS))
+                if 0 < tick <= TICKS and size > 0:
+                    sizes[tick] += size
+        self._levels.clear()
+
+    def set(self, side: str, price: float, size: float) -> None:
+        """Set the size at one price level (0 removes it)."""
+        side = _side(side)
+        tick = int(round(price * TICKS))
+        if 0 < tick <= TICKS:
+            self._sizes[side][tick] = max(size, 0.0)
+            self._levels.pop(side, None)
+
+    # -------------------------------------------------------------------------
+    # VIEWS
+    # -------------------------------------------------------------------------
+
+    def sizes(self, side: str) -> np.ndarray:
+        """Read-only size-per-tick array of a side (index = price * TICKS)."""
+        view = self._sizes[_side(side)].view()
+        view.flags.writeable = False
+        return view
+
+    def levels(self, side: str) -> _Levels:
+        """
+        Non-empty levels best first: (prices, sizes, cum_size, cum_notional).
+
+        Cached until the side changes; the arrays are read-only.
+        """
+        side = _side(side)
+        cached = self._levels.get(side)
+        if cached is None:
+            ticks = np.flatnonzero(self._sizes[side])
+            if side == BID:
+                ticks = ticks[::-1]
+            prices = TICK_PRICES[ticks]
+            sizes = self._sizes[side][ticks]
+            cached = (prices, sizes, np.cumsum(sizes), np.cumsum(prices * sizes))
+            for array in cached:
+                array.flags.writeable = False
+            self._levels[side] = cached
+        return cached
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        prices = self.levels(BID)[0]
+        return float(prices[0]) if len(prices) else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        prices = self.levels(ASK)[0]
+        return float(prices[0]) if len(prices) else None
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        best_bid, best_ask = self.best_bid, self.best_ask
+        if best_bid and best_ask:
+            return (best_bid + best_ask) / 2
+        return None
+
+    def depth(self, side: str, levels: Optional[int] = None) -> float:
+        """Total size over the top `levels` price levels (all when None)."""
+        cum_size = self.levels(side)[2]
+        if not len(cum_size):
+            return 0.0
+        if levels is None or levels >= len(cum_size):
+            return float(cum_size[-1])
+        return float(cum_size[levels - 1]) if levels > 0 else 0.0
+
+    # -------------------------------------------------------------------------
+    # FILL SIMULATION
+    # -------------------------------------------------------------------------
+
+    def walk(self, side: str, size: float) -> Fill:
+        """Take `size` shares from a side, best level first."""
+        prices, _, cum_size, cum_notional = self.levels(side)
+        return self._walk(prices, cum_size, cum_notional, size, by_notional=False)
+
+    def walk_notional(self, side: str, amount: float) -> Fill:
+        """Spend (or receive) `amount` of notional on a side, best level first."""
+        prices, _, cum_size, cum_notional = self.levels(side)
+        return self._walk(prices, cum_size, cum_notional, amount, by_notional=True)
+
+    @staticmethod
+    def _walk(
+        prices: np.ndarray,
+        cum_size: np.ndarray,
+        cum_notional: np.ndarray,
+        target: float,
+        by_notional: bool,
+    ) -> Fill:
+        n = len(prices)
+        cum_target = cum_notional if by_notional else cum_size
+        if n == 0 or target <= 0:
+            return Fill(0.0, 0.0, 0.0, 0.0, 0, target <= 0)
+
+        # First level whose cumulative amount reaches the target
+        i = int(np.searchsorted(cum_target, target, side="left"))
+        if i >= n:
+            size, cost = float(cum_size[-1]), float(cum_notional[-1])
+            return Fill(size, cost, cost / size, float(prices[-1]), n, False)
+
+        before_size = float(cum_size[i - 1]) if i else 0.0
+        before_cost = float(cum_notional[i - 1]) if i else 0.0
+        before_target = float(cum_target[i - 1]) if i else 0.0
+        price = float(prices[i])
+        # Remaining target at level i, in shares
+        rest = target - before_target
+        shares = rest / price if by_notional else rest
+        size = before_size + shares
+        cost = before_cost + shares * price
+        return Fill(size, cost, cost / size, price, i + 1, True)
+
+    def fills(self, side: str, fill: Fill) -> List[Dict[str, float]]:
+        """Per-level breakdown of a walk: [{"price", "size", "value"}] best first."""
+        if not fill.levels:
+            return []
+        prices, sizes, _, _ = self.levels(side)
+        prices = prices[:fill.levels]
+        taken = sizes[:fill.levels].copy()
+        taken[-1] = fill.size - float(taken[:-1].sum())
+        return [
+            {"price": float(p), "size": float(s), "value": float(p * s)}
+            for p, s in zip(prices, taken)
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"TickBook({self.token_id!r}, bid={self.best_bid}, ask={self.best_ask}, "
+            f"levels={len(self.levels(BID)[0])}/{len(self.levels(ASK)[0])})"
+        )
@@ -9,27 +9,52 @@ Tables:
 - Trade: All trades with strategy attribution
 - MarketSnapshot: Point-in-time market state
 - StrategyPerformance: Aggregated metrics per strategy
+- MarketMapping: Polymarket <-> PredictBase match cache
+
+Writes:
+- record_trade(): one trade, one transaction (scripts, one-off use)
+- TradeWriter: async write-behind queue for trades and market snapshots,
+  bulk inserts per batch (daemon)
 """
 
+import asyncio
+import enum
+import logging
+import os
+import time
+import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any
-import enum
+from typing import Any, Dict, List, Optional, Tuple
 
+from dotenv import load_dotenv
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, Boolean,
-    DateTime, Text, ForeignKey, Index, Enum, JSON, DECIMAL,
-    UniqueConstraint, CheckConstraint
+    DECIMAL,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    create_engine,
+    insert,
+    inspect,
+    text,
+    update,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
-from sqlalchemy.dialects.postgresql import JSONB
-
-import os
-from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # DATABASE CONNECTION
 # =============================================================================
@@ -334,6 +359,10 @@ class MarketMapping(Base):
     """
     Maps markets across exchanges for arbitrage detection.
     Polymarket <-> PredictBase matching.
+    
+    One row per Polymarket market, holding its best PredictBase candidate
+    whether or not it passed the threshold (rejected pairs are cached too,
+    see src/scanner/match_cache.py).
     """
     __tablename__ = "market_mappings"
     
@@ -351,9 +380,14 @@ class MarketMapping(Base):
     
     # Matching Metadata
     match_score = Column(Float)  # Fuzzy matching score (0-100)
-    match_method = Column(String(50))  # "fuzzy", "exact", "manual"
+    match_method = Column(String(50))  # "fuzzy", "opposite" (vetoed), "exact", "manual"
     is_verified = Column(Boolean, default=False)
     
+    # Hashes of the cleaned questions the score was computed from; the
+    # match is only recomputed when one of them changes
+    poly_question_hash = Column(String(16))
+    pb_question_hash = Column(String(16))
+    
     # State
     is_active = Column(Boolean, default=True)
     last_checked = Column(DateTime, default=datetime.utcnow)
@@ -364,10 +398,47 @@ class MarketMapping(Base):
 # INITIALIZATION
 # =============================================================================
 
+# Columns added to existing tables after their first release. create_all()
+# never alters a table that already exists, so init_database() adds these.
+ADDED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "market_mappings": ("poly_question_hash", "pb_question_hash"),
+}
+
+def missing_columns(bind=None) -> Dict[str, List[str]]:
+    """ADDED_COLUMNS absent from tables that already exist, by table name."""
+    inspector = inspect(bind if bind is not None else engine)
+    missing = {}
+    for table, columns in ADDED_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+        present = {column["name"] for column in inspector.get_columns(table)}
+        absent = [name for name in columns if name not in present]
+        if absent:
+            missing[table] = absent
+    return missing
+
+def migrate_columns(bind=None) -> List[str]:
+    """
+    Add missing ADDED_COLUMNS (nullable, no default) to existing tables.
+    
+    Returns:
+        "table.column" for each column added
+    """
+    added = []
+    with (bind if bind is not None else engine).begin() as conn:
+        for table, columns in missing_columns(conn).items():
+            for name in columns:
+                column_type = Base.metadata.tables[table].c[name].type.compile(conn.dialect)
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"))
+                added.append(f"{table}.{name}")
+    return added
+
 def init_database():
-    """Create all tables."""
+    """Create all tables and add columns missing from older ones."""
     Base.metadata.create_all(bind=engine)
     print("✅ Database tables created")
+    for column in migrate_columns():
+        print(f"   ➕ Added column: {column}")
     
     # Create default strategies
     db = SessionLocal()
@@ -428,6 +499,58 @@ def get_session():
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def _trade_row(
+    strategy_id: str,
+    condition_id: str,
+    outcome: str,
+    entry_price: float,
+    stake: float,
+    snapshot_data: dict = None,
+    signal_data: dict = None,
+    paper_mode: bool = True,
+    **kwargs
+) -> Dict[str, Any]:
+    """Column values for a new Trade (shared by record_trade and TradeWriter)."""
+    return {
+        "trade_id": f"{strategy_id}-{int(datetime.utcnow().timestamp())}-{uuid.uuid4().hex[:8]}",
+        "strategy_id": strategy_id,
+        "condition_id": condition_id,
+        "token_id": kwargs.get('token_id'),
+        "market_slug": kwargs.get('market_slug'),
+        "question": kwargs.get('question'),
+        "side": Side.BUY,
+        "outcome": Outcome.YES if outcome.upper() == "YES" else Outcome.NO,
+        "entry_price": Decimal(str(entry_price)),
+        "size": Decimal(str(stake / entry_price)),
+        "stake": Decimal(str(stake)),
+        "potential_payout": Decimal(str(stake / entry_price)),
+        "potential_multiplier": 1 / entry_price,
+        "status": TradeStatus.SIGNAL if paper_mode else TradeStatus.PENDING,
+        "paper_mode": paper_mode,
+        "snapshot_data": snapshot_data or {},
+        "signal_data": signal_data or {},
+        "signal_at": datetime.utcnow(),
+    }
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    return None if value is None else Decimal(str(value))
+
+def _snapshot_row(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values for a MarketSnapshot from MarketData.to_snapshot()."""
+    timestamp = snapshot.get("timestamp")
+    return {
+        "condition_id": snapshot["condition_id"],
+        "timestamp": datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow(),
+        "yes_price": _decimal(snapshot.get("yes_price")),
+        "no_price": _decimal(snapshot.get("no_price")),
+        "best_bid": _decimal(snapshot.get("best_bid")),
+        "best_ask": _decimal(snapshot.get("best_ask")),
+        "spread_bps": snapshot.get("spread_bps"),
+        "volume_24h": _decimal(snapshot.get("volume_24h")),
+        "volume_1h": _decimal(snapshot.get("volume_1h")),
+        "competitor_data": snapshot.get("competitor_prices") or None,
+    }
+
 def record_trade(
     strategy_id: str,
     condition_id: str,
@@ -442,6 +565,8 @@ def record_trade(
     """
     Record a new trade signal/execution.
     
+    One transaction per call; the daemon batches through TradeWriter.
+    
     Args:
         strategy_id: Strategy that generated the signal
         condition_id: Polymarket condition ID
@@ -455,29 +580,13 @@ def record_trade(
     Returns:
         Created Trade object
     """
-    import uuid
-    
     db = SessionLocal()
     try:
-        trade = Trade(
-            trade_id=f"{strategy_id}-{int(datetime.utcnow().timestamp())}-{uuid.uuid4().hex[:8]}",
-            strategy_id=strategy_id,
-            condition_id=condition_id,
-            token_id=kwargs.get('token_id'),
-            market_slug=kwargs.get('market_slug'),
-            question=kwargs.get('question'),
-            side=Side.BUY,
-            outcome=Outcome.YES if outcome.upper() == "YES" else Outcome.NO,
-            entry_price=Decimal(str(entry_price)),
-            size=Decimal(str(stake / entry_price)),
-            stake=Decimal(str(stake)),
-            potential_payout=Decimal(str(stake / entry_price)),
-            potential_multiplier=1 / entry_price,
-            status=TradeStatus.SIGNAL if paper_mode else TradeStatus.PENDING,
-            paper_mode=paper_mode,
-            snapshot_data=snapshot_data or {},
-            signal_data=signal_data or {},
-        )
+        trade = Trade(**_trade_row(
+            strategy_id, condition_id, outcome, entry_price, stake,
+            snapshot_data=snapshot_data, signal_data=signal_data,
+            paper_mode=paper_mode, **kwargs
+        ))
         
         db.add(trade)
         db.commit()
@@ -487,6 +596,267 @@ def record_trade(
     finally:
         db.close()
 
+# =============================================================================
+# BATCHED WRITER
+# =============================================================================
+
+class TradeWriter:
+    """
+    Write-behind queue for trades and market snapshots.
+    
+    Callers enqueue rows and get a future; a single worker drains the
+    queue into batches and writes each batch with one bulk INSERT per
+    table in one transaction (in a worker thread), so N signals in a
+    cycle cost one commit instead of N and hold one pool thread instead
+    of N.
+    
+    A trade future resolves to its trade_id once the batch has committed
+    (a snapshot future to None). If the batch fails, rows are retried one
+    transaction each so a single bad row (e.g. unknown strategy_id) only
+    fails its own future.
+    
+    close() stops intake and drains everything still queued, so rows
+    accepted before shutdown are committed before it returns.
+    
+    Usage:
+        writer = TradeWriter()
+        await writer.start()
+        trade_id = await writer.record_trade(strategy_id=..., ...)
+        await writer.record_snapshot(market.to_snapshot())
+        await writer.close()
+    
+    Parameters:
+        batch_size: Max rows per transaction
+        linger: Seconds to wait for more rows after the first one
+        max_pending: Queue bound; submitters wait when it is full
+    """
+    
+    def __init__(self, batch_size: int = 200, linger: float = 0.05, max_pending: int = 10000):
+        self.batch_size = batch_size
+        self.linger = linger
+        self.max_pending = max_pending
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closing = False
+        
+        self._batches = 0
+        self._trades_written = 0
+        self._snapshots_written = 0
+        self._failed = 0
+        self._fallbacks = 0
+        self._write_seconds = 0.0
+    
+    # -------------------------------------------------------------------------
+    # LIFECYCLE
+    # -------------------------------------------------------------------------
+    
+    async def start(self):
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._closing = False
+            self._worker = asyncio.create_task(self._run())
+    
+    async def close(self):
+        """Stop accepting rows and commit everything already queued."""
+        if self._worker is None:
+            return
+        self._closing = True
+        await self._queue.put(None)  # Wake the worker; it drains, then exits
+        await self._worker
+        self._worker = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.close()
+    
+    # -------------------------------------------------------------------------
+    # SUBMIT
+    # -------------------------------------------------------------------------
+    
+    async def submit_trade(self, **trade_fields) -> "asyncio.Future[str]":
+        """Queue a trade (record_trade arguments); the future yields its trade_id."""
+        return await self._submit(Trade, _trade_row(**trade_fields))
+    
+    async def record_trade(self, **trade_fields) -> str:
+        """Queue a trade and wait until it is committed."""
+        return await (await self.submit_trade(**trade_fields))
+    
+    async def submit_snapshot(self, snapshot: Dict[str, Any]) -> "asyncio.Future[None]":
+        """Queue a MarketSnapshot (MarketData.to_snapshot() dict)."""
+        return await self._submit(MarketSnapshot, _snapshot_row(snapshot))
+    
+    async def record_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Queue a MarketSnapshot and wait until it is committed."""
+        await (await self.submit_snapshot(snapshot))
+    
+    async def _submit(self, model, row: Dict[str, Any]) -> asyncio.Future:
+        if self._worker is None or self._closing:
+            raise RuntimeError("TradeWriter is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((model, row, future))
+        return future
+    
+    # -------------------------------------------------------------------------
+    # WORKER
+    # -------------------------------------------------------------------------
+    
+    async def _run(self):
+        # None items only wake the worker; it exits once closing and drained
+        # (rows from submitters still blocked in put() are drained too)
+        while not (self._closing and self._queue.empty()):
+            item = await self._queue.get()
+            batch = [] if item is None else [item]
+            
+            # Linger briefly so rows submitted together share a transaction
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - time.monotonic()
+                    if self._closing or remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is not None:
+                    batch.append(item)
+            
+            if batch:
+                await self._flush(batch)
+    
+    async def _flush(self, batch: List[Tuple[Any, Dict[str, Any], asyncio.Future]]):
+        start = time.perf_counter()
+        try:
+            errors = await asyncio.to_thread(self._write_batch, batch)
+        except Exception as e:
+            errors = [e] * len(batch)
+        self._write_seconds += time.perf_counter() - start
+        self._batches += 1
+        
+        for (_, row, future), error in zip(batch, errors):
+            if future.done():
+                continue  # Caller gave up (cancelled)
+            if error is None:
+                future.set_result(row.get("trade_id"))
+            else:
+                self._failed += 1
+                future.set_exception(error)
+    
+    def _write_batch(self, batch) -> List[Optional[Exception]]:
+        """Bulk insert per table in one transaction; per-row fallback if it fails."""
+        rows_by_model: Dict[Any, List[Dict[str, Any]]] = {}
+        for model, row, _ in batch:
+            rows_by_model.setdefault(model, []).append(row)
+        
+        db = SessionLocal()
+        try:
+            for model, rows in rows_by_model.items():
+                db.execute(insert(model), rows)
+            db.commit()
+            for model, rows in rows_by_model.items():
+                self._count_written(model, len(rows))
+            return [None] * len(batch)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Batch insert failed ({len(batch)} rows), retrying per row: {e}")
+        finally:
+            db.close()
+        
+        self._fallbacks += 1
+        errors: List[Optional[Exception]] = []
+        for model, row, _ in batch:
+            db = SessionLocal()
+            try:
+                db.execute(insert(model), [row])
+                db.commit()
+                self._count_written(model, 1)
+                errors.append(None)
+            except Exception as e:
+                db.rollback()
+                errors.append(e)
+            finally:
+                db.close()
+        return errors
+    
+    def _count_written(self, model, count: int):
+        if model is Trade:
+            self._trades_written += count
+        else:
+            self._snapshots_written += count
+    
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+    
+    def get_stats(self) -> Dict[str, Any]:
+        written = self._trades_written + self._snapshots_written
+        return {
+            "pending": self._queue.qsize() if self._queue else 0,
+            "batches": self._batches,
+            "trades_written": self._trades_written,
+            "snapshots_written": self._snapshots_written,
+            "failed": self._failed,
+            "fallback_batches": self._fallbacks,
+            "avg_batch_size": round(written / self._batches, 1) if self._batches else 0.0,
+            "write_seconds": round(self._write_seconds, 3),
+        }
+
+MAPPING_FIELDS = (
+    "poly_condition_id", "poly_question", "pb_market_id", "pb_question",
+    "match_score", "match_method", "is_verified",
+    "poly_question_hash", "pb_question_hash", "last_checked",
+)
+
+def load_market_mappings() -> List[Dict[str, Any]]:
+    """All market mappings as dicts (MAPPING_FIELDS keys)."""
+    db = SessionLocal()
+    try:
+        columns = [getattr(MarketMapping, name) for name in MAPPING_FIELDS]
+        return [dict(zip(MAPPING_FIELDS, row)) for row in db.query(*columns).all()]
+    finally:
+        db.close()
+
+def save_market_mappings(rows: List[Dict[str, Any]]) -> int:
+    """
+    Upsert market mappings by poly_condition_id in one transaction.
+    
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    db = SessionLocal()
+    try:
+        ids = [row["poly_condition_id"] for row in rows]
+        existing = dict(
+            db.query(MarketMapping.poly_condition_id, MarketMapping.id)
+            .filter(MarketMapping.poly_condition_id.in_(ids))
+            .all()
+        )
+        updates = [
+            {**row, "id": existing[row["poly_condition_id"]]}
+            for row in rows if row["poly_condition_id"] in existing
+        ]
+        inserts = [row for row in rows if row["poly_condition_id"] not in existing]
+        
+        if updates:
+            db.execute(update(MarketMapping), updates)
+        if inserts:
+            db.execute(insert(MarketMapping), inserts)
+        db.commit()
+        return len(rows)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 def get_strategy_stats(strategy_id: str = None, paper_mode: bool = True) -> dict:
     """Get aggregated stats for a strategy or all strategies."""
     db = SessionLocal()
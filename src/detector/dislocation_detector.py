@@ -7,6 +7,8 @@ from typing import Any
 
 import structlog
 
+from src.data.bounded_cache import BoundedCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -51,6 +53,8 @@ class DislocationDetector:
         dislocation_threshold_pct: float = 2.0,
         min_spread_change: float = 0.01,
         lookback_seconds: float = 60.0,
+        max_markets: int = 5000,
+        idle_ttl_seconds: float = 3600.0,
     ) -> None:
         """
         Initialize dislocation detector.
@@ -60,17 +64,21 @@ class DislocationDetector:
             dislocation_threshold_pct: Percentage change to consider a dislocation
             min_spread_change: Minimum absolute spread change to trigger
             lookback_seconds: How far back to look for average spread
+            max_markets: Markets tracked at once (least recently updated dropped)
+            idle_ttl_seconds: Drop a market's history after this long without updates
         """
         self.window_size = window_size
         self.dislocation_threshold_pct = dislocation_threshold_pct
         self.min_spread_change = min_spread_change
         self.lookback_seconds = lookback_seconds
 
-        # Price history per market
-        self._price_history: dict[str, deque[PricePoint]] = {}
+        # Price history per market (deque[PricePoint])
+        self._price_history = BoundedCache(
+            maxsize=max_markets, ttl=idle_ttl_seconds, sliding=True
+        )
         
         # Last dislocation timestamps (to avoid duplicate alerts)
-        self._last_dislocation: dict[str, datetime] = {}
+        self._last_dislocation = BoundedCache(maxsize=max_markets, ttl=idle_ttl_seconds)
 
     def update_price(
         self,
@@ -93,10 +101,9 @@ class DislocationDetector:
         point = PricePoint(timestamp=now, up_price=up_price, down_price=down_price)
 
         # Initialize history if needed
-        if market_id not in self._price_history:
-            self._price_history[market_id] = deque(maxlen=self.window_size)
-
-        history = self._price_history[market_id]
+        history = self._price_history.get_or_create(
+            market_id, lambda: deque(maxlen=self.window_size)
+        )
         history.append(point)
 
         # Need at least 2 points to detect change
@@ -193,12 +200,19 @@ class DislocationDetector:
             market_id: Specific market to clear, or None for all
         """
         if market_id:
-            self._price_history.pop(market_id, None)
-            self._last_dislocation.pop(market_id, None)
+            self._price_history.discard(market_id)
+            self._last_dislocation.discard(market_id)
         else:
             self._price_history.clear()
             self._last_dislocation.clear()
 
+    def get_memory_stats(self) -> dict[str, Any]:
+        """Size, eviction and approximate memory stats of the per-market state."""
+        return {
+            "price_history": self._price_history.get_stats(),
+            "last_dislocation": self._last_dislocation.get_stats(),
+        }
+
     def is_favorable_dislocation(
         self,
         event: DislocationEvent,
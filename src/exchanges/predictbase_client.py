@@ -36,6 +36,8 @@ from bs4 import BeautifulSoup
 from enum import Enum
 import json
 
+from src.data.bounded_cache import BoundedCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,6 +186,7 @@ class PredictBaseClient:
     
     # Cache TTL in seconds
     CACHE_TTL = 120  # 2 minutes for arb opportunities
+    CACHE_MAX_ENTRIES = 64
     
     # Rate limiting
     MIN_REQUEST_INTERVAL = 2.0  # seconds
@@ -198,7 +201,7 @@ class PredictBaseClient:
         """
         self.timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
-        self._cache: Dict[str, Tuple[Any, datetime]] = {}
+        self._cache = BoundedCache(maxsize=self.CACHE_MAX_ENTRIES, ttl=self.CACHE_TTL)
         self._api_endpoint: Optional[str] = custom_api_url
         self._use_scraper = False
         self._circuit_breaker = CircuitBreaker()
@@ -828,15 +831,11 @@ class PredictBaseClient:
     
     def _get_cached(self, key: str) -> Optional[Any]:
         """Get cached data if not expired."""
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if datetime.utcnow() - timestamp < timedelta(seconds=self.CACHE_TTL):
-                return data
-        return None
+        return self._cache.get(key)
     
     def _set_cached(self, key: str, data: Any):
         """Set cache data."""
-        self._cache[key] = (data, datetime.utcnow())
+        self._cache[key] = data
     
     def clear_cache(self):
         """Clear all cached data."""
@@ -855,6 +854,7 @@ class PredictBaseClient:
             "using_scraper": self._use_scraper,
             "circuit_breaker": "open" if self._circuit_breaker.is_open else "closed",
             "cache_size": len(self._cache),
+            "cache": self._cache.get_stats(),
             "latency_ms": None,
         }
         
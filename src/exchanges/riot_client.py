@@ -12,7 +12,6 @@
 """
 
 import asyncio
-import aiohttp
 import os
 import time
 import logging
@@ -23,6 +22,11 @@ from enum import Enum
 from functools import wraps
 import traceback
 
+import httpx
+
+from src.data import json_codec
+from src.data.http_client import HttpTransport, get_transport
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -227,7 +231,7 @@ class RiotGuard:
         self._on_key_expired = on_key_expired
         self._on_key_restored = on_key_restored
         
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._http: Optional[HttpTransport] = None
         self._key_status = KeyStatus()
         self._last_key_reload = datetime.utcnow()
         self._rate_limit_remaining = 20
@@ -273,11 +277,9 @@ class RiotGuard:
         """
         self.log.info("Initializing RiotGuard...")
         
-        # Create session
-        self._session = aiohttp.ClientSession(
-            headers={"X-Riot-Token": self._api_key},
-            timeout=aiohttp.ClientTimeout(total=10)
-        )
+        # Shared pooled transport; the key travels per request, so a
+        # hot-reloaded key needs no new connections
+        self._http = get_transport()
         
         # Validate key
         is_valid = await self.validate_key()
@@ -291,9 +293,7 @@ class RiotGuard:
     
     async def shutdown(self):
         """Cleanup resources"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._http = None  # Shared transport is closed by its owner
         self.log.info("RiotGuard shutdown complete")
     
     async def validate_key(self) -> bool:
@@ -308,20 +308,20 @@ class RiotGuard:
         try:
             url = self._build_url(RiotRegion.NA1, "/lol/status/v4/platform-data")
             
-            async with self._session.get(url) as resp:
-                if resp.status == 200:
-                    self._key_status.mark_valid()
-                    return True
-                elif resp.status == 403:
-                    self._key_status.mark_invalid("API key expired or invalid")
-                    await self._handle_key_expired()
-                    return False
-                elif resp.status == 401:
-                    self._key_status.mark_invalid("API key not provided")
-                    return False
-                else:
-                    self.log.warning(f"Unexpected status during validation: {resp.status}")
-                    return False
+            resp = await self._http.get(url, headers=self._auth_headers)
+            if resp.status_code == 200:
+                self._key_status.mark_valid()
+                return True
+            elif resp.status_code == 403:
+                self._key_status.mark_invalid("API key expired or invalid")
+                await self._handle_key_expired()
+                return False
+            elif resp.status_code == 401:
+                self._key_status.mark_invalid("API key not provided")
+                return False
+            else:
+                self.log.warning(f"Unexpected status during validation: {resp.status_code}")
+                return False
                     
         except Exception as e:
             self.log.error(f"Key validation error: {e}")
@@ -354,15 +354,6 @@ class RiotGuard:
         old_key = self._api_key
         self._api_key = new_key
         
-        # Recreate session with new key
-        if self._session:
-            await self._session.close()
-        
-        self._session = aiohttp.ClientSession(
-            headers={"X-Riot-Token": self._api_key},
-            timeout=aiohttp.ClientTimeout(total=10)
-        )
-        
         # Validate new key
         is_valid = await self.validate_key()
         
@@ -373,12 +364,6 @@ class RiotGuard:
         else:
             self.log.error("✗ New API key is invalid, reverting")
             self._api_key = old_key
-            # Recreate session with old key
-            await self._session.close()
-            self._session = aiohttp.ClientSession(
-                headers={"X-Riot-Token": self._api_key},
-                timeout=aiohttp.ClientTimeout(total=10)
-            )
         
         self._last_key_reload = datetime.utcnow()
         return is_valid
@@ -453,7 +438,7 @@ class RiotGuard:
                 # This is expected (no live game, etc.)
                 return None
                 
-            except aiohttp.ClientError as e:
+            except httpx.HTTPError as e:
                 self.log.error(f"Network error in {func.__name__}: {e}")
                 return None
                 
@@ -468,6 +453,10 @@ class RiotGuard:
     # HTTP HELPERS
     # ==========================================================================
     
+    @property
+    def _auth_headers(self) -> Dict[str, str]:
+        return {"X-Riot-Token": self._api_key}
+    
     def _build_url(self, region: RiotRegion, endpoint: str) -> str:
         """Build full API URL for a region and endpoint"""
         if region in [RiotRegion.AMERICAS, RiotRegion.EUROPE, RiotRegion.ASIA, RiotRegion.SEA]:
@@ -482,35 +471,35 @@ class RiotGuard:
         
         Raises appropriate exceptions based on response status.
         """
-        if not self._session:
+        if not self._http:
             raise RiotAPIError("Session not initialized. Call initialize() first.")
         
         url = self._build_url(region, endpoint)
         
-        async with self._session.get(url) as resp:
-            # Check rate limit headers
-            if "X-Rate-Limit-Count" in resp.headers:
-                self.log.debug(f"Rate limit: {resp.headers.get('X-Rate-Limit-Count')}")
-            
-            if resp.status == 200:
-                return await resp.json()
-            
-            elif resp.status == 403:
-                raise KeyExpiredError()
-            
-            elif resp.status == 404:
-                raise DataNotFoundError()
-            
-            elif resp.status == 429:
-                retry_after = int(resp.headers.get("Retry-After", 60))
-                raise RateLimitError(retry_after)
-            
-            elif resp.status == 503:
-                raise ServiceUnavailableError()
-            
-            else:
-                text = await resp.text()
-                raise RiotAPIError(f"Unexpected status {resp.status}: {text}")
+        resp = await self._http.get(url, headers=self._auth_headers)
+        
+        # Check rate limit headers
+        if "X-Rate-Limit-Count" in resp.headers:
+            self.log.debug(f"Rate limit: {resp.headers.get('X-Rate-Limit-Count')}")
+        
+        if resp.status_code == 200:
+            return json_codec.loads(resp.content)
+        
+        elif resp.status_code == 403:
+            raise KeyExpiredError()
+        
+        elif resp.status_code == 404:
+            raise DataNotFoundError()
+        
+        elif resp.status_code == 429:
+            retry_after = int(resp.headers.get("Retry-After", 60))
+            raise RateLimitError(retry_after)
+        
+        elif resp.status_code == 503:
+            raise ServiceUnavailableError()
+        
+        else:
+            raise RiotAPIError(f"Unexpected status {resp.status_code}: {resp.text}")
     
     # ==========================================================================
     # SPECTATOR API (spectator-v4)
@@ -688,12 +677,11 @@ class RiotGuard:
         params = {"hl": "en-US"}
         
         try:
-            async with self._session.get(url, headers=headers, params=params) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    events = data.get("data", {}).get("schedule", {}).get("events", [])
-                    return [e for e in events if e.get("state") == "inProgress"]
-                return []
+            data = await self._http.get_json(url, headers=headers, params=params)
+            if data:
+                events = data.get("data", {}).get("schedule", {}).get("events", [])
+                return [e for e in events if e.get("state") == "inProgress"]
+            return []
         except Exception as e:
             self.log.error(f"Error fetching esports matches: {e}")
             return []
@@ -711,10 +699,7 @@ class RiotGuard:
         url = f"https://feed.lolesports.com/livestats/v1/window/{game_id}"
         
         try:
-            async with self._session.get(url) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return None
+            return await self._http.get_json(url)
         except Exception as e:
             self.log.error(f"Error fetching game stats: {e}")
             return None
@@ -23,12 +23,19 @@
 """
 
 import asyncio
-import httpx
 import logging
-from datetime import datetime
-from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Tuple, Any
 from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.http_client import HttpTransport, get_transport
+from src.data.text_normalize import clean_question
+from src.scanner import fuzzy_matrix
+from src.scanner.fuzzy_matrix import RAPIDFUZZ_AVAILABLE
+from src.scanner.tfidf_matcher import TfidfIndex, char_ngrams
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +72,15 @@ GAMMA_API = "https://gamma-api.polymarket.com"
 # ─────────────────────────────────────────────────────────────────────────────
 
 try:
-    from thefuzz import fuzz
+    from rapidfuzz import fuzz
     FUZZY_AVAILABLE = True
 except ImportError:
-    FUZZY_AVAILABLE = False
-    logger.warning("⚠️ thefuzz not installed - pip install thefuzz[speedup]")
+    try:
+        from thefuzz import fuzz
+        FUZZY_AVAILABLE = True
+    except ImportError:
+        FUZZY_AVAILABLE = False
+        logger.warning("⚠️ rapidfuzz not installed - pip install rapidfuzz")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -230,26 +241,6 @@ STOPWORDS = {
 }
 
 
-def clean_question(q: str) -> str:
-    """Normalize question for better matching."""
-    import re
-    
-    # Lowercase
-    q = q.lower()
-    
-    # Remove dates in various formats (keep the question semantic)
-    q = re.sub(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b', '', q)
-    q = re.sub(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d+\b', '', q, flags=re.IGNORECASE)
-    
-    # Remove special chars but keep spaces
-    q = re.sub(r'[^\w\s]', ' ', q)
-    
-    # Collapse whitespace
-    q = ' '.join(q.split())
-    
-    return q.strip()
-
-
 def has_opposite_indicators(q1: str, q2: str) -> bool:
     """
     Check if questions have contradicting indicators.
@@ -269,6 +260,24 @@ def has_opposite_indicators(q1: str, q2: str) -> bool:
     return False
 
 
+def _score_clean(clean_a: str, clean_b: str) -> float:
+    """Fuzzy score for two questions already passed through clean_question()."""
+    if not FUZZY_AVAILABLE:
+        # Fallback: simple word overlap
+        words_a = set(clean_a.split()) - STOPWORDS
+        words_b = set(clean_b.split()) - STOPWORDS
+        
+        if not words_a:
+            return 0
+        
+        overlap = len(words_a & words_b)
+        return (overlap / max(len(words_a), len(words_b))) * 100
+    
+    # Use token_sort_ratio - handles word reordering. rapidfuzz returns a
+    # float; round it like thefuzz did so the 60/85 thresholds keep their meaning
+    return round(fuzz.token_sort_ratio(clean_a, clean_b))
+
+
 def calculate_match_score(poly_q: str, pb_q: str) -> float:
     """
     Calculate fuzzy match score between two questions.
@@ -279,134 +288,455 @@ def calculate_match_score(poly_q: str, pb_q: str) -> float:
     Returns:
         Score 0-100 (higher = better match)
     """
-    if not FUZZY_AVAILABLE:
-        # Fallback: simple word overlap
-        poly_words = set(clean_question(poly_q).split()) - STOPWORDS
-        pb_words = set(clean_question(pb_q).split()) - STOPWORDS
+    return _score_clean(clean_question(poly_q), clean_question(pb_q))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CANDIDATE BLOCKING
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Asset names -> ticker, so "bitcoin" and "btc" land in the same block
+ASSET_ALIASES = {
+    "bitcoin": "btc", "btc": "btc",
+    "ethereum": "eth", "ether": "eth", "eth": "eth",
+    "solana": "sol", "sol": "sol",
+    "dogecoin": "doge", "doge": "doge",
+    "xrp": "xrp", "ripple": "xrp",
+}
+
+_NUMBER_SUFFIXES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+
+def _normalize_number(token: str) -> Optional[str]:
+    """'100k' -> '100000', '2026' -> '2026'; None if not a number token."""
+    if token.isdigit():
+        return token.lstrip("0") or "0"
+    if len(token) > 1 and token[-1] in _NUMBER_SUFFIXES and token[:-1].isdigit():
+        return str(int(token[:-1]) * _NUMBER_SUFFIXES[token[-1]])
+    return None
+
+
+def blocking_tokens(clean_q: str) -> Tuple[set, set]:
+    """
+    Tokens used to block a cleaned question.
+    
+    Returns:
+        (tokens, key_tokens): stopword-stripped tokens with assets and
+        numbers normalized, and the subset that names a team or asset
+        (always used for blocking, however common)
+    """
+    tokens = set()
+    keys = set()
+    for word in clean_q.split():
+        if word in STOPWORDS or word in OPPOSITE_INDICATORS:
+            continue
+        asset = ASSET_ALIASES.get(word)
+        if asset:
+            tokens.add(asset)
+            keys.add(asset)
+            continue
+        number = _normalize_number(word)
+        if number is not None:
+            tokens.add(number)
+            continue
+        if len(word) < 2:
+            continue
+        tokens.add(word)
+        if word in _TEAM_TOKENS:
+            keys.add(word)
+    return tokens, keys
+
+
+class MatchIndex:
+    """
+    Inverted index over PredictBase questions for candidate blocking.
+    
+    Instead of fuzzy-scoring every Poly question against every PB question,
+    only PB questions sharing a rare token (or a team/asset token) with the
+    Poly question are scored. A token is rare when it appears in at most
+    max(min_df, max_df_ratio * n) PB questions; questions with no rare
+    token fall back to their `fallback_tokens` least common tokens.
+    
+    Parameters:
+        cleaned: PB questions already passed through clean_question()
+        max_df_ratio: Document-frequency share above which a token is common
+        min_df: Floor for the rare-token cutoff (small universes)
+        fallback_tokens: Tokens used when a question has no rare token
+    """
+    
+    def __init__(
+        self,
+        cleaned: List[str],
+        max_df_ratio: float = 0.05,
+        min_df: int = 25,
+        fallback_tokens: int = 3,
+    ):
+        self.size = len(cleaned)
+        self.max_df = max(min_df, int(max_df_ratio * self.size))
+        self.fallback_tokens = fallback_tokens
         
-        if not poly_words:
-            return 0
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for i, clean in enumerate(cleaned):
+            tokens, _ = blocking_tokens(clean)
+            for token in tokens:
+                postings[token].append(i)
+        self._postings = dict(postings)
         
-        overlap = len(poly_words & pb_words)
-        return (overlap / max(len(poly_words), len(pb_words))) * 100
+        self._queries = 0
+        self._candidates = 0
+    
+    def df(self, token: str) -> int:
+        return len(self._postings.get(token, ()))
+    
+    def candidates(self, clean_q: str) -> List[int]:
+        """Indices of PB questions worth scoring against a cleaned question."""
+        tokens, keys = blocking_tokens(clean_q)
+        present = [t for t in tokens if t in self._postings]
+        
+        blocking = [t for t in present if t in keys or self.df(t) <= self.max_df]
+        if not blocking:
+            blocking = sorted(present, key=self.df)[:self.fallback_tokens]
+        
+        found = set()
+        for token in blocking:
+            found.update(self._postings[token])
+        
+        self._queries += 1
+        self._candidates += len(found)
+        return sorted(found)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pb_markets": self.size,
+            "tokens": len(self._postings),
+            "max_df": self.max_df,
+            "queries": self._queries,
+            "candidates_scored": self._candidates,
+            "cross_product": self._queries * self.size,
+            "avg_candidates": round(self._candidates / max(1, self._queries), 1),
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TF-IDF RETRIEVAL
+# ─────────────────────────────────────────────────────────────────────────────
+
+TFIDF_TOP_K = 5  # Neighbours re-ranked with the fuzzy score per Poly question
+
+
+def tfidf_features(clean_q: str) -> List[str]:
+    """Blocking tokens (assets/numbers normalized) plus their character 3-grams."""
+    tokens, _ = blocking_tokens(clean_q)
+    features = []
+    for token in tokens:
+        features.append("w:" + token)
+        features.extend(char_ngrams(token))
+    return features
+
+
+def _best_pairs_tfidf(
+    poly_questions: List[str],
+    pb_questions: List[str],
+    poly_cleaned: List[str],
+    pb_cleaned: List[str],
+    k: int,
+) -> List[Tuple[int, int, float, bool]]:
+    """
+    TF-IDF top-k neighbours per Poly question, re-ranked.
     
-    # Use token_sort_ratio - handles word reordering
-    clean_poly = clean_question(poly_q)
-    clean_pb = clean_question(pb_q)
+    Among the k neighbours, the best fuzzy score without an opposite
+    indicator wins; vetoed neighbours are only kept when nothing else is.
+    """
+    index = TfidfIndex(pb_cleaned, analyzer=tfidf_features)
+    top_idx, _ = index.top_k(poly_cleaned, k=k)
     
-    score = fuzz.token_sort_ratio(clean_poly, clean_pb)
+    best_pairs = []
+    for i, candidates in enumerate(top_idx.tolist()):
+        if not poly_cleaned[i]:
+            continue
+        best = None  # (not opposite, score), j
+        for j in candidates:
+            if j < 0 or not pb_cleaned[j]:
+                continue
+            score = _score_clean(poly_cleaned[i], pb_cleaned[j])
+            if score <= 0:
+                continue
+            opposite = has_opposite_indicators(poly_questions[i], pb_questions[j])
+            rank = (not opposite, score)
+            if best is None or rank > best[0]:
+                best = (rank, j)
+        if best is not None:
+            (not_opposite, score), j = best
+            best_pairs.append((i, j, score, not not_opposite))
+    
+    logger.debug(f"🧮 TF-IDF index: {index.get_stats()}")
+    return best_pairs
+
+
+def _best_pairs_python(
+    poly_cleaned: List[str],
+    pb_cleaned: List[str],
+    index: Optional[MatchIndex],
+) -> List[Tuple[int, int, float]]:
+    """Best PB index per Poly question, scored pair by pair."""
+    best_pairs = []
+    all_candidates = range(len(pb_cleaned))
+    
+    for i, clean_poly in enumerate(poly_cleaned):
+        if not clean_poly:
+            continue
+        
+        best_j = -1
+        best_score = 0
+        
+        candidates = index.candidates(clean_poly) if index else all_candidates
+        for j in candidates:
+            clean_pb = pb_cleaned[j]
+            if not clean_pb:
+                continue
+            
+            score = _score_clean(clean_poly, clean_pb)
+            
+            if score > best_score:
+                best_score = score
+                best_j = j
+        
+        if best_j >= 0:
+            best_pairs.append((i, best_j, best_score))
     
-    return score
+    return best_pairs
+
+
+def match_questions(
+    poly_questions: List[str],
+    pb_questions: List[str],
+    use_index: bool = True,
+    use_matrix: Optional[bool] = None,
+    poly_cleaned: Optional[List[str]] = None,
+    pb_cleaned: Optional[List[str]] = None,
+    use_tfidf: bool = False,
+    tfidf_k: int = TFIDF_TOP_K,
+) -> List[Tuple[int, int, float, bool]]:
+    """
+    Best PB question for each Poly question.
+    
+    With rapidfuzz, the whole score matrix is computed in C++ on all cores
+    (fuzzy_matrix) and the opposite-indicator veto is vectorized. Without
+    it, each Poly question is only scored against PB questions sharing a
+    rare/team/asset token (MatchIndex), so cost scales with candidates,
+    not n*m.
+    
+    With use_tfidf, candidates are instead the tfidf_k nearest PB
+    questions by TF-IDF cosine over words and character n-grams (robust to
+    rewording), re-ranked by fuzzy score and the opposite-indicator veto.
+    
+    Args:
+        poly_questions, pb_questions: Raw question texts
+        use_index: Block candidates with MatchIndex on the Python path
+            (False = brute force, used to measure recall)
+        use_matrix: Score matrix via rapidfuzz (default: when installed)
+        poly_cleaned, pb_cleaned: clean_question() outputs, if already known
+        use_tfidf: Retrieve candidates with the local TF-IDF index
+        tfidf_k: Neighbours re-ranked per Poly question (use_tfidf)
+        
+    Returns:
+        [(poly index, pb index, score, opposite)] for Poly questions with
+        any candidate; `opposite` is the has_opposite_indicators veto
+    """
+    if use_matrix is None:
+        use_matrix = RAPIDFUZZ_AVAILABLE
+    if poly_cleaned is None:
+        poly_cleaned = [clean_question(q) for q in poly_questions]
+    if pb_cleaned is None:
+        pb_cleaned = [clean_question(q) for q in pb_questions]
+    
+    if use_tfidf:
+        return _best_pairs_tfidf(poly_questions, pb_questions, poly_cleaned, pb_cleaned, tfidf_k)
+    
+    if use_matrix:
+        best_idx, best_score = fuzzy_matrix.best_matches(
+            poly_cleaned, pb_cleaned, round_scores=True
+        )
+        veto = fuzzy_matrix.opposite_veto(
+            poly_questions, pb_questions, best_idx, OPPOSITE_INDICATORS
+        )
+        return [
+            (int(i), int(best_idx[i]), float(best_score[i]), bool(veto[i]))
+            for i in np.flatnonzero(best_idx >= 0)
+        ]
+    
+    index = MatchIndex(pb_cleaned) if use_index else None
+    best_pairs = _best_pairs_python(poly_cleaned, pb_cleaned, index)
+    if index:
+        stats = index.get_stats()
+        logger.debug(
+            f"🧮 Scored {stats['candidates_scored']} candidates "
+            f"(cross product {stats['cross_product']})"
+        )
+    return [
+        (i, j, score, has_opposite_indicators(poly_questions[i], pb_questions[j]))
+        for i, j, score in best_pairs
+    ]
+
+
+def build_market_pair(poly: Dict, pb: Any, score: float) -> Optional[MarketPair]:
+    """MarketPair with normalized prices; None if either side has no valid price."""
+    poly_yes = normalize_poly_price(poly.get('yes_price') or poly.get('outcomePrices', [0.5])[0])
+    poly_no = normalize_poly_price(poly.get('no_price') or (1 - poly_yes))
+    
+    pb_yes = normalize_pb_price(pb.yes_price if hasattr(pb, 'yes_price') else 0)
+    pb_no = normalize_pb_price(pb.no_price if hasattr(pb, 'no_price') else 0)
+    
+    # Skip if no valid prices
+    if poly_yes <= 0 or pb_yes <= 0:
+        return None
+    
+    return MarketPair(
+        poly_question=poly.get('question', '') or '',
+        poly_condition_id=poly.get('condition_id') or poly.get('conditionId', ''),
+        poly_token_id=poly.get('token_id') or '',
+        poly_yes_price=poly_yes,
+        poly_no_price=poly_no,
+        poly_volume=float(poly.get('volume_24h') or poly.get('volume') or 0),
+        pb_question=pb.question,
+        pb_market_id=pb.market_id if hasattr(pb, 'market_id') else '',
+        pb_yes_price=pb_yes,
+        pb_no_price=pb_no,
+        pb_volume=pb.volume if hasattr(pb, 'volume') else 0,
+        match_score=score,
+    )
 
 
 def batch_match_markets(
     poly_markets: List[Dict],
     pb_markets: List[Any],
     threshold: int = 85,
-    max_matches: int = 100
+    max_matches: Optional[int] = None,
+    use_index: bool = True,
+    use_matrix: Optional[bool] = None,
+    use_tfidf: bool = False,
 ) -> List[MarketPair]:
     """
     Batch fuzzy match Polymarket and PredictBase markets.
     
-    This is much more efficient than per-market lookup because:
-    - Single pass through both lists
-    - O(n*m) but with early termination
-    - Caches cleaned questions
+    This is much more efficient than per-market lookup: questions are
+    cleaned once and scored in bulk (see match_questions).
     
     Args:
         poly_markets: List of Polymarket market dicts
         pb_markets: List of PredictBaseMarket objects
         threshold: Minimum fuzzy score (0-100)
-        max_matches: Maximum matches to return
+        max_matches: Maximum matches to return (best scores kept; None = all)
+        use_index: Block candidates with MatchIndex on the Python path
+            (False = brute force, used to measure recall)
+        use_matrix: Score matrix via rapidfuzz (default: when installed)
+        use_tfidf: TF-IDF top-k retrieval + fuzzy re-rank (see match_questions)
         
     Returns:
         List of MarketPair objects sorted by match score
     """
     matches: List[MarketPair] = []
     
-    # Pre-clean PB questions
-    pb_cleaned = []
-    for pb in pb_markets:
-        q = getattr(pb, 'question', '') or ''
-        pb_cleaned.append((pb, clean_question(q)))
+    poly_questions = [poly.get('question', '') or '' for poly in poly_markets]
+    pb_questions = [getattr(pb, 'question', '') or '' for pb in pb_markets]
     
     logger.info(f"🔍 Matching {len(poly_markets)} Poly markets vs {len(pb_markets)} PB markets...")
     
-    for poly in poly_markets:
-        poly_q = poly.get('question', '') or ''
-        clean_poly = clean_question(poly_q)
-        
-        if not clean_poly:
-            continue
-        
-        # Find best PB match for this Poly market
-        best_pb = None
-        best_score = 0
-        
-        for pb, clean_pb in pb_cleaned:
-            if not clean_pb:
-                continue
-            
-            score = calculate_match_score(clean_poly, clean_pb)
-            
-            if score > best_score:
-                best_score = score
-                best_pb = pb
-        
+    best_pairs = match_questions(
+        poly_questions, pb_questions, use_index, use_matrix, use_tfidf=use_tfidf
+    )
+    
+    for i, j, best_score, opposite in best_pairs:
         # Check threshold
-        if best_score < threshold or best_pb is None:
+        if best_score < threshold:
             continue
         
         # Check for opposite indicators (skip contradicting questions)
-        if has_opposite_indicators(poly_q, best_pb.question):
-            logger.debug(f"⚠️ Skipping opposite match: '{poly_q[:40]}' vs '{best_pb.question[:40]}'")
+        if opposite:
+            logger.debug(f"⚠️ Skipping opposite match: '{poly_questions[i][:40]}' "
+                         f"vs '{pb_questions[j][:40]}'")
             continue
         
-        # Extract prices
-        poly_yes = normalize_poly_price(poly.get('yes_price') or poly.get('outcomePrices', [0.5])[0])
-        poly_no = normalize_poly_price(poly.get('no_price') or (1 - poly_yes))
-        
-        pb_yes = normalize_pb_price(best_pb.yes_price if hasattr(best_pb, 'yes_price') else 0)
-        pb_no = normalize_pb_price(best_pb.no_price if hasattr(best_pb, 'no_price') else 0)
-        
-        # Skip if no valid prices
-        if poly_yes <= 0 or pb_yes <= 0:
-            continue
-        
-        pair = MarketPair(
-            poly_question=poly_q,
-            poly_condition_id=poly.get('condition_id') or poly.get('conditionId', ''),
-            poly_token_id=poly.get('token_id') or '',
-            poly_yes_price=poly_yes,
-            poly_no_price=poly_no,
-            poly_volume=float(poly.get('volume_24h') or poly.get('volume') or 0),
-            pb_question=best_pb.question,
-            pb_market_id=best_pb.market_id if hasattr(best_pb, 'market_id') else '',
-            pb_yes_price=pb_yes,
-            pb_no_price=pb_no,
-            pb_volume=best_pb.volume if hasattr(best_pb, 'volume') else 0,
-            match_score=best_score,
-        )
-        
-        matches.append(pair)
-        
-        if len(matches) >= max_matches:
-            break
+        pair = build_market_pair(poly_markets[i], pb_markets[j], best_score)
+        if pair:
+            matches.append(pair)
     
     # Sort by match score descending
     matches.sort(key=lambda x: x.match_score, reverse=True)
+    if max_matches is not None:
+        matches = matches[:max_matches]
     
     logger.info(f"✅ Found {len(matches)} market pairs with score >= {threshold}")
     
     return matches
 
 
+def measure_blocking_recall(
+    poly_markets: List[Dict],
+    pb_markets: List[Any],
+    threshold: int = 85,
+    use_tfidf: bool = False,
+) -> Dict[str, Any]:
+    """
+    Compare indexed matching against the brute-force cross product.
+    
+    With use_tfidf, the TF-IDF top-k retrieval is measured instead of
+    MatchIndex blocking.
+    
+    Returns:
+        Dict with brute/indexed pair counts, recall (share of brute-force
+        pairs also found by the index) and timings
+    """
+    import time
+    
+    start = time.perf_counter()
+    brute = batch_match_markets(
+        poly_markets, pb_markets, threshold, use_index=False, use_matrix=False
+    )
+    brute_s = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    indexed = batch_match_markets(
+        poly_markets, pb_markets, threshold, use_index=True, use_matrix=False,
+        use_tfidf=use_tfidf,
+    )
+    indexed_s = time.perf_counter() - start
+    
+    brute_pairs = {(p.poly_question, p.pb_question) for p in brute}
+    indexed_pairs = {(p.poly_question, p.pb_question) for p in indexed}
+    found = len(brute_pairs & indexed_pairs)
+    
+    return {
+        "brute_pairs": len(brute_pairs),
+        "indexed_pairs": len(indexed_pairs),
+        "recall": found / len(brute_pairs) if brute_pairs else 1.0,
+        "brute_s": round(brute_s, 3),
+        "indexed_s": round(indexed_s, 3),
+    }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TARGETED POLYMARKET FETCHING (Sports Categories)
 # ─────────────────────────────────────────────────────────────────────────────
 
 import re as _re
 
+# Team names, matched as whole words by SPORTS_KEYWORDS and used as
+# blocking keys by MatchIndex
+NFL_TEAMS = (
+    'chiefs', 'eagles', 'bills', 'ravens', '49ers', 'cowboys', 'lions', 'packers', 'dolphins',
+    'bengals', 'jets', 'bears', 'rams', 'chargers', 'vikings', 'seahawks', 'steelers', 'broncos',
+    'saints', 'cardinals', 'colts', 'falcons', 'panthers', 'commanders', 'texans', 'browns',
+    'jaguars', 'raiders', 'titans', 'giants', 'patriots', 'buccaneers',
+)
+
+NBA_TEAMS = (
+    'lakers', 'celtics', 'warriors', 'bucks', 'suns', 'nuggets', 'heat', 'cavaliers', 'mavericks',
+    'thunder', 'grizzlies', 'clippers', 'kings', 'rockets', 'nets', 'knicks', 'sixers',
+    'timberwolves', 'pelicans', 'hawks', 'bulls', 'hornets', 'pistons', 'pacers', 'magic',
+    'raptors', 'wizards', 'spurs', 'jazz', 'blazers',
+)
+
 # Sports keywords for filtering (since category param doesn't work)
 # Use word boundary matching to avoid false positives like "inflation" matching "nfl"
 SPORTS_KEYWORDS = [
@@ -423,17 +753,9 @@ SPORTS_KEYWORDS = [
     r'\bworld series\b', r'\bstanley cup\b', r'\bfinals\b',
     r'\bmvp\b', r'\brookie of the year\b', r'\bscoring leader\b',
     # NFL Teams
-    r'\bchiefs\b', r'\beagles\b', r'\bbills\b', r'\bravens\b', r'\b49ers\b', r'\bcowboys\b', r'\blions\b',
-    r'\bpackers\b', r'\bdolphins\b', r'\bbengals\b', r'\bjets\b', r'\bbears\b', r'\brams\b', r'\bchargers\b',
-    r'\bvikings\b', r'\bseahawks\b', r'\bsteelers\b', r'\bbroncos\b', r'\bsaints\b', r'\bcardinals\b',
-    r'\bcolts\b', r'\bfalcons\b', r'\bpanthers\b', r'\bcommanders\b', r'\btexans\b', r'\bbrowns\b',
-    r'\bjaguars\b', r'\braiders\b', r'\btitans\b', r'\bgiants\b', r'\bpatriots\b', r'\bbuccaneers\b',
-    # NBA Teams  
-    r'\blakers\b', r'\bceltics\b', r'\bwarriors\b', r'\bbucks\b', r'\bsuns\b', r'\bnuggets\b', r'\bheat\b',
-    r'\bcavaliers\b', r'\bmavericks\b', r'\bthunder\b', r'\bgrizzlies\b', r'\bclippers\b', r'\bkings\b',
-    r'\brockets\b', r'\bnets\b', r'\bknicks\b', r'\bsixers\b', r'\btimberwolves\b', r'\bpelicans\b',
-    r'\bhawks\b', r'\bbulls\b', r'\bhornets\b', r'\bpistons\b', r'\bpacers\b', r'\bmagic\b', r'\braptors\b',
-    r'\bwizards\b', r'\bspurs\b', r'\bjazz\b', r'\bblazers\b',
+    *(rf'\b{team}\b' for team in NFL_TEAMS),
+    # NBA Teams
+    *(rf'\b{team}\b' for team in NBA_TEAMS),
     # Conferences
     r'\bnfc\b', r'\bafc\b', r'\beastern conference\b', r'\bwestern conference\b',
 ]
@@ -441,6 +763,10 @@ SPORTS_KEYWORDS = [
 # Compile regex pattern once for efficiency
 _SPORTS_PATTERN = _re.compile('|'.join(SPORTS_KEYWORDS), _re.IGNORECASE)
 
+# Blocking keys for MatchIndex. Leagues/sports/events are left out: they
+# are too common to narrow anything.
+_TEAM_TOKENS = frozenset(NFL_TEAMS + NBA_TEAMS)
+
 def _is_sports_question(question: str) -> bool:
     """Check if question is sports-related using word boundary matching."""
     return bool(_SPORTS_PATTERN.search(question))
@@ -449,6 +775,7 @@ async def fetch_targeted_markets(
     limit: int = 500,
     use_events: bool = True,
     use_keyword_filter: bool = True,
+    transport: Optional[HttpTransport] = None,
 ) -> List[Dict]:
     """
     Fetch Polymarket sports markets using WORKING strategies.
@@ -462,6 +789,7 @@ async def fetch_targeted_markets(
         limit: Max markets to fetch
         use_events: Include events-based fetching
         use_keyword_filter: Include keyword-filtered markets
+        transport: HTTP transport (default: the shared pooled transport)
         
     Returns:
         List of sports market dicts ready for ARB matching
@@ -469,112 +797,112 @@ async def fetch_targeted_markets(
     all_markets = []
     seen_ids = set()
     
-    async with httpx.AsyncClient(timeout=30) as client:
-        
-        # STRATEGY 1: Fetch via Events endpoint
-        if use_events:
-            try:
-                logger.info("   📅 Fetching sports via Events endpoint...")
+    client = transport or get_transport()
+    
+    # STRATEGY 1: Fetch via Events endpoint
+    if use_events:
+        try:
+            logger.info("   📅 Fetching sports via Events endpoint...")
+            resp = await client.get(
+                f"{GAMMA_API}/events",
+                params={"limit": 100, "active": "true"}
+            )
+            
+            if resp.status_code == 200:
+                events = resp.json()
+                sports_events = []
+                
+                for event in events:
+                    title = event.get('title', '')
+                    slug = event.get('slug', '')
+                    combined = f"{title} {slug}"
+                    
+                    if _is_sports_question(combined):
+                        sports_events.append(event)
+                
+                logger.info(f"   📅 Found {len(sports_events)} sports events")
+                
+                # Get markets from each sports event
+                for event in sports_events[:30]:  # Limit API calls
+                    event_slug = event.get('slug')
+                    if event_slug:
+                        try:
+                            resp = await client.get(
+                                f"{GAMMA_API}/events/{event_slug}"
+                            )
+                            if resp.status_code == 200:
+                                event_data = resp.json()
+                                markets = event_data.get('markets', [])
+                                for m in markets:
+                                    question = m.get('question', '')
+                                    # Double-check: only add if question is sports
+                                    if _is_sports_question(question):
+                                        cid = m.get("conditionId") or m.get("condition_id")
+                                        if cid and cid not in seen_ids:
+                                            seen_ids.add(cid)
+                                            all_markets.append(m)
+                            await asyncio.sleep(0.05)
+                        except:
+                            pass
+                
+                logger.info(f"   📅 Got {len(all_markets)} markets from events")
+                
+        except Exception as e:
+            logger.warning(f"Events fetch failed: {e}")
+    
+    # STRATEGY 2: Fetch bulk markets and filter by keywords
+    if use_keyword_filter:
+        try:
+            logger.info("   🔍 Fetching markets with keyword filtering...")
+            
+            # Fetch in batches (API returns 100 per request)
+            offset = 0
+            batch_size = 100
+            total_fetched = 0
+            sports_found = 0
+            
+            while total_fetched < limit:
                 resp = await client.get(
-                    f"{GAMMA_API}/events",
-                    params={"limit": 100, "active": "true"}
+                    f"{GAMMA_API}/markets",
+                    params={
+                        "limit": batch_size,
+                        "offset": offset,
+                        "active": "true",
+                        "closed": "false",
+                    }
                 )
                 
-                if resp.status_code == 200:
-                    events = resp.json()
-                    sports_events = []
-                    
-                    for event in events:
-                        title = event.get('title', '')
-                        slug = event.get('slug', '')
-                        combined = f"{title} {slug}"
-                        
-                        if _is_sports_question(combined):
-                            sports_events.append(event)
-                    
-                    logger.info(f"   📅 Found {len(sports_events)} sports events")
-                    
-                    # Get markets from each sports event
-                    for event in sports_events[:30]:  # Limit API calls
-                        event_slug = event.get('slug')
-                        if event_slug:
-                            try:
-                                resp = await client.get(
-                                    f"{GAMMA_API}/events/{event_slug}"
-                                )
-                                if resp.status_code == 200:
-                                    event_data = resp.json()
-                                    markets = event_data.get('markets', [])
-                                    for m in markets:
-                                        question = m.get('question', '')
-                                        # Double-check: only add if question is sports
-                                        if _is_sports_question(question):
-                                            cid = m.get("conditionId") or m.get("condition_id")
-                                            if cid and cid not in seen_ids:
-                                                seen_ids.add(cid)
-                                                all_markets.append(m)
-                                await asyncio.sleep(0.05)
-                            except:
-                                pass
-                    
-                    logger.info(f"   📅 Got {len(all_markets)} markets from events")
-                    
-            except Exception as e:
-                logger.warning(f"Events fetch failed: {e}")
-        
-        # STRATEGY 2: Fetch bulk markets and filter by keywords
-        if use_keyword_filter:
-            try:
-                logger.info("   🔍 Fetching markets with keyword filtering...")
+                if resp.status_code != 200:
+                    break
                 
-                # Fetch in batches (API returns 100 per request)
-                offset = 0
-                batch_size = 100
-                total_fetched = 0
-                sports_found = 0
+                markets = resp.json()
+                if not markets:
+                    break
                 
-                while total_fetched < limit:
-                    resp = await client.get(
-                        f"{GAMMA_API}/markets",
-                        params={
-                            "limit": batch_size,
-                            "offset": offset,
-                            "active": "true",
-                            "closed": "false",
-                        }
-                    )
-                    
-                    if resp.status_code != 200:
-                        break
-                    
-                    markets = resp.json()
-                    if not markets:
-                        break
-                    
-                    for m in markets:
-                        question = m.get('question', '')
-                        
-                        # Check if sports-related using word boundary regex
-                        if _is_sports_question(question):
-                            cid = m.get("conditionId") or m.get("condition_id")
-                            if cid and cid not in seen_ids:
-                                seen_ids.add(cid)
-                                all_markets.append(m)
-                                sports_found += 1
+                for m in markets:
+                    question = m.get('question', '')
                     
-                    total_fetched += len(markets)
-                    offset += batch_size
-                    await asyncio.sleep(0.1)
-                    
-                    # Stop if we have enough sports markets
-                    if sports_found >= limit // 2:
-                        break
+                    # Check if sports-related using word boundary regex
+                    if _is_sports_question(question):
+                        cid = m.get("conditionId") or m.get("condition_id")
+                        if cid and cid not in seen_ids:
+                            seen_ids.add(cid)
+                            all_markets.append(m)
+                            sports_found += 1
                 
-                logger.info(f"   🔍 Filtered {sports_found} sports from {total_fetched} markets")
+                total_fetched += len(markets)
+                offset += batch_size
+                await asyncio.sleep(0.1)
                 
-            except Exception as e:
-                logger.warning(f"Keyword filter fetch failed: {e}")
-    
+                # Stop if we have enough sports markets
+                if sports_found >= limit // 2:
+                    break
+            
+            logger.info(f"   🔍 Filtered {sports_found} sports from {total_fetched} markets")
+            
+        except Exception as e:
+            logger.warning(f"Keyword filter fetch failed: {e}")
+
     logger.info(f"🏀 TARGETED FETCH COMPLETE: {len(all_markets)} sports markets")
     return all_markets
 
@@ -656,6 +984,7 @@ class ARBScanner:
         # Clients (lazy init)
         self._pb_client = None
         self._initialized = False
+        self._match_cache = None  # Shared MatchCache (set in __aenter__)
         
         # Stats
         self._total_scans = 0
@@ -677,10 +1006,16 @@ class ARBScanner:
             logger.info("✅ ARBScanner initialized with PredictBase client")
         except Exception as e:
             logger.warning(f"⚠️ Failed to init PredictBase: {e}")
+        
+        from src.scanner.match_cache import get_match_cache
+        self._match_cache = get_match_cache()
+        await self._match_cache.warm_load()
         return self
     
     async def __aexit__(self, *args):
         """Cleanup."""
+        if self._match_cache:
+            await self._match_cache.flush()
         if self._pb_client:
             await self._pb_client.__aexit__(*args)
     
@@ -904,13 +1239,18 @@ class ARBScanner:
         
         logger.info(f"📊 Comparing {len(poly_markets)} Poly vs {len(pb_markets)} PB markets")
         
-        # Batch match markets
-        pairs = batch_match_markets(
-            poly_markets=poly_markets,
-            pb_markets=pb_markets,
-            threshold=self.fuzzy_threshold,
-            max_matches=200  # Limit for performance
-        )
+        # Batch match markets (known pairs come from the match cache)
+        if self._match_cache:
+            pairs = self._match_cache.match_markets(
+                poly_markets, pb_markets, threshold=self.fuzzy_threshold
+            )
+            await self._match_cache.maybe_flush()
+        else:
+            pairs = batch_match_markets(
+                poly_markets=poly_markets,
+                pb_markets=pb_markets,
+                threshold=self.fuzzy_threshold,
+            )
         
         if not pairs:
             logger.info("📭 No matching market pairs found")
@@ -962,6 +1302,7 @@ class ARBScanner:
             "min_roi_pct": self.min_roi_pct,
             "fuzzy_threshold": self.fuzzy_threshold,
             "paper_mode": self.paper_mode,
+            "match_cache": self._match_cache.get_stats() if self._match_cache else None,
         }
 
 
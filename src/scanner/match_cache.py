@@ -0,0 +1,395 @@
+"""
+Persistent cross-exchange match cache.
+
+Remembers, per Polymarket market, its best PredictBase candidate - both
+accepted and rejected pairs - with the score and a hash of each cleaned
+question, persisted in the MarketMapping table and warm-loaded at startup.
+
+- Known pairs: price refreshes are dictionary lookups, no fuzzy scoring
+- New Poly markets: scored against the PB universe (match_questions)
+- New PB markets: scored against stored (non-manual) entries the next time
+  their Poly market is looked up; only an improvement replaces the entry
+- An entry is recomputed only when the Poly or PB question text changes
+
+Acceptance is decided at lookup time (score >= caller threshold and not
+vetoed), so callers with different thresholds share one cache. Rows with
+match_method "manual" and is_verified set always match.
+
+Usage:
+    cache = get_match_cache()
+    await cache.warm_load()
+    pairs = cache.match_markets(poly_markets, pb_markets, threshold=60)
+    await cache.maybe_flush()
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.scanner.arb_scanner import (
+    MarketPair,
+    build_market_pair,
+    clean_question,
+    match_questions,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    from src.db.multi_strategy_models import (
+        load_market_mappings,
+        missing_columns,
+        save_market_mappings,
+    )
+    DB_AVAILABLE = True
+except Exception as e:
+    DB_AVAILABLE = False
+    logger.debug(f"Match cache persistence unavailable: {e}")
+
+
+def question_hash(clean: str) -> str:
+    """Short stable hash of a cleaned question."""
+    return hashlib.sha1(clean.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class MatchEntry:
+    """Best PB candidate for one Poly market."""
+    poly_condition_id: str
+    poly_question: str
+    poly_question_hash: str
+    pb_market_id: Optional[str] = None
+    pb_question: str = ""
+    pb_question_hash: Optional[str] = None
+    match_score: float = 0.0
+    match_method: str = "fuzzy"  # "fuzzy", "opposite" (vetoed), "manual"
+    is_verified: bool = False
+    last_checked: datetime = field(default_factory=datetime.utcnow)
+    pb_generation: int = 0  # PB universe generation last scored against (not persisted)
+
+    def accepted(self, threshold: float) -> bool:
+        if self.pb_market_id is None:
+            return False
+        if self.match_method == "manual":
+            return self.is_verified
+        return self.match_method != "opposite" and self.match_score >= threshold
+
+    def to_row(self) -> Dict[str, Any]:
+        return {
+            "poly_condition_id": self.poly_condition_id,
+            "poly_question": self.poly_question,
+            "pb_market_id": self.pb_market_id,
+            "pb_question": self.pb_question,
+            "match_score": self.match_score,
+            "match_method": self.match_method,
+            "is_verified": self.is_verified,
+            "poly_question_hash": self.poly_question_hash,
+            "pb_question_hash": self.pb_question_hash,
+            "last_checked": self.last_checked,
+        }
+
+
+@dataclass
+class _PBText:
+    market: Any
+    question: str
+    clean: str
+    hash: str
+
+
+class MatchCache:
+    """
+    Poly -> PB match cache with MarketMapping persistence.
+
+    Parameters:
+        persist: Load/save MarketMapping rows (requires the database)
+        flush_interval: Seconds between persistence flushes in maybe_flush()
+        use_tfidf: Score new markets with TF-IDF retrieval + fuzzy re-rank
+    """
+
+    def __init__(self, persist: bool = True, flush_interval: float = 30.0, use_tfidf: bool = False):
+        self.persist = persist and DB_AVAILABLE
+        self.flush_interval = flush_interval
+        self.use_tfidf = use_tfidf
+
+        self._entries: Dict[str, MatchEntry] = {}  # poly condition_id -> entry
+        self._dirty: Set[str] = set()
+        self._loaded = False
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        # PB universe as last seen: id -> text; id -> generation it appeared in
+        self._pb_list: Optional[List[Any]] = None
+        self._pb: Dict[str, _PBText] = {}
+        self._pb_gen: Dict[str, int] = {}
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._invalidated = 0
+        self._rechecked = 0
+
+    # -------------------------------------------------------------------------
+    # PERSISTENCE
+    # -------------------------------------------------------------------------
+
+    async def warm_load(self) -> int:
+        """
+        Load persisted mappings once; returns the number loaded.
+
+        Raises:
+            RuntimeError: market_mappings predates the question-hash columns;
+                every flush would fail and re-queue, so refuse to start
+        """
+        if self._loaded or not self.persist:
+            self._loaded = True
+            return 0
+        self._loaded = True
+        try:
+            stale = await asyncio.to_thread(missing_columns)
+            rows = [] if stale else await asyncio.to_thread(load_market_mappings)
+        except Exception as e:
+            logger.warning(f"⚠️ Match cache warm load failed: {e}")
+            return 0
+        if stale:
+            raise RuntimeError(
+                f"Match cache: database schema is out of date (missing {stale}); "
+                "run scripts/multi_strategy_daemon.py --init-db to add the columns"
+            )
+
+        for row in rows:
+            if not row.get("poly_condition_id"):
+                continue
+            row["match_score"] = row.get("match_score") or 0.0
+            row["match_method"] = row.get("match_method") or "fuzzy"
+            row["is_verified"] = bool(row.get("is_verified"))
+            row["last_checked"] = row.get("last_checked") or datetime.utcnow()
+            row["pb_question"] = row.get("pb_question") or ""
+            row["poly_question"] = row.get("poly_question") or ""
+            entry = MatchEntry(**row)
+            self._entries[entry.poly_condition_id] = entry
+        logger.info(f"🗂️ Match cache: {len(self._entries)} mappings loaded")
+        return len(self._entries)
+
+    async def flush(self) -> int:
+        """Persist entries changed since the last flush."""
+        async with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._dirty:
+                return 0
+            dirty, self._dirty = self._dirty, set()
+            if not self.persist:
+                return 0
+            rows = [self._entries[cid].to_row() for cid in dirty if cid in self._entries]
+            try:
+                return await asyncio.to_thread(save_market_mappings, rows)
+            except Exception as e:
+                self._dirty |= dirty  # Retry next flush
+                logger.warning(f"⚠️ Match cache flush failed ({len(rows)} rows): {e}")
+                return 0
+
+    async def maybe_flush(self):
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    # -------------------------------------------------------------------------
+    # MATCHING
+    # -------------------------------------------------------------------------
+
+    def _sync_pb(self, pb_markets: List[Any]):
+        """
+        Refresh PB texts (recleaning only changed questions).
+
+        New or edited PB markets get a new generation; entries scored
+        against an older generation are rechecked against them.
+        """
+        if pb_markets is self._pb_list:
+            return
+
+        current: Dict[str, _PBText] = {}
+        generations: Dict[str, int] = {}
+        new_generation = self._generation + 1
+        for pb in pb_markets:
+            pid = str(getattr(pb, "market_id", "") or "")
+            question = getattr(pb, "question", "") or ""
+            if not pid:
+                continue
+            known = self._pb.get(pid)
+            if known and known.question == question:
+                known.market = pb
+                current[pid] = known
+                generations[pid] = self._pb_gen[pid]
+            else:
+                clean = clean_question(question)
+                current[pid] = _PBText(pb, question, clean, question_hash(clean))
+                generations[pid] = new_generation  # New or edited: score it again
+        if new_generation in generations.values():
+            self._generation = new_generation
+        self._pb = current
+        self._pb_gen = generations
+        self._pb_list = pb_markets
+
+    def _is_valid(self, entry: MatchEntry, poly_hash: str) -> bool:
+        """False when the Poly question or the matched PB question changed."""
+        if entry.poly_question_hash != poly_hash:
+            return False
+        pb = self._pb.get(entry.pb_market_id) if entry.pb_market_id else None
+        return pb is None or pb.hash == entry.pb_question_hash
+
+    def match_markets(
+        self,
+        poly_markets: List[Dict],
+        pb_markets: List[Any],
+        threshold: float,
+    ) -> List[MarketPair]:
+        """
+        Accepted pairs for poly_markets, with current prices.
+
+        Poly markets without a valid entry are scored against the whole PB
+        universe; valid entries only against PB markets that appeared since
+        they were last scored, whatever the caller's threshold.
+
+        Returns:
+            MarketPair list sorted by match score
+        """
+        self._sync_pb(pb_markets)
+        pb_ids = list(self._pb)
+
+        to_match: List[Tuple[Dict, str, str, str]] = []  # poly, cid, question, clean
+        to_recheck: Dict[int, List[Tuple[Dict, str, str, str]]] = {}  # by generation
+        for poly in poly_markets:
+            question = poly.get("question", "") or ""
+            cid = poly.get("condition_id") or poly.get("conditionId") or question
+            if not question:
+                continue
+            entry = self._entries.get(cid)
+            if entry is not None and entry.poly_question == question:
+                poly_hash = entry.poly_question_hash
+                clean = None
+            else:
+                clean = clean_question(question)
+                poly_hash = question_hash(clean)
+
+            if entry is not None and self._is_valid(entry, poly_hash):
+                self._hits += 1
+                if entry.match_method != "manual" and entry.pb_generation < self._generation:
+                    to_recheck.setdefault(entry.pb_generation, []).append(
+                        (poly, cid, question, clean or clean_question(question))
+                    )
+                continue
+
+            if entry is not None:
+                self._invalidated += 1
+            self._misses += 1
+            to_match.append((poly, cid, question, clean or clean_question(question)))
+
+        if to_match:
+            self._score(to_match, pb_ids, replace=True)
+        for generation, polys in to_recheck.items():
+            self._rechecked += len(polys)
+            new_pb_ids = [pid for pid, gen in self._pb_gen.items() if gen > generation]
+            self._score(polys, new_pb_ids, replace=False)
+
+        pairs = []
+        for poly in poly_markets:
+            question = poly.get("question", "") or ""
+            cid = poly.get("condition_id") or poly.get("conditionId") or question
+            entry = self._entries.get(cid)
+            if entry is None or not entry.accepted(threshold):
+                continue
+            pb = self._pb.get(entry.pb_market_id)
+            if pb is None:
+                continue  # PB market not in the current list: no price
+            pair = build_market_pair(poly, pb.market, entry.match_score)
+            if pair:
+                pairs.append(pair)
+        pairs.sort(key=lambda p: p.match_score, reverse=True)
+        return pairs
+
+    def _score(self, polys: List[Tuple[Dict, str, str, str]], pb_ids: List[str], replace: bool):
+        """Fuzzy-score polys against pb_ids and store the best candidate each."""
+        if not pb_ids:
+            for _, cid, _, _ in polys:
+                if cid in self._entries:
+                    self._entries[cid].pb_generation = self._generation
+            return
+        pbs = [self._pb[pid] for pid in pb_ids]
+        best = {
+            i: (j, score, opposite)
+            for i, j, score, opposite in match_questions(
+                [question for _, _, question, _ in polys],
+                [pb.question for pb in pbs],
+                poly_cleaned=[clean for _, _, _, clean in polys],
+                pb_cleaned=[pb.clean for pb in pbs],
+                use_tfidf=self.use_tfidf,
+            )
+        }
+
+        now = datetime.utcnow()
+        for i, (poly, cid, question, clean) in enumerate(polys):
+            j, score, opposite = best.get(i, (None, 0.0, False))
+            current = self._entries.get(cid)
+            if not replace and current is not None:
+                current_score = 0.0 if current.match_method == "opposite" else current.match_score
+                if j is None or opposite or score <= current_score:
+                    current.last_checked = now
+                    current.pb_generation = self._generation
+                    continue  # New PB markets did not beat the stored candidate
+
+            pb = pbs[j] if j is not None else None
+            self._entries[cid] = MatchEntry(
+                poly_condition_id=cid,
+                poly_question=question,
+                poly_question_hash=question_hash(clean),
+                pb_market_id=pb_ids[j] if pb else None,
+                pb_question=pb.question if pb else "",
+                pb_question_hash=pb.hash if pb else None,
+                match_score=float(score),
+                match_method="opposite" if opposite else "fuzzy",
+                last_checked=now,
+                pb_generation=self._generation,
+            )
+            self._dirty.add(cid)
+
+    def match_one(
+        self, poly: Dict, pb_markets: List[Any], threshold: float
+    ) -> Optional[MarketPair]:
+        """Accepted pair for a single Poly market (dict lookup when known)."""
+        pairs = self.match_markets([poly], pb_markets, threshold)
+        return pairs[0] if pairs else None
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "pending_writes": len(self._dirty),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "invalidated": self._invalidated,
+            "rechecked": self._rechecked,
+            "persist": self.persist,
+        }
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_cache: Optional[MatchCache] = None
+
+
+def get_match_cache() -> MatchCache:
+    """Get the shared match cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = MatchCache()
+    return _cache
@@ -0,0 +1,277 @@
+"""Incremental L2 order book maintained from WebSocket snapshots and deltas."""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+# Polymarket prices sit on a 0.01 or 0.001 grid inside (0, 1)
+TICKS_PER_UNIT = 1000
+
+BID = "bid"
+ASK = "ask"
+
+_SIDE_ALIASES = {
+    "bid": BID, "bids": BID, "buy": BID, "buys": BID,
+    "ask": ASK, "asks": ASK, "sell": ASK, "sells": ASK,
+}
+
+
+def price_to_tick(price: float) -> int:
+    """Price -> integer tick on the 0.001 grid."""
+    return int(round(price * TICKS_PER_UNIT))
+
+
+def tick_to_price(tick: int) -> float:
+    """Integer tick -> price."""
+    return tick / TICKS_PER_UNIT
+
+
+def normalize_side(side: str) -> str | None:
+    """Map "BUY"/"bids"/... to BID and "SELL"/"asks"/... to ASK (None if unknown)."""
+    return _SIDE_ALIASES.get(str(side).lower())
+
+
+def parse_level(level: Any) -> tuple[float, float] | None:
+    """(price, size) from a {"price", "size"} dict, a .price/.size object or a pair."""
+    try:
+        if isinstance(level, dict):
+            return float(level.get("price", 0)), float(level.get("size", 0))
+        if hasattr(level, "price"):
+            return float(level.price), float(level.size)
+        price, size = level
+        return float(price), float(size)
+    except (ValueError, TypeError):
+        return None
+
+
+class BookSide:
+    """
+    One side of an L2 book: tick -> size plus the ticks in best-first order.
+
+    Keys are stored so that ascending order is best-first on both sides
+    (bid ticks negated), so the best level is always index 0. Updating an
+    existing level is O(1); adding or removing one is a bisect plus a
+    small list move.
+    """
+
+    __slots__ = ("is_bid", "_sizes", "_keys")
+
+    def __init__(self, is_bid: bool) -> None:
+        self.is_bid = is_bid
+        self._sizes: dict[int, float] = {}  # key -> size
+        self._keys: list[int] = []  # sorted ascending == best first
+
+    def _key(self, price: float) -> int:
+        tick = price_to_tick(price)
+        return -tick if self.is_bid else tick
+
+    def _price(self, key: int) -> float:
+        return tick_to_price(-key if self.is_bid else key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def set(self, price: float, size: float) -> None:
+        """Set the aggregate size at a price level (size <= 0 removes it)."""
+        key = self._key(price)
+        if size > 0:
+            if key not in self._sizes:
+                keys = self._keys
+                if not keys or key > keys[-1]:
+                    keys.append(key)
+                else:
+                    keys.insert(bisect_left(keys, key), key)
+            self._sizes[key] = size
+        elif self._sizes.pop(key, None) is not None:
+            keys = self._keys
+            del keys[bisect_left(keys, key)]
+
+    def replace(self, levels: Iterable[tuple[float, float]]) -> None:
+        """Replace every level (full snapshot)."""
+        sizes: dict[int, float] = {}
+        for price, size in levels:
+            if price > 0 and size > 0:
+                sizes[self._key(price)] = size
+        self._sizes = sizes
+        self._keys = sorted(sizes)
+
+    def size_at(self, price: float) -> float:
+        return self._sizes.get(self._key(price), 0.0)
+
+    @property
+    def best_price(self) -> float | None:
+        return self._price(self._keys[0]) if self._keys else None
+
+    @property
+    def best_size(self) -> float:
+        return self._sizes[self._keys[0]] if self._keys else 0.0
+
+    def levels(self, n: int | None = None) -> Iterator[tuple[float, float]]:
+        """(price, size) best first, lazily (top n levels when given)."""
+        keys = self._keys if n is None or n >= len(self._keys) else self._keys[:n]
+        sizes = self._sizes
+        for key in keys:
+            yield self._price(key), sizes[key]
+
+    def depth(self, n: int | None = None) -> float:
+        """Total size over the top n levels (all levels when None)."""
+        keys = self._keys if n is None else self._keys[:n]
+        sizes = self._sizes
+        return sum(sizes[key] for key in keys)
+
+    def vwap(self, size: float) -> float | None:
+        """
+        Average price of taking `size` from this side, best level first.
+
+        Returns:
+            Volume-weighted price, or None if the side is thinner than size.
+        """
+        if size <= 0:
+            return self.best_price
+        remaining = size
+        cost = 0.0
+        sizes = self._sizes
+        for key in self._keys:
+            take = min(remaining, sizes[key])
+            cost += take * self._price(key)
+            remaining -= take
+            if remaining <= 1e-12:
+                return cost / size
+        return None
+
+
+class L2Book:
+    """
+    Incremental price-level order book for one token.
+
+    Built from a full "book" snapshot and kept current by applying
+    "price_change" deltas in place; readers get best bid/ask, depth and
+    VWAP without copying the levels. `bids` / `asks` materialize tuple
+    lists for callers that want a plain copy.
+
+    `stale` is set by the feed when the book may have missed updates
+    (socket down, sequence gap, crossed levels) and cleared by the next
+    full snapshot.
+    """
+
+    __slots__ = (
+        "token_id", "bid_side", "ask_side", "timestamp", "updates", "hash",
+        "sequence", "stale",
+    )
+
+    def __init__(
+        self,
+        token_id: str,
+        bids: Iterable[tuple[float, float]] = (),
+        asks: Iterable[tuple[float, float]] = (),
+        timestamp: datetime | None = None,
+    ) -> None:
+        self.token_id = token_id
+        self.bid_side = BookSide(is_bid=True)
+        self.ask_side = BookSide(is_bid=False)
+        self.bid_side.replace(bids)
+        self.ask_side.replace(asks)
+        self.timestamp = timestamp or datetime.now()
+        self.updates = 0  # Deltas applied since the last snapshot
+        self.hash: str | None = None  # Exchange book hash, when sent
+        self.sequence: int | None = None  # Last message sequence number, when sent
+        self.stale = False
+
+    def side(self, side: str) -> BookSide:
+        """BookSide for BID / ASK (or any alias accepted by normalize_side)."""
+        return self.bid_side if normalize_side(side) == BID else self.ask_side
+
+    # -------------------------------------------------------------------------
+    # UPDATES
+    # -------------------------------------------------------------------------
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[tuple[float, float]],
+        asks: Iterable[tuple[float, float]],
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Replace both sides from a full book message."""
+        self.bid_side.replace(bids)
+        self.ask_side.replace(asks)
+        self.timestamp = timestamp or datetime.now()
+        self.updates = 0
+        self.stale = False
+
+    def apply_change(self, side: str, price: float, size: float) -> bool:
+        """
+        Set one level's aggregate size (0 removes the level).
+
+        Returns:
+            False if the side is not recognized.
+        """
+        normalized = normalize_side(side)
+        if normalized is None or price <= 0:
+            return False
+        (self.bid_side if normalized == BID else self.ask_side).set(price, size)
+        self.updates += 1
+        return True
+
+    # -------------------------------------------------------------------------
+    # READS
+    # -------------------------------------------------------------------------
+
+    @property
+    def best_bid(self) -> float | None:
+        """Best bid price."""
+        return self.bid_side.best_price
+
+    @property
+    def best_ask(self) -> float | None:
+        """Best ask price."""
+        return self.ask_side.best_price
+
+    @property
+    def mid_price(self) -> float | None:
+        """Mid price between best bid and ask."""
+        best_bid, best_ask = self.best_bid, self.best_ask
+        if best_bid and best_ask:
+            return (best_bid + best_ask) / 2
+        return None
+
+    @property
+    def crossed(self) -> bool:
+        """True if best bid >= best ask (only possible after missed updates)."""
+        best_bid, best_ask = self.best_bid, self.best_ask
+        return best_bid is not None and best_ask is not None and best_bid >= best_ask
+
+    @property
+    def spread(self) -> float | None:
+        best_bid, best_ask = self.best_bid, self.best_ask
+        if best_bid is None or best_ask is None:
+            return None
+        return best_ask - best_bid
+
+    @property
+    def bids(self) -> list[tuple[float, float]]:
+        """Bid levels (price, size), best first (a copy)."""
+        return list(self.bid_side.levels())
+
+    @property
+    def asks(self) -> list[tuple[float, float]]:
+        """Ask levels (price, size), best first (a copy)."""
+        return list(self.ask_side.levels())
+
+    def depth(self, side: str, levels: int | None = None) -> float:
+        """Total size over the top `levels` price levels of a side."""
+        return self.side(side).depth(levels)
+
+    def vwap(self, side: str, size: float) -> float | None:
+        """Average price of taking `size` from a side (None if too thin)."""
+        return self.side(side).vwap(size)
+
+    def __repr__(self) -> str:
+        return (
+            f"L2Book({self.token_id!r}, bid={self.best_bid}, ask={self.best_ask}, "
+            f"levels={len(self.bid_side)}/{len(self.ask_side)}"
+            f"{', stale' if self.stale else ''})"
+        )
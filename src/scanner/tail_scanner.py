@@ -4,7 +4,6 @@ Finds and monitors tail betting opportunities (YES < 4 cents).
 Uses CLOB API for accurate pricing.
 """
 import asyncio
-import aiohttp
 import json
 import time
 import os
@@ -12,6 +11,8 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from src.data.http_client import HttpTransport, close_transport, get_transport
+
 
 @dataclass
 class TailMarket:
@@ -33,7 +34,7 @@ GAMMA_API = "https://gamma-api.polymarket.com"
 CLOB_API = "https://clob.polymarket.com"
 
 
-async def get_all_markets(session: aiohttp.ClientSession) -> List[Dict]:
+async def get_all_markets(transport: HttpTransport) -> List[Dict]:
     """Get all active markets from Gamma API"""
     url = f"{GAMMA_API}/markets"
     params = {
@@ -42,44 +43,37 @@ async def get_all_markets(session: aiohttp.ClientSession) -> List[Dict]:
         "limit": 500
     }
     
-    async with session.get(url, params=params) as resp:
-        if resp.status == 200:
-            return await resp.json()
-    return []
+    return await transport.get_json(url, params=params) or []
 
 
-async def get_clob_markets(session: aiohttp.ClientSession) -> List[Dict]:
+async def get_clob_markets(transport: HttpTransport) -> List[Dict]:
     """Get markets from CLOB API with real prices"""
     url = f"{CLOB_API}/sampling-markets"
     
-    async with session.get(url) as resp:
-        if resp.status == 200:
-            data = await resp.json()
-            return data.get("data", [])
-    return []
+    data = await transport.get_json(url)
+    return data.get("data", []) if data else []
 
 
-async def get_orderbook_price(session: aiohttp.ClientSession, token_id: str) -> Optional[Dict]:
+async def get_orderbook_price(transport: HttpTransport, token_id: str) -> Optional[Dict]:
     """Get real orderbook price for a token"""
     url = f"{CLOB_API}/book"
     params = {"token_id": token_id}
     
     try:
-        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                bids = data.get("bids", [])
-                asks = data.get("asks", [])
-                
-                if bids and asks:
-                    best_bid = float(bids[0].get("price", 0))
-                    best_ask = float(asks[0].get("price", 1))
-                    return {
-                        "bid": best_bid,
-                        "ask": best_ask,
-                        "mid": (best_bid + best_ask) / 2,
-                        "spread": best_ask - best_bid
-                    }
+        data = await transport.get_json(url, params=params, timeout=5)
+        if data:
+            bids = data.get("bids", [])
+            asks = data.get("asks", [])
+            
+            if bids and asks:
+                best_bid = float(bids[0].get("price", 0))
+                best_ask = float(asks[0].get("price", 1))
+                return {
+                    "bid": best_bid,
+                    "ask": best_ask,
+                    "mid": (best_bid + best_ask) / 2,
+                    "spread": best_ask - best_bid
+                }
     except:
         pass
     return None
@@ -90,82 +84,79 @@ async def find_tail_markets(max_price: float = 0.04) -> List[TailMarket]:
     print(f"🔍 Scanning for tail markets (YES < ${max_price})...")
     
     tail_markets = []
+    transport = get_transport()  # CLOB rate budget replaces the per-call sleep
+    
+    # Get all CLOB markets
+    clob_markets = await get_clob_markets(transport)
+    print(f"  Found {len(clob_markets)} CLOB markets")
+    
+    # Filter for active markets with orderbook
+    active_markets = [
+        m for m in clob_markets 
+        if m.get("enable_order_book") and m.get("active") and not m.get("closed")
+    ]
+    print(f"  {len(active_markets)} active with orderbook")
     
-    async with aiohttp.ClientSession() as session:
-        # Get all CLOB markets
-        clob_markets = await get_clob_markets(session)
-        print(f"  Found {len(clob_markets)} CLOB markets")
+    # Check prices for each market
+    checked = 0
+    for market in active_markets:
+        tokens = market.get("tokens", [])
+        if not tokens:
+            continue
+            
+        # Find YES token
+        yes_token = None
+        no_token = None
+        for t in tokens:
+            outcome = t.get("outcome", "").lower()
+            if "yes" in outcome:
+                yes_token = t
+            elif "no" in outcome:
+                no_token = t
+                
+        if not yes_token:
+            continue
+            
+        # Get real price from orderbook
+        token_id = yes_token.get("token_id")
+        price_data = await get_orderbook_price(transport, token_id)
         
-        # Filter for active markets with orderbook
-        active_markets = [
-            m for m in clob_markets 
-            if m.get("enable_order_book") and m.get("active") and not m.get("closed")
-        ]
-        print(f"  {len(active_markets)} active with orderbook")
+        if not price_data:
+            continue
+            
+        yes_price = price_data["mid"]
         
-        # Check prices for each market
-        checked = 0
-        for market in active_markets:
-            tokens = market.get("tokens", [])
-            if not tokens:
-                continue
-                
-            # Find YES token
-            yes_token = None
-            no_token = None
+        # Check if tail market
+        if yes_price < max_price and yes_price > 0.001:
+            # Get liquidity from market data
+            liquidity = 0
             for t in tokens:
-                outcome = t.get("outcome", "").lower()
-                if "yes" in outcome:
-                    yes_token = t
-                elif "no" in outcome:
-                    no_token = t
-                    
-            if not yes_token:
-                continue
+                liquidity += float(t.get("liquidity", 0) or 0)
                 
-            # Get real price from orderbook
-            token_id = yes_token.get("token_id")
-            price_data = await get_orderbook_price(session, token_id)
-            
-            if not price_data:
+            # Skip very low liquidity
+            if liquidity < 500:
                 continue
                 
-            yes_price = price_data["mid"]
+            # Calculate score (lower price + higher liquidity = better)
+            score = (1 / yes_price) * min(liquidity / 10000, 10)
             
-            # Check if tail market
-            if yes_price < max_price and yes_price > 0.001:
-                # Get liquidity from market data
-                liquidity = 0
-                for t in tokens:
-                    liquidity += float(t.get("liquidity", 0) or 0)
-                    
-                # Skip very low liquidity
-                if liquidity < 500:
-                    continue
-                    
-                # Calculate score (lower price + higher liquidity = better)
-                score = (1 / yes_price) * min(liquidity / 10000, 10)
-                
-                tail_markets.append(TailMarket(
-                    question=market.get("question", "")[:150],
-                    slug=market.get("market_slug", ""),
-                    condition_id=market.get("condition_id", ""),
-                    token_id=token_id,
-                    yes_price=yes_price,
-                    no_price=1 - yes_price,
-                    liquidity=liquidity,
-                    volume_24h=float(market.get("volume", 0) or 0),
-                    spread=price_data["spread"],
-                    end_date=market.get("end_date_iso", ""),
-                    score=score
-                ))
-                
-            checked += 1
-            if checked % 50 == 0:
-                print(f"  Checked {checked}/{len(active_markets)} markets...")
-                
-            # Rate limit
-            await asyncio.sleep(0.1)
+            tail_markets.append(TailMarket(
+                question=market.get("question", "")[:150],
+                slug=market.get("market_slug", ""),
+                condition_id=market.get("condition_id", ""),
+                token_id=token_id,
+                yes_price=yes_price,
+                no_price=1 - yes_price,
+                liquidity=liquidity,
+                volume_24h=float(market.get("volume", 0) or 0),
+                spread=price_data["spread"],
+                end_date=market.get("end_date_iso", ""),
+                score=score
+            ))
+            
+        checked += 1
+        if checked % 50 == 0:
+            print(f"  Checked {checked}/{len(active_markets)} markets...")
             
     # Sort by score (best opportunities first)
     tail_markets.sort(key=lambda x: x.score, reverse=True)
@@ -341,12 +332,15 @@ async def main():
     
     args = parser.parse_args()
     
-    if args.monitor:
-        await monitor_tail_markets()
-    else:
-        markets = await find_tail_markets(args.max_price)
-        orders = await run_tail_scanner(args.max_price, stake_usd=args.stake)
-        save_results(markets, orders)
+    try:
+        if args.monitor:
+            await monitor_tail_markets()
+        else:
+            markets = await find_tail_markets(args.max_price)
+            orders = await run_tail_scanner(args.max_price, stake_usd=args.stake)
+            save_results(markets, orders)
+    finally:
+        await close_transport()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,196 @@
+"""
+Local TF-IDF nearest-neighbour retrieval.
+
+Questions are turned into sparse TF-IDF vectors over word and character
+n-gram features and compared by cosine similarity, so differently worded
+questions ("Lakers beat the Celtics" / "Celtics vs Lakers winner") still
+land next to each other. Retrieval is a sparse matrix product computed
+with NumPy only - no scipy, no network, no embedding service:
+
+    index = TfidfIndex(pb_cleaned, analyzer=tfidf_features)
+    top_idx, top_sim = index.top_k(poly_cleaned, k=5)
+
+- The corpus is stored column-wise (feature -> postings), so a chunk of
+  queries is scored with one gather + ``np.bincount`` instead of a
+  Python loop per pair
+- Features present in more than max(min_df, max_df_ratio * n) documents
+  are dropped: they carry almost no weight and dominate the postings
+- Candidates are meant to be re-ranked by the caller (e.g. with the
+  fuzzy score and the opposite-indicator veto)
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Analyzer = Callable[[str], Iterable[str]]
+
+# Upper bound on query rows x documents scored at once (dense scratch matrix)
+MAX_CHUNK_CELLS = 4_000_000
+
+
+def char_ngrams(word: str, n: int = 3) -> List[str]:
+    """Character n-grams of a word padded with spaces (' btc' -> ' bt', 'btc', 'tc ')."""
+    padded = f" {word} "
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def default_analyzer(text: str) -> List[str]:
+    """Word unigrams plus character 3-grams of each word."""
+    features = []
+    for word in text.split():
+        features.append("w:" + word)
+        features.extend(char_ngrams(word))
+    return features
+
+
+class TfidfIndex:
+    """
+    Sparse TF-IDF index over a fixed document list.
+
+    Parameters:
+        docs: Documents (already normalized, e.g. clean_question() output)
+        analyzer: Text -> features (default: words + char 3-grams)
+        max_df_ratio: Document-frequency share above which a feature is dropped
+        min_df: Floor for the drop cutoff (small corpora keep everything)
+    """
+
+    def __init__(
+        self,
+        docs: Sequence[str],
+        analyzer: Optional[Analyzer] = None,
+        max_df_ratio: float = 0.05,
+        min_df: int = 25,
+    ):
+        self.analyzer = analyzer or default_analyzer
+        self.size = len(docs)
+        self.max_df = max(min_df, int(max_df_ratio * self.size))
+
+        doc_features = [self._count(doc) for doc in docs]
+
+        df: Dict[str, int] = {}
+        for counts in doc_features:
+            for feature in counts:
+                df[feature] = df.get(feature, 0) + 1
+
+        self.vocabulary: Dict[str, int] = {}
+        idf: List[float] = []
+        for feature, count in df.items():
+            if count > self.max_df:
+                continue
+            self.vocabulary[feature] = len(idf)
+            idf.append(math.log((1 + self.size) / (1 + count)) + 1.0)
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.dropped_features = len(df) - len(self.vocabulary)
+
+        # Document vectors, stored by feature (CSC): postings of feature f are
+        # doc_ids[starts[f]:starts[f + 1]] with weights[...]
+        rows, cols, vals = self._vectors(doc_features)
+        order = np.argsort(cols, kind="stable")
+        self._doc_ids = rows[order]
+        self._weights = vals[order]
+        self._starts = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(self.vocabulary)), out=self._starts[1:])
+
+    def _count(self, text: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for feature in self.analyzer(text or ""):
+            counts[feature] = counts.get(feature, 0) + 1
+        return counts
+
+    def _vectors(
+        self, feature_counts: List[Dict[str, int]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """L2-normalized sublinear TF-IDF vectors in COO form (row, feature, weight)."""
+        row_ids: List[int] = []
+        col_ids: List[int] = []
+        tfs: List[float] = []
+        vocabulary = self.vocabulary
+        for row, counts in enumerate(feature_counts):
+            for feature, count in counts.items():
+                col = vocabulary.get(feature)
+                if col is not None:
+                    row_ids.append(row)
+                    col_ids.append(col)
+                    tfs.append(1.0 + math.log(count))
+
+        rows = np.asarray(row_ids, dtype=np.int64)
+        cols = np.asarray(col_ids, dtype=np.int64)
+        vals = np.asarray(tfs, dtype=np.float32)
+        if not len(vals):
+            return rows, cols, vals
+
+        vals *= self.idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=vals * vals, minlength=len(feature_counts)))
+        return rows, cols, (vals / norms[rows]).astype(np.float32)
+
+    def similarity(self, queries: Sequence[str]) -> np.ndarray:
+        """Dense (len(queries), size) float64 cosine similarity matrix."""
+        rows, cols, vals = self._vectors([self._count(q) for q in queries])
+
+        # Expand each query nonzero into the postings of its feature
+        lengths = self._starts[cols + 1] - self._starts[cols]
+        total = int(lengths.sum())
+        cells = len(queries) * self.size
+        if not total:
+            return np.zeros((len(queries), self.size))
+        offsets = np.repeat(self._starts[cols] - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(total)
+        keys = np.repeat(rows * self.size, lengths) + self._doc_ids[positions]
+        weights = np.repeat(vals, lengths) * self._weights[positions]
+        return np.bincount(keys, weights=weights, minlength=cells).reshape(len(queries), self.size)
+
+    def top_k(
+        self,
+        queries: Sequence[str],
+        k: int = 5,
+        chunk_size: int = 512,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k most similar documents per query, best first.
+
+        Queries are scored chunk_size rows at a time (fewer for large
+        corpora, see MAX_CHUNK_CELLS).
+
+        Returns:
+            (indices, similarities): (len(queries), k) int64 and float32
+            arrays; indices are -1 where fewer than k documents share a feature
+        """
+        n = len(queries)
+        k = max(1, min(k, self.size)) if self.size else 1
+        top_idx = np.full((n, k), -1, dtype=np.int64)
+        top_sim = np.zeros((n, k), dtype=np.float32)
+        if not n or not self.size:
+            return top_idx, top_sim
+
+        chunk_size = max(1, min(chunk_size, MAX_CHUNK_CELLS // self.size))
+        for start in range(0, n, chunk_size):
+            sims = self.similarity(queries[start:start + chunk_size])
+            rows = np.arange(len(sims))[:, None]
+
+            if k < self.size:
+                # Rows are mostly zeros: selecting the k smallest of -sims
+                # is much faster than the k largest of sims with that many ties
+                part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            else:
+                part = np.broadcast_to(np.arange(self.size), sims.shape)
+            # Best first (equal similarities: lower document index first)
+            order = np.lexsort((part, -sims[rows, part]), axis=1)
+            idx = part[rows, order]
+            sim = sims[rows, idx]
+
+            top_idx[start:start + len(sims)] = np.where(sim > 0, idx, -1)
+            top_sim[start:start + len(sims)] = np.where(sim > 0, sim, 0)
+        return top_idx, top_sim
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "documents": self.size,
+            "features": len(self.vocabulary),
+            "dropped_features": self.dropped_features,
+            "max_df": self.max_df,
+            "postings": len(self._doc_ids),
+        }
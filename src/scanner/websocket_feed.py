@@ -1,99 +1,243 @@
 """WebSocket feed for real-time market data."""
 
 import asyncio
-import json
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from src.config.constants import (
+    CLOB_HOST,
+    WS_CALLBACK_QUEUE_SIZE,
+    WS_MAX_TOKENS_PER_CONNECTION,
     WS_PING_INTERVAL_SECONDS,
     WS_PING_TIMEOUT_SECONDS,
     WS_RECONNECT_DELAY_SECONDS,
+    WS_RECONNECT_MAX_DELAY_SECONDS,
+    WS_RESYNC_CONCURRENCY,
+    WS_RESYNC_GRACE_SECONDS,
+    WS_SUBSCRIBE_BATCH_SIZE,
 )
+from src.data import json_codec
+from src.data.fanout_bus import BusSubscription, FanoutBus, OverflowPolicy
+from src.data.http_client import RetryPolicy, get_transport
+from src.scanner.order_book import L2Book, parse_level
+
+if TYPE_CHECKING:
+    # tick_book imports src.scanner.order_book, i.e. this package
+    from src.data.tick_book import TickBook
 
 logger = structlog.get_logger(__name__)
 
 # Polymarket WebSocket endpoint
 WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 
+# Reconnect delays: exponential per consecutive failure, +/-50% jitter so
+# shards that dropped together do not reconnect together
+RECONNECT_BACKOFF = RetryPolicy(
+    backoff_base=WS_RECONNECT_DELAY_SECONDS,
+    max_backoff=WS_RECONNECT_MAX_DELAY_SECONDS,
+    jitter=0.5,
+)
 
-@dataclass
-class OrderbookSnapshot:
-    """Local orderbook snapshot."""
 
-    token_id: str
-    bids: list[tuple[float, float]] = field(default_factory=list)  # (price, size)
-    asks: list[tuple[float, float]] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.now)
+# Bus topics: "book" carries the live L2Book of a token after each change
+# (coalesce it - readers see the latest state anyway); "raw" carries every
+# decoded socket message, for recorders
+TOPIC_BOOK = "book"
+TOPIC_RAW = "raw"
 
-    @property
-    def best_bid(self) -> float | None:
-        """Best bid price."""
-        return self.bids[0][0] if self.bids else None
+# Books are updated in place; the old name is kept for callers and type hints
+OrderbookSnapshot = L2Book
 
-    @property
-    def best_ask(self) -> float | None:
-        """Best ask price."""
-        return self.asks[0][0] if self.asks else None
+
+class FeedConnection:
+    """One socket of a sharded feed and the tokens subscribed on it."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.ws: Any | None = None
+        self.tokens: set[str] = set()
+        self.task: asyncio.Task[None] | None = None
+        self.connects = 0
+        self.drops = 0
+        self.failures = 0  # Consecutive drops without a message in between
 
     @property
-    def mid_price(self) -> float | None:
-        """Mid price between best bid and ask."""
-        if self.best_bid and self.best_ask:
-            return (self.best_bid + self.best_ask) / 2
-        return None
+    def connected(self) -> bool:
+        return self.ws is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"FeedConnection({self.index}, tokens={len(self.tokens)}, "
+            f"connected={self.connected})"
+        )
 
 
 class WebSocketFeed:
     """
     Real-time WebSocket feed for Polymarket orderbook updates.
     
-    Provides streaming price updates for subscribed markets.
+    Provides streaming price updates for subscribed markets. Each token
+    has one incremental L2Book: "book" messages replace it, "price_change"
+    deltas update single levels in place.
+
+    The receive loop never runs consumer code: updates are published on
+    `bus` (a FanoutBus) and each consumer reads its own bounded queue, e.g.
+    feed.bus.subscribe("recorder", topics={TOPIC_RAW}, maxsize=50_000,
+    policy=OverflowPolicy.BLOCK). Callbacks added with add_callback() are
+    consumers with a coalescing queue: they get the latest live book per
+    token (read it during the callback; copy levels to keep them) and may
+    be sync or async.
+
+    Subscriptions are sharded over as many sockets as needed to keep each
+    under max_tokens_per_connection, and sent as batched frames of up to
+    batch_size tokens. set_active() diffs a scanner's active token set
+    against the current subscriptions. When a socket drops, its tokens move
+    to live sockets with room; the rest wait for it to reconnect, with
+    exponential backoff and jitter.
+
+    Books that may have missed updates are flagged stale: every book of a
+    dropped socket, and any book with a sequence gap or crossed levels.
+    Readers do not see stale books (get_orderbook returns None, callbacks
+    are skipped) until a snapshot replaces them - from the socket, or from
+    a rate-limited parallel REST /book resync for books still stale
+    resync_grace_seconds after (re)subscribing.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_tokens_per_connection: int = WS_MAX_TOKENS_PER_CONNECTION,
+        batch_size: int = WS_SUBSCRIBE_BATCH_SIZE,
+        resync_concurrency: int = WS_RESYNC_CONCURRENCY,
+        resync_grace_seconds: float = WS_RESYNC_GRACE_SECONDS,
+    ) -> None:
         """Initialize WebSocket feed."""
-        self._ws: Any | None = None
+        self.max_tokens_per_connection = max(1, max_tokens_per_connection)
+        self.batch_size = max(1, batch_size)
+        self.resync_grace_seconds = resync_grace_seconds
+
         self._subscriptions: set[str] = set()
+        self._connections: list[FeedConnection] = []
+        self._connection_of: dict[str, FeedConnection] = {}
+        self._next_index = 0
+
         self._orderbooks: dict[str, OrderbookSnapshot] = {}
-        self._callbacks: list[Callable[[str, OrderbookSnapshot], None]] = []
+        self.bus = FanoutBus()
+        self._callbacks: dict[Callable[[str, OrderbookSnapshot], Any], BusSubscription] = {}
+        self._pumps: dict[Callable[[str, OrderbookSnapshot], Any], asyncio.Task[None]] = {}
         self._running = False
-        self._reconnect_task: asyncio.Task[None] | None = None
+        self._stopped = asyncio.Event()
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+        # REST snapshot resync (the CLOB host budget in get_transport() rate-limits it)
+        self._resync_slots = asyncio.Semaphore(max(1, resync_concurrency))
+        self._resync_pending: set[str] = set()
+        self._resync_task: asyncio.Task[None] | None = None
+
+        self._stats = {
+            "snapshots": 0,
+            "deltas": 0,
+            "deltas_without_book": 0,
+            "frames_sent": 0,
+            "rebalanced": 0,
+            "gaps": 0,
+            "resyncs": 0,
+            "resync_failures": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # CONNECTIONS
+    # -------------------------------------------------------------------------
 
     async def connect(self) -> None:
-        """Establish WebSocket connection."""
+        """Open every connection that has subscriptions."""
+        self._running = True
+        self._stopped.clear()
+        self._start_pumps()
+        for conn in list(self._connections):
+            if not conn.connected:
+                await self._open(conn)
+
+    async def disconnect(self) -> None:
+        """Close all connections (subscriptions are kept for the next connect)."""
+        self._running = False
+        self._stopped.set()
+        for task in [*self._tasks, *self._pumps.values()]:
+            task.cancel()
+        self._pumps.clear()
+        self._resync_pending.clear()
+        for conn in self._connections:
+            await self._close(conn)
+        for orderbook in self._orderbooks.values():
+            orderbook.stale = True
+        logger.info("WebSocket disconnected")
+
+    async def _open(self, conn: FeedConnection) -> None:
+        """Connect one socket and subscribe its tokens."""
         try:
-            self._ws = await websockets.connect(
+            conn.ws = await websockets.connect(
                 WS_URL,
                 ping_interval=WS_PING_INTERVAL_SECONDS,
                 ping_timeout=WS_PING_TIMEOUT_SECONDS,
             )
-            self._running = True
-            logger.info("WebSocket connected", url=WS_URL)
-
-            # Resubscribe to previously subscribed markets
-            for token_id in self._subscriptions:
-                await self._send_subscribe(token_id)
-
         except Exception as e:
-            logger.error("WebSocket connection failed", error=str(e))
+            logger.error("WebSocket connection failed", connection=conn.index, error=str(e))
             raise
-
-    async def disconnect(self) -> None:
-        """Close WebSocket connection."""
-        self._running = False
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-        if self._ws:
-            await self._ws.close()
-            self._ws = None
-        logger.info("WebSocket disconnected")
+        conn.connects += 1
+        logger.info(
+            "WebSocket connected",
+            url=WS_URL,
+            connection=conn.index,
+            tokens=len(conn.tokens),
+        )
+        await self._send_batches(conn, "subscribe", list(conn.tokens))
+        self._resync_later(list(conn.tokens))
+
+    async def _close(self, conn: FeedConnection) -> None:
+        if conn.task and conn.task is not asyncio.current_task():
+            conn.task.cancel()
+        conn.task = None
+        if conn.ws:
+            ws, conn.ws = conn.ws, None
+            try:
+                await ws.close()
+            except Exception as e:
+                logger.debug("WebSocket close error", connection=conn.index, error=str(e))
+
+    def _spawn(self, coro: Any) -> asyncio.Task[Any]:
+        """Background task cancelled by disconnect()."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _start(self, conn: FeedConnection) -> None:
+        """Run a connection's receive loop in the background (idempotent)."""
+        if conn.task is None or conn.task.done():
+            conn.task = asyncio.create_task(self._run_connection(conn))
+
+    def _connection_with_room(self) -> FeedConnection:
+        """First connection under the token cap (live ones first), else a new one."""
+        idle = None
+        for conn in self._connections:
+            if len(conn.tokens) < self.max_tokens_per_connection:
+                if conn.connected:
+                    return conn
+                idle = idle or conn
+        if idle is not None:
+            return idle
+        conn = FeedConnection(self._next_index)
+        self._next_index += 1
+        self._connections.append(conn)
+        return conn
+
+    # -------------------------------------------------------------------------
+    # SUBSCRIPTIONS
+    # -------------------------------------------------------------------------
 
     async def subscribe(self, token_id: str) -> None:
         """
@@ -102,9 +246,7 @@ class WebSocketFeed:
         Args:
             token_id: Token ID to subscribe to.
         """
-        self._subscriptions.add(token_id)
-        if self._ws:
-            await self._send_subscribe(token_id)
+        await self.subscribe_many([token_id])
 
     async def unsubscribe(self, token_id: str) -> None:
         """
@@ -113,93 +255,282 @@ class WebSocketFeed:
         Args:
             token_id: Token ID to unsubscribe from.
         """
-        self._subscriptions.discard(token_id)
-        if self._ws:
-            await self._send_unsubscribe(token_id)
+        await self.unsubscribe_many([token_id])
 
-    async def _send_subscribe(self, token_id: str) -> None:
-        """Send subscription message."""
-        if not self._ws:
-            return
+    async def subscribe_many(self, token_ids: Iterable[str]) -> int:
+        """
+        Subscribe to many tokens with batched frames.
 
-        message = {
-            "type": "subscribe",
-            "channel": "book",
-            "market": token_id,
-        }
-        await self._ws.send(json.dumps(message))
-        logger.debug("Subscribed to token", token_id=token_id)
+        New tokens fill existing connections up to the cap before another
+        socket is opened.
 
-    async def _send_unsubscribe(self, token_id: str) -> None:
-        """Send unsubscription message."""
-        if not self._ws:
-            return
+        Returns:
+            Number of tokens newly subscribed.
+        """
+        grouped: dict[FeedConnection, list[str]] = {}
+        for token_id in token_ids:
+            if not token_id or token_id in self._subscriptions:
+                continue
+            conn = self._connection_with_room()
+            conn.tokens.add(token_id)
+            self._connection_of[token_id] = conn
+            self._subscriptions.add(token_id)
+            grouped.setdefault(conn, []).append(token_id)
+
+        for conn, batch in grouped.items():
+            if conn.connected:
+                await self._send_batches(conn, "subscribe", batch)
+            elif self._running:
+                # Subscribes everything assigned to it once connected
+                self._start(conn)
+        return sum(len(batch) for batch in grouped.values())
+
+    async def unsubscribe_many(self, token_ids: Iterable[str]) -> int:
+        """
+        Unsubscribe from many tokens with batched frames.
 
-        message = {
-            "type": "unsubscribe",
-            "channel": "book",
-            "market": token_id,
-        }
-        await self._ws.send(json.dumps(message))
-        logger.debug("Unsubscribed from token", token_id=token_id)
+        Their books are dropped; connections left without tokens are closed.
+
+        Returns:
+            Number of tokens unsubscribed.
+        """
+        grouped: dict[FeedConnection, list[str]] = {}
+        for token_id in token_ids:
+            if token_id not in self._subscriptions:
+                continue
+            self._subscriptions.discard(token_id)
+            self._orderbooks.pop(token_id, None)
+            conn = self._connection_of.pop(token_id, None)
+            if conn is not None:
+                conn.tokens.discard(token_id)
+                grouped.setdefault(conn, []).append(token_id)
+
+        for conn, batch in grouped.items():
+            if not conn.tokens:
+                await self._close(conn)
+                self._connections.remove(conn)
+            elif conn.connected:
+                await self._send_batches(conn, "unsubscribe", batch)
+        return sum(len(batch) for batch in grouped.values())
+
+    async def set_active(self, token_ids: Iterable[str]) -> dict[str, int]:
+        """
+        Make the subscriptions exactly the given tokens.
+
+        Called with a scanner's active set each cycle: tokens entering the
+        set are subscribed, tokens leaving it unsubscribed.
+
+        Returns:
+            {"added": n, "removed": n}
+        """
+        active = set(token_ids)
+        removed = await self.unsubscribe_many(self._subscriptions - active)
+        added = await self.subscribe_many(active - self._subscriptions)
+        return {"added": added, "removed": removed}
+
+    async def _send_batches(
+        self, conn: FeedConnection, operation: str, token_ids: list[str]
+    ) -> None:
+        """Send subscribe/unsubscribe frames of up to batch_size tokens."""
+        for i in range(0, len(token_ids), self.batch_size):
+            if not conn.ws:
+                return
+            message = {
+                "type": operation,
+                "channel": "book",
+                "assets_ids": token_ids[i:i + self.batch_size],
+            }
+            try:
+                await conn.ws.send(json_codec.dumps(message))
+            except ConnectionClosed:
+                # The receive loop reconnects and resubscribes conn.tokens
+                logger.debug(
+                    "Send on closed connection", connection=conn.index, operation=operation
+                )
+                return
+            self._stats["frames_sent"] += 1
+        logger.debug(
+            "Sent subscription frames",
+            connection=conn.index,
+            operation=operation,
+            tokens=len(token_ids),
+        )
+
+    async def _rebalance(self, dropped: FeedConnection) -> int:
+        """Move a dropped connection's tokens onto live connections with room."""
+        moved = 0
+        for conn in list(self._connections):
+            if not dropped.tokens:
+                break
+            room = self.max_tokens_per_connection - len(conn.tokens)
+            if conn is dropped or not conn.connected or room <= 0:
+                continue
+            batch = [dropped.tokens.pop() for _ in range(min(room, len(dropped.tokens)))]
+            for token_id in batch:
+                conn.tokens.add(token_id)
+                self._connection_of[token_id] = conn
+            await self._send_batches(conn, "subscribe", batch)
+            self._resync_later(batch)
+            moved += len(batch)
+
+        if moved:
+            self._stats["rebalanced"] += moved
+            logger.info(
+                "Rebalanced tokens off dropped connection",
+                connection=dropped.index,
+                moved=moved,
+                remaining=len(dropped.tokens),
+            )
+        return moved
 
-    def add_callback(self, callback: Callable[[str, OrderbookSnapshot], None]) -> None:
+    def add_callback(self, callback: Callable[[str, OrderbookSnapshot], Any]) -> None:
         """
         Add a callback for orderbook updates.
 
+        Runs in its own task off a coalescing bus queue, so a slow callback
+        skips intermediate updates of a token instead of stalling the feed.
+
         Args:
-            callback: Function called with (token_id, orderbook) on updates.
+            callback: Function (or coroutine function) called with
+                (token_id, orderbook) on updates.
         """
-        self._callbacks.append(callback)
+        if callback in self._callbacks:
+            return
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        self._callbacks[callback] = self.bus.subscribe(
+            f"callback:{name}",
+            topics={TOPIC_BOOK},
+            maxsize=WS_CALLBACK_QUEUE_SIZE,
+            policy=OverflowPolicy.COALESCE,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Started by connect() / run()
+        self._start_pumps()
 
-    def remove_callback(self, callback: Callable[[str, OrderbookSnapshot], None]) -> None:
+    def remove_callback(self, callback: Callable[[str, OrderbookSnapshot], Any]) -> None:
         """Remove a callback."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        subscription = self._callbacks.pop(callback, None)
+        if subscription is not None:
+            self.bus.unsubscribe(subscription)  # Its pump drains and exits
+            self._pumps.pop(callback, None)
+
+    def _start_pumps(self) -> None:
+        for callback, subscription in self._callbacks.items():
+            task = self._pumps.get(callback)
+            if task is None or task.done():
+                self._pumps[callback] = asyncio.create_task(self._pump(subscription, callback))
+
+    async def _pump(
+        self,
+        subscription: BusSubscription,
+        callback: Callable[[str, OrderbookSnapshot], Any],
+    ) -> None:
+        """Deliver a callback's queued book updates."""
+        async for _, token_id, orderbook in subscription:
+            if orderbook.stale:
+                continue  # Went stale while queued
+            try:
+                result = callback(str(token_id), orderbook)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error("Callback error", callback=subscription.name, error=str(e))
+
+    def get_orderbook(self, token_id: str, include_stale: bool = False) -> OrderbookSnapshot | None:
+        """Get cached orderbook for a token (None while stale unless include_stale)."""
+        orderbook = self._orderbooks.get(token_id)
+        if orderbook is not None and orderbook.stale and not include_stale:
+            return None
+        return orderbook
+
+    def is_stale(self, token_id: str) -> bool:
+        """True if the token has no book yet or its book may have missed updates."""
+        orderbook = self._orderbooks.get(token_id)
+        return orderbook is None or orderbook.stale
 
-    def get_orderbook(self, token_id: str) -> OrderbookSnapshot | None:
-        """Get cached orderbook for a token."""
-        return self._orderbooks.get(token_id)
+    def get_tick_book(self, token_id: str) -> "TickBook | None":
+        """Fixed-tick array copy of a token's book for fill simulation."""
+        from src.data.tick_book import TickBook
+
+        orderbook = self.get_orderbook(token_id)
+        return TickBook.from_book(orderbook) if orderbook else None
 
     def get_mid_price(self, token_id: str) -> float | None:
         """Get mid price for a token."""
-        orderbook = self._orderbooks.get(token_id)
+        orderbook = self.get_orderbook(token_id)
         return orderbook.mid_price if orderbook else None
 
+    def get_stats(self) -> dict[str, Any]:
+        """Message/frame counters, books held, connection usage and consumer lag."""
+        return {
+            **self._stats,
+            "books": len(self._orderbooks),
+            "subscriptions": len(self._subscriptions),
+            "connections": len(self._connections),
+            "connected": sum(1 for conn in self._connections if conn.connected),
+            "stale": sum(1 for orderbook in self._orderbooks.values() if orderbook.stale),
+            "resync_pending": len(self._resync_pending),
+            "consumers": self.bus.get_stats(),
+        }
+
     async def run(self) -> None:
-        """Run the WebSocket feed (blocking)."""
-        while self._running:
+        """Run the WebSocket feed until disconnect() (blocking)."""
+        self._running = True
+        self._stopped.clear()
+        self._start_pumps()
+        for conn in self._connections:
+            self._start(conn)
+        await self._stopped.wait()
+
+    async def _run_connection(self, conn: FeedConnection) -> None:
+        """Receive loop of one connection, reconnecting while it has tokens."""
+        while self._running and conn in self._connections:
             try:
-                if not self._ws:
-                    await self.connect()
+                if not conn.connected:
+                    await self._open(conn)
+
+                await self._process_messages(conn)
+                logger.warning("WebSocket connection ended", connection=conn.index)
 
-                await self._process_messages()
+            except asyncio.CancelledError:
+                raise
 
             except ConnectionClosed as e:
-                logger.warning("WebSocket connection closed", code=e.code, reason=e.reason)
-                await self._handle_reconnect()
+                logger.warning(
+                    "WebSocket connection closed",
+                    connection=conn.index,
+                    code=e.code,
+                    reason=e.reason,
+                )
 
             except Exception as e:
-                logger.error("WebSocket error", error=str(e))
-                await self._handle_reconnect()
+                logger.error("WebSocket error", connection=conn.index, error=str(e))
+
+            await self._handle_reconnect(conn)
 
-    async def _process_messages(self) -> None:
+    async def _process_messages(self, conn: FeedConnection) -> None:
         """Process incoming WebSocket messages."""
-        if not self._ws:
+        if not conn.ws:
             return
 
-        async for message in self._ws:
+        async for message in conn.ws:
+            conn.failures = 0
             try:
-                data = json.loads(message)
+                data = json_codec.loads(message)
                 await self._handle_message(data)
-            except json.JSONDecodeError:
+            except json_codec.JSONDecodeError:
                 logger.warning("Invalid JSON message", message=message[:100])
             except Exception as e:
                 logger.error("Message processing error", error=str(e))
 
     async def _handle_message(self, data: dict[str, Any]) -> None:
         """Handle a parsed WebSocket message."""
-        msg_type = data.get("type", "")
+        if self.bus.has_subscribers(TOPIC_RAW):
+            await self.bus.publish(TOPIC_RAW, self._token_of(data), data)
+
+        msg_type = data.get("type") or data.get("event_type", "")
 
         if msg_type == "book":
             await self._handle_book_update(data)
@@ -210,83 +541,184 @@ class WebSocketFeed:
         elif msg_type == "error":
             logger.error("WebSocket error message", error=data.get("message"))
 
-    async def _handle_book_update(self, data: dict[str, Any]) -> None:
-        """Handle orderbook update message."""
-        token_id = data.get("market", "")
-        if not token_id:
-            return
+    @staticmethod
+    def _token_of(data: dict[str, Any]) -> str:
+        # Token messages carry asset_id; older payloads put the token in market
+        return str(data.get("asset_id") or data.get("market") or "")
 
-        # Parse bids and asks
-        bids = []
-        asks = []
+    @staticmethod
+    def _parse_levels(levels: list[Any] | None) -> list[tuple[float, float]]:
+        parsed = []
+        for level in levels or ():
+            price_size = parse_level(level)
+            if price_size:
+                parsed.append(price_size)
+        return parsed
 
-        for bid in data.get("bids", []):
-            try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
-                if price > 0 and size > 0:
-                    bids.append((price, size))
-            except (ValueError, TypeError):
-                continue
+    async def _notify(self, token_id: str, orderbook: L2Book) -> None:
+        """Publish a changed book (only waits on a full BLOCK consumer)."""
+        await self.bus.publish(TOPIC_BOOK, token_id, orderbook)
 
-        for ask in data.get("asks", []):
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
-                if price > 0 and size > 0:
-                    asks.append((price, size))
-            except (ValueError, TypeError):
-                continue
-
-        # Sort: bids descending, asks ascending
-        bids.sort(key=lambda x: x[0], reverse=True)
-        asks.sort(key=lambda x: x[0])
+    async def _handle_book_update(self, data: dict[str, Any]) -> None:
+        """Handle a full orderbook snapshot: replace the token's book."""
+        token_id = self._token_of(data)
+        if not token_id:
+            return
+        await self._notify(token_id, self._apply_book(token_id, data))
 
-        # Update orderbook
-        orderbook = OrderbookSnapshot(
-            token_id=token_id,
-            bids=bids,
-            asks=asks,
-            timestamp=datetime.now(),
-        )
-        self._orderbooks[token_id] = orderbook
+    def _apply_book(self, token_id: str, data: dict[str, Any]) -> L2Book:
+        """Replace a token's book from a socket or REST /book snapshot (clears stale)."""
+        bids = self._parse_levels(data.get("bids") or data.get("buys"))
+        asks = self._parse_levels(data.get("asks") or data.get("sells"))
 
-        # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(token_id, orderbook)
-            except Exception as e:
-                logger.error("Callback error", error=str(e))
+        orderbook = self._orderbooks.get(token_id)
+        if orderbook is None:
+            orderbook = self._orderbooks[token_id] = L2Book(token_id, bids, asks)
+        else:
+            orderbook.apply_snapshot(bids, asks)
+        orderbook.hash = data.get("hash")
+        orderbook.sequence = self._sequence_of(data)
+        self._stats["snapshots"] += 1
+        return orderbook
 
     async def _handle_price_change(self, data: dict[str, Any]) -> None:
-        """Handle price change message."""
-        # Price change messages are simpler updates
-        token_id = data.get("market", "")
-        if not token_id or token_id not in self._orderbooks:
-            return
-
-        # Update with new price data if available
-        orderbook = self._orderbooks[token_id]
-        orderbook.timestamp = datetime.now()
+        """
+        Apply price-level deltas to the books they belong to.
 
-        # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(token_id, orderbook)
-            except Exception as e:
-                logger.error("Callback error", error=str(e))
+        Each change sets one level's aggregate size (0 removes it). Changes
+        come as a "changes" / "price_changes" list (entries may carry their
+        own asset_id) or as a single level on the message itself.
+        """
+        default_token = self._token_of(data)
+        changes = data.get("changes") or data.get("price_changes")
+        if changes is None:
+            changes = [data] if "price" in data else []
+
+        sequence = self._sequence_of(data)
+        if sequence is not None:
+            orderbook = self._orderbooks.get(default_token)
+            if orderbook is not None:
+                if orderbook.sequence is not None and sequence != orderbook.sequence + 1:
+                    self._mark_gap(default_token, orderbook, "sequence")
+                orderbook.sequence = sequence
+
+        touched: dict[str, L2Book] = {}
+        for change in changes:
+            token_id = change.get("asset_id") or default_token
+            orderbook = self._orderbooks.get(token_id)
+            if orderbook is None:
+                # No snapshot yet: the next "book" message brings the levels
+                self._stats["deltas_without_book"] += 1
+                continue
+            price_size = parse_level(change)
+            if price_size and orderbook.apply_change(change.get("side", ""), *price_size):
+                self._stats["deltas"] += 1
+                if change.get("hash"):
+                    orderbook.hash = change["hash"]
+                touched[token_id] = orderbook
+
+        now = datetime.now()
+        for token_id, orderbook in touched.items():
+            orderbook.timestamp = now
+            if orderbook.crossed and not orderbook.stale:
+                self._mark_gap(token_id, orderbook, "crossed")
+            if not orderbook.stale:
+                await self._notify(token_id, orderbook)
+
+    @staticmethod
+    def _sequence_of(data: dict[str, Any]) -> int | None:
+        sequence = data.get("seq", data.get("sequence"))
+        try:
+            return int(sequence) if sequence is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _mark_gap(self, token_id: str, orderbook: L2Book, reason: str) -> None:
+        """A book missed updates: hide it and fetch a fresh snapshot."""
+        orderbook.stale = True
+        self._stats["gaps"] += 1
+        logger.debug("Order book gap detected", token_id=token_id, reason=reason)
+        self._request_resync([token_id])
+
+    # -------------------------------------------------------------------------
+    # SNAPSHOT RESYNC
+    # -------------------------------------------------------------------------
+
+    def _needs_resync(self, token_id: str) -> bool:
+        # Only tokens on a live socket: a REST snapshot of a token whose
+        # socket is down would just go stale again, silently
+        conn = self._connection_of.get(token_id)
+        return conn is not None and conn.connected and self.is_stale(token_id)
+
+    def _resync_later(self, token_ids: list[str]) -> None:
+        """Resync tokens still stale once the socket has had time to send snapshots."""
+        if token_ids and self._running:
+            self._spawn(self._resync_after(token_ids, self.resync_grace_seconds))
+
+    async def _resync_after(self, token_ids: list[str], delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._request_resync(token_ids)
+
+    def _request_resync(self, token_ids: Iterable[str]) -> None:
+        """Queue REST snapshot fetches (deduplicated; one worker drains the queue)."""
+        self._resync_pending.update(token_ids)
+        if self._resync_pending and (self._resync_task is None or self._resync_task.done()):
+            self._resync_task = self._spawn(self._run_resync())
+
+    async def _run_resync(self) -> None:
+        while self._resync_pending:
+            batch = [t for t in self._resync_pending if self._needs_resync(t)]
+            self._resync_pending.clear()
+            if batch:
+                await asyncio.gather(*(self._resync_one(token_id) for token_id in batch))
+                logger.info("Resynced order books", tokens=len(batch))
+
+    async def _resync_one(self, token_id: str) -> None:
+        """Replace one stale book with a REST /book snapshot."""
+        async with self._resync_slots:
+            if not self._needs_resync(token_id):
+                return  # A socket snapshot arrived while queued
+            data = await get_transport().get_json(
+                f"{CLOB_HOST}/book", params={"token_id": token_id}
+            )
 
-    async def _handle_reconnect(self) -> None:
-        """Handle reconnection with backoff."""
-        self._ws = None
+        if not isinstance(data, dict):
+            self._stats["resync_failures"] += 1
+            return
+        if not self._needs_resync(token_id):
+            return
+        self._stats["resyncs"] += 1
+        await self._notify(token_id, self._apply_book(token_id, data))
+
+    async def _handle_reconnect(self, conn: FeedConnection) -> None:
+        """Handle a dropped connection: mark its books stale, rebalance, back off."""
+        conn.ws = None
+        conn.drops += 1
+        for token_id in conn.tokens:
+            orderbook = self._orderbooks.get(token_id)
+            if orderbook is not None:
+                orderbook.stale = True
         if not self._running:
             return
 
+        await self._rebalance(conn)
+        if not conn.tokens:
+            # Everything moved elsewhere; retire the socket
+            conn.task = None
+            if conn in self._connections:
+                self._connections.remove(conn)
+            return
+
+        delay = RECONNECT_BACKOFF.delay(conn.failures)
+        conn.failures += 1
         logger.info(
             "Attempting reconnection",
-            delay_seconds=WS_RECONNECT_DELAY_SECONDS,
+            connection=conn.index,
+            tokens=len(conn.tokens),
+            attempt=conn.failures,
+            delay_seconds=round(delay, 2),
         )
-        await asyncio.sleep(WS_RECONNECT_DELAY_SECONDS)
+        await asyncio.sleep(delay)
 
     async def __aenter__(self) -> "WebSocketFeed":
         """Async context manager entry."""
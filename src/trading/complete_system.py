@@ -14,6 +14,8 @@ from typing import Optional, List
 from enum import Enum
 import logging
 
+from src.data.keyword_matcher import get_keyword_matcher
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -151,6 +153,9 @@ class CompleteTailSystem:
             "finance": ["stock", "fed", "rate", "gdp", "inflation", "nasdaq"],
             "tech": ["google", "apple", "microsoft", "ai", "openai", "meta", "nvidia"],
         }
+        self._category_groups = get_keyword_matcher().add_groups(
+            self.categories, prefix="complete_system."
+        )
         
         # ML model weights (will be trained from outcomes)
         self.category_weights = {
@@ -184,11 +189,9 @@ class CompleteTailSystem:
     
     def detect_category(self, question: str) -> str:
         """Detect market category"""
-        q_lower = question.lower()
-        for category, keywords in self.categories.items():
-            if any(kw in q_lower for kw in keywords):
-                return category
-        return "other"
+        # First category (in self.categories order) with a keyword hit
+        group = get_keyword_matcher().scan(question).first(self._category_groups)
+        return group.rpartition(".")[2] if group else "other"
     
     def calculate_ml_score(self, market: dict) -> float:
         """Calculate ML score for opportunity"""
@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from typing import Optional
 import random
 
+from src.data.keyword_matcher import get_keyword_matcher
+
 
 @dataclass
 class ScoredOpportunity:
@@ -62,16 +64,16 @@ class IntegratedTailSystem:
             "tech": ["google", "apple", "microsoft", "ai", "openai", "meta", "amazon", "nvidia"],
             "entertainment": ["movie", "oscar", "grammy", "netflix", "spotify", "album"],
         }
+        self._category_groups = get_keyword_matcher().add_groups(
+            self.categories, prefix="integrated_system."
+        )
     
     def detect_category(self, question: str) -> str:
         """Detect market category from question"""
-        q_lower = question.lower()
-        
-        for category, keywords in self.categories.items():
-            if any(kw in q_lower for kw in keywords):
-                return category
+        # First category (in self.categories order) with a keyword hit
+        group = get_keyword_matcher().scan(question).first(self._category_groups)
         
-        return "other"
+        return group.rpartition(".")[2] if group else "other"
     
     def calculate_ml_score(self, market: dict) -> float:
         """
@@ -12,6 +12,8 @@ from dataclasses import dataclass, asdict
 from typing import Optional
 from enum import Enum
 
+from src.data.text_normalize import normalize
+
 
 class BetStatus(Enum):
     PENDING = "pending"
@@ -38,6 +40,16 @@ class ResolvedBet:
     profit_loss: Optional[float] = None
 
 
+# text_normalize categories -> pending-bet report buckets
+CATEGORY_BUCKETS = {
+    "politics": "political",
+    "crypto": "crypto",
+    "sports": "sports",
+    "economics": "finance",
+    "tech": "tech",
+}
+
+
 class ResolutionTracker:
     """
     Tracks market resolutions and updates bet outcomes
@@ -305,20 +317,8 @@ class ResolutionTracker:
             if bet.get("status") != "pending":
                 continue
             
-            question = bet.get("question", "").lower()
-            
-            if any(w in question for w in ["trump", "biden", "election", "congress", "senate"]):
-                categories["political"].append(bet)
-            elif any(w in question for w in ["bitcoin", "ethereum", "crypto", "btc", "eth"]):
-                categories["crypto"].append(bet)
-            elif any(w in question for w in ["game", "match", "nfl", "nba", "soccer"]):
-                categories["sports"].append(bet)
-            elif any(w in question for w in ["stock", "market", "gdp", "fed", "rate"]):
-                categories["finance"].append(bet)
-            elif any(w in question for w in ["google", "apple", "ai", "tech", "software"]):
-                categories["tech"].append(bet)
-            else:
-                categories["other"].append(bet)
+            category = normalize(bet.get("question", "")).category
+            categories[CATEGORY_BUCKETS.get(category, "other")].append(bet)
         
         return categories
 
@@ -0,0 +1,261 @@
+"""
+📒 SIGNAL JOURNAL
+==================
+Append-only JSONL journal for recorded trade signals.
+
+Replaces the daemon's signals.json, which was re-serialized in full
+(indent=2) on every signal - O(n²) over a day and a blocking write on the
+event loop.
+
+Features:
+- One file per UTC day: <prefix>-YYYYMMDD.jsonl (daily rotation)
+- Write-behind buffer flushed by size or age, written off the event loop
+- Readers skip a torn trailing line (crash mid-write); the next append
+  starts on a fresh line so no later record is glued onto it
+- compact_journal(): dedupe a closed day by trade_id and gzip it
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def read_journal(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from a journal file (.jsonl or .jsonl.gz).
+
+    Lines that fail to decode (a partially written last line) are skipped.
+    """
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt journal line in {path.name}")
+
+
+def compact_journal(path: Path) -> Tuple[int, int]:
+    """
+    Rewrite a closed journal as <name>.jsonl.gz, one record per trade_id.
+
+    The last record for a trade_id wins; an existing .gz for the same day
+    is merged first. The compacted file is written to a temp name and
+    renamed, so a crash never loses the original.
+
+    Returns:
+        (records read, records kept)
+    """
+    target = path.with_name(path.name + ".gz") if path.suffix != ".gz" else path
+    sources = [target, path] if target != path and target.exists() else [path]
+
+    records: Dict[str, Dict[str, Any]] = {}
+    read = 0
+    for source in sources:
+        for record in read_journal(source):
+            read += 1
+            records[str(record.get("trade_id") or f"#{read}")] = record
+
+    tmp = target.with_name(target.name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        for record in records.values():
+            fh.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+    os.replace(tmp, target)
+
+    if target != path:
+        path.unlink()
+    return read, len(records)
+
+
+class SignalJournal:
+    """
+    Buffered, append-only, daily-rotated JSONL journal.
+
+    append() is synchronous and cheap (serialize + buffer). The buffer is
+    written in one append per file when it reaches flush_size records or
+    its oldest record is flush_interval seconds old; a background task
+    covers the age trigger when signals stop arriving.
+
+    Parameters:
+        directory: Journal directory (created if missing)
+        prefix: File name prefix
+        flush_size: Records buffered before a flush
+        flush_interval: Max seconds a record stays buffered
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = "signals",
+        flush_size: int = 50,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # (target file, serialized line); the file is fixed at append time
+        # so records buffered before midnight land in the previous day
+        self._buffer: List[Tuple[Path, str]] = []
+        self._oldest_buffered: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._timer: Optional["asyncio.Task[None]"] = None
+
+        self._flushes = 0
+        self._records_written = 0
+        self._write_errors = 0
+
+    # -------------------------------------------------------------------------
+    # FILES
+    # -------------------------------------------------------------------------
+
+    def path_for(self, day: date) -> Path:
+        return self.directory / f"{self.prefix}-{day:%Y%m%d}.jsonl"
+
+    @property
+    def current_path(self) -> Path:
+        return self.path_for(_utc_today())
+
+    def journals(self) -> List[Path]:
+        """All journal files, oldest first (plain and compacted)."""
+        return sorted(
+            p for p in self.directory.glob(f"{self.prefix}-*.jsonl*")
+            if not p.name.endswith(".tmp")
+        )
+
+    def read_day(self, day: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """Records written for a day (default: today), excluding the buffer."""
+        path = self.path_for(day or _utc_today())
+        for candidate in (path, path.with_name(path.name + ".gz")):
+            if candidate.exists():
+                yield from read_journal(candidate)
+
+    # -------------------------------------------------------------------------
+    # WRITE
+    # -------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def append(self, record: Dict[str, Any], day: Optional[date] = None) -> None:
+        """
+        Buffer one record; flushing is driven by flush_size/flush_interval.
+
+        Args:
+            record: JSON-serializable dict
+            day: Journal day (default: today, UTC)
+        """
+        line = json.dumps(record, default=str, separators=(",", ":"))
+        if not self._buffer:
+            self._oldest_buffered = time.monotonic()
+        path = self.path_for(day) if day else self.current_path
+        self._buffer.append((path, line))
+        self._ensure_timer()
+
+    def should_flush(self) -> bool:
+        if not self._buffer:
+            return False
+        if len(self._buffer) >= self.flush_size:
+            return True
+        return self._buffered_for() >= self.flush_interval
+
+    async def maybe_flush(self) -> None:
+        if self.should_flush():
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the buffer in a worker thread (one append per file)."""
+        async with self._lock:
+            batch = self._take_buffer()
+            if batch:
+                await asyncio.to_thread(self._write_batch, batch)
+
+    def flush_sync(self) -> None:
+        """Blocking flush, for shutdown paths without a running loop."""
+        batch = self._take_buffer()
+        if batch:
+            self._write_batch(batch)
+
+    async def close(self) -> None:
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+        await self.flush()
+
+    def _take_buffer(self) -> List[Tuple[Path, str]]:
+        batch, self._buffer = self._buffer, []
+        self._oldest_buffered = None
+        return batch
+
+    def _buffered_for(self) -> float:
+        """Seconds the oldest buffered record has waited (0 when empty)."""
+        if self._oldest_buffered is None:
+            return 0.0
+        return time.monotonic() - self._oldest_buffered
+
+    def _write_batch(self, batch: List[Tuple[Path, str]]) -> None:
+        by_path: Dict[Path, List[str]] = {}
+        for path, line in batch:
+            by_path.setdefault(path, []).append(line)
+
+        for path, lines in by_path.items():
+            text = "\n".join(lines) + "\n"
+            try:
+                with open(path, "a+b") as fh:
+                    if fh.seek(0, os.SEEK_END):
+                        fh.seek(-1, os.SEEK_END)
+                        if fh.read(1) != b"\n":
+                            text = "\n" + text  # Terminate a torn line
+                    fh.write(text.encode("utf-8"))
+                self._records_written += len(lines)
+            except OSError as e:
+                self._write_errors += 1
+                logger.error(f"Journal write error ({path.name}): {e}")
+        self._flushes += 1
+
+    def _ensure_timer(self) -> None:
+        if self._timer is not None and not self._timer.done():
+            return
+        try:
+            self._timer = asyncio.get_running_loop().create_task(self._flush_when_stale())
+        except RuntimeError:
+            self._timer = None  # No loop: caller flushes via flush_sync()
+
+    async def _flush_when_stale(self) -> None:
+        while self._buffer:
+            wait = self.flush_interval - self._buffered_for()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self.should_flush():
+                await self.flush()
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "file": self.current_path.name,
+            "pending": len(self._buffer),
+            "flushes": self._flushes,
+            "records_written": self._records_written,
+            "write_errors": self._write_errors,
+        }
@@ -7,6 +7,8 @@ from typing import Any
 
 import structlog
 
+from src.data.tick_book import TickBook
+
 logger = structlog.get_logger(__name__)
 
 
@@ -222,7 +224,8 @@ class SlippageSimulator:
             token_id: Token to trade
             side: "BUY" or "SELL"
             amount_usdc: Amount in USDC
-            orderbook: Optional orderbook (uses stored if not provided)
+            orderbook: Optional orderbook (uses stored if not provided); any
+                       book TickBook.from_book() accepts
             
         Returns:
             SimulationResult with execution details
@@ -257,10 +260,12 @@ class SlippageSimulator:
             else:
                 orderbook = self.generate_orderbook(token_id)
         
-        # Determine which side of the book to consume
-        levels = orderbook.asks if side == "BUY" else orderbook.bids
+        # Determine which side of the book to consume (walk on tick arrays)
+        book = TickBook.from_book(orderbook, token_id)
+        book_side = "ask" if side == "BUY" else "bid"
+        levels = book.levels(book_side)[0]
         
-        if not levels:
+        if not len(levels):
             return SimulationResult(
                 success=False,
                 order_id="",
@@ -274,29 +279,11 @@ class SlippageSimulator:
             )
         
         # Calculate fills across levels
-        remaining = amount_usdc
-        fills = []
-        total_contracts = 0
-        total_cost = 0
-        
-        for level in levels:
-            if remaining <= 0:
-                break
-            
-            # How much can we fill at this level?
-            level_value = level.size * level.price
-            fill_value = min(remaining, level_value)
-            fill_contracts = fill_value / level.price
-            
-            fills.append({
-                "price": level.price,
-                "size": fill_contracts,
-                "value": fill_value,
-            })
-            
-            total_contracts += fill_contracts
-            total_cost += fill_value
-            remaining -= fill_value
+        fill = book.walk_notional(book_side, amount_usdc)
+        fills = book.fills(book_side, fill)
+        total_contracts = fill.size
+        total_cost = fill.cost
+        remaining = amount_usdc - fill.cost
         
         # Check for partial fill
         fill_pct = (amount_usdc - remaining) / amount_usdc
@@ -324,7 +311,7 @@ class SlippageSimulator:
         
         # Calculate average price and slippage
         avg_price = total_cost / total_contracts
-        best_price = levels[0].price
+        best_price = float(levels[0])
         slippage = avg_price - best_price if side == "BUY" else best_price - avg_price
         slippage_pct = (slippage / best_price) * 100 if best_price > 0 else 0
         
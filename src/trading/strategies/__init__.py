@@ -33,6 +33,7 @@ from .base_strategy import (
     StrategyRegistry,
     strategy_registry
 )
+from .market_universe import MarketUniverse, MarketRow, UniverseSlice
 
 # ACTIVE STRATEGIES (Legacy)
 from .internal_arb import (
@@ -64,6 +65,9 @@ __all__ = [
     'SignalType',
     'StrategyRegistry',
     'strategy_registry',
+    'MarketUniverse',
+    'MarketRow',
+    'UniverseSlice',
     
     # Legacy Strategies
     'InternalArbStrategy',
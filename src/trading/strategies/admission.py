@@ -0,0 +1,205 @@
+"""
+🚦 ADMISSION SCHEDULER
+=======================
+Per-strategy work queue that decides which markets get evaluated.
+
+Replaces the old wall-clock throttle in BaseStrategy.process (which
+silently dropped any market arriving within 0.1s of the previous one)
+with an explicit budget and explicit accounting.
+
+Features:
+- Evaluation budget per cycle: market count and/or CPU milliseconds
+- Priority queue: strategy-defined priority (e.g. expected value),
+  ties broken by freshness (most recently submitted first)
+- One pending entry per market (newer data replaces older)
+- Bounded backlog: over-budget markets are deferred to the next cycle,
+  only overflow beyond max_backlog is dropped
+- Stats: evaluated / deferred / dropped / coalesced / CPU per cycle
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class AdmissionScheduler:
+    """
+    Budgeted priority queue of markets awaiting evaluation.
+
+    Usage:
+        scheduler.begin_cycle()
+        for market in markets:
+            scheduler.submit(market, priority)
+        while scheduler.has_budget():
+            market = scheduler.pop()
+            if market is None:
+                break
+            ... evaluate ...
+            scheduler.charge(cpu_seconds)
+        scheduler.end_cycle()
+
+    Parameters:
+        max_markets: Markets evaluated per cycle (None = unlimited)
+        cpu_budget_ms: CPU milliseconds per cycle (None = unlimited)
+        max_backlog: Deferred markets kept between cycles
+    """
+
+    def __init__(
+        self,
+        max_markets: Optional[int] = None,
+        cpu_budget_ms: Optional[float] = None,
+        max_backlog: int = 5000,
+    ) -> None:
+        self.max_markets = max_markets
+        self.cpu_budget_ms = cpu_budget_ms
+        self.max_backlog = max_backlog
+
+        # Lazy-deletion max-heap of (-priority, -seq, condition_id)
+        self._heap: List[Tuple[float, int, str]] = []
+        # condition_id -> (market, priority, seq); only the newest entry counts
+        self._pending: Dict[str, Tuple[Any, float, int]] = {}
+        self._seq = 0
+
+        # Current cycle
+        self._cycle_evaluated = 0
+        self._cycle_cpu_ms = 0.0
+
+        # Cumulative accounting
+        self._cycles = 0
+        self._submitted = 0
+        self._evaluated = 0
+        self._deferred = 0
+        self._deferred_before_cycle = 0
+        self._dropped_overflow = 0
+        self._dropped_stale = 0
+        self._dropped_limit = 0
+        self._coalesced = 0
+        self._last_cycle_cpu_ms = 0.0
+        self._last_cycle_evaluated = 0
+
+    # -------------------------------------------------------------------------
+    # BUDGET
+    # -------------------------------------------------------------------------
+
+    @property
+    def unlimited(self) -> bool:
+        return self.max_markets is None and self.cpu_budget_ms is None
+
+    @property
+    def backlog(self) -> int:
+        return len(self._pending)
+
+    def begin_cycle(self) -> None:
+        """Reset the per-cycle budget."""
+        self._cycles += 1
+        self._cycle_evaluated = 0
+        self._cycle_cpu_ms = 0.0
+        self._deferred_before_cycle = self._deferred
+
+    def has_budget(self) -> bool:
+        """True while the current cycle can evaluate another market."""
+        if self.max_markets is not None and self._cycle_evaluated >= self.max_markets:
+            return False
+        if self.cpu_budget_ms is not None and self._cycle_cpu_ms >= self.cpu_budget_ms:
+            return False
+        return True
+
+    def charge(self, cpu_seconds: float) -> None:
+        """Account one evaluation against the cycle budget."""
+        self._cycle_evaluated += 1
+        self._cycle_cpu_ms += cpu_seconds * 1000
+        self._evaluated += 1
+
+    def end_cycle(self) -> None:
+        """
+        Close the cycle; anything still queued is counted as deferred.
+
+        Idempotent within a cycle, so a cycle fed in several chunks can
+        call it after each chunk.
+        """
+        self._deferred = self._deferred_before_cycle + len(self._pending)
+        self._last_cycle_cpu_ms = self._cycle_cpu_ms
+        self._last_cycle_evaluated = self._cycle_evaluated
+
+    # -------------------------------------------------------------------------
+    # QUEUE
+    # -------------------------------------------------------------------------
+
+    def submit(self, market: Any, priority: float = 0.0) -> None:
+        """
+        Queue a market for evaluation.
+
+        A market already waiting is replaced by the newer submission
+        (fresher data), so the backlog holds at most one entry per market.
+        """
+        condition_id = market.condition_id
+        self._seq += 1
+        self._submitted += 1
+
+        if condition_id in self._pending:
+            self._coalesced += 1
+
+        self._pending[condition_id] = (market, priority, self._seq)
+        heapq.heappush(self._heap, (-priority, -self._seq, condition_id))
+
+        if len(self._pending) > self.max_backlog:
+            self._evict_lowest()
+
+        # Keep lazy-deleted heap entries bounded
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            self._heap = [(-p, -seq, cid) for cid, (_, p, seq) in self._pending.items()]
+            heapq.heapify(self._heap)
+
+    def pop(self) -> Optional[Any]:
+        """Highest-priority pending market, or None when the queue is empty."""
+        while self._heap:
+            _, neg_seq, condition_id = heapq.heappop(self._heap)
+            entry = self._pending.get(condition_id)
+            if entry is None or entry[2] != -neg_seq:
+                continue  # Superseded or evicted
+
+            del self._pending[condition_id]
+            market = entry[0]
+
+            # Row views over a reused universe slot no longer describe this market
+            if getattr(market, "condition_id", None) != condition_id:
+                self._dropped_stale += 1
+                continue
+
+            return market
+        return None
+
+    def drop_pending(self) -> int:
+        """Discard the backlog (e.g. daily trade limit reached)."""
+        dropped = len(self._pending)
+        self._dropped_limit += dropped
+        self._pending.clear()
+        self._heap.clear()
+        return dropped
+
+    def _evict_lowest(self) -> None:
+        condition_id = min(self._pending, key=lambda cid: self._pending[cid][1:])
+        del self._pending[condition_id]
+        self._dropped_overflow += 1
+
+    # -------------------------------------------------------------------------
+    # STATS
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Admission accounting (cumulative unless noted)."""
+        return {
+            "budget_markets": self.max_markets,
+            "budget_cpu_ms": self.cpu_budget_ms,
+            "cycles": self._cycles,
+            "submitted": self._submitted,
+            "evaluated": self._evaluated,
+            "deferred": self._deferred,
+            "dropped": self._dropped_overflow + self._dropped_stale + self._dropped_limit,
+            "dropped_overflow": self._dropped_overflow,
+            "dropped_stale": self._dropped_stale,
+            "dropped_daily_limit": self._dropped_limit,
+            "coalesced": self._coalesced,
+            "backlog": len(self._pending),
+            "last_cycle_evaluated": self._last_cycle_evaluated,
+            "last_cycle_cpu_ms": round(self._last_cycle_cpu_ms, 3),
+        }
@@ -11,6 +11,7 @@ Logic:
 
 Features:
 - Batch fuzzy matching for efficiency (ARBScanner)
+- One PredictBase fetch per cycle prices the whole batch (prepare_batch)
 - Ambiguity detection (opposite indicators like "NOT")
 - Two arbitrage types: DIRECT and SYNTHETIC
 - Circuit breaker for fault tolerance
@@ -21,10 +22,13 @@ Scan Interval: 60 seconds (non-blocking asyncio.create_task)
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Optional, Dict, List
 from collections import defaultdict
 
+from src.data.bounded_cache import BoundedCache
+
 from .base_strategy import BaseStrategy, MarketData, TradeSignal, SignalType
 
 logger = logging.getLogger(__name__)
@@ -53,6 +57,24 @@ except ImportError:
     ARB_SCANNER_AVAILABLE = False
     logger.warning("ARBScanner not available - using legacy per-market lookup")
 
+# Persistent match cache (shared with ARBScanner)
+try:
+    from src.scanner.match_cache import get_match_cache
+    MATCH_CACHE_AVAILABLE = True
+except ImportError:
+    MATCH_CACHE_AVAILABLE = False
+
+# PredictBase universe fetched per cycle
+PB_FETCH_LIMIT = 200
+PB_FETCH_TIMEOUT = 5.0  # seconds
+
+# After a failed PB fetch, no new fetch is attempted for PB_FETCH_RETRY seconds
+PB_FETCH_RETRY = 60.0
+
+# Markets without a PB match are not looked up again for PB_MISS_TTL seconds
+PB_MISS_TTL = 300.0
+PB_MISS_MAX = 20000
+
 
 class ArbitrageStrategy(BaseStrategy):
     """
@@ -107,9 +129,19 @@ class ArbitrageStrategy(BaseStrategy):
         self._pb_client: Optional[PredictBaseClient] = None
         self._pb_initialized = False
         
-        # Cache for matched markets
-        self._matched_pairs: Dict[str, dict] = {}  # question_hash -> pb_data
-        self._match_cache_ttl = 600  # 10 minutes
+        # Persistent Poly <-> PB match cache (shared with ARBScanner)
+        self._match_cache = None
+        
+        # condition_ids without a PB match, not looked up again until they expire
+        self._pb_misses = BoundedCache(maxsize=PB_MISS_MAX, ttl=PB_MISS_TTL)
+        self._caches["pb_misses"] = self._pb_misses
+        self._pb_fetches = 0
+        self._pb_prefetched = 0
+        self._pb_failed_at: Optional[float] = None
+        
+        # PB prices of the current batch (condition_id -> prices, None = no
+        # price this cycle); replaced on every prepare_batch()
+        self._pb_batch: Dict[str, Optional[Dict]] = {}
         
         # Track pending signals from batch scan
         self._pending_signals: List = []
@@ -241,41 +273,126 @@ class ArbitrageStrategy(BaseStrategy):
             except Exception as e:
                 logger.warning(f"⚠️ Failed to init PredictBase: {e}")
                 self._pb_initialized = True  # Don't retry
+            
+            if MATCH_CACHE_AVAILABLE:
+                self._match_cache = get_match_cache()
+                await self._match_cache.warm_load()
     
-    async def _get_pb_prices(self, question: str) -> Optional[Dict]:
-        """Get PredictBase prices with caching."""
-        # Check cache first
-        cache_key = question[:100]
-        if cache_key in self._matched_pairs:
-            return self._matched_pairs[cache_key]
+    async def _fetch_pb_markets(self) -> Optional[List]:
+        """
+        PB market universe (cached by the client); None when unavailable.
         
+        A failed fetch is remembered for PB_FETCH_RETRY seconds so a PB
+        outage costs one timeout per cycle, not one per market.
+        """
         await self._ensure_pb_client()
         
-        if not self._pb_client:
+        if not self._pb_client or not self._match_cache:
             return None
         
+        if self._pb_failed_at is not None:
+            if time.monotonic() - self._pb_failed_at < PB_FETCH_RETRY:
+                return None
+            self._pb_failed_at = None
+        
+        self._pb_fetches += 1
         try:
-            pb_market = await asyncio.wait_for(
-                self._pb_client.get_market_by_question(question, threshold=self.fuzzy_threshold),
-                timeout=5.0  # 5 second timeout
+            pb_markets = await asyncio.wait_for(
+                self._pb_client.get_markets(limit=PB_FETCH_LIMIT),
+                timeout=PB_FETCH_TIMEOUT,
             )
-            
-            if pb_market:
-                result = {
-                    "yes": pb_market.yes_price,
-                    "no": pb_market.no_price,
-                    "market_id": pb_market.market_id,
-                }
-                self._matched_pairs[cache_key] = result
-                return result
         except asyncio.TimeoutError:
-            logger.debug(f"PB timeout for: {question[:40]}")
+            logger.debug("PB markets fetch timeout")
+            pb_markets = None
         except Exception as e:
-            logger.debug(f"PB lookup error: {e}")
+            logger.debug(f"PB markets fetch error: {e}")
+            pb_markets = None
+        
+        if not pb_markets:
+            self._pb_failed_at = time.monotonic()
+        return pb_markets
+    
+    def _wants_pb_prices(self, market: MarketData) -> bool:
+        """Pre-filters of process_market(), plus no recent miss."""
+        if market.yes_price < 0.05 or market.yes_price > 0.95:
+            return False
+        if market.volume_24h and market.volume_24h < self.min_liquidity:
+            return False
+        return market.condition_id not in self._pb_misses
+    
+    @staticmethod
+    def _pb_price_data(pair) -> Dict:
+        return {
+            "yes": pair.pb_yes_price,
+            "no": pair.pb_no_price,
+            "market_id": pair.pb_market_id,
+        }
+    
+    async def prepare_batch(self, markets: List[MarketData]):
+        """
+        Price the whole batch from one PB fetch.
+        
+        The cycle's candidates are joined against the PB universe through
+        the match cache in one call, so process_market() needs no network
+        round trip. Prices are kept for this batch only; markets are shared
+        with the long-lived universe and must not carry last cycle's quote.
+        Unmatched markets are remembered for PB_MISS_TTL.
+        """
+        wanted = [m for m in markets if self._wants_pb_prices(m)]
+        # Every wanted market is settled here, priced or not: no lazy lookups
+        self._pb_batch = {m.condition_id: None for m in wanted}
+        if not wanted:
+            return
+        
+        pb_markets = await self._fetch_pb_markets()
+        if not pb_markets:
+            return
+        
+        pairs = self._match_cache.match_markets(
+            [
+                {"question": m.question, "condition_id": m.condition_id, "yes_price": 0.5}
+                for m in wanted
+            ],
+            pb_markets,
+            threshold=self.fuzzy_threshold,
+        )
+        await self._match_cache.maybe_flush()
+        
+        found = {pair.poly_condition_id: pair for pair in pairs}
+        for market in wanted:
+            pair = found.get(market.condition_id)
+            if pair:
+                self._pb_batch[market.condition_id] = self._pb_price_data(pair)
+            else:
+                self._pb_misses.add(market.condition_id)
+        self._pb_prefetched += len(found)
+    
+    async def _get_pb_prices(self, question: str, condition_id: str = "") -> Optional[Dict]:
+        """
+        Get PredictBase prices for a single Poly market (per-market path).
+        
+        process_batch() fills prices up front via prepare_batch(); this is
+        for markets evaluated one at a time through process().
+        """
+        if condition_id and condition_id in self._pb_misses:
+            return None
+        
+        pb_markets = await self._fetch_pb_markets()
+        if not pb_markets:
+            return None
         
-        # Cache negative result too
-        self._matched_pairs[cache_key] = None
-        return None
+        pair = self._match_cache.match_one(
+            {"question": question, "condition_id": condition_id, "yes_price": 0.5},
+            pb_markets,
+            threshold=self.fuzzy_threshold,
+        )
+        await self._match_cache.maybe_flush()
+        
+        if not pair:
+            if condition_id:
+                self._pb_misses.add(condition_id)
+            return None
+        return self._pb_price_data(pair)
     
     async def process_market(self, market: MarketData) -> Optional[TradeSignal]:
         """
@@ -283,7 +400,7 @@ class ArbitrageStrategy(BaseStrategy):
         
         Steps:
         1. Pre-filter: skip markets unlikely to have arb
-        2. Lazy lookup PredictBase prices
+        2. PredictBase prices (prefetched by prepare_batch, else lazy lookup)
         3. Calculate synthetic spread
         4. If profitable, generate signal
         """
@@ -296,14 +413,17 @@ class ArbitrageStrategy(BaseStrategy):
         if market.volume_24h and market.volume_24h < self.min_liquidity:
             return None
         
-        # Check competitor_prices if already populated (from cache)
-        pb_data = market.competitor_prices.get("predictbase", {})
-        
-        # If not populated, do lazy lookup (but only 1 in 10 markets to save API calls)
-        if not pb_data:
+        if market.condition_id in self._pb_batch:
+            # Settled by prepare_batch() for this batch (None = no PB price)
+            pb_data = self._pb_batch[market.condition_id] or {}
+        else:
+            # Check competitor_prices if already populated (from cache)
+            pb_data = market.competitor_prices.get("predictbase", {})
+            
+            # If not populated, do lazy lookup (but only 1 in 10 markets to save API calls)
             # Only lookup for "interesting" markets (mid-range prices)
-            if 0.20 <= market.yes_price <= 0.80:
-                pb_data = await self._get_pb_prices(market.question) or {}
+            if not pb_data and 0.20 <= market.yes_price <= 0.80:
+                pb_data = await self._get_pb_prices(market.question, market.condition_id) or {}
         
         if not pb_data:
             return None
@@ -393,6 +513,14 @@ class ArbitrageStrategy(BaseStrategy):
         
         return signal
     
+    def get_stats(self) -> Dict:
+        stats = super().get_stats()
+        stats["predictbase"] = {
+            "fetches": self._pb_fetches,
+            "prefetched_prices": self._pb_prefetched,
+        }
+        return stats
+    
     def match_markets(self, poly_question: str, pb_question: str) -> float:
         """
         Calculate match score between Polymarket and PredictBase questions.
@@ -9,7 +9,8 @@ All strategies must inherit from BaseStrategy and implement:
 
 Features:
 - Async-first design for non-blocking execution
-- Built-in rate limiting
+- Batch evaluation over a columnar MarketUniverse (vectorized pre-filters)
+- Admission scheduling (evaluation budget, priority queue, deferral accounting)
 - Automatic trade recording
 - Performance tracking
 """
@@ -18,13 +19,26 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 from enum import Enum
 import asyncio
 import logging
+import time
+
+from src.data.bounded_cache import BoundedCache
+
+from .admission import AdmissionScheduler
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .market_universe import MarketUniverse, UniverseSlice
 
 logger = logging.getLogger(__name__)
 
+# Dedup window for signalled markets (also cleared at the daily reset)
+PROCESSED_MARKETS_MAX = 50000
+PROCESSED_MARKETS_TTL = 86400  # seconds
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -170,9 +184,13 @@ class BaseStrategy(ABC):
     - get_config(): Return strategy configuration
     
     Optional overrides:
+    - batch_mask(): Vectorized pre-filter used by process_batch()
+    - admission_priority(): Queue priority when the evaluation budget is tight
+    - prepare_batch(): Bulk-load data for a batch's candidates before evaluation
     - on_start(): Called when strategy starts
     - on_stop(): Called when strategy stops
     - on_trade_executed(): Called after trade is recorded
+    - on_universe_update(): Called once per cycle with the full market universe
     """
     
     def __init__(
@@ -181,6 +199,9 @@ class BaseStrategy(ABC):
         paper_mode: bool = True,
         stake_size: float = 2.0,
         max_daily_trades: int = 50,
+        eval_budget_markets: Optional[int] = None,
+        eval_budget_cpu_ms: Optional[float] = None,
+        max_backlog: int = 5000,
         **kwargs
     ):
         self.strategy_id = strategy_id
@@ -192,15 +213,24 @@ class BaseStrategy(ABC):
         self._is_running = False
         self._trades_today = 0
         self._last_reset = datetime.utcnow().date()
-        self._processed_markets: set = set()  # Avoid duplicate signals
+        self._processed_markets = BoundedCache(  # Avoid duplicate signals
+            maxsize=PROCESSED_MARKETS_MAX, ttl=PROCESSED_MARKETS_TTL
+        )
+        
+        # Long-lived per-market state, reported in get_stats(); subclasses
+        # register their own BoundedCaches here
+        self._caches: Dict[str, BoundedCache] = {"processed_markets": self._processed_markets}
         
         # Performance tracking
         self._signals_generated = 0
         self._signals_executed = 0
         
-        # Rate limiting
-        self._last_process_time = 0
-        self._min_process_interval = 0.1  # seconds
+        # Admission control (None budgets = evaluate everything)
+        self._admission = AdmissionScheduler(
+            max_markets=eval_budget_markets,
+            cpu_budget_ms=eval_budget_cpu_ms,
+            max_backlog=max_backlog,
+        )
         
         # Custom parameters from kwargs
         self.params = kwargs
@@ -263,23 +293,150 @@ class BaseStrategy(ABC):
         """Called after trade is recorded. Override for post-trade logic."""
         pass
     
+    async def on_universe_update(self, universe: Dict[str, MarketData], removed: List[str]):
+        """
+        Called once per cycle with the full market universe.
+        
+        With incremental sync, process() only sees markets that changed;
+        override this for logic that needs every tracked market.
+        
+        Args:
+            universe: All tracked markets keyed by condition_id (read-only;
+                      a columnar MarketUniverse when the daemon syncs incrementally)
+            removed: condition_ids that left the universe this cycle
+        """
+        pass
+    
     # -------------------------------------------------------------------------
     # CORE PROCESSING (do not override)
     # -------------------------------------------------------------------------
     
     async def process(self, market: MarketData) -> Optional[TradeSignal]:
         """
-        Process market with rate limiting and deduplication.
+        Process market with admission control and deduplication.
         
-        This is the main entry point called by the orchestrator.
+        This is the per-market entry point.
         Do NOT override - override process_market() instead.
+        
+        When the cycle's evaluation budget is spent the market is queued
+        (deferred, not dropped) and picked up by the next process_batch().
         """
-        # Rate limiting
-        now = asyncio.get_event_loop().time()
-        if now - self._last_process_time < self._min_process_interval:
+        if not self._admission.has_budget():
+            self._admission.submit(market, self.admission_priority(market))
             return None
-        self._last_process_time = now
         
+        return await self._admit(market)
+    
+    async def process_batch(
+        self,
+        universe: Union["MarketUniverse", "UniverseSlice"],
+        mask: Optional["np.ndarray"] = None,
+        new_cycle: bool = True,
+    ) -> List[TradeSignal]:
+        """
+        Evaluate a whole cycle of markets at once.
+        
+        batch_mask() narrows the universe with array operations first; the
+        surviving rows (plus anything deferred earlier) are queued by
+        admission_priority() and evaluated until the cycle budget runs out.
+        Whatever is left stays queued for the next cycle.
+        
+        Do NOT override - override batch_mask() instead.
+        
+        Args:
+            universe: Columnar market universe for this cycle, or a slice of
+                      it (e.g. one page of changed markets)
+            mask: Optional bool mask of candidate slots (e.g. changed markets)
+            new_cycle: Start a new budget cycle (False when a pipelined cycle
+                       feeds several chunks)
+        
+        Returns:
+            Signals generated for this batch
+        """
+        try:
+            candidates = self.batch_mask(universe)
+        except Exception as e:
+            logger.error(f"Strategy {self.strategy_id} batch filter error: {e}")
+            return []
+        
+        if mask is not None:
+            # The universe may grow between mask creation and filtering
+            size = min(len(candidates), len(mask))
+            candidates = candidates[:size] & mask[:size]
+        
+        admission = self._admission
+        if new_cycle:
+            admission.begin_cycle()
+        rows = universe.select(candidates)
+        for row in rows:
+            admission.submit(row, self.admission_priority(row))
+        
+        try:
+            await self.prepare_batch(rows)
+        except Exception as e:
+            logger.error(f"Strategy {self.strategy_id} batch prepare error: {e}")
+        
+        signals = []
+        while admission.has_budget():
+            if self._trades_today >= self.max_daily_trades:
+                admission.drop_pending()
+                break
+            
+            market = admission.pop()
+            if market is None:
+                break
+            
+            signal = await self._admit(market)
+            if signal:
+                signals.append(signal)
+        
+        admission.end_cycle()
+        return signals
+    
+    def batch_mask(self, universe: Union["MarketUniverse", "UniverseSlice"]) -> "np.ndarray":
+        """
+        Vectorized pre-filter for process_batch().
+        
+        Must return a bool array aligned with universe columns that is True
+        for every market process_market() could possibly signal on (a
+        superset is fine; false negatives are not). Default: every market.
+        
+        Only per-row column/keyword tests belong here: `universe` may be a
+        UniverseSlice holding just one chunk of the cycle's markets.
+        """
+        return universe.alive.copy()
+    
+    async def prepare_batch(self, markets: List[MarketData]):
+        """
+        Called by process_batch() with the batch's candidates before any is
+        evaluated.
+        
+        Override to replace per-market lookups in process_market() with one
+        bulk request (e.g. competitor prices). Markets deferred from earlier
+        cycles were prepared when first submitted. Errors are logged and the
+        batch is evaluated anyway.
+        """
+        pass
+    
+    def admission_priority(self, market: MarketData) -> float:
+        """
+        Queue priority when the evaluation budget is tight (higher first).
+        
+        Default 0.0: pure freshness order (most recently submitted first).
+        Override with an expected-value estimate for smarter triage.
+        """
+        return 0.0
+    
+    async def _admit(self, market: MarketData) -> Optional[TradeSignal]:
+        """Evaluate one admitted market and charge it to the cycle budget."""
+        start = time.process_time()
+        try:
+            return await self._evaluate(market)
+        finally:
+            self._admission.charge(time.process_time() - start)
+    
+    async def _evaluate(self, market: MarketData) -> Optional[TradeSignal]:
+        """Daily reset, limits and dedup around process_market()."""
         # Reset daily counter
         today = datetime.utcnow().date()
         if today != self._last_reset:
@@ -340,6 +497,16 @@ class BaseStrategy(ABC):
             "signals_generated": self._signals_generated,
             "signals_executed": self._signals_executed,
             "processed_markets": len(self._processed_markets),
+            "admission": self._admission.get_stats(),
+            **self._cache_stats(),
+        }
+    
+    def _cache_stats(self) -> Dict[str, Any]:
+        """Stats of every registered BoundedCache plus their total memory."""
+        caches = {name: cache.get_stats() for name, cache in self._caches.items()}
+        return {
+            "caches": caches,
+            "cache_memory_bytes": sum(c["memory_bytes"] for c in caches.values()),
         }
     
     def reset_daily(self):
@@ -389,6 +556,37 @@ class StrategyRegistry:
         """Get all active strategies."""
         return [s for s in self._strategies.values() if s._is_running]
     
+    async def process_batch(
+        self,
+        universe: Union["MarketUniverse", "UniverseSlice"],
+        mask: Optional["np.ndarray"] = None,
+        new_cycle: bool = True,
+    ) -> List[TradeSignal]:
+        """
+        Process a whole universe through all strategies in parallel.
+        
+        One coroutine per strategy per cycle instead of one per market.
+        
+        Args:
+            universe: Columnar market universe for this cycle, or a slice of it
+            mask: Optional bool mask of candidate slots (e.g. changed markets)
+            new_cycle: Start a new admission budget cycle
+        
+        Returns:
+            List of signals from all strategies
+        """
+        tasks = [s.process_batch(universe, mask, new_cycle) for s in self._strategies.values()]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        signals = []
+        for result in results:
+            if isinstance(result, list):
+                signals.extend(result)
+            elif isinstance(result, Exception):
+                logger.error(f"Strategy error: {result}")
+        
+        return signals
+    
     async def process_all(self, market: MarketData) -> List[TradeSignal]:
         """
         Process market through all strategies in parallel.
@@ -408,6 +606,15 @@ class StrategyRegistry:
         
         return signals
     
+    async def notify_universe(self, universe: Dict[str, MarketData], removed: List[str]):
+        """Push the full-universe view to every strategy."""
+        tasks = [s.on_universe_update(universe, removed) for s in self._strategies.values()]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Strategy universe hook error: {result}")
+    
     def get_all_stats(self) -> Dict[str, Dict]:
         """Get stats from all strategies."""
         return {sid: s.get_stats() for sid, s in self._strategies.items()}
@@ -19,6 +19,10 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 import logging
 
+import numpy as np
+
+from src.data.keyword_matcher import get_keyword_matcher
+
 from .base_strategy import (
     BaseStrategy,
     MarketData,
@@ -83,12 +87,18 @@ class ContrarianNoStrategy(BaseStrategy):
         self.max_yes_price = max_yes_price
         self.min_volume = min_volume
         
-        # Compile keyword pattern
+        # Compile keyword pattern (batch mask: one regex pass over the universe)
         escaped = [re.escape(kw) for kw in self.SENSATIONAL_KEYWORDS]
         self._keyword_pattern = re.compile(
             r'\b(' + '|'.join(escaped) + r')\b',
             re.IGNORECASE
         )
+        
+        # Per-market lookups share the keyword matcher's single scan
+        self._keywords = get_keyword_matcher()
+        self._keyword_group = self._keywords.add_group(
+            f"{self.strategy_id}.sensational", self.SENSATIONAL_KEYWORDS, whole_words=True
+        )
     
     async def process_market(self, market: MarketData) -> Optional[TradeSignal]:
         """
@@ -165,10 +175,23 @@ class ContrarianNoStrategy(BaseStrategy):
             }
         )
     
+    def batch_mask(self, universe) -> np.ndarray:
+        """Vectorized price/volume range plus one keyword pass over all questions."""
+        yes = universe.column("yes_price")
+        
+        mask = (
+            (yes >= self.min_yes_price)
+            & (yes <= self.max_yes_price)
+            & (universe.column("volume_24h") >= self.min_volume)
+        )
+        if not mask.any():
+            return mask
+        
+        return mask & universe.keyword_mask(self._keyword_pattern)
+    
     def _find_keywords(self, text: str) -> List[str]:
         """Find sensational keywords in text."""
-        matches = self._keyword_pattern.findall(text)
-        return list(set(match.lower() for match in matches))
+        return sorted(self._keywords.scan(text).keywords(self._keyword_group))
     
     def get_config(self) -> Dict[str, Any]:
         """Return strategy configuration."""
@@ -16,11 +16,11 @@
 """
 
 import asyncio
-import aiohttp
 import os
 import re
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from difflib import SequenceMatcher
@@ -37,6 +37,8 @@ try:
         KeyExpiredError,
         create_riot_client
     )
+    from src.data.http_client import HttpTransport, get_transport
+    from src.data.keyword_matcher import KeywordMatcher, get_keyword_matcher
 except ImportError:
     # Fallback for direct execution
     from exchanges.riot_client import (
@@ -45,6 +47,8 @@ except ImportError:
         KeyExpiredError,
         create_riot_client
     )
+    from data.http_client import HttpTransport, get_transport
+    from data.keyword_matcher import KeywordMatcher, get_keyword_matcher
 
 
 # ==============================================================================
@@ -53,6 +57,11 @@ except ImportError:
 
 POLYMARKET_API = "https://gamma-api.polymarket.com"
 
+# Question must contain one of these to count as an esports market
+ESPORTS_GROUP = get_keyword_matcher().add_group(
+    "esports_oracle.esports", ["esport", "league", "lol", "worlds"]
+)
+
 # Strategy parameters
 POLLING_INTERVAL = 2.0  # seconds between checks
 MIN_EDGE_THRESHOLD = 0.05  # 5% minimum edge to trade
@@ -238,6 +247,112 @@ TEAM_ALIASES = {
     "ultra prime": ["up", "ultra prime"],
 }
 
+# Any known name (canonical or alias) -> first canonical team listing it
+TEAM_LOOKUP: Dict[str, str] = {}
+for _canonical, _aliases in TEAM_ALIASES.items():
+    for _name in (*_aliases, _canonical):
+        TEAM_LOOKUP.setdefault(_name, _canonical)
+
+
+# ==============================================================================
+# TEAM -> MARKET INDEX
+# ==============================================================================
+
+@lru_cache(maxsize=65536)
+def _word_ratio(team: str, word: str) -> float:
+    """SequenceMatcher ratio, memoized (question words repeat every refresh)"""
+    return SequenceMatcher(None, team, word).ratio()
+
+
+class TeamMarketIndex:
+    """
+    Precomputed team/alias -> market postings over one cache refresh.
+
+    Built once per Polymarket refresh so the event path (Baron, Ace, game
+    end) is a dict lookup instead of a fuzzy scan of every market:
+    - Every canonical team name and alias is located in every question with
+      one keyword-matcher pass, giving name -> market positions
+    - Per-team scores are computed at most once per refresh; the word-level
+      fuzzy fallback is memoized per (team, word)
+    - best(team1, team2) is memoized per pair, and can be warmed for live
+      matches before any event fires
+
+    Scores and tie-breaking are exactly those of the linear scan
+    (EsportsOracleStrategy._fuzzy_team_match over liquid markets, first
+    best market wins).
+    """
+
+    def __init__(self, markets: List[PolymarketMatch], min_liquidity: float = MIN_LIQUIDITY):
+        self.markets = [m for m in markets if m.liquidity >= min_liquidity]
+        self.by_condition_id = {m.condition_id: m for m in self.markets}
+        self._questions = [m.question.lower() for m in self.markets]
+        self._words = [set(q.split()) for q in self._questions]
+
+        matcher = KeywordMatcher(cache_size=0)
+        group = matcher.add_group("teams", TEAM_LOOKUP)
+        self._postings: Dict[str, List[int]] = {}
+        for pos, question in enumerate(self._questions):
+            for name in matcher.scan(question).keywords(group):
+                self._postings.setdefault(name, []).append(pos)
+
+        self._team_scores: Dict[str, List[float]] = {}
+        self._best: Dict[Tuple[str, str], Optional[Tuple[PolymarketMatch, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def _positions(self, name: str) -> List[int]:
+        """Markets whose question contains `name` as a substring"""
+        if name in TEAM_LOOKUP:
+            return self._postings.get(name, [])
+        return [pos for pos, q in enumerate(self._questions) if name in q]
+
+    def team_scores(self, team: str) -> List[float]:
+        """_fuzzy_team_match(team, question) for every indexed market"""
+        scores = self._team_scores.get(team)
+        if scores is not None:
+            return scores
+
+        scores = [None] * len(self.markets)
+        for alias in TEAM_ALIASES.get(team, [team]):
+            for pos in self._positions(alias):
+                scores[pos] = 0.95
+        for pos in self._positions(team):
+            scores[pos] = 1.0
+
+        for pos, score in enumerate(scores):
+            if score is None:
+                scores[pos] = max((_word_ratio(team, w) for w in self._words[pos]), default=0.0)
+
+        self._team_scores[team] = scores
+        return scores
+
+    def best(self, team1: str, team2: str) -> Optional[Tuple[PolymarketMatch, float]]:
+        """Best (market, combined score) for two normalized teams, or None"""
+        key = (team1, team2)
+        if key in self._best:
+            return self._best[key]
+
+        result = None
+        best_score = 0.0
+        pairs = zip(self.team_scores(team1), self.team_scores(team2))
+        for pos, (score1, score2) in enumerate(pairs):
+            combined = (score1 + score2) / 2
+            if combined > best_score and combined >= FUZZY_MATCH_THRESHOLD:
+                best_score = combined
+                result = (self.markets[pos], combined)
+
+        self._best[key] = result
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "markets": len(self.markets),
+            "names_indexed": len(self._postings),
+            "teams_scored": len(self._team_scores),
+            "pairs_cached": len(self._best),
+        }
+
 
 # ==============================================================================
 # ESPORTS ORACLE STRATEGY
@@ -275,13 +390,14 @@ class EsportsOracleStrategy:
         # State
         self.state = StrategyState.IDLE
         self.riot_client: Optional[RiotGuard] = None
-        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.http: Optional[HttpTransport] = None
         
         # Active monitoring
         self.active_matches: Dict[str, LiveMatch] = {}
         self.last_game_states: Dict[str, GameState] = {}
         self.polymarket_cache: List[PolymarketMatch] = []
         self.polymarket_cache_time: Optional[datetime] = None
+        self.market_index = TeamMarketIndex([])
         
         # Callbacks
         self.db_callback = db_callback
@@ -311,10 +427,8 @@ class EsportsOracleStrategy:
         self.log.info("Starting ORACLE Esports Strategy...")
         self.log.info("=" * 50)
         
-        # Create HTTP session
-        self.http_session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10)
-        )
+        # Shared pooled HTTP transport (Gamma budget shared with the scanner)
+        self.http = get_transport()
         
         # Initialize Riot client with callbacks
         self.riot_client = await create_riot_client(
@@ -352,9 +466,6 @@ class EsportsOracleStrategy:
         if self.riot_client:
             await self.riot_client.shutdown()
         
-        if self.http_session:
-            await self.http_session.close()
-        
         self.state = StrategyState.DISABLED
         self.log.info("✓ ORACLE strategy stopped")
     
@@ -423,6 +534,9 @@ class EsportsOracleStrategy:
                 if self.active_matches:
                     self.state = StrategyState.MONITORING
                     
+                    # Keep the market index fresh off the event path
+                    await self._refresh_polymarket_cache()
+                    
                     for match_id, match in list(self.active_matches.items()):
                         await self._monitor_match(match)
                 else:
@@ -472,6 +586,7 @@ class EsportsOracleStrategy:
                 
                 self.active_matches[event_id] = match
                 self.log.info(f"📺 New match: {match.team_blue} vs {match.team_red} ({match.league})")
+                self._warm_market_index(match)
             else:
                 # Update existing match
                 match = self.active_matches[event_id]
@@ -683,6 +798,7 @@ class EsportsOracleStrategy:
             return  # Cache is fresh
         
         self.polymarket_cache = []
+        seen: Dict[str, PolymarketMatch] = {}
         
         esports_keywords = [
             "esports", "league of legends", "lol", "worlds", "msi",
@@ -700,38 +816,35 @@ class EsportsOracleStrategy:
                     "_q": keyword,
                 }
                 
-                async with self.http_session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
+                data = await self.http.get_json(url, params=params, timeout=10)
+                if data:
+                    for market in data:
+                        # Check if already cached
+                        condition_id = market.get("conditionId", "")
+                        if condition_id in seen:
+                            continue
                         
-                        for market in data:
-                            # Check if already cached
-                            condition_id = market.get("conditionId", "")
-                            if any(m.condition_id == condition_id for m in self.polymarket_cache):
-                                continue
+                        # Filter for actual esports
+                        if ESPORTS_GROUP in get_keyword_matcher().scan(market.get("question", "")):
+                            tokens = market.get("tokens", [])
+                            
+                            pm = PolymarketMatch(
+                                condition_id=condition_id,
+                                question=market.get("question", ""),
+                                volume=float(market.get("volume", 0) or 0),
+                                liquidity=float(market.get("liquidity", 0) or 0),
+                            )
                             
-                            question = market.get("question", "").lower()
+                            if len(tokens) >= 2:
+                                pm.team1_outcome = tokens[0].get("outcome", "")
+                                pm.team2_outcome = tokens[1].get("outcome", "")
+                                pm.team1_token_id = tokens[0].get("token_id", "")
+                                pm.team2_token_id = tokens[1].get("token_id", "")
+                                pm.team1_price = float(tokens[0].get("price", 0) or 0)
+                                pm.team2_price = float(tokens[1].get("price", 0) or 0)
                             
-                            # Filter for actual esports
-                            if any(kw in question for kw in ["esport", "league", "lol", "worlds"]):
-                                tokens = market.get("tokens", [])
-                                
-                                pm = PolymarketMatch(
-                                    condition_id=condition_id,
-                                    question=market.get("question", ""),
-                                    volume=float(market.get("volume", 0) or 0),
-                                    liquidity=float(market.get("liquidity", 0) or 0),
-                                )
-                                
-                                if len(tokens) >= 2:
-                                    pm.team1_outcome = tokens[0].get("outcome", "")
-                                    pm.team2_outcome = tokens[1].get("outcome", "")
-                                    pm.team1_token_id = tokens[0].get("token_id", "")
-                                    pm.team2_token_id = tokens[1].get("token_id", "")
-                                    pm.team1_price = float(tokens[0].get("price", 0) or 0)
-                                    pm.team2_price = float(tokens[1].get("price", 0) or 0)
-                                
-                                self.polymarket_cache.append(pm)
+                            seen[condition_id] = pm
+                            self.polymarket_cache.append(pm)
                 
                 await asyncio.sleep(0.1)
             
@@ -740,36 +853,30 @@ class EsportsOracleStrategy:
             
         except Exception as e:
             self.log.error(f"Error refreshing Polymarket cache: {e}")
+        
+        self.market_index = TeamMarketIndex(self.polymarket_cache)
+        for match in self.active_matches.values():
+            self._warm_market_index(match)
+    
+    def _warm_market_index(self, match: LiveMatch):
+        """Precompute the market lookup for a live match before events fire"""
+        self.market_index.best(
+            self._normalize_team(match.team_blue),
+            self._normalize_team(match.team_red),
+        )
     
     async def _find_polymarket_match(self, match: LiveMatch) -> Optional[PolymarketMatch]:
         """Find Polymarket market for a given esports match"""
         await self._refresh_polymarket_cache()
         
-        if not self.polymarket_cache:
+        found = self.market_index.best(
+            self._normalize_team(match.team_blue),
+            self._normalize_team(match.team_red),
+        )
+        if not found:
             return None
         
-        best_match = None
-        best_score = 0.0
-        
-        team1_normalized = self._normalize_team(match.team_blue)
-        team2_normalized = self._normalize_team(match.team_red)
-        
-        for market in self.polymarket_cache:
-            if market.liquidity < MIN_LIQUIDITY:
-                continue
-            
-            question = market.question.lower()
-            
-            # Check for both teams in question
-            score1 = self._fuzzy_team_match(team1_normalized, question)
-            score2 = self._fuzzy_team_match(team2_normalized, question)
-            
-            combined = (score1 + score2) / 2
-            
-            if combined > best_score and combined >= FUZZY_MATCH_THRESHOLD:
-                best_score = combined
-                best_match = market
-        
+        best_match, best_score = found
         if best_match:
             self.log.debug(f"Matched market: {best_match.question[:50]}... (score: {best_score:.2f})")
         
@@ -778,12 +885,7 @@ class EsportsOracleStrategy:
     def _normalize_team(self, team_name: str) -> str:
         """Normalize team name for matching"""
         normalized = team_name.lower().strip()
-        
-        for canonical, aliases in TEAM_ALIASES.items():
-            if normalized in aliases or normalized == canonical:
-                return canonical
-        
-        return normalized
+        return TEAM_LOOKUP.get(normalized, normalized)
     
     def _fuzzy_team_match(self, team: str, text: str) -> float:
         """Calculate fuzzy match score"""
@@ -825,6 +927,7 @@ class EsportsOracleStrategy:
                 for m in self.active_matches.values()
             ],
             "polymarket_cache_size": len(self.polymarket_cache),
+            "market_index": self.market_index.get_stats(),
             "stats": {
                 "signals_generated": self.signals_generated,
                 "events_detected": self.events_detected,
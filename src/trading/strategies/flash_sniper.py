@@ -18,6 +18,10 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
 
+import numpy as np
+
+from src.data.keyword_matcher import get_keyword_matcher
+
 from .base_strategy import (
     BaseStrategy,
     MarketData,
@@ -63,6 +67,15 @@ class FlashSniperStrategy(BaseStrategy):
         # Flash-specific tracking
         self._paired_markets: Dict[str, str] = {}  # condition_id -> pair_id
         
+        # Both keyword lists are answered by one shared scan per question
+        self._keywords = get_keyword_matcher()
+        self._crypto_group = self._keywords.add_group(
+            f"{self.strategy_id}.crypto", self.CRYPTO_KEYWORDS
+        )
+        self._flash_group = self._keywords.add_group(
+            f"{self.strategy_id}.flash", self.FLASH_KEYWORDS
+        )
+        
     async def process_market(self, market: MarketData) -> Optional[TradeSignal]:
         """
         Evaluate market for flash arbitrage opportunity.
@@ -118,17 +131,35 @@ class FlashSniperStrategy(BaseStrategy):
             }
         )
     
+    def batch_mask(self, universe) -> np.ndarray:
+        """Vectorized combined-cost and flash-market keyword filter."""
+        combined_cost = universe.column("yes_price") + universe.column("no_price")
+        
+        mask = (combined_cost < self.max_combined_cost) & (1.0 - combined_cost >= self.min_spread)
+        if not mask.any():
+            return mask
+        
+        is_crypto = universe.keyword_mask(self.CRYPTO_KEYWORDS)
+        is_flash = universe.keyword_mask(self.FLASH_KEYWORDS) | (
+            universe.column("hours_to_expiry") <= 0.5  # NaN (unknown) compares False
+        )
+        
+        return mask & is_crypto & is_flash
+    
+    def admission_priority(self, market: MarketData) -> float:
+        """Prioritize the largest locked-in spread."""
+        return 1.0 - (market.yes_price + market.no_price)
+    
     def _is_flash_market(self, market: MarketData) -> bool:
         """Check if market is a 15-minute crypto flash market."""
-        question_lower = market.question.lower()
+        hits = self._keywords.scan(market.question)
         
         # Must be crypto-related
-        is_crypto = any(kw in question_lower for kw in self.CRYPTO_KEYWORDS)
-        if not is_crypto:
+        if self._crypto_group not in hits:
             return False
         
         # Must be flash/short-term
-        is_flash = any(kw in question_lower for kw in self.FLASH_KEYWORDS)
+        is_flash = self._flash_group in hits
         
         # Also check expiry (if available)
         if market.hours_to_expiry is not None:
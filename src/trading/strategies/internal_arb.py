@@ -35,6 +35,8 @@ from datetime import datetime
 from typing import Optional, Dict, List, Tuple, Any
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .base_strategy import BaseStrategy, MarketData, TradeSignal, SignalType
 
 logger = logging.getLogger(__name__)
@@ -383,6 +385,32 @@ class InternalArbStrategy(BaseStrategy):
         
         return signal
     
+    def batch_mask(self, universe) -> np.ndarray:
+        """
+        Vectorized sum-of-prices check for batch evaluation.
+        
+        Mirrors InternalArbDetector.check_market thresholds over whole columns.
+        """
+        yes = universe.column("yes_price")
+        no = universe.column("no_price")
+        liquidity = universe.column("liquidity")
+        volume = universe.column("volume_24h")
+        total_cost = yes + no
+        
+        return (
+            universe.alive
+            & (yes > 0)
+            & (no > 0)
+            & (total_cost < self.max_cost)
+            & (total_cost > self.min_cost)
+            & ~((liquidity > 0) & (liquidity < self.min_liquidity))
+            & ~((volume > 0) & (volume < self.min_volume_24h))
+        )
+    
+    def admission_priority(self, market: MarketData) -> float:
+        """Prioritize the widest YES+NO gap (highest guaranteed ROI)."""
+        return 1.0 - (market.yes_price + market.no_price)
+    
     def get_detector_stats(self) -> Dict[str, Any]:
         """Get detector statistics."""
         return self._detector.get_stats()
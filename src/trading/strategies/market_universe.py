@@ -0,0 +1,523 @@
+"""
+🗂️ MARKET UNIVERSE - COLUMNAR MARKET STORE
+===========================================
+Columnar storage for the whole market universe of a cycle.
+
+Instead of allocating one dict-heavy MarketData per market per cycle,
+numeric fields live in preallocated NumPy arrays (one slot per market)
+and identity strings are interned. Strategies receive lightweight
+MarketRow views that expose the same attributes as MarketData.
+
+Features:
+- O(1) upsert/remove keyed by condition_id (slots are reused)
+- Vectorized masks over whole columns (e.g. yes_price < 0.04)
+- Keyword masks: one regex pass over all questions at once
+- Slices: the same masks over a subset of rows (e.g. one page of changes)
+- Sparse side storage for rarely used dict/list fields
+- Row views satisfy the MarketData interface (incl. to_snapshot())
+
+Usage:
+    universe = MarketUniverse()
+    row = universe.upsert("0xabc", question="...", yes_price=0.03)
+    mask = universe.column("yes_price") < 0.04
+    for row in universe.select(mask):
+        ...
+"""
+
+import re
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base_strategy import MarketData
+
+# =============================================================================
+# SCHEMA
+# =============================================================================
+
+# Numeric MarketData fields stored as float64 columns
+NUMERIC_FIELDS = (
+    "yes_price",
+    "no_price",
+    "best_bid",
+    "best_ask",
+    "mid_price",
+    "spread_bps",
+    "volume_24h",
+    "volume_1h",
+    "liquidity",
+    "hours_to_expiry",  # NaN encodes None
+)
+
+# Identity fields stored as (interned) Python objects
+IDENTITY_FIELDS = ("condition_id", "question", "token_id", "market_slug", "end_date")
+
+# Rarely populated container fields, kept in a sparse per-slot dict
+EXTRA_FIELDS = (
+    "bid_depth",
+    "ask_depth",
+    "competitor_prices",
+    "price_history",
+    "volume_history",
+    "raw_data",
+)
+
+_EMPTY_MAPPING: MappingProxyType[str, Any] = MappingProxyType({})
+_EMPTY_DEFAULTS = {
+    "bid_depth": _EMPTY_MAPPING,
+    "ask_depth": _EMPTY_MAPPING,
+    "competitor_prices": _EMPTY_MAPPING,
+    "price_history": (),
+    "volume_history": (),
+    "raw_data": _EMPTY_MAPPING,
+}
+
+_INTERNED_FIELDS = ("condition_id", "token_id", "market_slug")
+
+# Columns whose "empty" value is NaN rather than 0 (_end_ts backs refresh_expiry)
+_NAN_COLUMNS = ("hours_to_expiry", "_end_ts")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    # Longest first so overlapping keywords prefer the specific one
+    ordered = sorted({kw.lower() for kw in keywords}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(kw) for kw in ordered))
+
+
+def _build_corpus(questions: Sequence[Optional[str]]) -> Tuple[str, np.ndarray]:
+    """Lowercased "\n"-joined questions plus each row's start offset."""
+    lowered = [(q or "").lower() for q in questions]
+    lengths = np.fromiter((len(q) + 1 for q in lowered), dtype=np.int64, count=len(lowered))
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if len(lowered) else lengths
+    return "\n".join(lowered), starts
+
+
+def _corpus_mask(
+    corpus: Tuple[str, np.ndarray], keywords: Union[Sequence[str], "re.Pattern[str]"]
+) -> np.ndarray:
+    """Bool mask of corpus rows containing any keyword (see keyword_mask)."""
+    text, starts = corpus
+    if isinstance(keywords, re.Pattern):
+        pattern = keywords
+    else:
+        pattern = _keyword_pattern(tuple(keywords))
+
+    mask = np.zeros(len(starts), dtype=bool)
+    positions = [m.start() for m in pattern.finditer(text)]
+    if positions:
+        mask[np.searchsorted(starts, positions, side="right") - 1] = True
+    return mask
+
+
+# =============================================================================
+# ROW VIEW
+# =============================================================================
+
+class MarketRow:
+    """
+    Lightweight view over one slot of a MarketUniverse.
+
+    Exposes the MarketData attributes without copying. Container fields
+    that were never set read as empty read-only mappings/tuples; assign
+    the attribute (row.competitor_prices = {...}) to populate them.
+
+    Views are only valid for the cycle they were created in: once a
+    market is removed its slot may be reused by another market.
+    """
+
+    __slots__ = ("_universe", "_slot")
+
+    _universe: "MarketUniverse"
+    _slot: int
+
+    def __init__(self, universe: "MarketUniverse", slot: int):
+        object.__setattr__(self, "_universe", universe)
+        object.__setattr__(self, "_slot", slot)
+
+    def __getattr__(self, name: str) -> Any:
+        universe = self._universe
+        slot = self._slot
+
+        if name in universe._columns:
+            value = float(universe._columns[name][slot])
+            if name == "hours_to_expiry" and value != value:  # NaN -> None
+                return None
+            return value
+
+        if name in universe._identity:
+            return universe._identity[name][slot]
+
+        if name in _EMPTY_DEFAULTS:
+            extras = universe._extras.get(slot)
+            if extras and name in extras:
+                return extras[name]
+            return _EMPTY_DEFAULTS[name]
+
+        raise AttributeError(f"MarketRow has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._universe._set_field(self._slot, name, value)
+
+    @property
+    def slot(self) -> int:
+        """Index of this market in the universe columns."""
+        return self._slot
+
+    # Reuse MarketData behaviour verbatim (only attribute access is needed)
+    multiplier = MarketData.multiplier
+    to_snapshot = MarketData.to_snapshot
+
+    def to_market_data(self) -> MarketData:
+        """Materialize a standalone MarketData copy of this row."""
+        return self._universe.to_market_data(self._slot)
+
+    def __repr__(self) -> str:
+        return (f"<MarketRow {self.condition_id[:12]} "
+                f"YES={self.yes_price:.4f} NO={self.no_price:.4f}>")
+
+
+# =============================================================================
+# COLUMNAR UNIVERSE
+# =============================================================================
+
+class MarketUniverse(Mapping[str, MarketRow]):
+    """
+    Columnar store for all markets of a cycle, keyed by condition_id.
+
+    Behaves as a read-only Mapping[str, MarketRow] so it can be passed
+    wherever a Dict[str, MarketData] universe is expected, while
+    column() exposes the underlying arrays for vectorized filtering.
+
+    Removed markets leave a tombstone (alive=False) and their slot is
+    reused by the next insert; column() arrays include tombstones, so
+    combine masks with `alive` (select() does this automatically).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = max(16, capacity)
+        self._size = 0  # High-water mark of used slots
+
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=np.float64) for name in NUMERIC_FIELDS
+        }
+        self._columns["_end_ts"] = np.zeros(self._capacity, dtype=np.float64)
+        for name in _NAN_COLUMNS:
+            self._columns[name].fill(np.nan)
+        self._alive = np.zeros(self._capacity, dtype=bool)
+
+        self._identity: Dict[str, List[Any]] = {
+            name: [None] * self._capacity for name in IDENTITY_FIELDS
+        }
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+        self._index: Dict[str, int] = {}
+        self._free: List[int] = []
+
+        # Lowercased "\n"-joined questions + row start offsets (see keyword_mask)
+        self._corpus: Optional[Tuple[str, np.ndarray]] = None
+
+    @classmethod
+    def from_markets(cls, markets: List[MarketData]) -> "MarketUniverse":
+        """Build a universe from existing MarketData objects."""
+        universe = cls(capacity=len(markets))
+        for market in markets:
+            universe.add(market)
+        return universe
+
+    # -------------------------------------------------------------------------
+    # MAPPING INTERFACE
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, condition_id: str) -> MarketRow:
+        return MarketRow(self, self._index[condition_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, condition_id: object) -> bool:
+        return condition_id in self._index
+
+    def rows(self) -> List[MarketRow]:
+        """Views over every live market, in slot order."""
+        return self.select(self._alive[:self._size])
+
+    # -------------------------------------------------------------------------
+    # MUTATION
+    # -------------------------------------------------------------------------
+
+    def upsert(self, condition_id: str, **fields: Any) -> MarketRow:
+        """
+        Insert or update a market in place.
+
+        Args:
+            condition_id: Market key
+            **fields: Any MarketData field (unknown fields raise AttributeError)
+
+        Returns:
+            Row view for the market
+        """
+        slot = self._index.get(condition_id)
+        if slot is None:
+            slot = self._allocate()
+            condition_id = sys.intern(condition_id)
+            self._index[condition_id] = slot
+            self._identity["condition_id"][slot] = condition_id
+            self._alive[slot] = True
+
+        for name, value in fields.items():
+            self._set_field(slot, name, value)
+
+        return MarketRow(self, slot)
+
+    def add(self, market: MarketData) -> MarketRow:
+        """Insert/update from a MarketData object."""
+        fields = {name: getattr(market, name) for name in NUMERIC_FIELDS}
+        for name in IDENTITY_FIELDS[1:]:
+            fields[name] = getattr(market, name)
+        for name in EXTRA_FIELDS:
+            value = getattr(market, name)
+            if value:
+                fields[name] = value
+        return self.upsert(market.condition_id, **fields)
+
+    def remove(self, condition_id: str) -> bool:
+        """Remove a market; its slot is recycled. Returns False if unknown."""
+        slot = self._index.pop(condition_id, None)
+        if slot is None:
+            return False
+
+        self._alive[slot] = False
+        for name, column in self._columns.items():
+            column[slot] = np.nan if name in _NAN_COLUMNS else 0.0
+        for values in self._identity.values():
+            values[slot] = None
+        self._extras.pop(slot, None)
+        self._free.append(slot)
+        self._corpus = None
+        return True
+
+    def clear(self) -> None:
+        """Drop every market but keep the allocated arrays."""
+        for condition_id in list(self._index):
+            self.remove(condition_id)
+        self._free.clear()
+        self._size = 0
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+
+        if self._size >= self._capacity:
+            self._grow(self._capacity * 2)
+
+        slot = self._size
+        self._size += 1
+        self._corpus = None
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        for name, column in self._columns.items():
+            fill = np.nan if name in _NAN_COLUMNS else 0.0
+            self._columns[name] = np.concatenate(
+                [column, np.full(extra, fill, dtype=np.float64)]
+            )
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        for values in self._identity.values():
+            values.extend([None] * extra)
+        self._capacity = capacity
+
+    def _set_field(self, slot: int, name: str, value: Any) -> None:
+        if name in self._columns:
+            if value is None:
+                value = np.nan if name == "hours_to_expiry" else 0.0
+            self._columns[name][slot] = value
+        elif name in self._identity:
+            if name == "condition_id":
+                raise AttributeError("condition_id is the row key and cannot be reassigned")
+            if name in _INTERNED_FIELDS:
+                value = _intern(value)
+            elif name == "end_date":
+                self._columns["_end_ts"][slot] = value.timestamp() if value else np.nan
+            elif name == "question":
+                self._corpus = None
+            self._identity[name][slot] = value
+        elif name in _EMPTY_DEFAULTS:
+            if value:
+                self._extras.setdefault(slot, {})[name] = value
+            elif slot in self._extras:
+                self._extras[slot].pop(name, None)
+        else:
+            raise AttributeError(f"Unknown market field '{name}'")
+
+    # -------------------------------------------------------------------------
+    # VECTORIZED ACCESS
+    # -------------------------------------------------------------------------
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Boolean mask of live slots (length = used slots)."""
+        return self._alive[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Zero-copy view of a numeric column (length = used slots).
+
+        Tombstoned slots are included; combine masks with `alive`.
+        """
+        return self._columns[name][:self._size]
+
+    def identity(self, name: str) -> List[Any]:
+        """Identity column (question, token_id, ...) aligned with column()."""
+        return self._identity[name][:self._size]
+
+    def select(self, mask: np.ndarray) -> List[MarketRow]:
+        """Row views for every live slot where `mask` is True."""
+        slots = np.flatnonzero(np.asarray(mask) & self._alive[:len(mask)])
+        return [MarketRow(self, int(slot)) for slot in slots]
+
+    def keyword_mask(
+        self, keywords: Union[Sequence[str], "re.Pattern[str]"]
+    ) -> np.ndarray:
+        """
+        Bool mask of markets whose lowercased question contains any keyword.
+
+        All questions are joined into one cached string, so the scan is a
+        single regex pass in C rather than a Python loop per market and
+        keyword. Plain substring semantics; word-boundary checks belong in
+        the strategy's per-market logic.
+
+        Args:
+            keywords: Keyword list, or a compiled pattern applied to the
+                      lowercased questions
+
+        Returns:
+            Bool array aligned with column()
+        """
+        if self._corpus is None:
+            self._corpus = _build_corpus(self._identity["question"][:self._size])
+        return _corpus_mask(self._corpus, keywords) & self._alive[:self._size]
+
+    def mask_for(self, rows: Sequence[MarketRow]) -> np.ndarray:
+        """Bool mask selecting the given row views (e.g. changed markets)."""
+        mask = np.zeros(self._size, dtype=bool)
+        if rows:
+            mask[[row.slot for row in rows]] = True
+        return mask
+
+    def slice(self, rows: Sequence[MarketRow]) -> "UniverseSlice":
+        """Vectorized view over just the given rows (see UniverseSlice)."""
+        return UniverseSlice(self, np.fromiter((row.slot for row in rows), dtype=np.intp,
+                                               count=len(rows)))
+
+    def refresh_expiry(self, now: datetime, thresholds: Sequence[float] = ()) -> np.ndarray:
+        """
+        Recompute hours_to_expiry for every market with a known end_date.
+
+        One vectorized pass instead of per-market datetime arithmetic.
+
+        Args:
+            now: Current time
+            thresholds: Hours-to-expiry cut-offs to watch (e.g. 0.5 for
+                        "expires within 30 min")
+
+        Returns:
+            Bool mask (aligned with column()) of live markets whose
+            hours_to_expiry dropped to or below any threshold in this pass
+        """
+        end_ts = self._columns["_end_ts"][:self._size]
+        hours = self._columns["hours_to_expiry"][:self._size]
+        known = ~np.isnan(end_ts)
+        before = hours[known]
+        after = np.maximum((end_ts[known] - now.timestamp()) / 3600.0, 0.0)
+        hours[known] = after
+
+        crossed = np.zeros(self._size, dtype=bool)
+        for threshold in thresholds:
+            crossed[known] |= (before > threshold) & (after <= threshold)
+        return crossed & self._alive[:self._size]
+
+    def to_market_data(self, slot: int) -> MarketData:
+        """Materialize a slot as a standalone MarketData."""
+        row = MarketRow(self, slot)
+        fields = {name: getattr(row, name) for name in NUMERIC_FIELDS}
+        for name in IDENTITY_FIELDS:
+            fields[name] = getattr(row, name)
+        for name in EXTRA_FIELDS:
+            value = getattr(row, name)
+            if value:
+                fields[name] = value
+        return MarketData(**fields)
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by the numeric columns."""
+        return sum(column.nbytes for column in self._columns.values()) + self._alive.nbytes
+
+
+# =============================================================================
+# SLICE VIEW
+# =============================================================================
+
+class UniverseSlice:
+    """
+    Vectorized view over a subset of MarketUniverse slots.
+
+    Offers the part of the universe API that batch_mask() implementations
+    use (alive, column, identity, keyword_mask, select), with arrays aligned
+    to the slice instead of the whole universe. A pipelined cycle filters
+    each page's changed rows through it, so per-chunk work (including the
+    keyword corpus) scales with the chunk, not the universe.
+
+    Like MarketRow, a slice is only valid until the universe is next mutated.
+    """
+
+    def __init__(self, universe: MarketUniverse, slots: np.ndarray):
+        self.universe = universe
+        self.slots = slots
+        self._corpus: Optional[Tuple[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Boolean mask of live slots in the slice."""
+        alive: np.ndarray = self.universe._alive[self.slots]
+        return alive
+
+    def column(self, name: str) -> np.ndarray:
+        """Copy of a numeric column restricted to the slice."""
+        column: np.ndarray = self.universe._columns[name][self.slots]
+        return column
+
+    def identity(self, name: str) -> List[Any]:
+        """Identity column restricted to the slice."""
+        values = self.universe._identity[name]
+        return [values[slot] for slot in self.slots]
+
+    def keyword_mask(self, keywords: Union[Sequence[str], "re.Pattern[str]"]) -> np.ndarray:
+        """MarketUniverse.keyword_mask() over the slice's questions only."""
+        if self._corpus is None:
+            self._corpus = _build_corpus(self.identity("question"))
+        mask: np.ndarray = _corpus_mask(self._corpus, keywords) & self.alive
+        return mask
+
+    def select(self, mask: np.ndarray) -> List[MarketRow]:
+        """Universe row views for every live slice entry where `mask` is True."""
+        slots = self.slots[np.asarray(mask, dtype=bool) & self.alive]
+        return [MarketRow(self.universe, int(slot)) for slot in slots]
@@ -28,6 +28,7 @@ Features:
 
 import asyncio
 import logging
+import sys
 from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple, Set
@@ -35,10 +36,15 @@ from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 
+from src.data.bounded_cache import BoundedCache
+
 from .base_strategy import BaseStrategy, MarketData, TradeSignal, SignalType
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on per-market state (price buffers, cooldowns, evaluated set)
+MAX_TRACKED_MARKETS = 20000
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -119,6 +125,12 @@ class PriceBuffer:
             return 0
         
         return (current_price - old_price) / old_price
+    
+    def sizeof(self) -> int:
+        """Approximate bytes held by the buffer (BoundedCache memory stats)."""
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(d) for d in (self.prices, self.volumes, self.timestamps)
+        ) + len(self.timestamps) * sys.getsizeof(datetime.min)
 
 
 @dataclass
@@ -263,16 +275,28 @@ class SniperStrategy(BaseStrategy):
         # STATE MANAGEMENT
         # =====================================================================
         
-        # Crash Detector state
-        self._price_buffers: Dict[str, PriceBuffer] = {}
-        self._crash_cooldowns: Dict[str, datetime] = {}
+        # Crash Detector state (buffers expire 24h after their last update)
         self._crash_cooldown_minutes = 30
+        self._price_buffers = BoundedCache(
+            maxsize=MAX_TRACKED_MARKETS, ttl=24 * 3600, sliding=True, sizeof=PriceBuffer.sizeof
+        )
+        self._crash_cooldowns = BoundedCache(  # condition_id -> cooldown end
+            maxsize=MAX_TRACKED_MARKETS, ttl=self._crash_cooldown_minutes * 60
+        )
         
         # Stink Bid state
         self._active_stink_bids: Dict[str, StinkBid] = {}  # bid_id -> StinkBid
         self._stink_bid_by_market: Dict[str, str] = {}     # condition_id -> bid_id
         self._filled_stink_bids: List[StinkBid] = []
-        self._markets_considered: Set[str] = set()         # Markets we've evaluated
+        self._markets_considered = BoundedCache(            # Markets we've evaluated
+            maxsize=MAX_TRACKED_MARKETS, ttl=24 * 3600
+        )
+        
+        self._caches.update({
+            "price_buffers": self._price_buffers,
+            "crash_cooldowns": self._crash_cooldowns,
+            "markets_considered": self._markets_considered,
+        })
         
         # Statistics
         self._stats = {
@@ -693,15 +717,14 @@ class SniperStrategy(BaseStrategy):
     
     def _get_price_buffer(self, condition_id: str) -> PriceBuffer:
         """Get or create price buffer for market."""
-        if condition_id not in self._price_buffers:
-            self._price_buffers[condition_id] = PriceBuffer()
-        return self._price_buffers[condition_id]
+        return self._price_buffers.get_or_create(condition_id, PriceBuffer)
     
     def _is_on_crash_cooldown(self, condition_id: str) -> bool:
         """Check if market is on crash detector cooldown."""
-        if condition_id not in self._crash_cooldowns:
+        cooldown_end = self._crash_cooldowns.get(condition_id)
+        if cooldown_end is None:
             return False
-        return datetime.utcnow() < self._crash_cooldowns[condition_id]
+        return datetime.utcnow() < cooldown_end
     
     def _set_crash_cooldown(self, condition_id: str):
         """Set cooldown for crash detector on market."""
@@ -747,7 +770,12 @@ class SniperStrategy(BaseStrategy):
         return base_stats
     
     def cleanup_old_buffers(self, max_age_hours: int = 24):
-        """Remove stale price buffers to free memory."""
+        """
+        Remove stale price buffers to free memory.
+        
+        Buffers are also bounded by size and expire on their own; this
+        drops them early, e.g. with a shorter max_age_hours.
+        """
         cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
         
         to_remove = []
@@ -757,8 +785,9 @@ class SniperStrategy(BaseStrategy):
         
         for cid in to_remove:
             del self._price_buffers[cid]
-            if cid in self._crash_cooldowns:
-                del self._crash_cooldowns[cid]
+            self._crash_cooldowns.discard(cid)
+        for cache in self._caches.values():
+            cache.purge()
         
         if to_remove:
             logger.debug(f"🧹 Cleaned {len(to_remove)} old price buffers")
@@ -21,7 +21,11 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, Dict, List
-import re
+
+import numpy as np
+
+from src.data.keyword_matcher import get_keyword_matcher
+from src.data.text_normalize import normalize
 
 from .base_strategy import BaseStrategy, MarketData, TradeSignal, SignalType
 
@@ -94,6 +98,11 @@ class TailStrategy(BaseStrategy):
         self.min_price = min_price
         self.min_multiplier = min_multiplier
         self.min_ml_score = min_ml_score
+        
+        self._keywords = get_keyword_matcher()
+        self._category_group = self._keywords.add_group(
+            f"{self.STRATEGY_ID}.category", self.CATEGORY_WEIGHTS
+        )
     
     def get_config(self) -> Dict:
         return {
@@ -106,6 +115,23 @@ class TailStrategy(BaseStrategy):
             "paper_mode": self.paper_mode,
         }
     
+    def batch_mask(self, universe) -> np.ndarray:
+        """
+        Vectorized price/multiplier filter for batch evaluation.
+        
+        Keeps the near-miss band so those markets are still logged.
+        """
+        yes = universe.column("yes_price")
+        
+        in_range = (
+            (yes > self.min_price)
+            & (yes < self.max_price)
+            & (yes <= (1 / self.min_multiplier) * (1 + 1e-9))  # multiplier >= min
+        )
+        near_miss = (yes >= self.max_price) & (yes <= self.max_price * 1.5)
+        
+        return (in_range | near_miss) & universe.alive
+    
     async def process_market(self, market: MarketData) -> Optional[TradeSignal]:
         """
         Evaluate market for tail betting opportunity.
@@ -192,25 +218,24 @@ class TailStrategy(BaseStrategy):
         
         Features designed for XGBoost training.
         """
-        question = market.question.lower()
+        flags = normalize(market.question).flags
         
-        # Category detection
-        detected_category = 'other'
-        for category in self.CATEGORY_WEIGHTS.keys():
-            if category in question:
-                detected_category = category
-                break
+        # Category detection: first CATEGORY_WEIGHTS key found in the question
+        found = self._keywords.scan(market.question).keywords(self._category_group)
+        detected_category = next(
+            (category for category in self.CATEGORY_WEIGHTS if category in found), 'other'
+        )
         
         # Binary category features
         features = {
-            'has_crypto': any(kw in question for kw in ['crypto', 'bitcoin', 'ethereum', 'btc', 'eth']),
-            'has_stock': any(kw in question for kw in ['nvidia', 'tesla', 'apple', 'stock', 'nvda', 'tsla']),
-            'has_ai': any(kw in question for kw in ['ai', 'openai', 'gpt', 'artificial intelligence', 'chatgpt']),
-            'has_politics': any(kw in question for kw in ['trump', 'biden', 'election', 'president', 'congress']),
-            'has_sports': any(kw in question for kw in ['sports', 'nba', 'nfl', 'football', 'basketball', 'score']),
-            'has_number': bool(re.search(r'\d+', question)),
-            'has_date': bool(re.search(r'(january|february|march|april|may|june|july|august|september|october|november|december|\d{4})', question)),
-            'has_comparison': any(kw in question for kw in ['above', 'below', 'more than', 'less than', 'exceed']),
+            'has_crypto': 'crypto' in flags,
+            'has_stock': 'stock' in flags,
+            'has_ai': 'ai' in flags,
+            'has_politics': 'politics' in flags,
+            'has_sports': 'sports' in flags,
+            'has_number': 'number' in flags,
+            'has_date': 'date' in flags,
+            'has_comparison': 'comparison' in flags,
             
             # Numeric features
             'question_length': len(market.question),
@@ -121,25 +121,21 @@ class ArbitrageStrategy:
             return
 
         markets = await self.market_scanner.scan_flash_markets()
+        markets = [market for market in markets if market.tokens]
 
-        for market in markets:
-            if not market.tokens:
-                continue
-
-            market_id = market.id
-
-            # Subscribe to new markets
-            if market_id not in self._subscribed_markets and self.websocket_feed:
-                await self.websocket_feed.subscribe(market.tokens.up_token_id)
-                await self.websocket_feed.subscribe(market.tokens.down_token_id)
-                self._subscribed_markets.add(market_id)
-
-                logger.debug(
-                    "Subscribed to market",
-                    market_id=market_id,
-                    asset=market.asset,
-                )
+        # Feed subscriptions follow the active set (enter: subscribe, exit: unsubscribe)
+        if self.websocket_feed:
+            changes = await self.websocket_feed.set_active(
+                token_id
+                for tokens in (market.tokens for market in markets)
+                if tokens
+                for token_id in (tokens.up_token_id, tokens.down_token_id)
+            )
+            if changes["added"] or changes["removed"]:
+                logger.debug("Feed subscriptions updated", **changes)
+            self._subscribed_markets = {market.id for market in markets}
 
+        for market in markets:
             # Get current prices and analyze
             tokens = await self.market_scanner.get_market_prices(market)
             if tokens:
@@ -147,8 +143,8 @@ class ArbitrageStrategy:
 
     def _on_orderbook_update(self, token_id: str, orderbook: OrderbookSnapshot) -> None:
         """Handle orderbook update from WebSocket."""
-        # This is called synchronously from the WebSocket feed
-        # We need to be careful not to block
+        # Runs in the feed's callback task off a coalescing queue: a slow
+        # handler skips intermediate books instead of stalling the feed
 
         # Update dislocation detector
         # Note: We'd need to map token_id back to market to get both prices
@@ -0,0 +1,116 @@
+"""Tests for the strategy admission scheduler."""
+
+from dataclasses import dataclass
+
+from src.trading.strategies import InternalArbStrategy, MarketUniverse
+from src.trading.strategies.admission import AdmissionScheduler
+
+
+@dataclass
+class _Market:
+    condition_id: str
+    yes_price: float = 0.5
+
+
+class TestAdmissionScheduler:
+    """Tests for AdmissionScheduler class."""
+
+    def test_priority_then_freshness(self) -> None:
+        """Test that higher priority pops first, newest first on ties."""
+        scheduler = AdmissionScheduler()
+        scheduler.submit(_Market("a"), priority=0.0)
+        scheduler.submit(_Market("b"), priority=0.0)
+        scheduler.submit(_Market("c"), priority=1.0)
+
+        order = [scheduler.pop().condition_id for _ in range(3)]
+
+        assert order == ["c", "b", "a"]
+        assert scheduler.pop() is None
+
+    def test_market_budget_defers(self) -> None:
+        """Test that over-budget markets stay queued and are counted."""
+        scheduler = AdmissionScheduler(max_markets=2)
+        scheduler.begin_cycle()
+        for cid in "abcde":
+            scheduler.submit(_Market(cid))
+
+        while scheduler.has_budget():
+            scheduler.pop()
+            scheduler.charge(0.0)
+        scheduler.end_cycle()
+
+        stats = scheduler.get_stats()
+        assert stats["evaluated"] == 2
+        assert stats["backlog"] == 3
+        assert stats["deferred"] == 3
+        assert stats["dropped"] == 0
+
+    def test_resubmission_coalesces(self) -> None:
+        """Test that resubmitting a market replaces the queued entry."""
+        scheduler = AdmissionScheduler()
+        first = _Market("a", yes_price=0.1)
+        second = _Market("a", yes_price=0.2)
+        scheduler.submit(first)
+        scheduler.submit(second)
+
+        assert scheduler.backlog == 1
+        assert scheduler.pop() is second
+        assert scheduler.get_stats()["coalesced"] == 1
+
+    def test_backlog_overflow_drops_lowest(self) -> None:
+        """Test that the bounded backlog evicts the lowest priority."""
+        scheduler = AdmissionScheduler(max_backlog=2)
+        scheduler.submit(_Market("low"), priority=0.0)
+        scheduler.submit(_Market("mid"), priority=0.5)
+        scheduler.submit(_Market("high"), priority=1.0)
+
+        assert [scheduler.pop().condition_id for _ in range(2)] == ["high", "mid"]
+        assert scheduler.get_stats()["dropped_overflow"] == 1
+
+
+async def test_strategy_evaluates_every_market_without_budget() -> None:
+    """Test that back-to-back process() calls are no longer throttled."""
+    strategy = InternalArbStrategy()
+    universe = MarketUniverse()
+    rows = [universe.upsert(f"cond-{i}", question="Q", yes_price=0.45, no_price=0.5)
+            for i in range(20)]
+
+    signals = [await strategy.process(row) for row in rows]
+
+    assert all(signals)
+    assert strategy.get_stats()["admission"]["evaluated"] == 20
+
+
+async def test_batch_budget_carries_backlog_forward() -> None:
+    """Test that deferred markets are evaluated in the next batch."""
+    strategy = InternalArbStrategy(eval_budget_markets=5)
+    universe = MarketUniverse()
+    for i in range(12):
+        universe.upsert(f"cond-{i}", question="Q", yes_price=0.45, no_price=0.5 - i / 1000)
+
+    first = await strategy.process_batch(universe)
+    second = await strategy.process_batch(universe, universe.mask_for([]))
+
+    assert len(first) == 5
+    assert len(second) == 5
+    # Widest gap (highest ROI) evaluated first
+    assert first[0].condition_id == "cond-11"
+    assert strategy.get_stats()["admission"]["backlog"] == 2
+
+
+async def test_chunked_batches_share_one_cycle_budget() -> None:
+    """Test that pipelined chunks (new_cycle=False) draw on one budget."""
+    strategy = InternalArbStrategy(eval_budget_markets=5)
+    universe = MarketUniverse()
+    rows = [universe.upsert(f"cond-{i}", question="Q", yes_price=0.45, no_price=0.5)
+            for i in range(8)]
+
+    first = await strategy.process_batch(universe, universe.mask_for(rows[:4]))
+    second = await strategy.process_batch(
+        universe, universe.mask_for(rows[4:]), new_cycle=False
+    )
+
+    assert len(first) + len(second) == 5
+    stats = strategy.get_stats()["admission"]
+    assert stats["cycles"] == 1
+    assert stats["deferred"] == 3
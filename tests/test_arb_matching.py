@@ -0,0 +1,144 @@
+"""Tests for cross-exchange question matching."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.scanner import fuzzy_matrix
+from src.scanner.arb_scanner import (
+    OPPOSITE_INDICATORS,
+    MatchIndex,
+    batch_match_markets,
+    blocking_tokens,
+    clean_question,
+    measure_blocking_recall,
+    tfidf_features,
+)
+from src.scanner.tfidf_matcher import TfidfIndex
+
+
+def _pb(question: str, market_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        question=question, market_id=market_id, yes_price=0.40, no_price=0.60, volume=100
+    )
+
+
+PB_MARKETS = [
+    _pb("NBA: Lakers vs. Celtics", "pb-1"),
+    _pb("NFL: Eagles vs. Panthers", "pb-2"),
+    _pb("Bitcoin above 100k on Friday", "pb-3"),
+    _pb("Ethereum above 5k on Friday", "pb-4"),
+] + [_pb(f"Will candidate {i} win the election?", f"pb-e{i}") for i in range(40)]
+
+POLY_MARKETS = [
+    {"question": "Lakers vs Celtics", "yes_price": 0.45},
+    {"question": "Bitcoin above 100k on Friday?", "yes_price": 0.30},
+    {"question": "Will candidate 7 win the election?", "yes_price": 0.20},
+]
+
+
+class TestMatchIndex:
+    """Tests for inverted-index candidate blocking."""
+
+    def test_tokens_normalize_assets_and_numbers(self) -> None:
+        """Test that assets map to tickers and 100k to 100000."""
+        tokens, keys = blocking_tokens(clean_question("Will Bitcoin reach 100k before the Lakers?"))
+
+        assert {"btc", "100000", "lakers"} <= tokens
+        assert "will" not in tokens and "before" not in tokens
+        assert keys == {"btc", "lakers"}
+
+    def test_candidates_skip_unrelated_questions(self) -> None:
+        """Test that only questions sharing a rare or key token are returned."""
+        index = MatchIndex([clean_question(m.question) for m in PB_MARKETS], min_df=5)
+
+        assert index.candidates(clean_question("BTC to 100k?")) == [2]
+        assert index.candidates(clean_question("Candidate 7 wins the election")) == [11]
+        assert index.get_stats()["candidates_scored"] == 2
+
+    def test_indexed_matching_matches_brute_force(self) -> None:
+        """Test that blocking keeps every brute-force pair."""
+        pairs = batch_match_markets(POLY_MARKETS, PB_MARKETS, threshold=60)
+        recall = measure_blocking_recall(POLY_MARKETS, PB_MARKETS, threshold=60)
+
+        assert {p.pb_market_id for p in pairs} == {"pb-1", "pb-3", "pb-e7"}
+        assert recall["recall"] == 1.0
+        assert recall["brute_pairs"] == recall["indexed_pairs"] == 3
+
+
+class TestTfidfMatcher:
+    """Tests for TF-IDF top-k retrieval."""
+
+    def test_top_k_ranks_reworded_question_first(self) -> None:
+        """Test that the reworded question is the nearest neighbour."""
+        docs = [clean_question(m.question) for m in PB_MARKETS]
+        index = TfidfIndex(docs, analyzer=tfidf_features)
+        top_idx, top_sim = index.top_k(
+            [clean_question("Celtics at Lakers, who wins?"), clean_question("Snow in Miami?")], k=3
+        )
+
+        assert top_idx[0, 0] == 0 and top_sim[0, 0] > top_sim[0, 1]
+        assert top_idx[1].tolist() == [-1, -1, -1]  # No shared feature
+
+    def test_tfidf_matching_matches_brute_force(self) -> None:
+        """Test that top-k retrieval keeps every brute-force pair."""
+        recall = measure_blocking_recall(POLY_MARKETS, PB_MARKETS, threshold=60, use_tfidf=True)
+
+        assert recall["recall"] == 1.0
+        assert recall["brute_pairs"] == recall["indexed_pairs"] == 3
+
+    def test_rerank_skips_opposite_neighbour(self) -> None:
+        """Test that a vetoed neighbour loses to a compatible one."""
+        pb_markets = [
+            _pb("Will BTC close below 100k?", "below"),
+            _pb("BTC close above 100k", "above"),
+        ]
+        pairs = batch_match_markets(
+            [{"question": "Will BTC close above 100k?", "yes_price": 0.5}], pb_markets,
+            threshold=60, use_tfidf=True,
+        )
+
+        assert [p.pb_market_id for p in pairs] == ["above"]
+
+
+@pytest.mark.skipif(not fuzzy_matrix.RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+class TestFuzzyMatrix:
+    """Tests for the vectorized score matrix."""
+
+    def test_best_matches_skip_empty_strings(self) -> None:
+        """Test best-per-row selection and that empty strings never match."""
+        best_idx, best_score = fuzzy_matrix.best_matches(
+            ["lakers vs celtics", "", "nothing alike"], ["", "nba lakers vs celtics", "zzz"]
+        )
+
+        assert best_idx[0] == 1 and best_score[0] > 80
+        assert best_idx[1] == -1
+
+    def test_opposite_veto_matches_python_check(self) -> None:
+        """Test the vectorized veto against has_opposite_indicators."""
+        queries = ["Will BTC be over 100k?", "Will BTC be above 100k?"]
+        choices = ["Will BTC be under 100k?", "Will BTC be above 100k?"]
+        veto = fuzzy_matrix.opposite_veto(queries, choices, np.array([0, 1]), OPPOSITE_INDICATORS)
+
+        assert veto.tolist() == [True, False]
+
+    def test_matrix_path_matches_python_path(self) -> None:
+        """Test that both scoring paths return the same pairs."""
+        matrix = batch_match_markets(POLY_MARKETS, PB_MARKETS, threshold=60, use_matrix=True)
+        python = batch_match_markets(
+            POLY_MARKETS, PB_MARKETS, threshold=60, use_matrix=False, use_index=False
+        )
+
+        assert [p.pb_market_id for p in matrix] == [p.pb_market_id for p in python]
+        assert [p.match_score for p in matrix] == pytest.approx([p.match_score for p in python])
+
+    def test_scores_are_whole_points(self) -> None:
+        """Test that rapidfuzz scores are rounded like thefuzz's ints on both paths."""
+        for use_matrix in (True, False):
+            pairs = batch_match_markets(
+                POLY_MARKETS, PB_MARKETS, threshold=0, use_matrix=use_matrix, use_index=False
+            )
+
+            assert pairs
+            assert all(p.match_score == round(p.match_score) for p in pairs)
@@ -0,0 +1,214 @@
+"""Tests for batch strategy evaluation over a MarketUniverse."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.scanner.match_cache import MatchCache
+from src.trading.strategies import (
+    ContrarianNoStrategy,
+    FlashSniperStrategy,
+    InternalArbStrategy,
+    MarketUniverse,
+    StrategyRegistry,
+    TailStrategy,
+)
+from src.trading.strategies.arbitrage_strategy import ArbitrageStrategy
+from src.trading.strategies.base_strategy import MarketData
+
+QUESTIONS = [
+    "Will Bitcoin go up or down in the next 15 min?",
+    "Will ETH be up or down at 3pm (15-min)?",
+    "Will there be a nuclear war in 2026?",
+    "Will the US economy crash before July?",
+    "Will Tesla stock be above $500 on Friday?",
+    "Will the Lakers win the NBA finals?",
+    "Will it rain in London tomorrow?",
+    "Will Trump resign before 2027?",
+]
+
+
+def _random_markets(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    markets = []
+    for i in range(n):
+        yes = rng.choice([rng.uniform(0.001, 0.08), rng.uniform(0.05, 0.6)])
+        no = rng.uniform(0.3, 1.0 - yes)
+        markets.append(MarketData(
+            condition_id=f"cond-{i}",
+            question=rng.choice(QUESTIONS),
+            yes_price=yes,
+            no_price=no,
+            volume_24h=rng.choice([0, 200, 6000, 150000]),
+            liquidity=rng.choice([0, 50, 5000]),
+            hours_to_expiry=rng.choice([None, 0.2, 30.0]),
+        ))
+    return markets
+
+
+def _unlimited(strategy_cls):
+    strategy = strategy_cls()
+    strategy.max_daily_trades = 10_000
+    return strategy
+
+
+@pytest.fixture
+def markets() -> list:
+    """Create a deterministic random market set."""
+    return _random_markets(400)
+
+
+@pytest.mark.parametrize("strategy_cls", [
+    TailStrategy,
+    InternalArbStrategy,
+    FlashSniperStrategy,
+    ContrarianNoStrategy,
+])
+async def test_batch_matches_per_market(strategy_cls, markets: list) -> None:
+    """Test that vectorized pre-filters never drop a per-market signal."""
+    reference = _unlimited(strategy_cls)
+    expected = {m.condition_id for m in markets if await reference.process_market(m)}
+
+    signals = await _unlimited(strategy_cls).process_batch(MarketUniverse.from_markets(markets))
+
+    assert {s.condition_id for s in signals} == expected
+
+
+async def test_batch_respects_candidate_mask(markets: list) -> None:
+    """Test that only masked (e.g. changed) markets are evaluated."""
+    universe = MarketUniverse.from_markets(markets)
+    all_signals = await _unlimited(InternalArbStrategy).process_batch(universe)
+    first = all_signals[0].condition_id
+    mask = universe.mask_for([universe[first]])
+
+    signals = await _unlimited(InternalArbStrategy).process_batch(universe, mask)
+
+    assert [s.condition_id for s in signals] == [first]
+
+
+@pytest.mark.parametrize("strategy_cls", [
+    TailStrategy,
+    InternalArbStrategy,
+    FlashSniperStrategy,
+    ContrarianNoStrategy,
+])
+async def test_chunked_slices_match_whole_universe(strategy_cls, markets: list) -> None:
+    """Test that filtering page-sized slices finds the same signals as one full batch."""
+    universe = MarketUniverse.from_markets(markets)
+    expected = await _unlimited(strategy_cls).process_batch(universe)
+
+    strategy = _unlimited(strategy_cls)
+    rows = universe.rows()
+    signals = []
+    for start in range(0, len(rows), 50):
+        chunk = universe.slice(rows[start:start + 50])
+        signals += await strategy.process_batch(chunk, new_cycle=start == 0)
+
+    assert {s.condition_id for s in signals} == {s.condition_id for s in expected}
+
+
+async def test_registry_dispatches_batches(markets: list) -> None:
+    """Test that the registry merges batch signals from every strategy."""
+    registry = StrategyRegistry()
+    registry.register(TailStrategy())
+    registry.register(InternalArbStrategy())
+
+    signals = await registry.process_batch(MarketUniverse.from_markets(markets))
+
+    assert {s.strategy_id for s in signals} <= {"TAIL_BETTING_V1", "ARB_INTERNAL_V1"}
+    assert len(signals) > 0
+
+
+async def test_arbitrage_prefetches_pb_prices_once() -> None:
+    """Test that one PB fetch prices the whole batch and misses are not refetched."""
+    fetches = []
+
+    async def get_markets(limit=100):
+        fetches.append(limit)
+        return [SimpleNamespace(
+            market_id="pb-1", question="Will the Lakers win the NBA finals?",
+            yes_price=0.30, no_price=0.60, volume=100,
+        )]
+
+    strategy = _unlimited(ArbitrageStrategy)
+    strategy._pb_client = SimpleNamespace(get_markets=get_markets)
+    strategy._pb_initialized = True
+    strategy._match_cache = MatchCache(persist=False)
+
+    markets = [
+        MarketData(condition_id=f"cond-{i}", question=q, yes_price=0.35, no_price=0.60,
+                   volume_24h=5000)
+        for i, q in enumerate(QUESTIONS)
+    ]
+    signals = await strategy.process_batch(MarketUniverse.from_markets(markets))
+
+    assert [s.condition_id for s in signals] == ["cond-5"]  # 0.35 + 0.60 < 0.975
+    assert len(fetches) == 1
+
+    unmatched = [m for m in markets if m.condition_id != "cond-5"]
+    await strategy.process_batch(MarketUniverse.from_markets(unmatched))
+    assert len(fetches) == 1  # Only cached misses left: no fetch
+    assert strategy.get_stats()["caches"]["pb_misses"]["size"] == len(QUESTIONS) - 1
+
+
+def _arb_strategy(get_markets) -> ArbitrageStrategy:
+    strategy = _unlimited(ArbitrageStrategy)
+    strategy._pb_client = SimpleNamespace(get_markets=get_markets)
+    strategy._pb_initialized = True
+    strategy._match_cache = MatchCache(persist=False)
+    return strategy
+
+
+async def test_arbitrage_reprices_every_cycle() -> None:
+    """Test that a changed PB price is used on the next cycle, not the first quote."""
+    pb_no = [0.55]
+
+    async def get_markets(limit=100):
+        return [SimpleNamespace(
+            market_id="pb-1", question="Will the Lakers win the NBA finals?",
+            yes_price=0.30, no_price=pb_no[0], volume=100,
+        )]
+
+    strategy = _arb_strategy(get_markets)
+    market = MarketData(condition_id="cond-5", question=QUESTIONS[5], yes_price=0.35,
+                        no_price=0.70, volume_24h=5000)
+    universe = MarketUniverse.from_markets([market])
+
+    first = await strategy.process_batch(universe)
+    assert first[0].signal_data["pb_no"] == 0.55
+
+    pb_no[0] = 0.60
+    strategy._processed_markets.clear()
+    second = await strategy.process_batch(universe)
+    assert second[0].signal_data["pb_no"] == 0.60
+    assert "predictbase" not in universe["cond-5"].competitor_prices
+
+    pb_no[0] = 0.68  # 0.35 + 0.68 > 0.975: the old quote must not signal
+    strategy._processed_markets.clear()
+    assert await strategy.process_batch(universe) == []
+
+
+async def test_arbitrage_pb_outage_costs_one_fetch() -> None:
+    """Test that a failed PB fetch is not retried per market."""
+    fetches = []
+
+    async def get_markets(limit=100):
+        fetches.append(limit)
+        raise ConnectionError("PB down")
+
+    strategy = _arb_strategy(get_markets)
+    markets = [
+        MarketData(condition_id=f"cond-{i}", question=q, yes_price=0.35, no_price=0.60,
+                   volume_24h=5000)
+        for i, q in enumerate(QUESTIONS)
+    ]
+
+    assert await strategy.process_batch(MarketUniverse.from_markets(markets)) == []
+    assert len(fetches) == 1
+
+    # Per-market path right after the outage: remembered, no new fetch
+    other = MarketData(condition_id="cond-x", question=QUESTIONS[5], yes_price=0.35,
+                       no_price=0.60, volume_24h=5000)
+    assert await strategy.process(other) is None
+    assert len(fetches) == 1
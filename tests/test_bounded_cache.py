@@ -0,0 +1,58 @@
+"""Tests for the size- and TTL-bounded cache."""
+
+from src.data.bounded_cache import BoundedCache
+from src.trading.strategies import SniperStrategy
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBoundedCache:
+    """Tests for BoundedCache."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry goes first when full."""
+        cache = BoundedCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1  # "b" is now least recently used
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache.keys() == ["a", "c"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_fixed_and_sliding(self) -> None:
+        """Test that entries expire after ttl, counted from the last read when sliding."""
+        clock = FakeClock()
+        fixed = BoundedCache(ttl=10, clock=clock)
+        sliding = BoundedCache(ttl=10, sliding=True, clock=clock)
+        fixed.add("m")
+        sliding.add("m")
+
+        clock.now = 8
+        assert "m" in fixed and "m" in sliding
+        clock.now = 15
+        assert "m" not in fixed
+        assert "m" in sliding  # Read at t=8 extended it to t=18
+        clock.now = 30
+        assert "m" not in sliding
+        assert len(sliding) == 0 and sliding.get_stats()["expirations"] == 1
+
+    def test_strategy_reports_cache_memory(self) -> None:
+        """Test that strategy caches are bounded and reported in get_stats."""
+        strategy = SniperStrategy()
+        for i in range(50):
+            strategy._get_price_buffer(f"cond-{i}").add(0.5, 100.0)
+
+        stats = strategy.get_stats()
+        assert stats["caches"]["price_buffers"]["size"] == 50
+        assert stats["caches"]["processed_markets"]["maxsize"] > 0
+        assert stats["cache_memory_bytes"] >= stats["caches"]["price_buffers"]["memory_bytes"] > 0
@@ -0,0 +1,91 @@
+"""Tests for the esports oracle team -> market index."""
+
+import random
+from types import SimpleNamespace
+
+from src.trading.strategies.esports_oracle import (
+    FUZZY_MATCH_THRESHOLD,
+    MIN_LIQUIDITY,
+    EsportsOracleStrategy,
+    LiveMatch,
+    PolymarketMatch,
+    TeamMarketIndex,
+)
+
+WORDS = (
+    "will t1 skt gen.g geng fnatic fnc g2 cloud9 c9 team liquid blg weibo drx "
+    "beat win the worlds lol msi final vs game series 2026 tlq fnatc gen"
+).split()
+
+
+def _market(question: str, condition_id: str, liquidity: float = 1000.0) -> PolymarketMatch:
+    return PolymarketMatch(condition_id=condition_id, question=question, liquidity=liquidity)
+
+
+def _linear_match(strategy, markets, team1, team2):
+    """The pre-index scan of _find_polymarket_match."""
+    best, best_score = None, 0.0
+    for market in markets:
+        if market.liquidity < MIN_LIQUIDITY:
+            continue
+        question = market.question.lower()
+        combined = (
+            strategy._fuzzy_team_match(team1, question)
+            + strategy._fuzzy_team_match(team2, question)
+        ) / 2
+        if combined > best_score and combined >= FUZZY_MATCH_THRESHOLD:
+            best, best_score = market, combined
+    return best
+
+
+class TestTeamMarketIndex:
+    """Tests for TeamMarketIndex."""
+
+    def test_matches_linear_scan(self) -> None:
+        """Test the index picks the same market as the fuzzy scan for every pair."""
+        rng = random.Random(3)
+        markets = [
+            _market(
+                " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 9))).title() + "?",
+                f"c{i}",
+                liquidity=rng.choice([100.0, 1000.0, 5000.0]),
+            )
+            for i in range(300)
+        ]
+        strategy = EsportsOracleStrategy()
+        index = TeamMarketIndex(markets)
+
+        teams = ["T1", "Gen.G", "FNATIC", "Team Liquid", "Cloud9", "BLG", "Unknown Squad", "drx"]
+        for blue in teams:
+            for red in teams:
+                team1, team2 = strategy._normalize_team(blue), strategy._normalize_team(red)
+                found = index.best(team1, team2)
+                expected = _linear_match(strategy, markets, team1, team2)
+                assert (found[0] if found else None) is expected
+
+        assert index.get_stats()["teams_scored"] == len(teams)
+        assert index.get_stats()["pairs_cached"] == len(teams) ** 2
+
+    async def test_refresh_dedups_and_warms_live_matches(self) -> None:
+        """Test that a refresh drops repeated markets and precomputes live pairs."""
+        page = [
+            {"conditionId": "c1", "question": "LoL Worlds: T1 vs Gen.G", "liquidity": 2000},
+            {"conditionId": "c2", "question": "LoL Worlds: Fnatic vs G2", "liquidity": 2000},
+        ]
+
+        async def get_json(url, params=None, timeout=None):
+            return page  # Every keyword search returns the same markets
+
+        strategy = EsportsOracleStrategy()
+        strategy.http = SimpleNamespace(get_json=get_json)
+        strategy.active_matches["e1"] = LiveMatch(
+            match_id="m1", event_id="e1", league="Worlds", team_blue="SKT", team_red="GenG",
+            score_blue=0, score_red=0, best_of=5,
+        )
+        await strategy._refresh_polymarket_cache()
+
+        assert [m.condition_id for m in strategy.polymarket_cache] == ["c1", "c2"]
+        assert strategy.market_index.get_stats()["pairs_cached"] == 1
+
+        market = await strategy._find_polymarket_match(strategy.active_matches["e1"])
+        assert market.condition_id == "c1"
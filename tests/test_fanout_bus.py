@@ -0,0 +1,87 @@
+"""Tests for the async fan-out bus and its use by WebSocketFeed."""
+
+import asyncio
+
+from src.data.fanout_bus import FanoutBus, OverflowPolicy
+from src.scanner.websocket_feed import TOPIC_RAW, WebSocketFeed
+
+
+class TestFanoutBus:
+    """Tests for FanoutBus overflow policies."""
+
+    async def test_overflow_policies(self) -> None:
+        """Test drop-oldest, coalesce-per-key and topic/key filtering on full queues."""
+        bus = FanoutBus()
+        oldest = bus.subscribe("oldest", maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+        latest = bus.subscribe(
+            "latest", topics={"book"}, maxsize=10, policy=OverflowPolicy.COALESCE
+        )
+        only_b = bus.subscribe("only_b", keys={"b"})
+
+        for i in range(3):
+            await bus.publish("book", "a", i)
+            await bus.publish("book", "b", i)
+        await bus.publish("trade", "a", "t")
+
+        assert [oldest.get_nowait() for _ in range(3)] == [
+            ("book", "b", 2), ("trade", "a", "t"), None
+        ]
+        assert [latest.get_nowait() for _ in range(3)] == [("book", "a", 2), ("book", "b", 2), None]
+        assert [p for _, _, p in [only_b.get_nowait() for _ in range(3)]] == [0, 1, 2]
+
+        stats = bus.get_stats()
+        assert (stats["oldest"]["dropped"], stats["oldest"]["max_lag"]) == (5, 2)
+        assert (stats["latest"]["coalesced"], stats["latest"]["max_lag"]) == (4, 2)
+
+    async def test_block_waits_for_slow_consumer(self) -> None:
+        """Test that BLOCK is lossless: the publisher waits until the consumer makes room."""
+        bus = FanoutBus()
+        recorder = bus.subscribe("recorder", maxsize=2, policy=OverflowPolicy.BLOCK)
+        received = []
+
+        async def consume() -> None:
+            async for _, _, payload in recorder:
+                await asyncio.sleep(0.001)
+                received.append(payload)
+
+        consumer = asyncio.create_task(consume())
+        for i in range(10):
+            await bus.publish("raw", None, i)
+        recorder.close()
+        await consumer
+
+        assert received == list(range(10))
+        assert recorder.get_stats()["blocked_s"] > 0
+
+
+class TestWebSocketFeedBus:
+    """Tests for WebSocketFeed publishing through the bus."""
+
+    async def test_slow_callback_does_not_stall_receive_loop(self) -> None:
+        """Test that a slow callback gets coalesced books while a recorder gets every message."""
+        feed = WebSocketFeed()
+        recorder = feed.bus.subscribe(
+            "recorder", topics={TOPIC_RAW}, maxsize=100, policy=OverflowPolicy.BLOCK
+        )
+        seen = []
+
+        async def slow_callback(token_id, book) -> None:
+            seen.append(book.best_bid)
+            await asyncio.sleep(0.05)
+
+        feed.add_callback(slow_callback)
+        await feed._handle_message(
+            {"type": "book", "asset_id": "tok", "bids": [{"price": "0.40", "size": "1"}]}
+        )
+        await asyncio.sleep(0)  # Callback starts on the first book and sleeps
+        for i in range(1, 50):
+            await feed._handle_message({
+                "type": "price_change", "asset_id": "tok",
+                "changes": [{"price": f"{0.40 + i / 1000:.3f}", "side": "BUY", "size": "1"}],
+            })
+
+        assert recorder.lag == 50
+        assert feed.get_stats()["consumers"]["callback:" + slow_callback.__qualname__]["lag"] == 1
+        await asyncio.sleep(0.08)
+        assert seen == [0.40, 0.449]
+        await feed.disconnect()
@@ -0,0 +1,89 @@
+"""Tests for the shared HTTP transport."""
+
+import httpx
+
+from src.data.http_client import HostPolicy, HttpTransport, RetryPolicy, TokenBucket
+
+FAST_RETRY = RetryPolicy(max_retries=2, backoff_base=0.001, jitter=0.0)
+
+
+def _mock(transport: HttpTransport, host: str, handler) -> None:
+    """Route a host's pool through an httpx.MockTransport."""
+    transport._clients[host] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_policy_lookup_by_suffix() -> None:
+    """Test that the longest matching host suffix selects the policy."""
+    transport = HttpTransport()
+
+    key, policy = transport.policy_for("kr.api.riotgames.com")
+    assert key == "api.riotgames.com"
+    assert 429 not in policy.retry.retry_statuses
+
+    key, policy = transport.policy_for("example.com")
+    assert key == "example.com"
+    assert policy.rate is None
+
+
+async def test_retries_retryable_status() -> None:
+    """Test that 503 is retried and the final 200 is returned."""
+    transport = HttpTransport(policies={"api.test": HostPolicy(retry=FAST_RETRY)})
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[{"ok": True}])
+
+    _mock(transport, "api.test", handler)
+
+    assert await transport.get_json("https://api.test/markets") == [{"ok": True}]
+    assert len(calls) == 3
+    assert transport.get_stats()["hosts"]["api.test"]["retries"] == 2
+    await transport.aclose()
+
+
+async def test_exhausted_retries_return_last_response() -> None:
+    """Test that callers see the final status once retries run out."""
+    transport = HttpTransport(policies={"api.test": HostPolicy(retry=FAST_RETRY)})
+    _mock(transport, "api.test", lambda request: httpx.Response(429, headers={"Retry-After": "0"}))
+
+    resp = await transport.get("https://api.test/markets")
+
+    assert resp.status_code == 429
+    assert await transport.get_json("https://api.test/markets") is None
+    await transport.aclose()
+
+
+async def test_hosts_sharing_a_policy_share_one_budget() -> None:
+    """Test that regional hosts draw from the same token bucket."""
+    transport = HttpTransport(policies={"api.test": HostPolicy(rate=100, burst=2)})
+    for host in ("na.api.test", "kr.api.test"):
+        _mock(transport, host, lambda request: httpx.Response(200, json={}))
+
+    await transport.get("https://na.api.test/x")
+    await transport.get("https://kr.api.test/x")
+
+    assert len(transport._buckets) == 1
+    assert transport._buckets["api.test"]._tokens < 1
+    await transport.aclose()
+
+
+async def test_token_bucket_bursts_then_paces() -> None:
+    """Test that a full bucket serves `capacity` requests at once, then refills at rate."""
+    bucket = TokenBucket(rate=100, period=1.0, capacity=2)
+
+    assert await bucket.acquire() < 0.005
+    assert await bucket.acquire() < 0.005
+    waited = await bucket.acquire()  # Empty: one token takes ~10ms
+
+    assert 0.005 < waited < 0.5
+
+
+async def test_token_bucket_drain_makes_callers_wait() -> None:
+    """Test that drain() (after a 429) empties the bucket."""
+    bucket = TokenBucket(rate=100, period=1.0, capacity=50)
+    bucket.drain()
+
+    assert await bucket.acquire() > 0.005
@@ -0,0 +1,43 @@
+"""Tests for the pluggable JSON codec."""
+
+import pytest
+
+from src.data import json_codec
+
+
+@pytest.fixture
+def restore_backend():
+    backend = json_codec.BACKEND
+    yield
+    json_codec.set_backend(backend)
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_backends_agree(backend: str, restore_backend) -> None:
+    """Test that every installed backend decodes and raises the same way."""
+    try:
+        json_codec.set_backend(backend)
+    except ImportError:
+        pytest.skip(f"{backend} not installed")
+
+    payload = b'[{"conditionId": "0x1", "outcomePrices": "[\\"0.2\\", \\"0.8\\"]"}]'
+    market = json_codec.loads(payload)[0]
+
+    assert json_codec.decode_str_array(market["outcomePrices"]) == ["0.2", "0.8"]
+    assert json_codec.loads(json_codec.dumps(market)) == market
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads("{broken")
+
+
+def test_cached_str_array_and_passthrough() -> None:
+    """Test memoized decoding and passthrough of already-decoded values."""
+    outcomes = '["Yes", "No"]'
+    assert json_codec.cached_str_array(outcomes) == ("Yes", "No")
+    assert json_codec.cached_str_array(outcomes) is json_codec.cached_str_array(outcomes)
+    assert json_codec.decode_str_array(["a"]) == ["a"]
+
+
+def test_unknown_backend_rejected() -> None:
+    """Test that an unknown backend name raises ValueError."""
+    with pytest.raises(ValueError):
+        json_codec.set_backend("simdjson")
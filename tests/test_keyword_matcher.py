@@ -0,0 +1,61 @@
+"""Tests for the shared Aho-Corasick keyword matcher."""
+
+import re
+
+import pytest
+
+from src.data import keyword_matcher
+from src.data.keyword_matcher import KeywordMatcher
+
+BACKENDS = [False] + ([True] if keyword_matcher.AHOCORASICK_AVAILABLE else [])
+
+KEYWORDS = ["war", "ai", "bank run", "all-time high", "eth", "ethereum"]
+
+
+@pytest.mark.parametrize("native", BACKENDS)
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+
+    def test_substring_and_whole_word_groups(self, native: bool) -> None:
+        """Test both semantics against `in` and a \\b regex in one scan."""
+        matcher = KeywordMatcher(native=native)
+        matcher.add_group("sub", KEYWORDS)
+        matcher.add_group("word", KEYWORDS, whole_words=True)
+        pattern = re.compile(r"\b(" + "|".join(re.escape(kw) for kw in KEYWORDS) + r")\b")
+
+        for text in (
+            "Will Ethereum hit an ALL-TIME HIGH?",
+            "He said the warden ran a bank run",
+            "Software awards",
+            "",
+        ):
+            hits = matcher.scan(text)
+            lower = text.lower()
+            assert hits.keywords("sub") == {kw for kw in KEYWORDS if kw in lower}
+            assert hits.keywords("word") == {
+                kw for kw in KEYWORDS if re.search(rf"\b{re.escape(kw)}\b", lower)
+            }
+            assert ("word" in hits) == bool(pattern.search(lower))
+
+    def test_first_follows_given_order(self, native: bool) -> None:
+        """Test category detection picks the first listed group with a hit."""
+        matcher = KeywordMatcher(native=native)
+        groups = matcher.add_groups(
+            {"political": ["trump"], "crypto": ["btc"], "sports": ["nba"]}, prefix="t."
+        )
+
+        assert matcher.scan("NBA star buys BTC").first(groups) == "t.crypto"
+        assert matcher.scan("Will it rain?").first(groups) is None
+
+    def test_regroup_rebuilds_once_and_keeps_cached_hits(self, native: bool) -> None:
+        """Test identical re-registration is free and changes invalidate the cache."""
+        matcher = KeywordMatcher(native=native)
+        matcher.add_group("g", ["btc"])
+        old = matcher.scan("btc and eth")
+        matcher.add_group("g", ["BTC"])  # Same keywords: no rebuild
+        assert matcher.scan("btc and eth") is old
+
+        matcher.add_group("g", ["eth"])
+        assert matcher.scan("btc and eth").keywords("g") == {"eth"}
+        assert old.keywords("g") == {"btc"}  # Earlier result keeps its snapshot
+        assert matcher.get_stats()["builds"] == 2
@@ -0,0 +1,127 @@
+"""Tests for the columnar market universe."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.trading.strategies.base_strategy import MarketData
+from src.trading.strategies.market_universe import MarketRow, MarketUniverse
+
+
+@pytest.fixture
+def universe() -> MarketUniverse:
+    """Create a universe with three markets."""
+    universe = MarketUniverse(capacity=16)
+    universe.upsert("cond-a", question="Will BTC hit 100k?", yes_price=0.03, no_price=0.97)
+    universe.upsert("cond-b", question="Will it rain?", yes_price=0.50, no_price=0.48)
+    universe.upsert("cond-c", question="Will ETH flip BTC?", yes_price=0.01, no_price=0.99)
+    return universe
+
+
+class TestMarketUniverse:
+    """Tests for MarketUniverse class."""
+
+    def test_row_view_matches_market_data_interface(self, universe: MarketUniverse) -> None:
+        """Test that rows expose MarketData attributes."""
+        row = universe["cond-a"]
+
+        assert isinstance(row, MarketRow)
+        assert row.condition_id == "cond-a"
+        assert row.yes_price == pytest.approx(0.03)
+        assert row.hours_to_expiry is None
+        assert row.competitor_prices == {}
+        assert row.multiplier == pytest.approx(1 / 0.03)
+        assert row.to_snapshot()["no_price"] == pytest.approx(0.97)
+
+    def test_upsert_updates_in_place(self, universe: MarketUniverse) -> None:
+        """Test that upserting an existing market reuses its slot."""
+        slot = universe["cond-b"].slot
+        row = universe.upsert("cond-b", yes_price=0.55)
+
+        assert row.slot == slot
+        assert len(universe) == 3
+        assert universe["cond-b"].yes_price == pytest.approx(0.55)
+
+    def test_vectorized_select_skips_removed(self, universe: MarketUniverse) -> None:
+        """Test masks over columns and tombstoned slots."""
+        universe.remove("cond-c")
+
+        rows = universe.select(universe.column("yes_price") < 0.04)
+
+        assert [r.condition_id for r in rows] == ["cond-a"]
+        assert "cond-c" not in universe
+
+    def test_slice_masks_align_with_its_rows(self, universe: MarketUniverse) -> None:
+        """Test that a slice filters only its rows and selects universe views."""
+        chunk = universe.slice([universe["cond-c"], universe["cond-a"]])
+
+        assert chunk.column("yes_price").tolist() == pytest.approx([0.01, 0.03])
+        assert chunk.keyword_mask(["eth"]).tolist() == [True, False]
+        assert universe.keyword_mask(["eth"]).tolist() == [False, False, True]
+
+        rows = chunk.select(chunk.column("yes_price") > 0.02)
+        assert [(r.condition_id, r.slot) for r in rows] == [("cond-a", universe["cond-a"].slot)]
+
+        universe.remove("cond-a")
+        assert [r.condition_id for r in chunk.select([True, True])] == ["cond-c"]
+
+    def test_removed_slot_is_reused(self, universe: MarketUniverse) -> None:
+        """Test that freed slots are recycled and cleared."""
+        slot = universe["cond-a"].slot
+        universe.remove("cond-a")
+        row = universe.upsert("cond-d", question="New market")
+
+        assert row.slot == slot
+        assert row.yes_price == 0.0
+
+    def test_grows_past_capacity(self) -> None:
+        """Test that columns grow when more markets are added."""
+        universe = MarketUniverse(capacity=16)
+        for i in range(40):
+            universe.upsert(f"cond-{i}", yes_price=i / 100)
+
+        assert len(universe) == 40
+        assert universe["cond-39"].yes_price == pytest.approx(0.39)
+
+    def test_extra_fields_round_trip(self) -> None:
+        """Test that container fields survive add/materialize."""
+        market = MarketData(
+            condition_id="cond-x",
+            question="Q",
+            yes_price=0.2,
+            competitor_prices={"predictbase": {"yes": 0.25}},
+        )
+        universe = MarketUniverse.from_markets([market])
+
+        restored = universe["cond-x"].to_market_data()
+
+        assert restored.competitor_prices == {"predictbase": {"yes": 0.25}}
+        assert restored.yes_price == pytest.approx(0.2)
+
+    def test_refresh_expiry(self) -> None:
+        """Test vectorized hours_to_expiry refresh from end_date."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        universe = MarketUniverse()
+        universe.upsert("cond-a", end_date=now + timedelta(hours=10), hours_to_expiry=12.0)
+        universe.upsert("cond-b", end_date=now - timedelta(hours=1), hours_to_expiry=1.0)
+        universe.upsert("cond-c")
+
+        universe.refresh_expiry(now)
+
+        assert universe["cond-a"].hours_to_expiry == pytest.approx(10.0)
+        assert universe["cond-b"].hours_to_expiry == 0.0
+        assert universe["cond-c"].hours_to_expiry is None
+
+    def test_refresh_expiry_reports_crossed_thresholds(self) -> None:
+        """Test that only markets dropping past a threshold in this pass are flagged."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        universe = MarketUniverse()
+        universe.upsert("cond-a", end_date=now + timedelta(hours=0.4), hours_to_expiry=0.6)
+        universe.upsert("cond-b", end_date=now + timedelta(hours=0.2), hours_to_expiry=0.3)
+        universe.upsert("cond-c", end_date=now + timedelta(hours=23), hours_to_expiry=25.0)
+        universe.upsert("cond-d", end_date=now + timedelta(hours=5), hours_to_expiry=6.0)
+
+        crossed = universe.refresh_expiry(now, thresholds=(0.5, 24.0))
+
+        assert [r.condition_id for r in universe.select(crossed)] == ["cond-a", "cond-c"]
+        assert not universe.refresh_expiry(now, thresholds=(0.5, 24.0)).any()
@@ -0,0 +1,101 @@
+"""Tests for the market universe mapper's sharded matching."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pandas")
+pytest.importorskip("rich")
+
+MAPPER_PATH = Path(__file__).parent.parent / "tools" / "market_universe_mapper.py"
+
+POLY_QUESTIONS = [
+    "Will the Lakers beat the Celtics?",
+    "Will Bitcoin be above $100k on Friday?",
+    "Will it snow in Miami in 2026?",
+    "Chiefs vs Eagles: who wins the Super Bowl?",
+    "Will ETH flip BTC by December?",
+    "Will the Fed cut rates in March?",
+    "Will Trump win the 2028 election?",
+    "Nuggets vs Suns game 7",
+    "",
+    "Will Taylor Swift release a new album?",
+]
+
+PB_QUESTIONS = [
+    "NBA: Lakers vs. Celtics",
+    "Bitcoin above 100k on Friday",
+    "Super Bowl: Chiefs vs Eagles",
+    "Fed rate cut in March?",
+    "Denver Nuggets vs Phoenix Suns",
+]
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    """Import the mapper tool (registered so process-pool workers can unpickle shards)."""
+    spec = importlib.util.spec_from_file_location("market_universe_mapper", MAPPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeProgress:
+    """Stands in for rich.progress.Progress."""
+
+    def __init__(self):
+        self.advanced = 0
+
+    def add_task(self, description: str, total: int) -> int:
+        return 0
+
+    def update(self, task: int, advance: int = 0) -> None:
+        self.advanced += advance
+
+
+def _markets(mapper, questions: list, source: str) -> list:
+    return [
+        mapper.Market(
+            id=f"{source}-{i}", question=q, source=source, category="other",
+            yes_price=0.5, no_price=0.5, volume=0.0, end_date=None, status="active",
+            clean_question=mapper.clean_text(q),
+        )
+        for i, q in enumerate(questions)
+    ]
+
+
+def _pairs(best: list) -> list:
+    return [(poly.id, pb.id if pb else None) for poly, pb, _ in best]
+
+
+class TestParallelMatching:
+    """Tests for MarketMatcher._best_matches_parallel."""
+
+    @pytest.mark.parametrize("use_matrix", [True, False])
+    def test_parallel_matches_serial_path(self, mapper, monkeypatch, use_matrix) -> None:
+        """Test that sharding across processes returns exactly the serial result."""
+        if use_matrix and not mapper.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(mapper, "RAPIDFUZZ_AVAILABLE", use_matrix)
+        polys = _markets(mapper, POLY_QUESTIONS, "POLY")
+        pbs = _markets(mapper, PB_QUESTIONS, "PB")
+
+        serial = mapper.MarketMatcher(polys, pbs, workers=1)
+        serial_best = (
+            serial._best_matches_matrix(FakeProgress(), 0) if use_matrix
+            else serial._best_matches_python(FakeProgress(), 0)
+        )
+        progress = FakeProgress()
+        parallel_best = mapper.MarketMatcher(polys, pbs, workers=2)._best_matches_parallel(
+            progress, 0
+        )
+
+        assert _pairs(parallel_best) == _pairs(serial_best)
+        assert [s for _, _, s in parallel_best] == pytest.approx([s for _, _, s in serial_best])
+        assert progress.advanced == len(polys)
+        assert _pairs(serial_best)[0] == ("POLY-0", "PB-0")
+        assert _pairs(serial_best)[8] == ("POLY-8", None)  # Empty question never matches
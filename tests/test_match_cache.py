@@ -0,0 +1,126 @@
+"""Tests for the persistent cross-exchange match cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.scanner import match_cache as match_cache_module
+from src.scanner.match_cache import MatchCache
+
+
+def _pb(question: str, market_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        question=question, market_id=market_id, yes_price=0.40, no_price=0.60, volume=100
+    )
+
+
+def _poly(question: str, condition_id: str) -> dict:
+    return {"question": question, "condition_id": condition_id, "yes_price": 0.45}
+
+
+PB_MARKETS = [
+    _pb("NBA: Lakers vs. Celtics", "pb-1"),
+    _pb("Bitcoin above 100k on Friday", "pb-2"),
+]
+
+
+class TestMatchCache:
+    """Tests for MatchCache."""
+
+    def test_known_pairs_skip_scoring(self, monkeypatch) -> None:
+        """Test that a second scan is answered from the cache."""
+        cache = MatchCache(persist=False)
+        polys = [_poly("Lakers vs Celtics", "c1"), _poly("Will it snow in Miami?", "c2")]
+
+        first = cache.match_markets(polys, PB_MARKETS, threshold=60)
+        monkeypatch.setattr(match_cache_module, "match_questions", None)  # Must not be called
+        second = cache.match_markets(polys, PB_MARKETS, threshold=60)
+
+        assert [p.pb_market_id for p in first] == [p.pb_market_id for p in second] == ["pb-1"]
+        assert cache.get_stats()["hits"] == 2
+        assert cache._entries["c2"].accepted(60) is False  # Rejected pair is cached too
+
+    def test_new_pb_markets_recheck_stored_entries(self) -> None:
+        """Test that new PB markets are scored against accepted and rejected entries."""
+        cache = MatchCache(persist=False)
+        polys = [_poly("Lakers vs Celtics", "c1"), _poly("Will it snow in Miami?", "c2")]
+        cache.match_markets(polys, PB_MARKETS, threshold=60)
+
+        pb_markets = PB_MARKETS + [_pb("Will it snow in Miami", "pb-3")]
+        pairs = cache.match_markets(polys, pb_markets, threshold=60)
+
+        assert {p.pb_market_id for p in pairs} == {"pb-1", "pb-3"}
+        assert cache.get_stats()["rechecked"] == 2
+
+        cache.match_markets(polys, list(pb_markets), threshold=60)
+        assert cache.get_stats()["rechecked"] == 2  # Nothing new since
+
+    def test_recheck_is_independent_of_caller_threshold(self) -> None:
+        """Test that a low-threshold caller does not hide new PB markets from a strict one."""
+        question = "Will the Lakers beat the Celtics in game 7?"
+        polys = [_poly(question, "c1")]
+        weak = [_pb("Lakers vs Celtics game 7", "p1")]
+        exact = weak + [_pb(question, "p2")]
+
+        cache = MatchCache(persist=False)
+        assert [p.pb_market_id for p in cache.match_markets(polys, weak, threshold=60)] == ["p1"]
+        assert cache.match_markets(polys, weak, threshold=85) == []
+
+        # The scanner (threshold 60) sees p2 first; the strategy (85) must still get it
+        scanner_pairs = cache.match_markets(polys, exact, threshold=60)
+        strategy_pairs = cache.match_markets(polys, exact, threshold=85)
+
+        assert [p.pb_market_id for p in scanner_pairs] == ["p2"]
+        assert [p.pb_market_id for p in strategy_pairs] == ["p2"]
+        assert cache._entries["c1"].match_score == 100
+
+    def test_question_change_invalidates(self) -> None:
+        """Test that editing the PB question recomputes its pairs."""
+        cache = MatchCache(persist=False)
+        polys = [_poly("Lakers vs Celtics", "c1")]
+        cache.match_markets(polys, PB_MARKETS, threshold=60)
+
+        edited = [_pb("Election winner announced", "pb-1"), PB_MARKETS[1]]
+        pairs = cache.match_markets(polys, edited, threshold=60)
+
+        assert pairs == []
+        assert cache.get_stats()["invalidated"] == 1
+
+    async def test_flush_and_warm_load_round_trip(self, monkeypatch) -> None:
+        """Test that persisted rows warm-load into an equivalent cache."""
+        store = {}
+        monkeypatch.setattr(
+            match_cache_module, "save_market_mappings",
+            lambda rows: store.update({r["poly_condition_id"]: r for r in rows}) or len(rows),
+            raising=False,
+        )
+        monkeypatch.setattr(
+            match_cache_module, "load_market_mappings",
+            lambda: [dict(row) for row in store.values()], raising=False,
+        )
+        monkeypatch.setattr(match_cache_module, "missing_columns", lambda: {}, raising=False)
+
+        cache = MatchCache(persist=False)
+        cache.persist = True
+        cache.match_markets([_poly("Lakers vs Celtics", "c1")], PB_MARKETS, threshold=60)
+        assert await cache.flush() == 1
+
+        warm = MatchCache(persist=False)
+        warm.persist = True
+        assert await warm.warm_load() == 1
+        pairs = warm.match_markets([_poly("Lakers vs Celtics", "c1")], PB_MARKETS, threshold=60)
+
+        assert [p.pb_market_id for p in pairs] == ["pb-1"]
+        assert warm.get_stats()["misses"] == 0
+
+    async def test_warm_load_refuses_stale_schema(self, monkeypatch) -> None:
+        """Test that a table without the hash columns fails at startup, not on every flush."""
+        monkeypatch.setattr(
+            match_cache_module, "missing_columns",
+            lambda: {"market_mappings": ["poly_question_hash"]}, raising=False,
+        )
+        cache = MatchCache(persist=False)
+        cache.persist = True
+
+        with pytest.raises(RuntimeError, match="--init-db"):
+            await cache.warm_load()
@@ -0,0 +1,334 @@
+"""Tests for the multi-strategy daemon scanner and cycle pipeline."""
+
+import asyncio
+import importlib.util
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+DAEMON_PATH = Path(__file__).parent.parent / "scripts" / "multi_strategy_daemon.py"
+
+
+@pytest.fixture(scope="module")
+def daemon(tmp_path_factory):
+    """Import the daemon script (it creates logs/ and data/ in the cwd)."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("daemon"))
+    try:
+        spec = importlib.util.spec_from_file_location("multi_strategy_daemon", DAEMON_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+def _raw(cid: str, yes: float = 0.40, volume: str = "5000") -> dict:
+    return {
+        "conditionId": cid,
+        "question": f"Will {cid} happen?",
+        "outcomes": '["Yes", "No"]',
+        "outcomePrices": f'["{yes}", "{1 - yes:.2f}"]',
+        "volume": volume,
+        "liquidity": "1000",
+        "endDate": "2099-01-01T00:00:00Z",
+    }
+
+
+class FakeGamma:
+    """
+    Serves raw markets in BATCH_SIZE pages, recording requested offsets.
+
+    delays: per-offset seconds before the page returns (out-of-order completion)
+    fail_at: offset whose request raises
+    """
+
+    def __init__(self, markets: list, batch_size: int = 100, delays=None, fail_at=None):
+        self.markets = markets
+        self.batch_size = batch_size
+        self.delays = delays or {}
+        self.fail_at = fail_at
+        self.offsets: list = []
+        self.cancelled: list = []
+
+    async def __call__(self, offset: int, extra_params=None) -> list:
+        self.offsets.append(offset)
+        try:
+            await asyncio.sleep(self.delays.get(offset, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(offset)
+            raise
+        if offset == self.fail_at:
+            raise ConnectionError(f"page {offset} failed")
+        return self.markets[offset:offset + self.batch_size]
+
+
+def _scanner(daemon, gamma: FakeGamma, **kwargs):
+    scanner = daemon.MarketScanner(fetch_window=kwargs.pop("fetch_window", 1), **kwargs)
+    scanner.BATCH_SIZE = gamma.batch_size
+    scanner.REQUEST_DELAY = 0
+    scanner._fetch_batch = gamma
+    return scanner
+
+
+async def _pages(scanner) -> list:
+    return [[m["conditionId"] for m in page] async for page in scanner._iter_pages()]
+
+
+class FakeTransport:
+    """Answers every GET with a fixed 200 body."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def get(self, url: str, params=None) -> SimpleNamespace:
+        return SimpleNamespace(status_code=200, content=self.content)
+
+
+class TestFetchBatch:
+    """Tests for MarketScanner._fetch_batch."""
+
+    @pytest.mark.parametrize("content", [b"<html>Bad gateway</html>", b'[{"conditionId": "c'])
+    async def test_undecodable_body_is_an_empty_page(self, daemon, content) -> None:
+        """Test that an HTML or truncated 200 body ends the sweep instead of raising."""
+        scanner = daemon.MarketScanner(fetch_window=1)
+        scanner.transport = FakeTransport(content)
+
+        assert await scanner._fetch_batch(0) == []
+
+
+class TestWindowedPagination:
+    """Tests for MarketScanner._iter_pages_windowed."""
+
+    async def test_pages_yield_in_offset_order(self, daemon) -> None:
+        """Test that pages finishing out of order are still yielded by offset."""
+        markets = [_raw(f"cond-{i}") for i in range(25)]
+        gamma = FakeGamma(markets, batch_size=5, delays={0: 0.03, 5: 0.02, 10: 0.01})
+        scanner = _scanner(daemon, gamma, fetch_window=4)
+
+        pages = await _pages(scanner)
+
+        assert [cid for page in pages for cid in page] == [m["conditionId"] for m in markets]
+        assert pages[-1] == [f"cond-{i}" for i in range(20, 25)]
+
+    async def test_short_page_stops_and_cancels_in_flight(self, daemon) -> None:
+        """Test that nothing past a short page is yielded and its in-flight pages are cancelled."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(12)], batch_size=5,
+                          delays={15: 1.0, 20: 1.0})
+        scanner = _scanner(daemon, gamma, fetch_window=5)
+
+        pages = await _pages(scanner)
+
+        assert [len(page) for page in pages] == [5, 5, 2]
+        assert sorted(gamma.cancelled) == [15, 20]
+
+    async def test_error_cancels_in_flight(self, daemon) -> None:
+        """Test that a failing page propagates and cancels the rest of the window."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(50)], batch_size=5,
+                          fail_at=5, delays={10: 1.0, 15: 1.0})
+        scanner = _scanner(daemon, gamma, fetch_window=4)
+
+        with pytest.raises(ConnectionError):
+            await _pages(scanner)
+
+        assert sorted(gamma.cancelled) == [10, 15]
+
+    async def test_limit_closes_iterator_and_cancels(self, daemon) -> None:
+        """Test that stopping at the limit cancels pages still in flight."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(50)], batch_size=5,
+                          delays={10: 1.0, 15: 1.0})
+        scanner = _scanner(daemon, gamma, fetch_window=4)
+
+        markets = await scanner.get_active_markets(limit=5)
+
+        assert [m.condition_id for m in markets] == [f"cond-{i}" for i in range(5)]
+        assert sorted(gamma.cancelled) == [10, 15]
+
+
+class TestMarketSync:
+    """Tests for MarketScanner.sync_markets."""
+
+    async def test_limited_sync_evicts_markets_missing_for_k_sweeps(self, daemon) -> None:
+        """Test that closed markets leave the universe even when every sweep hits the limit."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(6)])
+        scanner = _scanner(daemon, gamma, evict_after=2)
+
+        delta = await scanner.sync_markets(limit=4)
+        assert not delta.complete
+        assert set(scanner.universe) == {f"cond-{i}" for i in range(4)}
+
+        # cond-0 closes; cond-4 moves up into the top 4
+        gamma.markets = gamma.markets[1:]
+        delta = await scanner.sync_markets(limit=4)
+        assert not delta.complete
+        assert delta.removed == []  # Missing from one truncated sweep only
+        assert "cond-0" in scanner.universe
+
+        delta = await scanner.sync_markets(limit=4)
+        assert delta.removed == ["cond-0"]
+        assert set(scanner.universe) == {f"cond-{i}" for i in range(1, 5)}
+        assert "cond-0" not in scanner._fingerprints
+
+    async def test_delta_reports_changed_unchanged_and_removed(self, daemon) -> None:
+        """Test that only markets whose fingerprint moved are re-emitted."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(4)])
+        scanner = _scanner(daemon, gamma)
+
+        delta = await scanner.sync_markets(limit=0)
+        assert delta.complete
+        assert [row.condition_id for row in delta.changed] == [f"cond-{i}" for i in range(4)]
+
+        delta = await scanner.sync_markets(limit=0)
+        assert (delta.changed, delta.unchanged, delta.removed) == ([], 4, [])
+
+        gamma.markets = [
+            _raw("cond-0", yes=0.55),       # Price moved
+            _raw("cond-1"),
+            _raw("cond-2", volume="10"),    # Now filtered out
+        ]                                   # cond-3 delisted
+        delta = await scanner.sync_markets(limit=0)
+
+        assert [row.condition_id for row in delta.changed] == ["cond-0"]
+        assert scanner.universe["cond-0"].yes_price == pytest.approx(0.55)
+        assert delta.unchanged == 1
+        assert sorted(delta.removed) == ["cond-2", "cond-3"]
+        assert set(scanner.universe) == {"cond-0", "cond-1"}
+
+    async def test_markets_crossing_an_expiry_threshold_are_re_emitted(self, daemon) -> None:
+        """Test that an unchanged market is re-evaluated once it enters the 30-minute window."""
+        soon = datetime.now(timezone.utc) + timedelta(minutes=20)
+        gamma = FakeGamma([_raw("cond-0"), _raw("cond-1")])
+        gamma.markets[0]["endDate"] = soon.strftime("%Y-%m-%dT%H:%M:%SZ")
+        scanner = _scanner(daemon, gamma)
+        await scanner.sync_markets(limit=0)
+        scanner.universe["cond-0"].hours_to_expiry = 0.6  # As of the previous cycle
+
+        delta = await scanner.sync_markets(limit=0)
+
+        assert [row.condition_id for row in delta.changed] == ["cond-0"]
+        assert delta.unchanged == 1
+        assert scanner.universe["cond-0"].hours_to_expiry < 0.5
+
+        delta = await scanner.sync_markets(limit=0)
+        assert delta.changed == []
+
+    def test_sync_keeps_markets_past_their_end_date(self, daemon) -> None:
+        """Test that Gamma is not asked to drop active markets whose end date passed."""
+        scanner = daemon.MarketScanner(fetch_window=1)
+
+        assert "end_date_min" not in scanner.sync_params(limit=0)
+        assert "end_date_min" not in scanner.sync_params(limit=500)
+
+    async def test_full_resync_emits_unchanged_markets(self, daemon) -> None:
+        """Test that full=True re-emits every market without re-parsing."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(3)])
+        scanner = _scanner(daemon, gamma)
+        await scanner.sync_markets(limit=0)
+
+        delta = await scanner.sync_markets(limit=0, full=True)
+
+        assert len(delta.changed) == 3
+        assert delta.unchanged == 0
+
+
+class FakeRegistry:
+    """Strategy registry stand-in: one 'signal' (the condition id) per evaluated market."""
+
+    def __init__(self, gamma: FakeGamma, fail: bool = False):
+        self.gamma = gamma
+        self.fail = fail
+        self.calls: list = []  # (condition ids, new_cycle, pages fetched so far)
+        self.filtered: list = []  # Markets each batch_mask pass would scan
+        self.removed = None
+
+    async def notify_universe(self, universe, removed) -> None:
+        self.removed = list(removed)
+
+    async def process_batch(self, universe, mask=None, new_cycle: bool = True) -> list:
+        self.filtered.append(len(universe))
+        rows = universe.select(universe.alive if mask is None else mask)
+        self.calls.append(([row.condition_id for row in rows], new_cycle, len(self.gamma.offsets)))
+        if self.fail:
+            raise RuntimeError("strategy crashed")
+        return [row.condition_id for row in rows]
+
+
+class TestCyclePipeline:
+    """Tests for CyclePipeline."""
+
+    @pytest.fixture
+    def small_queues(self, daemon, monkeypatch) -> None:
+        """Shrink the pipeline queues so backpressure kicks in."""
+        monkeypatch.setattr(daemon.Config, "PIPELINE_PAGE_QUEUE", 1)
+        monkeypatch.setattr(daemon.Config, "PIPELINE_EVAL_QUEUE", 1)
+        monkeypatch.setattr(daemon.Config, "PIPELINE_SIGNAL_QUEUE", 2)
+
+    async def test_stages_stream_through_bounded_queues(self, daemon, small_queues) -> None:
+        """Test that pages are evaluated while later ones are fetched, within queue bounds."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(50)], batch_size=5)
+        registry = FakeRegistry(gamma)
+        recorded = []
+
+        async def record(signal) -> None:
+            await asyncio.sleep(0.001)  # Slow DB: backs up the signal queue
+            recorded.append(signal)
+
+        pipeline = daemon.CyclePipeline(_scanner(daemon, gamma), registry, record)
+        delta = await pipeline.run(limit=0)
+
+        assert len(delta.changed) == 50
+        assert sorted(recorded) == sorted(f"cond-{i}" for i in range(50))
+        assert [new_cycle for _, new_cycle, _ in registry.calls] == [True] + [False] * 9
+        assert registry.calls[0][2] <= 5  # First page evaluated before the sweep ended (11 pages)
+        assert registry.filtered == [5] * 10  # Each chunk is filtered alone, not the universe
+
+        stats = pipeline.get_stats()["stages"]
+        assert stats["fetch"]["max_queue_depth"] <= 1
+        assert stats["parse"]["max_queue_depth"] <= 1
+        assert stats["evaluate"]["max_queue_depth"] <= 2
+        assert stats["record"]["items"] == 50
+
+    async def test_unchanged_cycle_still_runs_backlog(self, daemon) -> None:
+        """Test that a cycle with no changed rows gives strategies one empty batch."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(3)])
+        scanner = _scanner(daemon, gamma)
+        await scanner.sync_markets(limit=0)
+        registry = FakeRegistry(gamma)
+
+        await daemon.CyclePipeline(scanner, registry, lambda s: asyncio.sleep(0)).run(limit=0)
+
+        assert registry.calls == [([], True, len(gamma.offsets))]
+
+    async def test_expiring_markets_are_evaluated(self, daemon) -> None:
+        """Test that rows re-emitted by finish_sync reach the strategies."""
+        soon = datetime.now(timezone.utc) + timedelta(minutes=20)
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(3)])
+        gamma.markets[1]["endDate"] = soon.strftime("%Y-%m-%dT%H:%M:%SZ")
+        scanner = _scanner(daemon, gamma)
+        await scanner.sync_markets(limit=0)
+        scanner.universe["cond-1"].hours_to_expiry = 0.6
+        registry = FakeRegistry(gamma)
+
+        await daemon.CyclePipeline(scanner, registry, lambda s: asyncio.sleep(0)).run(limit=0)
+
+        assert [(cids, new_cycle) for cids, new_cycle, _ in registry.calls] == [(["cond-1"], True)]
+
+    async def test_stage_error_shuts_down_the_pipeline(self, daemon, small_queues) -> None:
+        """Test that a failing stage cancels the others instead of hanging."""
+        gamma = FakeGamma([_raw(f"cond-{i}") for i in range(50)], batch_size=5,
+                          delays={offset: 0.01 for offset in range(0, 55, 5)})
+        registry = FakeRegistry(gamma, fail=True)
+        pipeline = daemon.CyclePipeline(_scanner(daemon, gamma, fetch_window=3), registry,
+                                        lambda signal: asyncio.sleep(0))
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await asyncio.wait_for(pipeline.run(limit=0), timeout=5)
+
+        assert excinfo.group_contains(RuntimeError, match="strategy crashed")
+        assert len(registry.calls) == 1
+        assert gamma.cancelled  # In-flight pages were cancelled
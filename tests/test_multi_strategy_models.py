@@ -0,0 +1,159 @@
+"""Tests for the batched TradeWriter and column migrations."""
+
+import asyncio
+import os
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+
+# The models module builds its engine at import; sessions are faked below
+os.environ.setdefault("DATABASE_URL", "sqlite:///polybot-test.db")
+
+from src.db import multi_strategy_models  # noqa: E402
+from src.db.multi_strategy_models import TradeWriter  # noqa: E402
+
+
+class FakeDatabase:
+    """Records committed transactions; any INSERT with strategy_id BAD fails."""
+
+    def __init__(self):
+        self.transactions: list = []
+        self.tables: list = []
+
+    def session(self) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, database: FakeDatabase):
+        self.database = database
+        self.pending: list = []
+
+    def execute(self, statement, rows: list) -> None:
+        if any(row.get("strategy_id") == "BAD" for row in rows):
+            raise ValueError("unknown strategy_id")
+        self.database.tables.append(statement.table.name)
+        self.pending.extend(rows)
+
+    def commit(self) -> None:
+        self.database.transactions.append(self.pending)
+        self.pending = []
+
+    def rollback(self) -> None:
+        self.pending = []
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def database(monkeypatch) -> FakeDatabase:
+    """Route TradeWriter sessions to an in-memory fake."""
+    database = FakeDatabase()
+    monkeypatch.setattr(multi_strategy_models, "SessionLocal", database.session)
+    return database
+
+
+def _trade(strategy_id: str = "TAIL_BETTING_V1", condition_id: str = "cond-1") -> dict:
+    return dict(strategy_id=strategy_id, condition_id=condition_id, outcome="YES",
+                entry_price=0.04, stake=2.0)
+
+
+class TestTradeWriter:
+    """Tests for TradeWriter."""
+
+    async def test_concurrent_trades_share_one_transaction(self, database) -> None:
+        """Test that trades submitted together are committed in one batch."""
+        async with TradeWriter(linger=0.05) as writer:
+            futures = [await writer.submit_trade(**_trade(condition_id=f"c{i}")) for i in range(5)]
+            trade_ids = await asyncio.gather(*futures)
+
+        assert len(database.transactions) == 1
+        assert [row["trade_id"] for row in database.transactions[0]] == trade_ids
+        assert writer.get_stats()["batches"] == 1
+        assert writer.get_stats()["trades_written"] == 5
+
+    async def test_failed_batch_falls_back_per_row(self, database) -> None:
+        """Test that one bad row only fails its own future."""
+        async with TradeWriter(linger=0.05) as writer:
+            futures = [
+                await writer.submit_trade(**_trade(strategy_id=strategy_id))
+                for strategy_id in ("TAIL_BETTING_V1", "BAD", "ARB_INTERNAL_V1")
+            ]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+
+        assert isinstance(results[1], ValueError)
+        assert [len(rows) for rows in database.transactions] == [1, 1]
+        assert [rows[0]["trade_id"] for rows in database.transactions] == [results[0], results[2]]
+
+        stats = writer.get_stats()
+        assert (stats["failed"], stats["fallback_batches"], stats["trades_written"]) == (1, 1, 2)
+
+    async def test_close_drains_queued_trades(self, database) -> None:
+        """Test that close() commits every row accepted before it."""
+        writer = TradeWriter(batch_size=3, linger=10.0)
+        await writer.start()
+        futures = [await writer.submit_trade(**_trade(condition_id=f"c{i}")) for i in range(7)]
+
+        await writer.close()
+
+        assert all(future.done() and not future.exception() for future in futures)
+        assert sum(len(rows) for rows in database.transactions) == 7
+        with pytest.raises(RuntimeError):
+            await writer.submit_trade(**_trade())
+
+    async def test_close_with_blocked_submitters(self, database) -> None:
+        """Test that submitters waiting on a full queue do not break shutdown."""
+        writer = TradeWriter(batch_size=1, linger=0.0, max_pending=2)
+        await writer.start()
+        submitters = [
+            asyncio.create_task(writer.submit_trade(**_trade(condition_id=f"c{i}")))
+            for i in range(10)
+        ]
+        await asyncio.sleep(0)  # Let them fill the queue and block
+
+        await asyncio.wait_for(writer.close(), timeout=5)
+
+        futures = [task.result() for task in submitters]
+        assert all(future.done() and not future.exception() for future in futures)
+        assert sum(len(rows) for rows in database.transactions) == 10
+
+    async def test_snapshots_share_the_trade_transaction(self, database) -> None:
+        """Test that snapshots queued with trades go out as one INSERT per table."""
+        snapshot = {"timestamp": "2026-01-02T10:30:00", "condition_id": "cond-1",
+                    "yes_price": 0.03, "no_price": 0.97, "volume_24h": 1500.0,
+                    "competitor_prices": {}}
+        async with TradeWriter(linger=0.05) as writer:
+            trade_id, snapshot_result = await asyncio.gather(
+                writer.record_trade(**_trade()), writer.record_snapshot(snapshot)
+            )
+
+        assert snapshot_result is None
+        assert len(database.transactions) == 1
+        assert sorted(database.tables) == ["market_snapshots", "trades"]
+        row = next(row for row in database.transactions[0] if "trade_id" not in row)
+        assert row["yes_price"] == Decimal("0.03") and row["competitor_data"] is None
+        assert writer.get_stats()["snapshots_written"] == 1
+        assert trade_id.startswith("TAIL_BETTING_V1-")
+
+
+class TestMigrateColumns:
+    """Tests for adding columns that create_all() skips on existing tables."""
+
+    def test_adds_hash_columns_to_old_market_mappings(self) -> None:
+        """Test that a pre-hash market_mappings table gets both columns, once."""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE market_mappings (id INTEGER PRIMARY KEY, poly_condition_id TEXT)"
+            ))
+
+        assert multi_strategy_models.missing_columns(engine) == {
+            "market_mappings": ["poly_question_hash", "pb_question_hash"]
+        }
+        assert multi_strategy_models.migrate_columns(engine) == [
+            "market_mappings.poly_question_hash", "market_mappings.pb_question_hash"
+        ]
+        assert multi_strategy_models.missing_columns(engine) == {}
+        assert multi_strategy_models.migrate_columns(engine) == []
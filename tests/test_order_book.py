@@ -0,0 +1,186 @@
+"""Tests for the incremental L2 order book and its WebSocket wiring."""
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from src.data.http_client import RetryPolicy
+from src.scanner import websocket_feed
+from src.scanner.order_book import L2Book
+from src.scanner.websocket_feed import WebSocketFeed
+
+
+class TestL2Book:
+    """Tests for L2Book."""
+
+    def test_deltas_match_full_rebuild(self) -> None:
+        """Test that random level updates give the same book as rebuilding from scratch."""
+        rng = random.Random(5)
+        book = L2Book("tok")
+        reference = {"bid": {}, "ask": {}}
+
+        for _ in range(2000):
+            side = rng.choice(["BUY", "SELL"])
+            key = "bid" if side == "BUY" else "ask"
+            price = round(rng.randint(1, 999) / 1000, 3)
+            size = rng.choice([0.0, rng.uniform(1, 500)])
+            book.apply_change(side, price, size)
+            if size > 0:
+                reference[key][price] = size
+            else:
+                reference[key].pop(price, None)
+
+        assert book.bids == sorted(reference["bid"].items(), reverse=True)
+        assert book.asks == sorted(reference["ask"].items())
+
+    def test_depth_and_vwap(self) -> None:
+        """Test depth-at-N and VWAP-to-size walk levels best first."""
+        book = L2Book("tok", bids=[(0.48, 100), (0.50, 50)], asks=[(0.53, 40), (0.52, 10)])
+
+        assert (book.best_bid, book.best_ask) == (0.50, 0.52)
+        assert book.depth("bid", 1) == 50
+        assert book.depth("ask") == 50
+        assert book.vwap("ask", 30) == pytest.approx((10 * 0.52 + 20 * 0.53) / 30)
+        assert book.vwap("ask", 51) is None
+
+
+class TestWebSocketFeedBooks:
+    """Tests for book handling in WebSocketFeed."""
+
+    async def test_price_change_updates_book_in_place(self) -> None:
+        """Test that deltas are applied to the snapshot and callbacks get the latest book."""
+        feed = WebSocketFeed()
+        seen = []
+        feed.add_callback(lambda token_id, book: seen.append((token_id, book.best_bid)))
+
+        await feed._handle_message({
+            "type": "book", "market": "tok",
+            "bids": [{"price": "0.40", "size": "10"}, {"price": "0.41", "size": "5"}],
+            "asks": [{"price": "0.45", "size": "7"}],
+        })
+        book = feed.get_orderbook("tok")
+        await feed._handle_message({
+            "type": "price_change", "market": "tok",
+            "changes": [
+                {"price": "0.41", "side": "BUY", "size": "0"},
+                {"price": "0.44", "side": "SELL", "size": "3"},
+            ],
+        })
+
+        assert feed.get_orderbook("tok") is book
+        assert book.bids == [(0.40, 10.0)]
+        assert book.asks == [(0.44, 3.0), (0.45, 7.0)]
+        assert seen == []  # Callbacks run off the receive loop...
+        await asyncio.sleep(0)
+        assert seen == [("tok", 0.40)]  # ...and both updates coalesced into one
+        assert feed.get_stats()["deltas"] == 2
+        await feed.disconnect()
+
+
+class FakeSocket:
+    """In-memory websocket: records sent frames; close() ends the receive loop."""
+
+    def __init__(self) -> None:
+        self.sent = []
+        self.closed = asyncio.Event()
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        await self.closed.wait()
+        raise StopAsyncIteration
+
+
+class TestWebSocketFeedSubscriptions:
+    """Tests for batched, sharded subscriptions."""
+
+    async def test_set_active_shards_batches_and_rebalances(self, monkeypatch) -> None:
+        """Test that tokens are sharded under the cap, batched, and moved off dropped sockets."""
+        sockets = []
+
+        async def fake_connect(*args, **kwargs):
+            sockets.append(FakeSocket())
+            return sockets[-1]
+
+        monkeypatch.setattr(websocket_feed.websockets, "connect", fake_connect)
+        monkeypatch.setattr(websocket_feed, "RECONNECT_BACKOFF", RetryPolicy(backoff_base=3600))
+        feed = WebSocketFeed(
+            max_tokens_per_connection=100, batch_size=40, resync_grace_seconds=3600
+        )
+        runner = asyncio.create_task(feed.run())
+
+        tokens = [f"tok-{i}" for i in range(250)]
+        assert await feed.subscribe_many(tokens) == 250
+        assert await feed.set_active(tokens) == {"added": 0, "removed": 0}
+        await asyncio.sleep(0.01)
+        assert len(sockets) == 3
+        assert [sum(len(f["assets_ids"]) for f in ws.sent) for ws in sockets] == [100, 100, 50]
+        assert all(len(f["assets_ids"]) <= 40 for ws in sockets for f in ws.sent)
+
+        # The scanner drops 40 tokens of the first socket: one batched unsubscribe frame
+        before = sum(len(ws.sent) for ws in sockets)
+        assert await feed.set_active(tokens[40:]) == {"added": 0, "removed": 40}
+        assert sum(len(ws.sent) for ws in sockets) == before + 1
+        assert sockets[0].sent[-1]["type"] == "unsubscribe"
+
+        # The third socket drops: 40 of its tokens fit on the first, 10 wait for a reconnect
+        await sockets[2].close()
+        await asyncio.sleep(0.01)
+        stats = feed.get_stats()
+        assert stats["rebalanced"] == 40
+        assert (stats["connections"], stats["connected"], stats["subscriptions"]) == (3, 2, 210)
+        assert sum(len(f["assets_ids"]) for f in sockets[0].sent if f["type"] == "subscribe") == 140
+
+        await feed.disconnect()
+        await runner
+
+
+class FakeTransport:
+    """Serves REST /book snapshots."""
+
+    def __init__(self, book: dict) -> None:
+        self.book = book
+        self.calls = []
+
+    async def get_json(self, url: str, params: dict) -> dict:
+        self.calls.append(params["token_id"])
+        return self.book
+
+
+class TestWebSocketFeedResync:
+    """Tests for gap detection and snapshot resync."""
+
+    async def test_sequence_gap_marks_stale_and_resyncs(self, monkeypatch) -> None:
+        """Test that a missed sequence number hides the book until a REST snapshot replaces it."""
+        transport = FakeTransport(
+            {"asset_id": "tok", "bids": [{"price": "0.39", "size": "4"}], "asks": []}
+        )
+        monkeypatch.setattr(websocket_feed, "get_transport", lambda: transport)
+        feed = WebSocketFeed()
+        await feed.subscribe("tok")
+        feed._connection_of["tok"].ws = FakeSocket()  # Subscribed on a live socket
+
+        await feed._handle_message({
+            "type": "book", "asset_id": "tok", "seq": 1,
+            "bids": [{"price": "0.40", "size": "10"}], "asks": [],
+        })
+        await feed._handle_message({
+            "type": "price_change", "asset_id": "tok", "seq": 3,
+            "changes": [{"price": "0.41", "side": "BUY", "size": "2"}],
+        })
+
+        assert feed.is_stale("tok") and feed.get_orderbook("tok") is None
+        await asyncio.sleep(0.01)
+        assert transport.calls == ["tok"]
+        assert feed.get_orderbook("tok").bids == [(0.39, 4.0)]
+        stats = feed.get_stats()
+        assert (stats["gaps"], stats["resyncs"], stats["stale"]) == (1, 1, 0)
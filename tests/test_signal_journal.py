@@ -0,0 +1,66 @@
+"""Tests for the append-only signal journal."""
+
+import gzip
+from datetime import date
+from pathlib import Path
+
+from src.trading.signal_journal import SignalJournal, compact_journal, read_journal
+
+
+async def test_buffer_flushes_by_size(tmp_path: Path) -> None:
+    """Test that records are buffered until flush_size is reached."""
+    journal = SignalJournal(tmp_path, flush_size=3, flush_interval=60)
+    for i in range(2):
+        journal.append({"trade_id": f"t{i}"})
+        await journal.maybe_flush()
+
+    assert journal.pending == 2
+    assert not journal.current_path.exists()
+
+    journal.append({"trade_id": "t2"})
+    await journal.maybe_flush()
+
+    assert journal.pending == 0
+    assert [r["trade_id"] for r in journal.read_day()] == ["t0", "t1", "t2"]
+    await journal.close()
+
+
+async def test_close_flushes_and_skips_torn_line(tmp_path: Path) -> None:
+    """Test that close() writes the buffer and readers skip partial lines."""
+    journal = SignalJournal(tmp_path, flush_size=100)
+    journal.append({"trade_id": "a", "stake": 1.5})
+    await journal.close()
+
+    with open(journal.current_path, "a") as fh:
+        fh.write('{"trade_id": "b", "sta')
+
+    assert list(journal.read_day()) == [{"trade_id": "a", "stake": 1.5}]
+
+    # Appending after the tear starts a new line: the next record survives
+    journal.append({"trade_id": "c", "stake": 2.0})
+    await journal.close()
+
+    assert list(journal.read_day()) == [
+        {"trade_id": "a", "stake": 1.5},
+        {"trade_id": "c", "stake": 2.0},
+    ]
+
+
+def test_compact_dedupes_and_gzips(tmp_path: Path) -> None:
+    """Test that compaction keeps the last record per trade_id."""
+    journal = SignalJournal(tmp_path)
+    day = date(2026, 1, 2)
+    for stake in (1, 2):
+        journal.append({"trade_id": "x", "stake": stake}, day=day)
+    journal.append({"trade_id": "y", "stake": 3}, day=day)
+    journal.flush_sync()
+
+    path = journal.path_for(day)
+    read, kept = compact_journal(path)
+
+    assert (read, kept) == (3, 2)
+    assert not path.exists()
+    gz = path.with_name(path.name + ".gz")
+    with gzip.open(gz, "rt") as fh:
+        assert len(fh.readlines()) == 2
+    assert {r["trade_id"]: r["stake"] for r in read_journal(gz)} == {"x": 2, "y": 3}
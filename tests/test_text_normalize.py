@@ -0,0 +1,27 @@
+"""Tests for shared question normalization."""
+
+from src.data.text_normalize import normalize, strip_years
+
+
+class TestNormalize:
+    """Tests for normalize()."""
+
+    def test_clean_tokens_and_category(self) -> None:
+        """Test cleaning, tokens and whole-word categories."""
+        norm = normalize("Will Bitcoin hit $100k by Dec 31, 2025?")
+
+        assert norm.clean == "will bitcoin hit 100k by 2025"
+        assert {"bitcoin", "100k"} <= norm.tokens
+        assert norm.category == "crypto"
+        assert normalize("Will it rain in Dubai?").category == "other"
+        assert strip_years(norm.clean) == "will bitcoin hit 100k by"
+
+    def test_flags_keep_substring_semantics(self) -> None:
+        """Test that ML flags match the original substring checks."""
+        flags = normalize("Will the CEO have said above 5?").flags
+
+        assert flags == {"ai", "number", "comparison"}  # "ai" inside "said"
+
+    def test_results_are_memoized(self) -> None:
+        """Test that repeated questions reuse the cached result."""
+        assert normalize("Will ETH flip BTC?") is normalize("Will ETH flip BTC?")
@@ -0,0 +1,78 @@
+"""Tests for the fixed-tick NumPy order book."""
+
+import random
+
+import pytest
+
+from src.data.polymarket_feed import OrderBookSnapshot
+from src.data.tick_book import TickBook
+from src.scanner.order_book import L2Book
+from src.trading.slippage_simulator import OrderbookLevel, SimulatedOrderbook
+
+
+def _loop_walk_notional(levels, amount):
+    """Reference: the per-level loop the simulator used to run."""
+    remaining, size, cost = amount, 0.0, 0.0
+    for price, level_size in levels:
+        value = price * level_size
+        if value >= remaining:
+            size += remaining / price
+            cost += remaining
+            remaining = 0.0
+            break
+        size += level_size
+        cost += value
+        remaining -= value
+    return size, cost, remaining <= 0
+
+
+class TestTickBook:
+    """Tests for TickBook."""
+
+    def test_walks_match_loop_reference(self) -> None:
+        """Test that searchsorted walks agree with a level-by-level loop."""
+        rng = random.Random(11)
+        for _ in range(200):
+            asks = {
+                rng.randint(400, 999) / 1000: rng.uniform(1, 300)
+                for _ in range(rng.randint(1, 30))
+            }
+            book = TickBook("tok", asks=asks.items())
+            amount = rng.uniform(0, 3000)
+
+            size, cost, complete = _loop_walk_notional(sorted(asks.items()), amount)
+            fill = book.walk_notional("ask", amount)
+            assert fill.size == pytest.approx(size)
+            assert fill.cost == pytest.approx(cost)
+            assert fill.complete == complete
+            filled = sum(level["size"] for level in book.fills("ask", fill))
+            assert filled == pytest.approx(fill.size)
+
+            shares = book.walk("ask", size)
+            assert shares.cost == pytest.approx(cost)
+
+    def test_adapters_agree_across_producers(self) -> None:
+        """Test that the feed, simulator and REST books convert to the same arrays."""
+        bids = [(0.48, 100.0), (0.5, 50.0)]
+        asks = [(0.52, 10.0), (0.53, 40.0)]
+        books = [
+            L2Book("tok", bids, asks),
+            SimulatedOrderbook(
+                token_id="tok",
+                bids=[OrderbookLevel(p, s) for p, s in bids],
+                asks=[OrderbookLevel(p, s) for p, s in asks],
+            ),
+            OrderBookSnapshot(
+                timestamp=0.0, token_id="tok",
+                bids=[{"price": str(p), "size": str(s)} for p, s in bids],
+                asks=[{"price": str(p), "size": str(s)} for p, s in asks],
+                spread=0.02, mid_price=0.51,
+            ),
+        ]
+        converted = [TickBook.from_book(book) for book in books]
+
+        for book in converted:
+            assert (book.token_id, book.best_bid, book.best_ask) == ("tok", 0.5, 0.52)
+            assert book.depth("bid", 1) == 50
+            assert (book.sizes("ask") == converted[0].sizes("ask")).all()
+            assert (book.sizes("bid") == converted[0].sizes("bid")).all()
@@ -0,0 +1,132 @@
+"""
+Benchmark the shared keyword matcher against the per-strategy keyword scans.
+
+Runs the keyword checks every strategy does per market - flash sniper,
+contrarian NO, tail strategy, tail scorer, complete/integrated tail
+systems, esports oracle - once with the old `any(kw in q ...)` loops and
+regexes, once with a single KeywordMatcher scan (cold and memoized), and
+checks both give the same answers.
+
+Usage:
+    python tools/benchmark_keywords.py [--markets 20000] [--cycles 5]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai.tail_scorer import TailFeatureEngineer
+from src.data.keyword_matcher import AHOCORASICK_AVAILABLE, get_keyword_matcher
+from src.trading.complete_system import CompleteTailSystem
+from src.trading.integrated_system import IntegratedTailSystem
+from src.trading.strategies.contrarian_no import ContrarianNoStrategy
+from src.trading.strategies.esports_oracle import ESPORTS_GROUP
+from src.trading.strategies.flash_sniper import FlashSniperStrategy
+from src.trading.strategies.tail_strategy import TailStrategy
+
+WORDS = (
+    "will the price of be above below before end year win match game election trump "
+    "biden bitcoin btc eth solana sol xrp up or down 15 min flash minute nba nfl lakers "
+    "celtics war nuclear crash collapse resign impeach dies divorce all-time high 100k "
+    "openai gpt nvidia tesla apple google fed rate inflation stock league worlds lol "
+    "esports t1 g2 fnatic movie oscar netflix weather rain snow said again"
+).split()
+
+
+def make_questions(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize() + "?"
+        for _ in range(n)
+    ]
+
+
+def legacy_scan(q, flash, contrarian, tail, complete, integrated):
+    """Keyword answers the way each caller computed them before."""
+    lower = q.lower()
+    categories = lambda cats: next(  # noqa: E731
+        (c for c, kws in cats.items() if any(kw in lower for kw in kws)), "other"
+    )
+    return (
+        any(kw in lower for kw in flash.CRYPTO_KEYWORDS),
+        any(kw in lower for kw in flash.FLASH_KEYWORDS),
+        sorted({m.lower() for m in contrarian._keyword_pattern.findall(q)}),
+        next((c for c in tail.CATEGORY_WEIGHTS if c in lower), "other"),
+        tuple(
+            int(any(kw in lower for kw in kws))
+            for kws in (
+                TailFeatureEngineer.POLITICAL_KEYWORDS, TailFeatureEngineer.CRYPTO_KEYWORDS,
+                TailFeatureEngineer.SPORTS_KEYWORDS, TailFeatureEngineer.FINANCE_KEYWORDS,
+                TailFeatureEngineer.TECH_KEYWORDS,
+            )
+        ),
+        categories(complete.categories),
+        categories(integrated.categories),
+        any(kw in lower for kw in ["esport", "league", "lol", "worlds"]),
+    )
+
+
+def shared_scan(q, flash, contrarian, tail, complete, integrated):
+    """The same answers from one KeywordMatcher scan."""
+    hits = get_keyword_matcher().scan(q)
+    tail_found = hits.keywords(tail._category_group)
+    return (
+        flash._crypto_group in hits,
+        flash._flash_group in hits,
+        sorted(hits.keywords(contrarian._keyword_group)),
+        next((c for c in tail.CATEGORY_WEIGHTS if c in tail_found), "other"),
+        tuple(TailFeatureEngineer.detect_category(q).values()),
+        complete.detect_category(q),
+        integrated.detect_category(q),
+        ESPORTS_GROUP in hits,
+    )
+
+
+def timed(fn, questions, cycles, *owners):
+    start = time.perf_counter()
+    for _ in range(cycles):
+        results = [fn(q, *owners) for q in questions]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--markets", type=int, default=20000)
+    parser.add_argument("--cycles", type=int, default=5)
+    args = parser.parse_args()
+
+    owners = (
+        FlashSniperStrategy(), ContrarianNoStrategy(), TailStrategy(),
+        CompleteTailSystem(), IntegratedTailSystem(),
+    )
+    questions = make_questions(args.markets)
+    matcher = get_keyword_matcher()
+
+    legacy_time, legacy = timed(legacy_scan, questions, args.cycles, *owners)
+    print(f"markets={args.markets} cycles={args.cycles}")
+    print(f"  legacy scans:              {legacy_time:7.3f}s")
+
+    mismatches = 0
+    for native in ([True, False] if AHOCORASICK_AVAILABLE else [False]):
+        matcher.native = native
+        matcher._invalidate()
+        cold_time, _ = timed(shared_scan, questions, 1, *owners)
+        matcher._scan.cache_clear()
+        shared_time, shared = timed(shared_scan, questions, args.cycles, *owners)
+        mismatches += sum(a != b for a, b in zip(legacy, shared))
+
+        backend = "pyahocorasick" if native else "pure python"
+        print(f"  shared ({backend}), 1 cold cycle: {cold_time:7.3f}s")
+        print(f"  shared ({backend}), {args.cycles} cycles:   {shared_time:7.3f}s "
+              f"({legacy_time / shared_time:.1f}x)")
+
+    stats = matcher.get_stats()
+    print(f"  groups={stats['groups']} keywords={stats['keywords']} mismatches={mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
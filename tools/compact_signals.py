@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compact multi-strategy signal journals.
+
+Closed days (everything before today, UTC) are deduplicated by trade_id
+and gzipped; today's journal is left alone because the daemon is still
+appending to it.
+
+Usage:
+    python tools/compact_signals.py                    # compact closed days
+    python tools/compact_signals.py --import-legacy    # split old signals.json into journals first
+    python tools/compact_signals.py --export out.json  # dump all signals as one JSON array
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.trading.signal_journal import SignalJournal, compact_journal, read_journal
+
+DEFAULT_DIR = Path("data/multi_strategy/signals")
+LEGACY_FILE = Path("data/multi_strategy/signals.json")
+
+
+def import_legacy(journal: SignalJournal, legacy: Path) -> int:
+    """Append a legacy signals.json array to the journal of each signal's day."""
+    signals = json.loads(legacy.read_text())
+    for signal in signals:
+        try:
+            day = datetime.fromisoformat(str(signal.get("timestamp"))).date()
+        except ValueError:
+            day = datetime.now(timezone.utc).date()
+        journal.append(signal, day=day)
+    journal.flush_sync()
+    legacy.rename(legacy.with_name(legacy.name + ".imported"))
+    return len(signals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact signal journals")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_DIR, help="Journal directory")
+    parser.add_argument("--import-legacy", action="store_true",
+                        help=f"Import {LEGACY_FILE} before compacting")
+    parser.add_argument("--export", type=Path, help="Write all signals to a JSON array file")
+    args = parser.parse_args()
+
+    journal = SignalJournal(args.dir)
+
+    if args.import_legacy and LEGACY_FILE.exists():
+        print(f"📥 Imported {import_legacy(journal, LEGACY_FILE)} legacy signals")
+
+    today = journal.current_path
+    for path in journal.journals():
+        if path == today or path.suffix == ".gz":
+            continue
+        read, kept = compact_journal(path)
+        print(f"🗜️  {path.name}: {read} records -> {kept}")
+
+    if args.export:
+        signals = [record for path in journal.journals() for record in read_journal(path)]
+        args.export.write_text(json.dumps(signals, indent=2, default=str))
+        print(f"📤 Exported {len(signals)} signals to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
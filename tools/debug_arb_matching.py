@@ -76,5 +76,16 @@ async def debug_matching():
         print(f"  Poly: {m.poly_question[:70]}...")
         print(f"  PB:   {m.pb_question[:70]}...")
 
+    # Candidate blocking vs brute force
+    from src.scanner.arb_scanner import measure_blocking_recall
+    recall = measure_blocking_recall(poly_dicts, pb_markets, threshold=40)
+    print(f"\nBlocking recall: {recall['recall']:.1%} "
+          f"({recall['indexed_pairs']}/{recall['brute_pairs']} pairs, "
+          f"{recall['brute_s']}s brute vs {recall['indexed_s']}s indexed)")
+    recall = measure_blocking_recall(poly_dicts, pb_markets, threshold=40, use_tfidf=True)
+    print(f"TF-IDF top-k recall: {recall['recall']:.1%} "
+          f"({recall['indexed_pairs']}/{recall['brute_pairs']} pairs, "
+          f"{recall['brute_s']}s brute vs {recall['indexed_s']}s TF-IDF)")
+
 if __name__ == "__main__":
     asyncio.run(debug_matching())
@@ -8,16 +8,25 @@
 Forensic analysis tool to map the complete intersection between 
 PredictBase and Polymarket prediction markets.
 
+Usage:
+    python tools/market_universe_mapper.py [--workers N]
+
+--workers shards the matching phase across N processes (0 = all cores);
+results are identical to the single-process run.
+
 Author: PolyBot Team
 Date: January 2026
 """
 
+import argparse
 import asyncio
 import json
-import re
+import multiprocessing
+import os
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -25,11 +34,11 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
 import pandas as pd
+from rich import print as rprint
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 from rich.panel import Panel
-from rich import print as rprint
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from rich.table import Table
 
 # Fuzzy matching
 try:
@@ -43,6 +52,9 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.data.text_normalize import clean_question, is_year, normalize, strip_years  # noqa: E402
+from src.scanner.fuzzy_matrix import RAPIDFUZZ_AVAILABLE, best_matches  # noqa: E402
+
 console = Console()
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -131,46 +143,23 @@ STOPWORDS = {
     'vs', 'versus', 'against'
 }
 
-# Category mappings
-CATEGORY_ALIASES = {
-    # PredictBase → Polymarket category mapping
-    "sports": ["sports", "nfl", "nba", "mlb", "nhl", "soccer", "football", "basketball"],
-    "politics": ["politics", "election", "president", "congress", "senate"],
-    "crypto": ["crypto", "bitcoin", "ethereum", "btc", "eth", "defi"],
-    "entertainment": ["entertainment", "movies", "tv", "oscars", "emmys"],
-    "science": ["science", "space", "ai", "technology"],
-    "economics": ["economics", "inflation", "gdp", "fed", "rates"],
-}
-
 
 def clean_text(text: str) -> str:
-    """Normalize text for matching."""
+    """Normalize text for matching (shared cleaning, years dropped)."""
     if not text:
         return ""
-    
-    # Lowercase
-    text = text.lower()
-    
-    # Remove dates in various formats
-    text = re.sub(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b', '', text)
-    text = re.sub(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+\d+\b', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\b\d{4}\b', '', text)  # Years
-    
-    # Remove special chars but keep spaces
-    text = re.sub(r'[^\w\s]', ' ', text)
-    
-    # Collapse whitespace
-    text = ' '.join(text.split())
-    
-    return text.strip()
+    return strip_years(clean_question(text))
 
 
 def tokenize(text: str) -> Set[str]:
     """Extract meaningful tokens from text."""
-    clean = clean_text(text)
-    tokens = set(clean.split()) - STOPWORDS
+    if not text:
+        return set()
     # Keep only tokens with 2+ chars
-    return {t for t in tokens if len(t) >= 2}
+    return {
+        t for t in normalize(text).tokens
+        if len(t) >= 2 and t not in STOPWORDS and not is_year(t)
+    }
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -200,13 +189,19 @@ def calculate_similarity(text1: str, text2: str) -> float:
 
 def detect_category(question: str) -> str:
     """Detect market category from question text."""
-    q_lower = question.lower()
-    
-    for category, keywords in CATEGORY_ALIASES.items():
-        if any(kw in q_lower for kw in keywords):
-            return category
-    
-    return "other"
+    return normalize(question).category
+
+
+def best_similarity(poly_clean: str, pb_cleans: List[str]) -> Tuple[int, float]:
+    """Index and score of the best PB question for one Poly question (-1 if none > 0)."""
+    best_idx = -1
+    best_score = 0
+    for j, pb_clean in enumerate(pb_cleans):
+        score = calculate_similarity(poly_clean, pb_clean)
+        if score > best_score:
+            best_score = score
+            best_idx = j
+    return best_idx, best_score
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -569,12 +564,18 @@ class PolymarketExtractor:
 class MarketMatcher:
     """CPU-intensive market matching engine."""
     
-    def __init__(self, poly_markets: List[Market], pb_markets: List[Market]):
+    def __init__(self, poly_markets: List[Market], pb_markets: List[Market], workers: int = 1):
         self.poly_markets = poly_markets
         self.pb_markets = pb_markets
+        self.workers = workers
         self.matches: List[MarketMatch] = []
         self.stats = defaultdict(int)
     
+    # calculate_similarity() weights, for the vectorized path
+    SIMILARITY_BLEND = (("ratio", 0.2), ("token_sort_ratio", 0.4), ("token_set_ratio", 0.4))
+    MATRIX_CHUNK = 1024  # Poly rows scored per cdist call
+    SHARDS_PER_WORKER = 8  # Poly shards per process (load balancing, progress updates)
+    
     def run_matching(self, progress: Progress) -> List[MarketMatch]:
         """Run full matching algorithm."""
         task = progress.add_task(
@@ -582,30 +583,20 @@ class MarketMatcher:
             total=len(self.poly_markets)
         )
         
-        matches = []
-        
-        # Pre-compute PB data for efficiency
-        pb_questions = [(m, m.clean_question) for m in self.pb_markets]
+        if self.workers > 1 and len(self.poly_markets) > 1:
+            best = self._best_matches_parallel(progress, task)
+        elif RAPIDFUZZ_AVAILABLE:
+            best = self._best_matches_matrix(progress, task)
+        else:
+            best = self._best_matches_python(progress, task)
         
-        for poly_market in self.poly_markets:
-            best_match = None
-            best_score = 0
-            
-            # Find best PB match for this Poly market
-            for pb_market, pb_clean in pb_questions:
-                score = calculate_similarity(poly_market.clean_question, pb_clean)
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = pb_market
-            
+        matches = []
+        for poly_market, best_match, best_score in best:
             # Classify match
             if best_score >= CONFIG["FUZZY_THRESHOLD_LOW"] and best_match:
                 match = self._create_match(poly_market, best_match, best_score)
                 matches.append(match)
                 self.stats[match.match_type] += 1
-            
-            progress.update(task, advance=1)
         
         # Sort by score
         matches.sort(key=lambda m: m.similarity_score, reverse=True)
@@ -613,6 +604,93 @@ class MarketMatcher:
         self.matches = matches
         return matches
     
+    def _best_matches_matrix(
+        self, progress: Progress, task
+    ) -> List[Tuple[Market, Optional[Market], float]]:
+        """Best PB match per Poly market from rapidfuzz score matrices (all cores)."""
+        pb_cleans = [m.clean_question for m in self.pb_markets]
+        best = []
+        
+        for start in range(0, len(self.poly_markets), self.MATRIX_CHUNK):
+            chunk = self.poly_markets[start:start + self.MATRIX_CHUNK]
+            best_idx, best_score = best_matches(
+                [m.clean_question for m in chunk], pb_cleans, blend=self.SIMILARITY_BLEND
+            )
+            for poly_market, j, score in zip(chunk, best_idx, best_score):
+                pb_market = self.pb_markets[j] if j >= 0 else None
+                best.append((poly_market, pb_market, float(score)))
+            progress.update(task, advance=len(chunk))
+        
+        return best
+    
+    def _best_matches_python(
+        self, progress: Progress, task
+    ) -> List[Tuple[Market, Optional[Market], float]]:
+        """Best PB match per Poly market, scored pair by pair."""
+        best = []
+        
+        # Pre-compute PB data for efficiency
+        pb_cleans = [m.clean_question for m in self.pb_markets]
+        
+        for poly_market in self.poly_markets:
+            j, best_score = best_similarity(poly_market.clean_question, pb_cleans)
+            best.append((poly_market, self.pb_markets[j] if j >= 0 else None, best_score))
+            progress.update(task, advance=1)
+        
+        return best
+    
+    def _best_matches_parallel(
+        self, progress: Progress, task
+    ) -> List[Tuple[Market, Optional[Market], float]]:
+        """
+        Best PB match per Poly market, Poly side sharded across processes.
+        
+        The PB corpus is handed to each worker once (inherited on fork,
+        otherwise via the pool initializer), never per task. Shards only
+        carry Poly question strings and return PB indexes, which are
+        reassembled in order, so the result equals the serial paths.
+        """
+        pb_cleans = [m.clean_question for m in self.pb_markets]
+        poly_cleans = [m.clean_question for m in self.poly_markets]
+        use_matrix = RAPIDFUZZ_AVAILABLE
+        
+        shard = -(-len(poly_cleans) // (self.workers * self.SHARDS_PER_WORKER))
+        if use_matrix:
+            shard = min(shard, self.MATRIX_CHUNK)
+        
+        if "fork" in multiprocessing.get_all_start_methods():
+            _WORKER_STATE.update(
+                pb_cleans=pb_cleans, use_matrix=use_matrix, blend=self.SIMILARITY_BLEND
+            )
+            pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"))
+        else:
+            pool = ProcessPoolExecutor(
+                self.workers,
+                initializer=_init_match_worker,
+                initargs=(pb_cleans, use_matrix, self.SIMILARITY_BLEND),
+            )
+        
+        best_idx: List[int] = [-1] * len(poly_cleans)
+        best_score: List[float] = [0.0] * len(poly_cleans)
+        try:
+            with pool:
+                futures = [
+                    pool.submit(_match_shard, start, poly_cleans[start:start + shard])
+                    for start in range(0, len(poly_cleans), shard)
+                ]
+                for future in as_completed(futures):
+                    start, idx, scores = future.result()
+                    best_idx[start:start + len(idx)] = idx
+                    best_score[start:start + len(scores)] = scores
+                    progress.update(task, advance=len(idx))
+        finally:
+            _WORKER_STATE.clear()
+        
+        return [
+            (poly_market, self.pb_markets[j] if j >= 0 else None, score)
+            for poly_market, j, score in zip(self.poly_markets, best_idx, best_score)
+        ]
+    
     def _create_match(self, poly: Market, pb: Market, score: float) -> MarketMatch:
         """Create a MarketMatch object with classification."""
         # Determine match type
@@ -660,6 +738,27 @@ class MarketMatcher:
         )
 
 
+# Process-pool worker state: PB corpus and scoring mode, set once per worker
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_match_worker(pb_cleans: List[str], use_matrix: bool, blend) -> None:
+    """Pool initializer for start methods without fork (PB corpus sent once per worker)."""
+    _WORKER_STATE.update(pb_cleans=pb_cleans, use_matrix=use_matrix, blend=blend)
+
+
+def _match_shard(start: int, poly_cleans: List[str]) -> Tuple[int, List[int], List[float]]:
+    """Best PB index and score for a shard of Poly questions (runs in a worker)."""
+    pb_cleans = _WORKER_STATE["pb_cleans"]
+    if _WORKER_STATE["use_matrix"]:
+        # One rapidfuzz thread per process: the pool already uses every core
+        idx, scores = best_matches(poly_cleans, pb_cleans, blend=_WORKER_STATE["blend"], workers=1)
+        return start, idx.tolist(), [float(s) for s in scores]
+    
+    best = [best_similarity(clean, pb_cleans) for clean in poly_cleans]
+    return start, [j for j, _ in best], [score for _, score in best]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PHASE 4: REPORT GENERATOR
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -930,7 +1029,7 @@ class ReportGenerator:
 # MAIN ORCHESTRATOR
 # ═══════════════════════════════════════════════════════════════════════════════
 
-async def main():
+async def main(workers: int = 1):
     """Main orchestration function."""
     console.print(Panel.fit(
         "[bold cyan]MARKET UNIVERSE MAPPER[/bold cyan]\n"
@@ -993,11 +1092,13 @@ async def main():
     # ═══════════════════════════════════════════════════════════════════════════
     console.print("\n[bold]═══ PHASE 3: Market Matching (CPU Intensive) ═══[/bold]\n")
     
-    if not FUZZY_AVAILABLE:
-        console.print("[red]❌ thefuzz not installed! Run: pip install thefuzz[speedup][/red]")
+    if not (FUZZY_AVAILABLE or RAPIDFUZZ_AVAILABLE):
+        console.print("[red]❌ No fuzzy matcher installed! Run: pip install rapidfuzz[/red]")
         return
     
-    matcher = MarketMatcher(poly_markets, pb_markets)
+    if workers > 1:
+        console.print(f"[cyan]⚙️ Matching with {workers} worker processes[/cyan]")
+    matcher = MarketMatcher(poly_markets, pb_markets, workers=workers)
     
     with Progress(
         SpinnerColumn(),
@@ -1089,8 +1190,17 @@ async def main():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Map the PredictBase <-> Polymarket market intersection"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Matching processes (0 = one per CPU core, default: 1)",
+    )
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(workers=args.workers or os.cpu_count() or 1))
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️ Analysis interrupted by user[/yellow]")
     except Exception as e: